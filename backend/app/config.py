@@ -23,6 +23,16 @@ class Settings(BaseSettings):
     jwt_audience: str = "mtterp"
     jwt_issuer: str = "auth-service"
 
+    # Password hashing
+    password_hash_rounds: int = 12
+    password_hash_workers: int = 4
+
+    # Activity log
+    activity_log_batch_size: int = 200
+    activity_log_flush_seconds: float = 2.0
+    activity_log_partition_months_ahead: int = 3
+    activity_log_partition_check_seconds: float = 6 * 3600
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
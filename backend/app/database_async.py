@@ -9,9 +9,14 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 from config import settings
 from redis.asyncio import Redis
+from datetime import date, timedelta
+import logging
+
+logger = logging.getLogger(__name__)
 
 _engine = None
 _redis_client = None
@@ -68,3 +73,88 @@ async def init_models() -> None:
     engine = get_async_engine()
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+
+
+def activity_log_partition_statements(month_start: date) -> list[str]:
+    """DDL that creates the partition of ``month_start``'s month
+
+    ``CREATE TABLE ... PARTITION OF`` fails once the default partition holds
+    rows of that month, so the partition is created standalone, those rows
+    are moved into it and it is attached afterwards. The default partition
+    is locked against writes while its rows move.
+    """
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    partition = f"activity_logs_{month_start:%Y_%m}"
+    in_month = (
+        f"created_at >= '{month_start.isoformat()}' "
+        f"AND created_at < '{next_month.isoformat()}'"
+    )
+    return [
+        f"CREATE TABLE {partition} "
+        f"(LIKE activity_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        "LOCK TABLE activity_logs_default IN EXCLUSIVE MODE",
+        f"WITH moved AS (DELETE FROM activity_logs_default WHERE {in_month} RETURNING *) "
+        f"INSERT INTO {partition} SELECT * FROM moved",
+        f"ALTER TABLE activity_logs ATTACH PARTITION {partition} "
+        f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}')",
+    ]
+
+
+async def ensure_activity_log_partitions(
+    months_ahead: int = settings.activity_log_partition_months_ahead,
+) -> None:
+    """Create monthly partitions of the activity log up to ``months_ahead``
+
+    Only applies to PostgreSQL; other backends keep a plain table. A default
+    partition catches rows outside the created months so inserts never fail.
+    Runs at startup and periodically from the activity log writer, so
+    long-running processes keep creating partitions ahead of time.
+    """
+    engine = get_async_engine()
+    if engine.dialect.name != "postgresql":
+        return
+
+    month_start = date.today().replace(day=1)
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS activity_logs_default "
+            "PARTITION OF activity_logs DEFAULT"
+        ))
+    for _ in range(months_ahead + 1):
+        partition = f"activity_logs_{month_start:%Y_%m}"
+        # One transaction per month so a failure leaves the others in place
+        async with engine.begin() as conn:
+            exists = await conn.scalar(text(f"SELECT to_regclass('{partition}')"))
+            if exists is None:
+                for statement in activity_log_partition_statements(month_start):
+                    await conn.execute(text(statement))
+                logger.info(f"Created activity log partition {partition}")
+        month_start = (month_start + timedelta(days=32)).replace(day=1)
+    logger.info("Activity log partitions ensured")
+
+
+# Columns matched by utils.search, indexed with pg_trgm
+TRIGRAM_INDEXED_COLUMNS = {
+    "users": ["full_name", "email", "phone"],
+}
+
+
+async def ensure_search_indexes() -> None:
+    """Create the pg_trgm GIN indexes used by fuzzy search
+
+    Only applies to PostgreSQL. Safe to run on every startup; databases
+    migrated with Alembic already have them.
+    """
+    engine = get_async_engine()
+    if engine.dialect.name != "postgresql":
+        return
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, columns in TRIGRAM_INDEXED_COLUMNS.items():
+            for column in columns:
+                await conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_trgm_{table}_{column} "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                ))
+    logger.info("Search indexes ensured")
@@ -8,6 +8,9 @@ from fastapi.exceptions import RequestValidationError
 from config import settings
 # from database import create_db_and_tables
 from routers import auth_router, users_router, roles_router
+from database_async import ensure_activity_log_partitions, ensure_search_indexes
+from services.activity_log_writer import activity_log_writer
+from utils.security import password_hash_pool
 import logging
 
 
@@ -72,6 +75,33 @@ async def internal_server_error_handler(request: Request, exc: Exception):
 #     logger.info("Database initialized successfully")
 
 
+@app.on_event("startup")
+async def start_activity_log():
+    """Create upcoming activity log partitions and start the log writer"""
+    try:
+        await ensure_activity_log_partitions()
+    except Exception as e:
+        logger.error(f"Failed to ensure activity log partitions: {str(e)}")
+    activity_log_writer.start()
+
+
+@app.on_event("startup")
+async def create_search_indexes():
+    """Create the trigram indexes used by user search"""
+    try:
+        await ensure_search_indexes()
+    except Exception as e:
+        logger.error(f"Failed to ensure search indexes: {str(e)}")
+
+
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Drain the activity log and stop the password hashing workers"""
+    await activity_log_writer.stop()
+    password_hash_pool.shutdown()
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -98,7 +128,8 @@ async def health_check():
             "service": "auth-microservice",
             "version": "1.0.0",
             "database": "healthy",
-            "redis": redis_status
+            "redis": redis_status,
+            "password_hashing": password_hash_pool.stats()
         }
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
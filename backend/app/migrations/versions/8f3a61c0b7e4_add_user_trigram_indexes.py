@@ -0,0 +1,44 @@
+"""add trigram indexes for user search
+
+Revision ID: 8f3a61c0b7e4
+Revises: d41c7e2a9f05
+Create Date: 2026-10-18 14:37:52.118604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a61c0b7e4'
+down_revision: Union[str, Sequence[str], None] = 'd41c7e2a9f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ['full_name', 'email', 'phone']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    # Fresh databases get the indexes at startup, once the tables exist
+    if conn.dialect.name != 'postgresql' or not sa.inspect(conn).has_table('users'):
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_trgm_users_{column} "
+            f"ON users USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_trgm_users_{column}")
@@ -0,0 +1,90 @@
+"""partition activity_logs by month
+
+Revision ID: d41c7e2a9f05
+Revises: b230f00539df
+Create Date: 2026-10-18 11:02:17.604331
+
+"""
+from typing import Sequence, Union
+from datetime import date, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41c7e2a9f05'
+down_revision: Union[str, Sequence[str], None] = 'b230f00539df'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _relkind(conn) -> Union[str, None]:
+    return conn.execute(sa.text(
+        "SELECT relkind FROM pg_class WHERE relname = 'activity_logs' AND relkind IN ('r', 'p')"
+    )).scalar()
+
+
+def _create_indexes() -> None:
+    op.create_foreign_key(None, 'activity_logs', 'users', ['actor_id'], ['id'])
+    op.create_foreign_key(None, 'activity_logs', 'users', ['target_user_id'], ['id'])
+    op.create_index('ix_activity_logs_actor_email', 'activity_logs', ['actor_email'])
+    op.create_index('ix_activity_logs_action', 'activity_logs', ['action'])
+    op.create_index('ix_activity_logs_resource', 'activity_logs', ['resource'])
+    op.create_index('ix_activity_logs_actor_created', 'activity_logs', ['actor_id', 'created_at'])
+    op.create_index('ix_activity_logs_target_created', 'activity_logs', ['target_user_id', 'created_at'])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    # Fresh databases get the partitioned table from create_all
+    if conn.dialect.name != 'postgresql' or _relkind(conn) != 'r':
+        return
+
+    op.execute(
+        "CREATE TABLE activity_logs_partitioned (LIKE activity_logs INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute("ALTER TABLE activity_logs_partitioned ADD PRIMARY KEY (id, created_at)")
+    op.execute("CREATE TABLE activity_logs_default PARTITION OF activity_logs_partitioned DEFAULT")
+
+    oldest = conn.execute(sa.text("SELECT min(created_at) FROM activity_logs")).scalar()
+    month_start = (oldest.date() if oldest else date.today()).replace(day=1)
+    last_month = date.today().replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last_month = (last_month + timedelta(days=32)).replace(day=1)
+    while month_start <= last_month:
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        op.execute(
+            f"CREATE TABLE activity_logs_{month_start:%Y_%m} PARTITION OF activity_logs_partitioned "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month_start = next_month
+
+    op.execute("INSERT INTO activity_logs_partitioned SELECT * FROM activity_logs")
+    op.execute("DROP TABLE activity_logs")
+    op.execute("ALTER TABLE activity_logs_partitioned RENAME TO activity_logs")
+    op.execute("ALTER TABLE activity_logs RENAME CONSTRAINT activity_logs_partitioned_pkey TO activity_logs_pkey")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql' or _relkind(conn) != 'p':
+        return
+
+    op.execute("CREATE TABLE activity_logs_plain (LIKE activity_logs INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO activity_logs_plain SELECT * FROM activity_logs")
+    op.execute("DROP TABLE activity_logs CASCADE")
+    op.execute("ALTER TABLE activity_logs_plain RENAME TO activity_logs")
+    op.execute("ALTER TABLE activity_logs ADD CONSTRAINT activity_logs_pkey PRIMARY KEY (id)")
+    _create_indexes()
+    op.drop_index('ix_activity_logs_actor_created', 'activity_logs')
+    op.drop_index('ix_activity_logs_target_created', 'activity_logs')
+    op.create_index('ix_activity_logs_actor_id', 'activity_logs', ['actor_id'])
+    op.create_index('ix_activity_logs_target_user_id', 'activity_logs', ['target_user_id'])
+    op.create_index('ix_activity_logs_created_at', 'activity_logs', ['created_at'])
@@ -2,6 +2,7 @@
 Activity log model for auditing user management actions
 """
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from typing import Optional, Dict, Any
 from datetime import datetime
 import uuid
@@ -9,22 +10,34 @@ import json
 
 
 class ActivityLog(SQLModel, table=True):
-    """Activity log for tracking user management actions"""
+    """Activity log for tracking user management actions
+    
+    Partitioned by month on PostgreSQL, see
+    ``database_async.ensure_activity_log_partitions``.
+    """
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        # Latest activity of a user as actor or as target
+        Index("ix_activity_logs_actor_created", "actor_id", "created_at"),
+        Index("ix_activity_logs_target_created", "target_user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
+    # The partition key must be part of the primary key on a partitioned table
     id: Optional[uuid.UUID] = Field(
         default_factory=uuid.uuid4, primary_key=True
     )
+    created_at: datetime = Field(default_factory=datetime.utcnow, primary_key=True)
     
     # User who performed the action
     actor_id: Optional[uuid.UUID] = Field(
-        foreign_key="users.id", index=True, description="User who performed the action"
+        foreign_key="users.id", description="User who performed the action"
     )
     actor_email: str = Field(max_length=255, index=True, description="Email of the actor")
     
     # Target of the action (if applicable)
     target_user_id: Optional[uuid.UUID] = Field(
-        foreign_key="users.id", index=True, description="User who was affected by the action"
+        foreign_key="users.id", description="User who was affected by the action"
     )
     target_user_email: Optional[str] = Field(max_length=255, description="Email of the target user")
     
@@ -40,9 +53,6 @@ class ActivityLog(SQLModel, table=True):
     ip_address: Optional[str] = Field(max_length=45, description="IP address of the actor")
     user_agent: Optional[str] = Field(max_length=500, description="User agent of the request")
     
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    
     def set_metadata(self, data: dict[str, Any]):
         """Set metadata as JSON string"""
         self.extra_data = json.dumps(data) if data else None
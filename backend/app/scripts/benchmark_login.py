@@ -0,0 +1,120 @@
+"""
+Login throughput benchmark for the auth_service.
+
+Fires a burst of concurrent logins through AuthService (in-memory SQLite,
+fake Redis) while a probe task stands in for the `/auth/me` token checks
+other services send during the burst. Reports login throughput, probe
+latency (how long the event loop was blocked) and the hashing pool stats.
+
+Run inside the container:
+    docker compose exec auth_service python -m scripts.benchmark_login
+
+Compare against hashing on the event loop:
+    docker compose exec auth_service python -m scripts.benchmark_login --inline
+
+Options:
+    --logins 200        total logins in the burst
+    --concurrency 50    logins in flight at once
+    --rounds 12         bcrypt cost of the stored hashes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+from models.user import User
+from schemas.auth import LoginRequest
+from services.auth_service import AuthService
+from test_database import create_test_db_and_tables, TestSessionLocal, get_test_redis
+from utils import security
+
+PASSWORD = "Benchmark!234"
+PROBE_INTERVAL = 0.01
+
+
+async def _seed_users(count: int, rounds: int) -> list[str]:
+    password_hash = security.pwd_context.hash(PASSWORD, rounds=rounds)
+    emails = [f"driver{i}@example.com" for i in range(count)]
+    async with TestSessionLocal() as session:
+        session.add_all(
+            User(
+                full_name=f"Driver {i}",
+                email=email,
+                phone="+212600000000",
+                password_hash=password_hash,
+            )
+            for i, email in enumerate(emails)
+        )
+        await session.commit()
+    return emails
+
+
+async def _probe(stop: asyncio.Event, latencies: list[float]) -> None:
+    """Measure how late a short sleep wakes up, like a queued token check"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+
+async def _login(email: str, semaphore: asyncio.Semaphore) -> None:
+    async with semaphore:
+        async with TestSessionLocal() as session:
+            await AuthService(session, get_test_redis()).login(
+                LoginRequest(email=email, password=PASSWORD)
+            )
+
+
+async def run(logins: int, concurrency: int, rounds: int, inline: bool) -> None:
+    # Stored hashes use the configured cost, so logins do not rehash
+    security.pwd_context.update(bcrypt__rounds=rounds)
+    if inline:
+        async def on_loop(fn, *args):
+            return fn(*args)
+        security.password_hash_pool.run = on_loop
+
+    await create_test_db_and_tables()
+    emails = await _seed_users(logins, rounds)
+
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    probe = asyncio.create_task(_probe(stop, latencies))
+
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
+    await asyncio.gather(*(_login(email, semaphore) for email in emails))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    security.password_hash_pool.shutdown()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0
+    print(f"mode:             {'inline' if inline else 'pool'}")
+    print(f"logins:           {logins} ({concurrency} concurrent, bcrypt rounds {rounds})")
+    print(f"throughput:       {logins / elapsed:.1f} logins/s over {elapsed:.2f}s")
+    print(
+        "probe delay ms:   "
+        f"p50 {statistics.median(latencies) * 1000:.1f}  "
+        f"p99 {p99 * 1000:.1f}  max {max(latencies, default=0.0) * 1000:.1f}"
+    )
+    if not inline:
+        print(f"hash pool:        {security.password_hash_pool.stats()}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark concurrent logins")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=security.settings.password_hash_rounds)
+    parser.add_argument(
+        "--inline", action="store_true", help="Hash on the event loop, as before the pool"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.logins, args.concurrency, args.rounds, args.inline))
@@ -6,5 +6,13 @@ from .auth_service import AuthService
 from .otp_service import OTPService
 from .user_service import UserService
 from .role_service import RoleService
+from .activity_log_writer import ActivityLogWriter, activity_log_writer
 
-__all__ = ["AuthService", "OTPService", "UserService", "RoleService"]
+__all__ = [
+    "AuthService",
+    "OTPService",
+    "UserService",
+    "RoleService",
+    "ActivityLogWriter",
+    "activity_log_writer",
+]
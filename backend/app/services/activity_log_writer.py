@@ -0,0 +1,191 @@
+"""
+Buffered activity log writer
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlmodel import select
+
+from config import settings
+from database_async import async_session_maker, ensure_activity_log_partitions
+from models.activity_log import ActivityLog
+from models.user import User
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_ACTOR_EMAIL = "unknown"
+
+
+class ActivityLogWriter:
+    """In-process sink that writes activity log rows in bulk
+
+    Rows are flushed with one multi-row INSERT when the buffer reaches
+    ``max_size`` or every ``flush_interval`` seconds, whichever comes first,
+    so user mutations no longer pay an extra commit per audit entry. Actor
+    emails come from a small cache; the ones still missing are resolved with
+    a single query per batch. Every ``partition_interval`` seconds the flush
+    task also creates the upcoming monthly partitions.
+    """
+
+    def __init__(
+        self,
+        session_factory=async_session_maker,
+        max_size: int = settings.activity_log_batch_size,
+        flush_interval: float = settings.activity_log_flush_seconds,
+        email_cache_size: int = 1024,
+        partition_interval: float = settings.activity_log_partition_check_seconds,
+        ensure_partitions=ensure_activity_log_partitions,
+    ):
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.email_cache_size = email_cache_size
+        self.partition_interval = partition_interval
+        self.ensure_partitions = ensure_partitions
+        self._pending: list[dict[str, Any]] = []
+        self._emails: OrderedDict[uuid.UUID, str] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def remember_email(self, user_id: uuid.UUID, email: str) -> None:
+        """Cache a user's email, evicting the least recently used entry"""
+        self._emails[user_id] = email
+        self._emails.move_to_end(user_id)
+        if len(self._emails) > self.email_cache_size:
+            self._emails.popitem(last=False)
+
+    def cached_email(self, user_id: uuid.UUID) -> Optional[str]:
+        email = self._emails.get(user_id)
+        if email is not None:
+            self._emails.move_to_end(user_id)
+        return email
+
+    async def add(self, row: dict[str, Any]) -> None:
+        """Queue a row, flushing immediately when the size trigger is hit
+
+        A row without ``actor_email`` gets it resolved at flush time.
+        """
+        if not row.get("actor_email") and row.get("actor_id"):
+            row["actor_email"] = self.cached_email(row["actor_id"])
+        self._pending.append(row)
+        if len(self._pending) >= self.max_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write all buffered rows in one bulk insert
+
+        When the database rejects the batch, e.g. because an actor was
+        deleted before the flush, the rows are inserted one by one and only
+        the rejected ones are dropped.
+
+        Returns:
+            Number of rows written
+        """
+        async with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, []
+            try:
+                await self._write_batch(batch)
+            except (IntegrityError, DataError) as e:
+                logger.warning(
+                    f"Bulk insert of {len(batch)} activity logs rejected, writing them one by one: {str(e)}"
+                )
+                return await self._write_rows(batch)
+            except Exception as e:
+                logger.error(f"Failed to flush {len(batch)} activity logs: {str(e)}")
+                self._requeue(batch)
+                return 0
+            return len(batch)
+
+    def _requeue(self, rows: list[dict[str, Any]]) -> None:
+        # Keep the rows for the next attempt unless the backlog is runaway
+        if len(self._pending) + len(rows) <= self.max_size * 10:
+            self._pending = rows + self._pending
+
+    async def _write_rows(self, batch: list[dict[str, Any]]) -> int:
+        """Insert rows in their own transactions, dropping the rejected ones"""
+        written = 0
+        for index, row in enumerate(batch):
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(ActivityLog), [row])
+                    await session.commit()
+            except (IntegrityError, DataError) as e:
+                logger.error(
+                    f"Dropped activity log {row.get('action')} by {row.get('actor_id')}: {str(e)}"
+                )
+                continue
+            except Exception as e:
+                logger.error(f"Failed to flush {len(batch) - index} activity logs: {str(e)}")
+                self._requeue(batch[index:])
+                break
+            written += 1
+        return written
+
+    async def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        async with self.session_factory() as session:
+            missing = {
+                row["actor_id"]
+                for row in batch
+                if not row.get("actor_email") and row.get("actor_id")
+            }
+            if missing:
+                result = await session.execute(
+                    select(User.id, User.email).where(User.id.in_(missing))
+                )
+                for user_id, email in result.all():
+                    self.remember_email(user_id, email)
+
+            for row in batch:
+                if not row.get("actor_email"):
+                    row["actor_email"] = (
+                        self.cached_email(row["actor_id"]) if row.get("actor_id") else None
+                    ) or UNKNOWN_ACTOR_EMAIL
+
+            await session.execute(insert(ActivityLog), batch)
+            await session.commit()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Startup already created the partitions
+        next_partition_check = loop.time() + self.partition_interval
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if loop.time() >= next_partition_check:
+                next_partition_check = loop.time() + self.partition_interval
+                try:
+                    await self.ensure_partitions()
+                except Exception as e:
+                    logger.error(f"Failed to ensure activity log partitions: {str(e)}")
+
+    def start(self) -> None:
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush task and drain the buffer"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+# Process-wide writer shared by all requests
+activity_log_writer = ActivityLogWriter()
@@ -13,7 +13,7 @@ from schemas.auth import LoginRequest, LoginResponse
 from schemas.user import UserResponse
 from utils.security import (
     verify_token as decode_jwt,
-    verify_password,
+    verify_and_update_password_async,
     create_access_token,
     blacklist_token_async,
     is_token_blacklisted_async,
@@ -40,7 +40,12 @@ class AuthService:
         result = await self.session.execute(stmt)
         user = result.scalar_one_or_none()
 
-        if not user or not verify_password(login_data.password, user.password_hash):
+        valid, new_hash = False, None
+        if user:
+            valid, new_hash = await verify_and_update_password_async(
+                login_data.password, user.password_hash
+            )
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
@@ -51,6 +56,11 @@ class AuthService:
                 detail="User account is disabled",
             )
 
+        if new_hash:
+            # Hashing settings changed since this hash was stored
+            user.password_hash = new_hash
+            logger.info("Rehashed password for user_id=%s", user.id)
+
         user.last_login_at = datetime.utcnow()
         self.session.add(user)
         await self.session.commit()
@@ -2,15 +2,17 @@
 Async User service
 """
 
-from sqlmodel import select, and_, or_, func
+from sqlmodel import select, and_, func, union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from models.user import User, UserRole
 from models.role import Role
 from models.activity_log import ActivityLog, ActivityActions, ActivityResources
+from services.activity_log_writer import ActivityLogWriter, activity_log_writer
 from schemas.user import UserCreate, UserUpdate, UserResponse, UserWithRoles
-from utils.security import get_password_hash, generate_random_password
+from utils.search import fuzzy_search_condition, similarity_rank
+from utils.security import get_password_hash_async, generate_random_password
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -45,8 +47,11 @@ class UserSearchFilters:
 class UserService:
     """Service for handling user operations"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self, session: AsyncSession, activity_log: ActivityLogWriter = activity_log_writer
+    ):
         self.session = session
+        self.activity_log = activity_log
 
     async def create_user(
         self, user_data: UserCreate, actor_id: Optional[uuid.UUID] = None
@@ -64,7 +69,7 @@ class UserService:
             full_name=user_data.full_name,
             email=user_data.email,
             phone=user_data.phone,
-            password_hash=get_password_hash(user_data.password),
+            password_hash=await get_password_hash_async(user_data.password),
             is_verified=getattr(user_data, "is_verified", False),
             must_change_password=getattr(user_data, "must_change_password", False),
             avatar_url=getattr(user_data, "avatar_url", None),
@@ -105,17 +110,18 @@ class UserService:
     ) -> dict[str, object]:
         query = select(User).options(selectinload(User.roles))
         conditions = []
+        rank = None
 
         if not filters.include_deleted:
             conditions.append(User.deleted_at.is_(None))
 
         if filters.search:
-            st = f"%{filters.search}%"
+            search_columns = [User.full_name, User.email, User.phone]
+            dialect_name = self.session.get_bind().dialect.name
             conditions.append(
-                or_(
-                    User.full_name.ilike(st), User.email.ilike(st), User.phone.ilike(st)
-                )
+                fuzzy_search_condition(search_columns, filters.search, dialect_name)
             )
+            rank = similarity_rank(search_columns, filters.search, dialect_name)
 
         if filters.is_active is not None:
             conditions.append(User.is_active == filters.is_active)
@@ -150,6 +156,9 @@ class UserService:
         total_result = await self.session.execute(count_query)
         total = total_result.scalar_one()
 
+        # Closest matches first when searching by text
+        if rank is not None:
+            query = query.order_by(rank.desc())
         if hasattr(User, sort_by):
             col = getattr(User, sort_by)
             query = query.order_by(
@@ -214,7 +223,7 @@ class UserService:
                 await self._log_activity(
                     actor_id=actor_id,
                     action=ActivityActions.USER_UPDATED,
-                    target_user_id=user.id,
+                    target_user=user,
                     description=f"Updated user {user.email}",
                     metadata={
                         "changes": changes,
@@ -253,9 +262,10 @@ class UserService:
             await self._log_activity(
                 actor_id=actor_id,
                 action=action,
-                target_user_id=user_id,
+                # A hard-deleted user can no longer be referenced by the log
+                target_user=None if hard_delete else user,
                 description=f"Deleted user {user.email}",
-                metadata={"hard_delete": hard_delete},
+                metadata={"hard_delete": hard_delete, "user_id": str(user_id)},
             )
 
         return {"message": message}
@@ -274,7 +284,7 @@ class UserService:
             await self._log_activity(
                 actor_id=actor_id,
                 action=ActivityActions.ROLE_ASSIGNED,
-                target_user_id=user_id,
+                target_user=user,
                 description=f"Updated roles for user {user.email}",
                 metadata={
                     "previous_roles": [str(rid) for rid in current_role_ids],
@@ -302,7 +312,7 @@ class UserService:
             await self._log_activity(
                 actor_id=actor_id,
                 action=ActivityActions.USER_LOCKED,
-                target_user_id=user_id,
+                target_user=user,
                 description=f"Locked user account {user.email}",
             )
         return {"message": "User account locked successfully"}
@@ -325,7 +335,7 @@ class UserService:
             await self._log_activity(
                 actor_id=actor_id,
                 action=ActivityActions.USER_UNLOCKED,
-                target_user_id=user_id,
+                target_user=user,
                 description=f"Unlocked user account {user.email}",
             )
         return {"message": "User account unlocked successfully"}
@@ -346,7 +356,7 @@ class UserService:
         if not new_password:
             new_password = generate_random_password()
 
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await get_password_hash_async(new_password)
         user.must_change_password = True
         user.updated_at = datetime.utcnow()
 
@@ -357,7 +367,7 @@ class UserService:
             await self._log_activity(
                 actor_id=actor_id,
                 action=ActivityActions.USER_PASSWORD_RESET,
-                target_user_id=user_id,
+                target_user=user,
                 description=f"Reset password for user {user.email}",
             )
 
@@ -417,13 +427,34 @@ class UserService:
     async def get_user_activity(
         self, user_id: uuid.UUID, limit: int = 50
     ) -> list[dict[str, object]]:
+        # Include entries still sitting in the buffer
+        await self.activity_log.flush()
+
+        # Top entries per role, each served by its (user, created_at) index,
+        # instead of an OR that cannot use either index for the ordering
+        as_actor = (
+            select(ActivityLog.id, ActivityLog.created_at)
+            .where(ActivityLog.actor_id == user_id)
+            .order_by(ActivityLog.created_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        as_target = (
+            select(ActivityLog.id, ActivityLog.created_at)
+            .where(ActivityLog.target_user_id == user_id)
+            .order_by(ActivityLog.created_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        latest = union(select(as_actor), select(as_target)).subquery()
         stmt = (
             select(ActivityLog)
-            .where(
-                or_(
-                    ActivityLog.actor_id == user_id,
-                    ActivityLog.target_user_id == user_id,
-                )
+            .join(
+                latest,
+                and_(
+                    ActivityLog.id == latest.c.id,
+                    ActivityLog.created_at == latest.c.created_at,
+                ),
             )
             .order_by(ActivityLog.created_at.desc())
             .limit(limit)
@@ -464,32 +495,28 @@ class UserService:
         actor_id: uuid.UUID,
         action: str,
         description: str,
-        target_user_id: Optional[uuid.UUID] = None,
+        target_user: Optional[User | UserWithRoles] = None,
         metadata: Optional[dict[str, object]] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
     ):
-        actor_result = await self.session.execute(select(User).where(User.id == actor_id))
-        actor = actor_result.scalar_one_or_none()
-        actor_email = actor.email if actor else "unknown"
-
-        target_user_email = None
-        if target_user_id:
-            tu_result = await self.session.execute(select(User).where(User.id == target_user_id))
-            tu = tu_result.scalar_one_or_none()
-            target_user_email = tu.email if tu else None
+        """Queue an activity log entry on the buffered writer
 
+        The target email comes from the already loaded user; the actor email
+        is resolved by the writer from its cache or in one query per batch.
+        """
         activity = ActivityLog.create_log(
             actor_id=actor_id,
-            actor_email=actor_email,
+            actor_email=self.activity_log.cached_email(actor_id),
             action=action,
             resource=ActivityResources.USER,
             description=description,
-            target_user_id=target_user_id,
-            target_user_email=target_user_email,
+            target_user_id=target_user.id if target_user else None,
+            target_user_email=target_user.email if target_user else None,
             metadata=metadata,
             ip_address=ip_address,
             user_agent=user_agent,
         )
-        self.session.add(activity)
-        await self.session.commit()
+        if target_user:
+            self.activity_log.remember_email(target_user.id, target_user.email)
+        await self.activity_log.add(activity.model_dump())
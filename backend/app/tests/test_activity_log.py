@@ -0,0 +1,188 @@
+# backend/app/tests/test_activity_log.py
+"""
+Tests for the buffered activity log writer and the user activity feed.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import event, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from database_async import activity_log_partition_statements
+from models.activity_log import ActivityActions, ActivityLog
+from services.activity_log_writer import ActivityLogWriter
+from services.user_service import UserService
+from test_database import TestSessionLocal, test_engine
+
+
+@pytest.fixture
+def writer() -> ActivityLogWriter:
+    # Long interval so only explicit or size-triggered flushes write
+    return ActivityLogWriter(
+        session_factory=TestSessionLocal, max_size=50, flush_interval=3600
+    )
+
+
+@pytest.fixture
+def insert_statements():
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO activity_logs"):
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+
+class TestActivityLogWriter:
+    @pytest.mark.asyncio
+    async def test_mutations_are_written_in_one_batch(
+        self, session: AsyncSession, make_user, writer, insert_statements
+    ):
+        """
+        User mutations only queue log rows; a flush writes them all
+        with a single insert and resolves the actor email.
+        """
+        admin = await make_user(email="admin@example.com")
+        targets = [await make_user(email=f"user{i}@example.com") for i in range(3)]
+        svc = UserService(session, activity_log=writer)
+
+        for target in targets:
+            await svc.lock_user_account(target.id, actor_id=admin.id)
+        await svc.unlock_user_account(targets[0].id, actor_id=admin.id)
+
+        assert writer.pending_count == 4
+        assert insert_statements == []
+
+        assert await writer.flush() == 4
+        assert len(insert_statements) == 1
+
+        async with TestSessionLocal() as check:
+            logs = (await check.execute(select(ActivityLog))).scalars().all()
+        assert len(logs) == 4
+        assert {log.actor_email for log in logs} == {"admin@example.com"}
+        assert {log.target_user_email for log in logs} == {
+            t.email for t in targets
+        }
+
+    @pytest.mark.asyncio
+    async def test_size_trigger_flushes(self, session: AsyncSession, make_user):
+        """Reaching max_size writes the buffer without an explicit flush."""
+        admin = await make_user(email="admin@example.com")
+        target = await make_user(email="target@example.com")
+        writer = ActivityLogWriter(
+            session_factory=TestSessionLocal, max_size=2, flush_interval=3600
+        )
+        svc = UserService(session, activity_log=writer)
+
+        await svc.lock_user_account(target.id, actor_id=admin.id)
+        await svc.unlock_user_account(target.id, actor_id=admin.id)
+
+        assert writer.pending_count == 0
+        async with TestSessionLocal() as check:
+            count = await check.scalar(select(func.count()).select_from(ActivityLog))
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_buffer(self, session: AsyncSession, make_user, writer):
+        """Stopping the writer flushes what is still queued."""
+        admin = await make_user(email="admin@example.com")
+        target = await make_user(email="target@example.com")
+        writer.start()
+
+        await UserService(session, activity_log=writer).lock_user_account(
+            target.id, actor_id=admin.id
+        )
+        await writer.stop()
+
+        assert writer.pending_count == 0
+        async with TestSessionLocal() as check:
+            count = await check.scalar(select(func.count()).select_from(ActivityLog))
+        assert count == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_row_does_not_block_the_batch(
+        self, session: AsyncSession, make_user, writer
+    ):
+        """Only the row the database rejects is dropped from a failed batch."""
+        admin = await make_user(email="admin@example.com")
+        target = await make_user(email="target@example.com")
+        svc = UserService(session, activity_log=writer)
+
+        await svc.lock_user_account(target.id, actor_id=admin.id)
+        bad_row = dict(writer._pending[0], id=None, description=None)
+        writer._pending.append(bad_row)
+        await svc.unlock_user_account(target.id, actor_id=admin.id)
+
+        assert await writer.flush() == 2
+        assert writer.pending_count == 0
+        async with TestSessionLocal() as check:
+            count = await check.scalar(select(func.count()).select_from(ActivityLog))
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_task_creates_partitions_periodically(self):
+        """The flush loop keeps creating partitions in long-running processes."""
+        calls: list[int] = []
+
+        async def ensure_partitions() -> None:
+            calls.append(1)
+
+        writer = ActivityLogWriter(
+            session_factory=TestSessionLocal,
+            flush_interval=0.01,
+            partition_interval=0.03,
+            ensure_partitions=ensure_partitions,
+        )
+        writer.start()
+        await asyncio.sleep(0.2)
+        await writer.stop()
+
+        assert 2 <= len(calls) <= 6
+
+    def test_partition_statements_move_default_rows_before_attaching(self):
+        """Rows of the month leave the default partition before the attach."""
+        statements = activity_log_partition_statements(date(2026, 12, 1))
+
+        assert statements[0].startswith("CREATE TABLE activity_logs_2026_12 (LIKE activity_logs")
+        assert "DELETE FROM activity_logs_default" in statements[2]
+        assert "created_at >= '2026-12-01' AND created_at < '2027-01-01'" in statements[2]
+        assert "INSERT INTO activity_logs_2026_12" in statements[2]
+        assert statements[3] == (
+            "ALTER TABLE activity_logs ATTACH PARTITION activity_logs_2026_12 "
+            "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+        )
+        assert not any("PARTITION OF" in statement for statement in statements)
+
+    @pytest.mark.asyncio
+    async def test_user_activity_includes_actor_and_target_entries(
+        self, session: AsyncSession, make_user, writer
+    ):
+        """
+        The activity feed flushes pending rows and merges entries where
+        the user acted and where they were the target, newest first.
+        """
+        admin = await make_user(email="admin@example.com")
+        manager = await make_user(email="manager@example.com")
+        target = await make_user(email="target@example.com")
+        svc = UserService(session, activity_log=writer)
+
+        await svc.lock_user_account(manager.id, actor_id=admin.id)
+        await svc.lock_user_account(target.id, actor_id=manager.id)
+        await svc.unlock_user_account(target.id, actor_id=admin.id)
+
+        activity = await svc.get_user_activity(manager.id)
+        assert [a["action"] for a in activity] == [
+            ActivityActions.USER_LOCKED,
+            ActivityActions.USER_LOCKED,
+        ]
+        assert activity[0]["actor_email"] == "manager@example.com"
+        assert activity[1]["target_user_email"] == "manager@example.com"
+
+        limited = await svc.get_user_activity(target.id, limit=1)
+        assert [a["action"] for a in limited] == [ActivityActions.USER_UNLOCKED]
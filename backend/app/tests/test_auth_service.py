@@ -13,6 +13,7 @@ from services.auth_service import AuthService
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 from utils.security import is_token_blacklisted_async
+from utils.security import password_hash_pool, pwd_context, verify_password
 from utils.security import verify_token as decode_jwt
 
 
@@ -79,6 +80,25 @@ class TestAuthService:
             )
         assert "User account is disabled" in str(exc.value)
 
+    @pytest.mark.asyncio
+    async def test_login_rehashes_outdated_hash(
+        self, session: AsyncSession, redis_client: Redis, make_user
+    ):
+        """A hash made with other cost settings is replaced on login."""
+        user: User = await make_user(email="rehash@example.com", password="Secret123!")
+        user.password_hash = pwd_context.hash("Secret123!", rounds=4)
+        session.add(user)
+        await session.commit()
+        completed = password_hash_pool.stats()["completed"]
+
+        svc = AuthService(session, redis_client)
+        await svc.login(LoginRequest(email="rehash@example.com", password="Secret123!"))
+
+        await session.refresh(user)
+        assert user.password_hash.startswith(f"$2b${settings.password_hash_rounds:02d}$")
+        assert verify_password("Secret123!", user.password_hash)
+        assert password_hash_pool.stats()["completed"] == completed + 1
+
     @pytest.mark.asyncio
     async def test_logout_blacklists_token(
         self, session: AsyncSession, redis_client: Redis, make_user
@@ -0,0 +1,44 @@
+# backend/app/tests/test_user_search.py
+"""
+Tests for user free-text search.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from models.user import User
+from services.user_service import UserSearchFilters, UserService
+from utils.search import fuzzy_search_condition, similarity_rank
+
+
+class TestUserSearch:
+    @pytest.mark.asyncio
+    async def test_search_matches_substring(self, session: AsyncSession, make_user):
+        """Search still matches part of a name, email or phone."""
+        await make_user(full_name="Youssef Amrani", email="youssef@example.com")
+        await make_user(full_name="Salma Idrissi", email="salma@example.com")
+
+        result = await UserService(session).search_users(
+            UserSearchFilters(search="amran")
+        )
+
+        assert result["total"] == 1
+        assert [u.email for u in result["users"]] == ["youssef@example.com"]
+
+    def test_postgresql_search_uses_trigram_operators(self):
+        """On PostgreSQL the search adds indexed similarity matching and ranking."""
+        columns = [User.full_name, User.email]
+        stmt = (
+            select(User.id)
+            .where(fuzzy_search_condition(columns, "yousef", "postgresql"))
+            .order_by(similarity_rank(columns, "yousef", "postgresql").desc())
+        )
+
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "users.full_name ILIKE" in sql
+        assert "users.full_name %%>" in sql
+        assert "ORDER BY greatest(word_similarity(" in sql
+        assert similarity_rank(columns, "yousef", "sqlite") is None
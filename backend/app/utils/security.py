@@ -1,4 +1,8 @@
+import asyncio
 import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from jose import jwt as jose_jwt
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -13,7 +17,7 @@ from utils.redis_compat import r_exists, r_setex
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12,
+    bcrypt__rounds=settings.password_hash_rounds,
 )
 
 ISSUER = "auth-service"
@@ -168,3 +172,109 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Verify a password and rehash it if its cost parameters are outdated.
+
+    Returns (valid, new_hash); new_hash is None unless the stored hash
+    was made with other settings than ``pwd_context`` now uses.
+    """
+    try:
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+    except Exception:
+        return False, None
+
+
+# ---------------------
+# Off-loop hashing pool
+# ---------------------
+
+
+class PasswordHashPool:
+    """Bounded thread pool running password hashing off the event loop.
+
+    bcrypt releases the GIL while it works, so threads hash in parallel
+    while the loop keeps serving token checks. The pool size caps how many
+    cores a login burst can take; excess calls wait in the executor queue,
+    whose depth and wait times are tracked for ``stats()``.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run(self, fn, *args):
+        submitted_at = time.perf_counter()
+
+        def task():
+            waited = time.perf_counter() - submitted_at
+            with self._lock:
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            return fn(*args)
+
+        def done(_future):
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+        with self._lock:
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+        future = self._get_executor().submit(task)
+        future.add_done_callback(done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "in_progress": min(self._pending, self.workers),
+                "queue_depth": max(self._pending - self.workers, 0),
+                "peak_queue_depth": max(self._peak_pending - self.workers, 0),
+                "completed": self._completed,
+                "avg_wait_ms": round(
+                    self._total_wait / self._completed * 1000, 2
+                ) if self._completed else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(settings.password_hash_workers)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return await password_hash_pool.run(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hash_pool.run(get_password_hash, password)
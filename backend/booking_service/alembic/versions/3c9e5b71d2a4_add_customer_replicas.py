@@ -0,0 +1,34 @@
+"""add customer_replicas read model
+
+Revision ID: 3c9e5b71d2a4
+Revises: 8df432895bde
+Create Date: 2026-10-18 16:12:40.527310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3c9e5b71d2a4"
+down_revision = "8df432895bde"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Local copy of CRM customers, kept current from the changes:customers stream
+    op.create_table(
+        "customer_replicas",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("full_name", sa.String(length=255), nullable=True),
+        sa.Column("company_name", sa.String(length=255), nullable=True),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("phone", sa.String(length=20), nullable=True),
+        sa.Column("preferred_language", sa.String(length=50), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("version", sa.DateTime(), nullable=False),
+        sa.Column("synced_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+def downgrade():
+    op.drop_table("customer_replicas")
@@ -0,0 +1,25 @@
+"""make bookings.created_at non-null and index it for keyset paging
+
+Revision ID: 5e8d2c47a1b9
+Revises: 3c9e5b71d2a4
+Create Date: 2026-10-18 18:05:12.604931
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5e8d2c47a1b9"
+down_revision = "3c9e5b71d2a4"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Cursor paging needs a non-null sort key; old rows without one sort as created now
+    op.execute("UPDATE bookings SET created_at = now() WHERE created_at IS NULL")
+    op.alter_column("bookings", "created_at", existing_type=sa.DateTime(), nullable=False)
+    op.create_index("ix_bookings_created_at_id", "bookings", ["created_at", "id"], unique=False)
+
+def downgrade():
+    op.drop_index("ix_bookings_created_at_id", table_name="bookings")
+    op.alter_column("bookings", "created_at", existing_type=sa.DateTime(), nullable=True)
@@ -8,8 +8,19 @@ from .base import (
     IntegrationBadRequest,
     IntegrationNotFound,
     IntegrationTimeoutError,
+    CircuitOpenError,
+    CircuitBreaker,
+    get_circuit_breaker,
+    circuit_breaker_metrics,
+)
+from .customer_client import (
+    get_customer_by_id,
+    get_customers_by_ids,
+    verify_customer_exists,
+    CustomerVerificationError,
+    CustomerLoader,
+    customer_loader,
 )
-from .customer_client import get_customer_by_id, verify_customer_exists, CustomerVerificationError
 from .fleet_client import FleetServiceClient
 from .payment_client import PaymentServiceClient
 from .notification_client import NotificationServiceClient
@@ -21,9 +32,16 @@ __all__ = [
     "IntegrationBadRequest",
     "IntegrationNotFound",
     "IntegrationTimeoutError",
+    "CircuitOpenError",
+    "CircuitBreaker",
+    "get_circuit_breaker",
+    "circuit_breaker_metrics",
     "get_customer_by_id",
+    "get_customers_by_ids",
     "verify_customer_exists",
     "CustomerVerificationError",
+    "CustomerLoader",
+    "customer_loader",
     "FleetServiceClient",
     "PaymentServiceClient",
     "NotificationServiceClient",
@@ -2,12 +2,22 @@
 Base classes and exceptions for external service clients.
 """
 import asyncio
+import copy
 import logging
+import os
 import random
-from typing import Any, Dict, Optional
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+BREAKER_WINDOW_SECONDS = int(os.getenv("CIRCUIT_BREAKER_WINDOW_SECONDS", "30"))
+BREAKER_MIN_REQUESTS = int(os.getenv("CIRCUIT_BREAKER_MIN_REQUESTS", "10"))
+BREAKER_FAILURE_RATE = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))
+BREAKER_OPEN_SECONDS = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "15"))
+BREAKER_HALF_OPEN_CALLS = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_CALLS", "1"))
+
 # --- Custom Exceptions ---
 
 class ExternalServiceError(Exception):
@@ -36,15 +46,179 @@ class IntegrationBadRequest(ExternalServiceError):
     def __init__(self, message: str = "Bad request or invalid data"):
         super().__init__(message, status_code=400)
 
+class CircuitOpenError(ExternalServiceError):
+    """Raised without a network call while the target's circuit breaker is open."""
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message, status_code=503)
+
+
+# --- Circuit Breaker ---
+
+class CircuitBreaker:
+    """
+    Per-target circuit breaker driven by the failure rate over a rolling window.
+
+    Outcomes are counted in one-second buckets over ``window_seconds``. Once at
+    least ``min_requests`` calls were seen and the failure rate reaches
+    ``failure_rate_threshold`` the breaker opens and every call fails fast with
+    CircuitOpenError. After ``open_seconds`` it lets ``half_open_max_calls``
+    probes through: a successful probe closes it, a failed one reopens it.
+    A probe that ends without an outcome (cancelled, or failing outside
+    httpx) hands its slot back with ``release_probe``; as a fallback, slots
+    still taken after another ``open_seconds`` are granted again.
+    Only timeouts, network errors and 5xx responses count as failures; a 4xx
+    means the dependency is up.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_seconds: int = BREAKER_WINDOW_SECONDS,
+        min_requests: int = BREAKER_MIN_REQUESTS,
+        failure_rate_threshold: float = BREAKER_FAILURE_RATE,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+        half_open_max_calls: int = BREAKER_HALF_OPEN_CALLS,
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_requests = min_requests
+        self.failure_rate_threshold = failure_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.CLOSED
+        self._buckets: Deque[List[int]] = deque()  # [second, successes, failures]
+        self._opened_at = 0.0
+        self._half_open_at = 0.0
+        self._half_open_calls = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    def _bucket(self, now: float) -> List[int]:
+        second = int(now)
+        while self._buckets and self._buckets[0][0] <= second - self.window_seconds:
+            self._buckets.popleft()
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
+
+    def _counts(self, now: float) -> Tuple[int, int]:
+        self._bucket(now)
+        successes = sum(bucket[1] for bucket in self._buckets)
+        failures = sum(bucket[2] for bucket in self._buckets)
+        return successes + failures, failures
+
+    def _open(self, now: float) -> None:
+        self.state = self.OPEN
+        self._opened_at = now
+        self.times_opened += 1
+        logger.warning("Circuit breaker for %s opened", self.name)
+
+    def _start_probes(self, now: float) -> None:
+        self.state = self.HALF_OPEN
+        self._half_open_at = now
+        self._half_open_calls = 0
+
+    def before_request(self) -> bool:
+        """
+        Admit a call or raise CircuitOpenError; cheap enough to run on every call.
+
+        Returns True when the call took a half-open probe slot, which the
+        caller hands back with ``release_probe`` once the call is over.
+        """
+        if self.state == self.CLOSED:
+            return False
+        now = time.monotonic()
+        if self.state == self.OPEN and now - self._opened_at >= self.open_seconds:
+            self._start_probes(now)
+        elif (
+            self.state == self.HALF_OPEN
+            and self._half_open_calls >= self.half_open_max_calls
+            and now - self._half_open_at >= self.open_seconds
+        ):
+            # Probes that never reported back must not keep the breaker shut
+            self._start_probes(now)
+        if self.state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        self.rejected += 1
+        raise CircuitOpenError(f"Circuit breaker for {self.name} is open")
+
+    def release_probe(self) -> None:
+        """
+        Free a probe slot. A no-op once the probe recorded an outcome, since
+        that already closed or reopened the breaker.
+        """
+        if self.state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        now = time.monotonic()
+        if self.state == self.HALF_OPEN:
+            self.state = self.CLOSED
+            self._buckets.clear()
+            logger.info("Circuit breaker for %s closed", self.name)
+        self._bucket(now)[1] += 1
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        if self.state == self.HALF_OPEN:
+            self._open(now)
+            return
+        self._bucket(now)[2] += 1
+        if self.state == self.CLOSED:
+            total, failures = self._counts(now)
+            if total >= self.min_requests and failures / total >= self.failure_rate_threshold:
+                self._open(now)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current state and window counters, for health checks and dashboards."""
+        total, failures = self._counts(time.monotonic())
+        return {
+            "state": self.state,
+            "requests": total,
+            "failures": failures,
+            "failure_rate": round(failures / total, 3) if total else 0.0,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+# Breakers are per target, shared by every client instance in the process
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(target: str) -> CircuitBreaker:
+    """Returns the process-wide circuit breaker for a base URL."""
+    breaker = _breakers.get(target)
+    if breaker is None:
+        breaker = _breakers[target] = CircuitBreaker(target)
+    return breaker
+
+
+def circuit_breaker_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every circuit breaker created so far, keyed by target."""
+    return {target: breaker.metrics() for target, breaker in _breakers.items()}
+
+
+# Identical GETs currently on the wire, shared by concurrent callers
+_inflight_gets: Dict[Tuple, "asyncio.Future[Any]"] = {}
+
 
 # --- Base Service Client ---
 
 class ServiceClientBase:
     """
-    Base class for asynchronous service clients with built-in retry logic.
+    Base class for asynchronous service clients with built-in retry logic,
+    a per-target circuit breaker and single-flight coalescing of GETs.
     """
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip('/')
+        self.breaker = get_circuit_breaker(self.base_url)
 
     def build_headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
@@ -75,60 +249,127 @@ class ServiceClientBase:
     ) -> Any:
         """
         Makes an async JSON request with retries and standardized error handling.
-        """
-        import httpx
 
+        Fails fast with CircuitOpenError while the target's breaker is open.
+        Concurrent GETs with the same URL, params and headers share one
+        request; each caller gets its own copy of the response body. Callers
+        joining an in-flight GET do not go through the breaker, so they
+        neither use up half-open probe slots nor get rejected by them.
+        """
         url = f"{self.base_url}{path}"
         request_headers = self.build_headers(headers)
 
+        if method.upper() != "GET":
+            probe = self.breaker.before_request()
+            try:
+                return await self._request_with_retries(
+                    method, url, params=params, json=json, request_headers=request_headers, timeout=timeout, retries=retries
+                )
+            finally:
+                if probe:
+                    self.breaker.release_probe()
+
+        key = (
+            url,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted(request_headers.items())),
+        )
+        inflight = _inflight_gets.get(key)
+        if inflight is not None:
+            result = await asyncio.shield(inflight)
+            return copy.deepcopy(result)
+
+        probe = self.breaker.before_request()
+        task = asyncio.ensure_future(self._request_with_retries(
+            method, url, params=params, json=json, request_headers=request_headers, timeout=timeout, retries=retries
+        ))
+        _inflight_gets[key] = task
+        task.add_done_callback(lambda _: _inflight_gets.pop(key, None))
+        if probe:
+            # The request outlives a cancelled caller, so the slot is freed when it ends
+            task.add_done_callback(lambda _: self.breaker.release_probe())
+        # Shielded: the first caller giving up must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Any],
+        request_headers: Dict[str, str],
+        timeout: float,
+        retries: int,
+    ) -> Any:
+        import httpx
+
         last_exception = None
 
-        for attempt in range(retries + 1):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method, url, params=params, json=json, headers=request_headers, timeout=timeout
-                    )
-
-                if response.status_code in {502, 503, 504} and attempt < retries:
-                    last_exception = ExternalServiceError(
-                        f"External service returned a retryable server error: {response.status_code}",
-                        status_code=response.status_code
-                    )
-                    logger.warning(
-                        "Attempt %d/%d failed with retryable status %d for %s %s",
-                        attempt + 1, retries + 1, response.status_code, method, url
-                    )
-                    # Go to the backoff sleep
-                    raise httpx.RequestError("Retryable server error")
-
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.TimeoutException as e:
-                last_exception = IntegrationTimeoutError(f"Request to {url} timed out.")
-                logger.warning("Timeout on attempt %d/%d for %s %s", attempt + 1, retries + 1, method, url)
-
-            except httpx.RequestError as e:
-                if "Retryable server error" not in str(e):
-                    last_exception = ExternalServiceError(f"Network error requesting {url}: {e}")
-                    logger.warning("Network error on attempt %d/%d for %s %s: %s", attempt + 1, retries + 1, method, url, e)
-
-            except httpx.HTTPStatusError as e:
-                status = e.response.status_code
-                if status in {401, 403}:
-                    raise IntegrationAuthError from e
-                if status == 404:
-                    raise IntegrationNotFound from e
-                if 400 <= status < 500:
-                    raise IntegrationBadRequest(f"Bad request: {e.response.text}") from e
-
-                # For non-retryable 5xx errors
-                raise ExternalServiceError(f"HTTP error: {status} {e.response.text}", status_code=status) from e
-
-            if attempt < retries:
-                backoff_time = 0.2 * (2 ** attempt) + random.uniform(0.0, 0.1)
-                await asyncio.sleep(backoff_time)
+        # Probe slot taken by a retry; the first attempt's belongs to the caller
+        probe = False
+        try:
+            for attempt in range(retries + 1):
+                if attempt > 0:
+                    # Stop retrying as soon as the breaker trips
+                    try:
+                        probe = self.breaker.before_request() or probe
+                    except CircuitOpenError:
+                        break
+                try:
+                    async with httpx.AsyncClient() as client:
+                        response = await client.request(
+                            method, url, params=params, json=json, headers=request_headers, timeout=timeout
+                        )
+
+                    if response.status_code in {502, 503, 504} and attempt < retries:
+                        last_exception = ExternalServiceError(
+                            f"External service returned a retryable server error: {response.status_code}",
+                            status_code=response.status_code
+                        )
+                        logger.warning(
+                            "Attempt %d/%d failed with retryable status %d for %s %s",
+                            attempt + 1, retries + 1, response.status_code, method, url
+                        )
+                        # Go to the backoff sleep
+                        raise httpx.RequestError("Retryable server error")
+
+                    if response.status_code >= 500:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    response.raise_for_status()
+                    return response.json()
+
+                except httpx.TimeoutException as e:
+                    self.breaker.record_failure()
+                    last_exception = IntegrationTimeoutError(f"Request to {url} timed out.")
+                    logger.warning("Timeout on attempt %d/%d for %s %s", attempt + 1, retries + 1, method, url)
+
+                except httpx.RequestError as e:
+                    self.breaker.record_failure()
+                    if "Retryable server error" not in str(e):
+                        last_exception = ExternalServiceError(f"Network error requesting {url}: {e}")
+                        logger.warning("Network error on attempt %d/%d for %s %s: %s", attempt + 1, retries + 1, method, url, e)
+
+                except httpx.HTTPStatusError as e:
+                    status = e.response.status_code
+                    if status in {401, 403}:
+                        raise IntegrationAuthError from e
+                    if status == 404:
+                        raise IntegrationNotFound from e
+                    if 400 <= status < 500:
+                        raise IntegrationBadRequest(f"Bad request: {e.response.text}") from e
+
+                    # For non-retryable 5xx errors
+                    raise ExternalServiceError(f"HTTP error: {status} {e.response.text}", status_code=status) from e
+
+                if attempt < retries:
+                    backoff_time = 0.2 * (2 ** attempt) + random.uniform(0.0, 0.1)
+                    await asyncio.sleep(backoff_time)
+        finally:
+            if probe:
+                self.breaker.release_probe()
 
         if last_exception:
             raise last_exception
@@ -2,8 +2,11 @@
 Resilient customer client for booking service
 """
 from __future__ import annotations
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+import asyncio
 import os
+import time
 import httpx
 import logging
 from uuid import UUID
@@ -13,6 +16,9 @@ logger = logging.getLogger(__name__)
 CUSTOMER_SVC_BASE = os.getenv("CUSTOMER_SERVICE_BASE", "http://crm_service:8001/api/v1")
 CUSTOMER_VERIFY_STRICT = os.getenv("CUSTOMER_VERIFY_STRICT", "false").lower() in {"1", "true", "yes"}
 HTTP_TIMEOUT = float(os.getenv("CUSTOMER_HTTP_TIMEOUT", "2.0"))
+BATCH_WINDOW_MS = float(os.getenv("CUSTOMER_BATCH_WINDOW_MS", "5"))
+BATCH_MAX_SIZE = int(os.getenv("CUSTOMER_BATCH_MAX_SIZE", "100"))
+CACHE_TTL_SECONDS = float(os.getenv("CUSTOMER_CACHE_TTL_SECONDS", "60"))
 
 
 class CustomerVerificationError(Exception):
@@ -110,4 +116,163 @@ async def verify_customer_exists(customer_id: UUID, token: Optional[str] = None,
         raise
     except Exception as e:
         logger.warning("Customer verification failed: %s", e)
-        return not CUSTOMER_VERIFY_STRICT  # Fail open in non-strict mode
\ No newline at end of file
+        return not CUSTOMER_VERIFY_STRICT  # Fail open in non-strict mode
+
+
+async def get_customers_by_ids(customer_ids: Iterable[UUID], token: Optional[str] = None, auth_header: Optional[str] = None) -> dict[UUID, dict[str, Any]]:
+    """
+    Fetch many customers with one call to the CRM batch endpoint.
+    Returns the customers found, keyed by id; unknown ids are simply absent.
+    Failures follow get_customer_by_id: raise CustomerVerificationError if
+    STRICT, else log and return an empty dict.
+    """
+    ids = [str(customer_id) for customer_id in customer_ids]
+    if not ids:
+        return {}
+
+    url = f"{CUSTOMER_SVC_BASE}/customers/batch"
+    headers = {"Accept": "application/json"}
+    if auth_header:
+        headers["Authorization"] = auth_header
+    elif token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    logger.debug("Fetching %d customers at %s", len(ids), url)
+
+    try:
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+            resp = await client.post(url, json={"ids": ids}, headers=headers)
+    except Exception as e:
+        logger.warning("Customer batch lookup network error: %s", str(e)[:100])
+        if CUSTOMER_VERIFY_STRICT:
+            raise CustomerVerificationError("Customer lookup failed", "customer_service_unreachable", 503)
+        return {}
+
+    if resp.status_code == 200:
+        try:
+            return {UUID(customer["id"]): customer for customer in resp.json()["customers"]}
+        except Exception:
+            logger.warning("Customer batch lookup invalid JSON: %s", resp.text[:100])
+            if CUSTOMER_VERIFY_STRICT:
+                raise CustomerVerificationError("Invalid customer response", "customer_service_invalid", 502)
+            return {}
+
+    if resp.status_code in (401, 403):
+        logger.warning("Customer batch lookup auth error (%s): %s", resp.status_code, resp.text[:100])
+        if CUSTOMER_VERIFY_STRICT:
+            raise CustomerVerificationError("Not authorized to verify customer", "customer_forbidden", 403)
+        return {}
+
+    logger.warning("Customer batch lookup unexpected status %s: %s", resp.status_code, resp.text[:100])
+    if CUSTOMER_VERIFY_STRICT:
+        raise CustomerVerificationError("Customer service error", "customer_service_error", 502)
+    return {}
+
+
+class CustomerLoader:
+    """
+    DataLoader-style customer lookups.
+
+    Single-id loads issued within ``window_ms`` of each other (per
+    Authorization header) are coalesced into one batch request, and found
+    customers are cached per process for ``cache_ttl`` seconds. The cache is
+    keyed by Authorization header too, so a caller is never served a
+    customer it was not allowed to read. Misses are not cached, so a
+    customer created moments ago is found on the next call.
+    """
+
+    def __init__(
+        self,
+        window_ms: float = BATCH_WINDOW_MS,
+        max_batch_size: int = BATCH_MAX_SIZE,
+        cache_ttl: float = CACHE_TTL_SECONDS,
+        cache_size: int = 2048,
+        fetch=None,
+    ):
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.fetch = fetch or get_customers_by_ids
+        self._cache: OrderedDict[tuple[Optional[str], UUID], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._pending: dict[Optional[str], dict[UUID, asyncio.Future]] = {}
+        self._timers: dict[Optional[str], asyncio.TimerHandle] = {}
+        self._inflight: set[asyncio.Task] = set()
+
+    def _cached(self, auth_header: Optional[str], customer_id: UUID) -> Optional[dict[str, Any]]:
+        key = (auth_header, customer_id)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, customer = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return customer
+
+    def _remember(self, auth_header: Optional[str], customer_id: UUID, customer: dict[str, Any]) -> None:
+        key = (auth_header, customer_id)
+        self._cache[key] = (time.monotonic() + self.cache_ttl, customer)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached customers"""
+        self._cache.clear()
+
+    async def load(self, customer_id: UUID, auth_header: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """Return one customer dict, or None if the CRM does not know it"""
+        cached = self._cached(auth_header, customer_id)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        batch = self._pending.setdefault(auth_header, {})
+        future = batch.get(customer_id)
+        if future is None:
+            future = loop.create_future()
+            batch[customer_id] = future
+            if len(batch) >= self.max_batch_size:
+                self._dispatch(auth_header)
+            elif auth_header not in self._timers:
+                self._timers[auth_header] = loop.call_later(self.window, self._dispatch, auth_header)
+        # Shielded: one caller giving up must not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, customer_ids: Iterable[UUID], auth_header: Optional[str] = None) -> dict[UUID, Optional[dict[str, Any]]]:
+        """Return customers for many ids, sharing batches with concurrent loads"""
+        customer_ids = list(dict.fromkeys(customer_ids))
+        customers = await asyncio.gather(*(self.load(customer_id, auth_header) for customer_id in customer_ids))
+        return dict(zip(customer_ids, customers))
+
+    def _dispatch(self, auth_header: Optional[str]) -> None:
+        timer = self._timers.pop(auth_header, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(auth_header, None)
+        if batch:
+            task = asyncio.ensure_future(self._fetch_batch(batch, auth_header))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _fetch_batch(self, batch: dict[UUID, asyncio.Future], auth_header: Optional[str]) -> None:
+        try:
+            customers = await self.fetch(list(batch), auth_header=auth_header)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for customer_id, future in batch.items():
+            customer = customers.get(customer_id)
+            if customer is not None:
+                self._remember(auth_header, customer_id, customer)
+            if not future.done():
+                future.set_result(customer)
+
+
+# Process-wide loader, so concurrent requests share batches and the cache
+customer_loader = CustomerLoader()
@@ -3,7 +3,7 @@ Configuration settings for the booking microservice
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -13,6 +13,19 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://redis_auth:6379/2"
     
+    # Change feed (Redis Streams shared by all services; defaults to redis_url)
+    change_feed_redis_url: Optional[str] = None
+    change_stream_max_length: int = 100000  # Approximate cap per stream
+    change_feed_enabled: bool = True  # Keep local read models of other services
+    change_feed_batch_size: int = 100
+    change_feed_block_ms: int = 5000
+    change_feed_max_deliveries: int = 5  # Deliveries before a failing entry is logged and dropped
+    
+    # Idempotency-Key handling for retried create requests
+    idempotency_ttl_seconds: int = 86400  # How long a stored response can be replayed
+    idempotency_lock_seconds: int = 60  # Claim timeout if the first request dies mid-flight
+    idempotency_wait_seconds: float = 30.0  # How long a concurrent duplicate waits
+    
     # Service Integration
     auth_service_url: str = "http://auth_service:8000"
     crm_service_url: str = "http://crm_service:8001"
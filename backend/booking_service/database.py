@@ -4,6 +4,7 @@ Database configuration and session management
 from sqlmodel import SQLModel, create_engine, Session
 from config import settings
 import redis
+import redis.asyncio as aioredis
 from typing import Generator
 
 
@@ -18,6 +19,10 @@ engine = create_engine(
 # Redis client
 redis_client = redis.from_url(settings.redis_url, decode_responses=True)
 
+# Redis holding the cross-service change feed, for publishing and consuming
+change_feed_redis = redis.from_url(settings.change_feed_redis_url or settings.redis_url, decode_responses=True)
+async_change_feed_redis = aioredis.from_url(settings.change_feed_redis_url or settings.redis_url, decode_responses=True)
+
 
 def create_db_and_tables():
     """Create database tables"""
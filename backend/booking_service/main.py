@@ -9,6 +9,8 @@ from dependencies import get_redis
 from config import settings
 from dependencies import get_redis
 from database import create_db_and_tables
+from services.change_feed import change_feed_consumer
+from clients.base import circuit_breaker_metrics
 from routers import bookings_router, pricing_router, availability_router, reservation_items_router
 import logging
 
@@ -78,9 +80,17 @@ async def startup_event():
     # NOTE: Database creation is now handled by Alembic migrations.
     # This function is left for potential dev/testing use, but not called on startup.
     # create_db_and_tables()
+    if settings.change_feed_enabled:
+        change_feed_consumer.start()
     logger.info("Booking service started. DB schema managed by Alembic.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the change feed consumer"""
+    await change_feed_consumer.stop()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint with JWT configuration info"""
@@ -107,6 +117,7 @@ async def health_check():
             "version": "1.0.0",
             "database": "connected",
             "redis": redis_status,
+            "circuit_breakers": circuit_breaker_metrics(),
             "jwt_config": {
                 "audience": settings.jwt_audience,
                 "allowed_audiences": settings.jwt_allowed_audiences,
@@ -20,6 +20,7 @@ from .booking import Booking
 from .reservation_item import ReservationItem
 from .pricing_rule import PricingRule
 from .availability_slot import AvailabilitySlot
+from .replica import CustomerReplica
 
 __all__ = [
     # enums
@@ -34,4 +35,5 @@ __all__ = [
     "ReservationItem",
     "PricingRule",
     "AvailabilitySlot",
+    "CustomerReplica",
 ]
@@ -9,7 +9,7 @@ from decimal import Decimal
 from typing import Optional, TYPE_CHECKING
 import uuid
 
-from sqlalchemy import Column, Numeric
+from sqlalchemy import Column, Index, Numeric
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship  # << explicit SA relationship
 from sqlmodel import SQLModel, Field, Relationship
@@ -25,6 +25,8 @@ class Booking(SQLModel, table=True):
     """Booking model for managing customer reservations."""
 
     __tablename__ = "bookings"
+    # Serves the default newest-first listing and its keyset cursor
+    __table_args__ = (Index("ix_bookings_created_at_id", "created_at", "id"),)
 
     id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
 
@@ -92,7 +94,7 @@ class Booking(SQLModel, table=True):
     cancelled_at: Optional[datetime] = Field(default=None)
 
     # Timestamps
-    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = Field(default=None)
     confirmed_at: Optional[datetime] = Field(default=None)
     expires_at: Optional[datetime] = Field(default=None)
@@ -0,0 +1,29 @@
+"""
+Local read models of other services, kept current from the change feed.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+import uuid
+
+from sqlmodel import SQLModel, Field
+
+
+class CustomerReplica(SQLModel, table=True):
+    """Summary of a CRM customer, replicated from ``changes:customers``"""
+
+    __tablename__ = "customer_replicas"
+
+    id: uuid.UUID = Field(primary_key=True)
+    full_name: Optional[str] = Field(default=None, max_length=255)
+    company_name: Optional[str] = Field(default=None, max_length=255)
+    email: Optional[str] = Field(default=None, max_length=255)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    preferred_language: Optional[str] = Field(default=None, max_length=50)
+    is_active: bool = Field(default=True)
+
+    # Source ``updated_at`` of the applied event, older events are skipped
+    version: datetime
+    synced_at: datetime = Field(default_factory=datetime.utcnow)
@@ -8,18 +8,20 @@ import logging
 from typing import Optional
 import redis.asyncio as redis
 
-from fastapi import APIRouter, Depends, Body, Query, HTTPException, status, Request
+from fastapi import APIRouter, Depends, Body, Query, HTTPException, status, Request, Header
 from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from database import get_session, get_redis
 from services.booking_service import BookingService
+from models import CustomerReplica
 from clients.customer_client import get_customer_by_id, CustomerVerificationError
 
 from schemas.booking_filters import BookingFilters
-from schemas.booking import BookingCreate, BookingUpdate, BookingResponse
+from schemas.booking import BookingCreate, BookingUpdate, BookingResponse, BookingListItem
 from utils.auth import get_current_user, require_permission, CurrentUser
 from utils.pagination import PaginatedResponse
+from utils.idempotency import IdempotencyStore
 from config import settings
 from utils import pdf_generator
 
@@ -36,6 +38,7 @@ async def create_booking(
     redis_client: redis.Redis = Depends(get_redis),
     current_user: CurrentUser = Depends(get_current_user),
     _: None = Depends(require_permission("booking", "create", "bookings")),
+    idempotency_key: Optional[str] = Header(None, description="Retries with the same key replay the first response"),
 ):
     """
     Create a new booking.
@@ -43,13 +46,35 @@ async def create_booking(
     Notes:
     - Do NOT gate booking creation on PDF/reportlab.
     - Optional: attempt customer verification; map known failures to typed errors.
+    - With an Idempotency-Key, retries replay the stored response instead of creating again.
     """
+    return await IdempotencyStore(redis_client).run(
+        "bookings:create",
+        idempotency_key,
+        current_user.user_id,
+        booking_data,
+        lambda: _create_booking(booking_data, request, db, redis_client, current_user),
+    )
+
+
+async def _create_booking(
+    booking_data: BookingCreate,
+    request: Request,
+    db: Session,
+    redis_client: redis.Redis,
+    current_user: CurrentUser,
+) -> BookingResponse:
     logger.info("Creating booking for customer %s", booking_data.customer_id)
 
     # Optional: resilient customer verification (non-strict by default)
+    # The change feed replica answers locally; the CRM call covers customers it has not seen yet
     auth_header = request.headers.get("Authorization")
     try:
-        customer_data = await get_customer_by_id(booking_data.customer_id, auth_header=auth_header)
+        replica = db.get(CustomerReplica, booking_data.customer_id)
+        if replica is not None:
+            customer_data = replica.model_dump(exclude={"version", "synced_at"})
+        else:
+            customer_data = await get_customer_by_id(booking_data.customer_id, auth_header=auth_header)
         customer_verified = customer_data is not None
         logger.debug("Customer verification result for %s: %s", booking_data.customer_id, customer_verified)
         # We do not hard-fail if None; the service layer can decide how to tag unverified customers.
@@ -66,10 +91,13 @@ async def create_booking(
     )
 
 
-@router.get("/", response_model=PaginatedResponse[BookingResponse])
+@router.get("/", response_model=PaginatedResponse[BookingListItem])
 async def get_bookings(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor"),
+    include_total: Optional[bool] = Query(None, description="Count matching rows (defaults to on without a cursor)"),
     sort_by: Optional[str] = Query(None),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
     customer_id: Optional[uuid.UUID] = Query(None),
@@ -95,6 +123,8 @@ async def get_bookings(
     filters = BookingFilters(
         page=page,
         size=size,
+        cursor=cursor,
+        include_total=include_total,
         sort_by=sort_by,
         sort_order=sort_order,
         customer_id=customer_id,
@@ -112,12 +142,13 @@ async def get_bookings(
     )
 
     service = BookingService(db, redis_client)
-    return await service.get_bookings(filters)
+    return await service.get_bookings(filters, auth_header=request.headers.get("Authorization"))
 
 
 @router.get("/{booking_id}/voucher")
 async def download_booking_voucher(
     booking_id: uuid.UUID,
+    request: Request,
     db: Session = Depends(get_session),
     redis_client: redis.Redis = Depends(get_redis),
     _: None = Depends(require_permission("booking", "read", "bookings")),
@@ -141,6 +172,11 @@ async def download_booking_voucher(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
 
     booking_dict = booking.model_dump() if hasattr(booking, "model_dump") else booking.__dict__
+    customers = await service.get_customers_info(
+        [booking.customer_id], auth_header=request.headers.get("Authorization")
+    )
+    customer_info = customers.get(booking.customer_id) or {}
+    booking_dict["customer_name"] = customer_info.get("full_name") or customer_info.get("company_name")
 
     buf = io.BytesIO()
     pdf_generator.generate_booking_voucher(booking_dict, buf)
@@ -8,6 +8,7 @@ __all__ = [
     "BookingCreate",
     "BookingUpdate",
     "BookingResponse",
+    "BookingListItem",
     "BookingSummary",
     "ReservationItemCreate",
     "ReservationItemUpdate",
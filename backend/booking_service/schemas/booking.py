@@ -87,6 +87,13 @@ class BookingResponse(BookingBase):
     expires_at: Optional[datetime]
 
 
+class BookingListItem(BookingResponse):
+    """Booking in a list, with the customer's name and email"""
+
+    customer_name: Optional[str] = None
+    customer_email: Optional[str] = None
+
+
 class BookingSummary(BookingResponse):
     """Extended booking response with summary information"""
 
@@ -11,6 +11,8 @@ class BookingFilters(BaseModel):
     # Pagination
     page: int = Field(default=1, ge=1, description="Page number")
     size: int = Field(default=20, ge=1, le=200, description="Items per page")
+    cursor: Optional[str] = Field(default=None, description="Opaque cursor from a previous response's next_cursor")
+    include_total: Optional[bool] = Field(default=None, description="Count matching rows (defaults to on without a cursor)")
     
     # Sorting
     sort_by: Optional[str] = Field(default=None, description="Field to sort by")
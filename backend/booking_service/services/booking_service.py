@@ -9,11 +9,13 @@ from models import (
     BookingStatus,
     PaymentStatus,
     ReservationItem,
+    CustomerReplica,
 )
 from schemas.booking import (
     BookingCreate,
     BookingUpdate,
     BookingResponse,
+    BookingListItem,
     BookingSummary,
     BookingConfirm,
     BookingCancel,
@@ -22,7 +24,9 @@ from schemas.booking import (
 from schemas.booking_filters import BookingFilters
 from utils.pagination import PaginationParams, paginate_query
 from utils.locking import acquire_booking_lock, release_booking_lock
+from utils.events import publish_booking_change
 from services.pricing_service import PricingService
+from clients.customer_client import customer_loader
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime, timedelta
 from math import ceil
@@ -131,6 +135,7 @@ class BookingService:
             self.session.add(booking)
             self.session.commit()
             self.session.refresh(booking)
+            publish_booking_change(booking)
 
             # Schedule expiry check
             await self._schedule_booking_expiry(booking.id)
@@ -160,11 +165,14 @@ class BookingService:
 
         return BookingResponse(**booking.model_dump())
 
-    async def get_bookings(self, filters: BookingFilters):
-        """Get paginated list of bookings with filters"""
+    async def get_bookings(self, filters: BookingFilters, auth_header: Optional[str] = None):
+        """Get paginated list of bookings with filters
+
+        Customer names and emails of the whole page are resolved together,
+        with at most one CRM batch request.
+        """
         # Build base query
         query = select(Booking)
-        count_query = select(func.count(Booking.id))
         
         # Apply filters based on actual Booking model fields
         conditions = []
@@ -220,7 +228,6 @@ class BookingService:
         if conditions:
             from sqlmodel import and_
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
         
         # Apply sorting
         if filters.sort_by:
@@ -247,18 +254,30 @@ class BookingService:
             # Default sort by creation date
             query = query.order_by(Booking.created_at.desc())
         
-        # Get total count
-        total = self.session.exec(count_query).one()
-        
-        # Apply pagination
-        items = self.session.exec(query.offset(filters.offset).limit(filters.size)).all()
+        # Keyset-paged when a cursor is given, offset-paged otherwise.
+        # BookingFilters already validated the bounds, which allow larger pages.
+        pagination = PaginationParams.model_construct(
+            page=filters.page,
+            size=filters.size,
+            cursor=filters.cursor,
+            include_total=filters.include_total,
+        )
+        bookings, total = paginate_query(self.session, query, pagination)
+        customers = await self.get_customers_info(
+            [booking.customer_id for booking in bookings], auth_header
+        )
+        items = [
+            self._to_list_item(booking, customers.get(booking.customer_id))
+            for booking in bookings
+        ]
         
         return {
             "items": items,
             "page": filters.page,
             "size": filters.size,
             "total": total,
-            "pages": ceil(total / filters.size) if filters.size else 1
+            "pages": ceil(total / filters.size) if total is not None else None,
+            "next_cursor": pagination.next_cursor,
         }
 
     async def update_booking(
@@ -290,6 +309,7 @@ class BookingService:
         self.session.add(booking)
         self.session.commit()
         self.session.refresh(booking)
+        publish_booking_change(booking)
 
         return BookingResponse(**booking.model_dump())
 
@@ -332,6 +352,7 @@ class BookingService:
         self.session.add(booking)
         self.session.commit()
         self.session.refresh(booking)
+        publish_booking_change(booking)
 
         return BookingResponse(**booking.model_dump())
 
@@ -370,10 +391,13 @@ class BookingService:
         self.session.add(booking)
         self.session.commit()
         self.session.refresh(booking)
+        publish_booking_change(booking)
 
         return BookingResponse(**booking.model_dump())
 
-    async def get_booking_summary(self, booking_id: uuid.UUID) -> BookingSummary:
+    async def get_booking_summary(
+        self, booking_id: uuid.UUID, auth_header: Optional[str] = None
+    ) -> BookingSummary:
         """Get comprehensive booking summary"""
         statement = select(Booking).where(Booking.id == booking_id)
         booking = self.session.exec(statement).first()
@@ -390,7 +414,7 @@ class BookingService:
         reservation_items = self.session.exec(items_count_stmt).all()
 
         # Get customer information from CRM service
-        customer_info = await self._get_customer_info(booking.customer_id)
+        customer_info = await self._get_customer_info(booking.customer_id, auth_header)
 
         # Create summary response
         base_response = BookingResponse(**booking.model_dump())
@@ -419,6 +443,7 @@ class BookingService:
 
             self.session.add(booking)
             self.session.commit()
+            publish_booking_change(booking)
 
             return True
 
@@ -450,6 +475,8 @@ class BookingService:
     async def _verify_customer_exists(self, customer_id: uuid.UUID) -> bool:
         """Verify customer exists in CRM service"""
         logger.debug("DIAGNOSTIC: _verify_customer_exists called for customer_id: %s", customer_id)
+        if self.session.get(CustomerReplica, customer_id) is not None:
+            return True
         try:
             from config import settings
 
@@ -470,20 +497,48 @@ class BookingService:
                 detail="Unable to verify customer information",
             )
 
-    async def _get_customer_info(self, customer_id: uuid.UUID) -> Optional[dict]:
-        """Get customer information from CRM service"""
-        try:
-            from config import settings
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.crm_service_url}/api/v1/customers/{customer_id}"
-                )
-                if response.status_code == 200:
-                    return response.json()
-        except:
-            pass
-        return None
+    async def get_customers_info(
+        self, customer_ids: List[uuid.UUID], auth_header: Optional[str] = None
+    ) -> Dict[uuid.UUID, Optional[dict]]:
+        """Get customer information for many bookings
+
+        Customers come from the local replica in one query; the ones it has
+        not seen yet are loaded from the CRM service in one batch, with the
+        caller's Authorization header.
+        """
+        customer_ids = list(dict.fromkeys(customer_ids))
+        if not customer_ids:
+            return {}
+
+        replicas = self.session.exec(
+            select(CustomerReplica).where(CustomerReplica.id.in_(customer_ids))
+        ).all()
+        customers = {
+            replica.id: replica.model_dump(exclude={"version", "synced_at"})
+            for replica in replicas
+        }
+        missing = [customer_id for customer_id in customer_ids if customer_id not in customers]
+        if missing:
+            try:
+                # Coalesced with concurrent lookups into one CRM batch request
+                customers.update(await customer_loader.load_many(missing, auth_header))
+            except Exception as e:
+                logger.warning("Customer lookup failed for %d customers: %s", len(missing), e)
+        return customers
+
+    async def _get_customer_info(
+        self, customer_id: uuid.UUID, auth_header: Optional[str] = None
+    ) -> Optional[dict]:
+        """Get customer information, from the local replica or the CRM service"""
+        customers = await self.get_customers_info([customer_id], auth_header)
+        return customers.get(customer_id)
+
+    def _to_list_item(self, booking: Booking, customer_info: Optional[dict]) -> BookingListItem:
+        return BookingListItem(
+            **booking.model_dump(),
+            customer_name=customer_info.get("full_name") if customer_info else None,
+            customer_email=customer_info.get("email") if customer_info else None,
+        )
 
     async def _schedule_booking_expiry(self, booking_id: uuid.UUID):
         """Schedule booking expiry check"""
@@ -0,0 +1,158 @@
+"""
+Tests for the circuit breaker and GET coalescing in ServiceClientBase
+"""
+import asyncio
+import time
+
+import pytest
+
+from clients.base import CircuitBreaker, CircuitOpenError, circuit_breaker_metrics
+from clients.fleet_client import FleetServiceClient
+
+
+def _trip(breaker: CircuitBreaker):
+    for _ in range(breaker.min_requests):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_breaker_opens_on_failure_rate():
+    """The breaker opens once the window failure rate crosses the threshold"""
+    breaker = CircuitBreaker("http://fleet-test", min_requests=4, failure_rate_threshold=0.5)
+
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    assert breaker.metrics()["rejected"] == 1
+
+
+def test_half_open_probe_closes_or_reopens():
+    """After the open period one probe decides whether the breaker closes"""
+    breaker = CircuitBreaker("http://fleet-test", min_requests=2, open_seconds=0.01)
+    _trip(breaker)
+    time.sleep(0.02)
+
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.02)
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.metrics()["times_opened"] == 2
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast_without_request(monkeypatch):
+    """Clients sharing a target fail fast while its breaker is open"""
+    calls = []
+
+    async def fake_request(self, method, url, **kwargs):
+        calls.append(url)
+        return {}
+
+    monkeypatch.setattr(FleetServiceClient, "_request_with_retries", fake_request)
+    client = FleetServiceClient(base_url="http://fleet-down")
+    _trip(client.breaker)
+
+    with pytest.raises(CircuitOpenError):
+        await FleetServiceClient(base_url="http://fleet-down").request_json("GET", "/vehicles/available")
+    assert calls == []
+    assert circuit_breaker_metrics()["http://fleet-down"]["state"] == CircuitBreaker.OPEN
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_are_coalesced(monkeypatch):
+    """Concurrent identical GETs share one request; others are sent separately"""
+    calls = []
+
+    async def fake_request(self, method, url, *, params, **kwargs):
+        calls.append((method, params))
+        await asyncio.sleep(0.01)
+        return {"vehicles": [params]}
+
+    monkeypatch.setattr(FleetServiceClient, "_request_with_retries", fake_request)
+    client = FleetServiceClient(base_url="http://fleet-coalesce")
+
+    results = await asyncio.gather(
+        client.request_json("GET", "/vehicles/available", params={"capacity": 4}),
+        client.request_json("GET", "/vehicles/available", params={"capacity": 4}),
+        client.request_json("GET", "/vehicles/available", params={"capacity": 8}),
+        client.request_json("POST", "/vehicles/1/reserve", json={}),
+        client.request_json("POST", "/vehicles/1/reserve", json={}),
+    )
+
+    assert len(calls) == 4
+    assert results[0] == results[1] and results[0] is not results[1]
+
+
+def test_unreported_probe_slots_are_granted_again():
+    """Probe slots nobody reported back on are reissued after the open period"""
+    breaker = CircuitBreaker("http://fleet-test", min_requests=2, open_seconds=0.01)
+    _trip(breaker)
+    time.sleep(0.02)
+
+    assert breaker.before_request() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    time.sleep(0.02)
+    assert breaker.before_request() is True
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_frees_its_slot(monkeypatch):
+    """A probe cancelled before any outcome hands its slot back"""
+    started = asyncio.Event()
+
+    async def hanging_request(self, method, url, **kwargs):
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(FleetServiceClient, "_request_with_retries", hanging_request)
+    client = FleetServiceClient(base_url="http://fleet-cancel")
+    client.breaker.open_seconds = 0.01
+    _trip(client.breaker)
+    time.sleep(0.02)
+
+    probe = asyncio.ensure_future(client.request_json("POST", "/vehicles/1/reserve", json={}))
+    await started.wait()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert client.breaker.state == CircuitBreaker.HALF_OPEN
+    assert client.breaker.before_request() is True
+
+
+@pytest.mark.asyncio
+async def test_coalesced_get_does_not_need_a_probe_slot(monkeypatch):
+    """A GET joining the in-flight probe is not rejected by the half-open breaker"""
+    async def fake_request(self, method, url, **kwargs):
+        await asyncio.sleep(0.01)
+        self.breaker.record_success()
+        return {"vehicles": []}
+
+    monkeypatch.setattr(FleetServiceClient, "_request_with_retries", fake_request)
+    client = FleetServiceClient(base_url="http://fleet-probe")
+    client.breaker.open_seconds = 0.01
+    _trip(client.breaker)
+    time.sleep(0.02)
+
+    results = await asyncio.gather(
+        client.request_json("GET", "/vehicles/available"),
+        client.request_json("GET", "/vehicles/available"),
+    )
+
+    assert results == [{"vehicles": []}, {"vehicles": []}]
+    assert client.breaker.state == CircuitBreaker.CLOSED
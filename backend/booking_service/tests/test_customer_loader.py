@@ -0,0 +1,78 @@
+"""
+Tests for the batching customer loader
+"""
+import asyncio
+import uuid
+
+import pytest
+
+from clients.customer_client import CustomerLoader
+
+
+def _fake_crm(known):
+    calls = []
+
+    async def fetch(customer_ids, auth_header=None):
+        calls.append(list(customer_ids))
+        return {cid: known[cid] for cid in customer_ids if cid in known}
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_batch():
+    """Concurrent single-id loads are sent as one batch request"""
+    first, second, unknown = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    fetch, calls = _fake_crm({
+        first: {"id": str(first), "full_name": "Ahmed Hassan"},
+        second: {"id": str(second), "full_name": "Fatima Zahra"},
+    })
+    loader = CustomerLoader(window_ms=5, fetch=fetch)
+
+    results = await asyncio.gather(
+        loader.load(first), loader.load(second), loader.load(first), loader.load(unknown)
+    )
+
+    assert [r["full_name"] if r else None for r in results] == [
+        "Ahmed Hassan", "Fatima Zahra", "Ahmed Hassan", None
+    ]
+    assert calls == [[first, second, unknown]]
+
+
+@pytest.mark.asyncio
+async def test_found_customers_are_cached():
+    """Found customers are served from the cache; misses are fetched again"""
+    known_id, unknown = uuid.uuid4(), uuid.uuid4()
+    fetch, calls = _fake_crm({known_id: {"id": str(known_id), "full_name": "Ahmed Hassan"}})
+    loader = CustomerLoader(window_ms=1, fetch=fetch)
+
+    await loader.load_many([known_id, unknown])
+    assert (await loader.load(known_id))["full_name"] == "Ahmed Hassan"
+    assert await loader.load(unknown) is None
+
+    assert calls == [[known_id, unknown], [unknown]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_dispatches_immediately():
+    """A full batch is sent without waiting for the window"""
+    ids = [uuid.uuid4() for _ in range(3)]
+    fetch, calls = _fake_crm({})
+    loader = CustomerLoader(window_ms=60000, max_batch_size=3, fetch=fetch)
+
+    assert await asyncio.wait_for(loader.load_many(ids), timeout=1) == dict.fromkeys(ids)
+    assert calls == [ids]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_per_authorization_header():
+    """A customer cached for one caller is fetched again for another"""
+    customer_id = uuid.uuid4()
+    fetch, calls = _fake_crm({customer_id: {"id": str(customer_id), "full_name": "Ahmed Hassan"}})
+    loader = CustomerLoader(window_ms=1, fetch=fetch)
+
+    await loader.load(customer_id, auth_header="Bearer agent")
+    await loader.load(customer_id, auth_header="Bearer agent")
+    await loader.load(customer_id, auth_header="Bearer other")
+
+    assert calls == [[customer_id], [customer_id]]
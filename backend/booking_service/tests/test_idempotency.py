@@ -0,0 +1,75 @@
+"""
+Tests for Idempotency-Key handling
+"""
+import asyncio
+import json
+
+import fakeredis
+import pytest
+from fastapi import HTTPException
+
+from utils.idempotency import IdempotencyStore
+
+
+@pytest.fixture
+def store():
+    return IdempotencyStore(fakeredis.FakeRedis(decode_responses=True), wait_timeout=1, poll_interval=0.01)
+
+
+def _handler(calls, result=None):
+    async def handler():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return result or {"id": len(calls)}
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_replay_returns_stored_response(store):
+    """A retry with the same key and body replays the first response"""
+    calls = []
+    first = await store.run("bookings:create", "key-1", "user-1", {"pax": 2}, _handler(calls))
+    replay = await store.run("bookings:create", "key-1", "user-1", {"pax": 2}, _handler(calls))
+
+    assert first == {"id": 1}
+    assert json.loads(replay.body) == {"id": 1}
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_waits_for_first(store):
+    """A duplicate arriving mid-flight waits and gets the same response"""
+    calls = []
+    first, second = await asyncio.gather(
+        store.run("bookings:create", "key-1", "user-1", {"pax": 2}, _handler(calls)),
+        store.run("bookings:create", "key-1", "user-1", {"pax": 2}, _handler(calls)),
+    )
+
+    assert first == {"id": 1}
+    assert json.loads(second.body) == {"id": 1}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_key_reuse_with_different_body_is_rejected(store):
+    """Reusing a key for a different request is a 422"""
+    await store.run("bookings:create", "key-1", "user-1", {"pax": 2}, _handler([]))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await store.run("bookings:create", "key-1", "user-1", {"pax": 3}, _handler([]))
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_key(store):
+    """A failed attempt can be retried with the same key"""
+    async def failing():
+        raise HTTPException(status_code=409, detail="Resource is currently being booked")
+
+    with pytest.raises(HTTPException):
+        await store.run("bookings:create", "key-1", "user-1", {"pax": 2}, failing)
+
+    calls = []
+    assert await store.run("bookings:create", "key-1", "user-1", {"pax": 2}, _handler(calls)) == {"id": 1}
+    assert len(calls) == 1
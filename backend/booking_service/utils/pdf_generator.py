@@ -95,6 +95,8 @@ def generate_booking_voucher(booking: Dict[str, Any], stream: BinaryIO) -> None:
             f"Status: {booking.get('status', 'N/A')}",
             f"Total Price: {booking.get('total_price', 'N/A')} {booking.get('currency', 'MAD')}",
         ]
+        if booking.get('customer_name'):
+            details.insert(1, f"Account: {booking['customer_name']}")
         
         for detail in details:
             c.drawString(inch, y_position, detail)
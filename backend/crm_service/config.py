@@ -2,7 +2,7 @@
 Configuration settings for the CRM microservice
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str
     
+    # Change feed (Redis Streams shared by all services; defaults to redis_url)
+    change_feed_redis_url: Optional[str] = None
+    change_stream_max_length: int = 100000  # Approximate cap per stream
+    
     # Auth Service Integration
     auth_service_url: str
     
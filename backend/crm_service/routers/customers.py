@@ -6,7 +6,8 @@ from sqlmodel import Session
 from database import get_session
 from services.customer_service import CustomerService
 from schemas.customer import (
-    CustomerCreate, CustomerUpdate, CustomerResponse, CustomerSummary, CustomerSearch
+    CustomerCreate, CustomerUpdate, CustomerResponse, CustomerSummary, CustomerSearch,
+    CustomerBatchRequest, CustomerBatchResponse
 )
 from utils.auth import require_permission, CurrentUser
 from utils.pagination import PaginationParams, PaginatedResponse
@@ -61,10 +62,22 @@ async def get_customers(
         items=customers,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
+@router.post("/batch", response_model=CustomerBatchResponse)
+async def get_customers_batch(
+    batch: CustomerBatchRequest,
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("crm", "read", "customers"))
+):
+    """Get many customers by ID in one request"""
+    customer_service = CustomerService(session)
+    return await customer_service.get_customers_by_ids(batch.ids)
+
+
 @router.get("/{customer_id}", response_model=CustomerResponse)
 async def get_customer(
     customer_id: uuid.UUID,
@@ -55,7 +55,8 @@ async def get_feedback_list(
         items=feedback_list,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -128,5 +129,6 @@ async def get_customer_feedback(
         items=feedback_list,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
\ No newline at end of file
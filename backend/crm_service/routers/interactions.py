@@ -57,7 +57,8 @@ async def get_interactions(
         items=interactions,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -126,5 +127,6 @@ async def get_customer_interactions(
         items=interactions,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
\ No newline at end of file
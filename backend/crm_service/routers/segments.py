@@ -47,7 +47,8 @@ async def get_segments(
         items=segments,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
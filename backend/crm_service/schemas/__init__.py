@@ -8,6 +8,7 @@ from .segment import *
 
 __all__ = [
     "CustomerCreate", "CustomerUpdate", "CustomerResponse", "CustomerSummary",
+    "CustomerBatchRequest", "CustomerBatchResponse",
     "InteractionCreate", "InteractionUpdate", "InteractionResponse",
     "FeedbackCreate", "FeedbackUpdate", "FeedbackResponse", "FeedbackStats",
     "SegmentCreate", "SegmentUpdate", "SegmentResponse", "SegmentWithCustomers"
@@ -1,7 +1,7 @@
 """
 Customer-related Pydantic schemas
 """
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from models.customer import ContactType, LoyaltyStatus
@@ -71,6 +71,20 @@ class CustomerResponse(CustomerBase):
         )
 
 
+MAX_BATCH_SIZE = 500
+
+
+class CustomerBatchRequest(BaseModel):
+    """Customer IDs to fetch in one call"""
+    ids: List[uuid.UUID] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class CustomerBatchResponse(BaseModel):
+    """Customers found for a batch request, plus the IDs that were not"""
+    customers: List[CustomerResponse]
+    missing: List[uuid.UUID] = []
+
+
 class CustomerSummary(CustomerResponse):
     """Extended customer response with summary statistics"""
     total_interactions: int = 0
@@ -6,8 +6,13 @@ from fastapi import HTTPException, status
 from models.customer import Customer
 from models.interaction import Interaction
 from models.feedback import Feedback
-from schemas.customer import CustomerCreate, CustomerUpdate, CustomerResponse, CustomerSummary, CustomerSearch
+from schemas.customer import (
+    CustomerCreate, CustomerUpdate, CustomerResponse, CustomerSummary, CustomerSearch,
+    CustomerBatchResponse
+)
 from utils.pagination import PaginationParams, paginate_query
+from utils.search import fuzzy_search_condition, similarity_rank
+from utils.events import publish_customer_change
 from typing import List, Optional, Tuple
 from datetime import datetime
 import uuid
@@ -39,6 +44,7 @@ class CustomerService:
         self.session.add(customer)
         self.session.commit()
         self.session.refresh(customer)
+        publish_customer_change(customer)
         
         return CustomerResponse.from_model(customer)
     
@@ -55,6 +61,24 @@ class CustomerService:
         
         return CustomerResponse.from_model(customer)
     
+    async def get_customers_by_ids(self, customer_ids: List[uuid.UUID]) -> CustomerBatchResponse:
+        """Get many customers by ID with a single primary key ``IN`` lookup
+        
+        Customers come back in request order; unknown IDs are listed in
+        ``missing`` instead of failing the whole batch.
+        """
+        unique_ids = list(dict.fromkeys(customer_ids))
+        statement = select(Customer).where(Customer.id.in_(unique_ids))
+        found = {customer.id: customer for customer in self.session.exec(statement).all()}
+        
+        return CustomerBatchResponse(
+            customers=[
+                CustomerResponse.from_model(found[customer_id])
+                for customer_id in unique_ids if customer_id in found
+            ],
+            missing=[customer_id for customer_id in unique_ids if customer_id not in found]
+        )
+    
     async def get_customers(
         self, 
         pagination: PaginationParams,
@@ -62,21 +86,17 @@ class CustomerService:
     ) -> Tuple[List[CustomerResponse], int]:
         """Get list of customers with optional search"""
         query = select(Customer)
+        rank = None
         
         # Apply search filters
         if search:
             conditions = []
             
             if search.query:
-                search_term = f"%{search.query}%"
-                conditions.append(
-                    or_(
-                        Customer.full_name.ilike(search_term),
-                        Customer.company_name.ilike(search_term),
-                        Customer.email.ilike(search_term),
-                        Customer.phone.ilike(search_term)
-                    )
-                )
+                search_columns = [Customer.full_name, Customer.company_name, Customer.email, Customer.phone]
+                dialect_name = self.session.get_bind().dialect.name
+                conditions.append(fuzzy_search_condition(search_columns, search.query, dialect_name))
+                rank = similarity_rank(search_columns, search.query, dialect_name)
             
             if search.contact_type:
                 conditions.append(Customer.contact_type == search.contact_type)
@@ -100,7 +120,9 @@ class CustomerService:
             if conditions:
                 query = query.where(and_(*conditions))
         
-        # Order by creation date (newest first)
+        # Order by closest match when searching by text, then by creation date (newest first)
+        if rank is not None:
+            query = query.order_by(rank.desc())
         query = query.order_by(Customer.created_at.desc())
         
         customers, total = paginate_query(self.session, query, pagination)
@@ -133,6 +155,7 @@ class CustomerService:
         self.session.add(customer)
         self.session.commit()
         self.session.refresh(customer)
+        publish_customer_change(customer)
         
         return CustomerResponse.from_model(customer)
     
@@ -152,6 +175,7 @@ class CustomerService:
         
         self.session.add(customer)
         self.session.commit()
+        publish_customer_change(customer)
         
         return {"message": "Customer deactivated successfully"}
     
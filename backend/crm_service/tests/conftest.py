@@ -45,6 +45,12 @@ def redis_client_fixture():
     return fakeredis.FakeRedis(decode_responses=True)
 
 
+@pytest.fixture(autouse=True)
+def change_feed_fixture(monkeypatch):
+    """Publish change events to a fake Redis"""
+    monkeypatch.setattr("utils.events.change_feed_redis", fakeredis.FakeRedis(decode_responses=True))
+
+
 @pytest.fixture(name="client")
 def client_fixture(session: Session, redis_client):
     """Create test client with dependency overrides"""
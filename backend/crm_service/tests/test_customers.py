@@ -85,6 +85,22 @@ class TestCustomers:
         
         assert "Customer not found" in str(exc_info.value)
     
+    @pytest.mark.asyncio
+    async def test_get_customers_by_ids(self, session, create_test_customer):
+        """Test batch lookup keeps request order and reports missing IDs"""
+        customer_service = CustomerService(session)
+        
+        import uuid
+        first = create_test_customer(full_name="John Doe")
+        second = create_test_customer(full_name="Jane Doe")
+        fake_id = uuid.uuid4()
+        
+        result = await customer_service.get_customers_by_ids([second.id, fake_id, first.id, second.id])
+        
+        assert [c.id for c in result.customers] == [second.id, first.id]
+        assert result.customers[0].full_name == "Jane Doe"
+        assert result.missing == [fake_id]
+    
     @pytest.mark.asyncio
     async def test_update_customer(self, session, create_test_customer):
         """Test updating customer information"""
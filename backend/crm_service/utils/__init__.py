@@ -3,8 +3,12 @@ Utility functions and dependencies
 """
 from .auth import *
 from .pagination import *
+from .search import *
+from .events import *
 
 __all__ = [
     "get_current_user", "require_permission", "verify_auth_token",
-    "PaginationParams", "paginate_query"
+    "PaginationParams", "paginate_query",
+    "fuzzy_search_condition", "similarity_rank",
+    "publish_change", "publish_customer_change"
 ]
\ No newline at end of file
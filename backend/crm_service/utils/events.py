@@ -0,0 +1,56 @@
+"""
+Change events published to the shared Redis Streams change feed
+"""
+from database import change_feed_redis
+from config import settings
+from datetime import datetime
+from typing import Any, Dict, Optional
+import json
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+CUSTOMER_STREAM = "changes:customers"
+
+
+def publish_change(
+    stream: str,
+    entity_id: uuid.UUID,
+    data: Dict[str, Any],
+    version: Optional[datetime] = None
+):
+    """Publish the current state of an entity to a change stream
+    
+    Consumers keep the highest ``version`` per entity, so replays and
+    out-of-order delivery are harmless. Publishing is best effort: consumers
+    fall back to HTTP for anything their replica has not seen yet.
+    """
+    fields = {
+        "id": str(entity_id),
+        "version": (version or datetime.utcnow()).isoformat(),
+        "data": json.dumps(data, default=str)
+    }
+    try:
+        change_feed_redis.xadd(
+            stream, fields, maxlen=settings.change_stream_max_length, approximate=True
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish change to {stream}: {str(e)}")
+
+
+def publish_customer_change(customer):
+    """Publish the summary fields other services replicate for a customer"""
+    publish_change(
+        CUSTOMER_STREAM,
+        customer.id,
+        {
+            "full_name": customer.full_name,
+            "company_name": customer.company_name,
+            "email": customer.email,
+            "phone": customer.phone,
+            "preferred_language": customer.preferred_language,
+            "is_active": customer.is_active
+        },
+        version=customer.updated_at or customer.created_at
+    )
@@ -4,9 +4,20 @@ Pagination utilities
 
 from __future__ import annotations
 
-from fastapi import Query
-from pydantic import BaseModel
-from typing import Generic, List, TypeVar
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, PrivateAttr
+from typing import Any, Generic, List, NamedTuple, Optional, Tuple, TypeVar
+from sqlalchemy import literal, tuple_
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
 from sqlmodel import Session, select, func
 
 from config import settings
@@ -15,7 +26,13 @@ T = TypeVar("T")
 
 
 class PaginationParams(BaseModel):
-    """Pagination parameters"""
+    """Pagination parameters
+
+    ``page``/``size`` keep offset paging. Passing the ``next_cursor`` of a
+    previous response switches to keyset paging, which costs the same on
+    every page; the total count is then skipped unless ``include_total``
+    asks for it.
+    """
 
     page: int = Query(1, ge=1, description="Page number")
     size: int = Query(
@@ -24,26 +41,42 @@ class PaginationParams(BaseModel):
         le=settings.max_page_size,
         description="Page size",
     )
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor")
+    include_total: Optional[bool] = Query(None, description="Count matching rows (defaults to on for page mode, off for cursor mode)")
+
+    _next_cursor: Optional[str] = PrivateAttr(default=None)
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.size
 
+    @property
+    def wants_total(self) -> bool:
+        if self.include_total is None:
+            return self.cursor is None
+        return self.include_total
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Cursor for the page after the last one fetched, if there is one"""
+        return self._next_cursor
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response wrapper"""
 
     items: List[T]
-    total: int
+    total: Optional[int]
     page: int
     size: int
-    pages: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(cls, items: List[T], total: int, page: int, size: int):
+    def create(cls, items: List[T], total: Optional[int], page: int, size: int, next_cursor: Optional[str] = None):
         """Create paginated response"""
-        pages = (total + size - 1) // size if total else 0  # ceiling division
-        return cls(items=items, total=total, page=page, size=size, pages=pages)
+        pages = (total + size - 1) // size if total is not None else None  # ceiling division
+        return cls(items=items, total=total, page=page, size=size, pages=pages, next_cursor=next_cursor)
 
 
 def _scalar_one_compat(exec_result) -> int:
@@ -60,19 +93,151 @@ def _scalar_one_compat(exec_result) -> int:
     return int(value or 0)
 
 
+class _Keyset(NamedTuple):
+    """Sort columns, direction and id tie-breaker of a keyset-pageable query"""
+    names: Tuple[str, ...]
+    columns: Tuple[Any, ...]
+    id_column: Any
+    descending: bool
+    ordered_by_id: bool
+
+
+def _keyset_order(query) -> Optional[_Keyset]:
+    """Return the keyset of a ``select(Model)`` ordered by its own columns
+
+    The sort columns must be non-null and share one direction. Queries
+    ordered by expressions, mixed directions or nullable columns only
+    support offset paging.
+    """
+    descriptions = query.column_descriptions
+    if len(descriptions) != 1 or descriptions[0]["expr"] is not descriptions[0]["entity"]:
+        return None
+    table = getattr(descriptions[0]["entity"], "__table__", None)
+    if table is None or "id" not in table.c:
+        return None
+    id_column = table.c.id
+
+    names, directions = [], set()
+    for clause in query._order_by_clauses:
+        descending = False
+        if isinstance(clause, UnaryExpression) and clause.modifier in (operators.desc_op, operators.asc_op):
+            descending = clause.modifier is operators.desc_op
+            clause = clause.element
+        name = getattr(clause, "key", None)
+        if getattr(clause, "table", None) is not table or name not in table.c or table.c[name].nullable:
+            return None
+        names.append(name)
+        directions.add(descending)
+    if len(directions) > 1:
+        return None
+
+    ordered_by_id = "id" in names
+    if ordered_by_id and names[-1] != "id":
+        return None
+    names = [name for name in names if name != "id"]
+    return _Keyset(
+        tuple(names),
+        tuple(table.c[name] for name in names),
+        id_column,
+        directions.pop() if directions else False,
+        ordered_by_id,
+    )
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def _decode_value(column, value: Any) -> Any:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, (datetime, date)):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(keyset: _Keyset, item) -> str:
+    """Opaque token holding the sort key and id of the last item on a page"""
+    payload = {
+        "s": list(keyset.names),
+        "d": keyset.descending,
+        "k": [_encode_value(getattr(item, name)) for name in keyset.names],
+        "id": _encode_value(item.id),
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(keyset: _Keyset, cursor: str):
+    """Return the keyset condition selecting the rows after ``cursor``"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["s"] != list(keyset.names) or payload["d"] != keyset.descending:
+            raise ValueError("cursor belongs to a different sort order")
+        columns = keyset.columns + (keyset.id_column,)
+        # Bound with the column types so enums, UUIDs and datetimes compare as stored
+        values = [
+            literal(_decode_value(column, value), column.type)
+            for column, value in zip(columns, payload["k"] + [payload["id"]])
+        ]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+    if not keyset.columns:
+        return keyset.id_column < values[0] if keyset.descending else keyset.id_column > values[0]
+    # Row-value comparison so an index on the sort columns serves the seek
+    return tuple_(*columns) < tuple_(*values) if keyset.descending else tuple_(*columns) > tuple_(*values)
+
+
 def paginate_query(session: Session, query, pagination: PaginationParams):
     """
     Apply pagination to a SQLModel select() query.
 
     - Returns ORM instances for `items` (not Row objects).
-    - `total` is a plain int.
+    - `total` is a plain int, or None when the count was not requested.
+    - Queries that select one model ordered by its own non-null columns also
+      set `pagination.next_cursor`; with a cursor the page is read with an
+      indexed seek instead of OFFSET.
     """
-    # Efficient count over a subquery without ORDER BY
-    count_stmt = select(func.count()).select_from(query.order_by(None).subquery())
-    total: int = _scalar_one_compat(session.exec(count_stmt))
+    keyset = _keyset_order(query)
 
-    # Apply pagination and fetch ORM objects
-    paginated_stmt = query.offset(pagination.offset).limit(pagination.size)
-    items: List[T] = session.exec(paginated_stmt).all()
+    # Efficient count over a subquery without ORDER BY
+    total: Optional[int] = None
+    if pagination.wants_total:
+        count_stmt = select(func.count()).select_from(query.order_by(None).subquery())
+        total = _scalar_one_compat(session.exec(count_stmt))
+
+    # Apply pagination
+    if pagination.cursor:
+        if keyset is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not supported for this ordering",
+            )
+        paginated_query = query.where(decode_cursor(keyset, pagination.cursor))
+    else:
+        paginated_query = query.offset(pagination.offset)
+    if keyset is not None and not keyset.ordered_by_id:
+        # The id breaks ties so the order, and therefore the cursor, is total
+        paginated_query = paginated_query.order_by(
+            keyset.id_column.desc() if keyset.descending else keyset.id_column.asc(),
+        )
+
+    # One extra row tells whether another page exists
+    items: List[T] = session.exec(paginated_query.limit(pagination.size + 1)).all()
+    has_more = len(items) > pagination.size
+    items = items[:pagination.size]
+
+    pagination._next_cursor = encode_cursor(keyset, items[-1]) if keyset is not None and has_more else None
 
     return items, total
@@ -38,6 +38,12 @@ class Settings(BaseSettings):
     license_alert_days: int = 30  # Alert 30 days before license expiry
     health_cert_alert_days: int = 60  # Alert 60 days before health cert expiry
     training_validity_months: int = 24  # Default training validity period
+    certificate_alert_days: int = 30  # Alert 30 days before training certificate or document expiry
+    
+    # Expiry Scan
+    expiry_scan_enabled: bool = True  # Run the daily expiry scan
+    expiry_scan_check_minutes: int = 60  # How often to check whether today's scan has run
+    compliance_alert_recipients: List[str] = []  # User IDs receiving the daily expiry digest
     
     # Assignment Configuration
     max_daily_hours: int = 10  # Maximum driving hours per day
@@ -51,6 +57,12 @@ class Settings(BaseSettings):
     mobile_session_timeout: int = 86400  # 24 hours
     offline_sync_enabled: bool = True
     
+    # Location Tracking
+    location_buffer_max_size: int = 1000  # Flush once this many pings are buffered
+    location_flush_interval_seconds: float = 1.0  # Flush at least this often
+    location_partition_months_ahead: int = 2  # Monthly ping partitions created ahead of time
+    location_partition_check_seconds: float = 6 * 3600  # How often the flush task re-checks partitions
+    
     # Performance Tracking
     performance_review_period_months: int = 6
     incident_severity_weights: Dict[str, int] = {
@@ -2,7 +2,10 @@
 Database configuration and session management for driver service
 """
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import text
 from config import settings
+from typing import List
+from datetime import date, timedelta
 import redis
 import logging
 
@@ -39,6 +42,98 @@ def create_db_and_tables():
         raise
 
 
+def location_partition_statements(month_start: date) -> List[str]:
+    """DDL that creates the GPS ping partition of ``month_start``'s month
+
+    ``CREATE TABLE ... PARTITION OF`` fails once the default partition holds
+    pings of that month, so the partition is created standalone, those rows
+    are moved into it and it is attached afterwards. The default partition
+    is locked against writes while its rows move.
+    """
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    partition = f"driver_location_pings_{month_start:%Y_%m}"
+    in_month = (
+        f"recorded_at >= '{month_start.isoformat()}' "
+        f"AND recorded_at < '{next_month.isoformat()}'"
+    )
+    return [
+        f"CREATE TABLE {partition} "
+        f"(LIKE driver_location_pings INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        "LOCK TABLE driver_location_pings_default IN EXCLUSIVE MODE",
+        f"WITH moved AS (DELETE FROM driver_location_pings_default WHERE {in_month} RETURNING *) "
+        f"INSERT INTO {partition} SELECT * FROM moved",
+        f"ALTER TABLE driver_location_pings ATTACH PARTITION {partition} "
+        f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}')"
+    ]
+
+
+def ensure_location_partitions(months_ahead: int = settings.location_partition_months_ahead):
+    """Create monthly partitions of the GPS ping table up to ``months_ahead``
+
+    Only applies to PostgreSQL; other backends store pings in a plain table.
+    A default partition catches late or far-future pings so inserts never fail.
+    Runs at startup and periodically from the ping flush task, so
+    long-running processes keep creating partitions ahead of time.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    month_start = date.today().replace(day=1)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS driver_location_pings_default "
+            "PARTITION OF driver_location_pings DEFAULT"
+        ))
+    for _ in range(months_ahead + 1):
+        partition = f"driver_location_pings_{month_start:%Y_%m}"
+        # One transaction per month so a failure leaves the others in place
+        with engine.begin() as conn:
+            if conn.scalar(text(f"SELECT to_regclass('{partition}')")) is None:
+                for statement in location_partition_statements(month_start):
+                    conn.execute(text(statement))
+                logger.info(f"Created driver location partition {partition}")
+        month_start = (month_start + timedelta(days=32)).replace(day=1)
+    logger.info("Driver location partitions ensured")
+
+
+def ensure_expiry_indexes():
+    """Create the partial expiry-scan indexes on tables that predate them
+
+    ``create_all`` skips indexes of tables that already exist, so the
+    ``ix_expiry_*`` indexes are created individually.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name and index.name.startswith("ix_expiry_"):
+                index.create(engine, checkfirst=True)
+    logger.info("Expiry scan indexes ensured")
+
+
+# Columns matched by utils.search, indexed with pg_trgm
+TRIGRAM_INDEXED_COLUMNS = {
+    "drivers": ["full_name", "license_number", "employee_id"]
+}
+
+
+def ensure_search_indexes():
+    """Create the pg_trgm GIN indexes used by fuzzy search
+
+    Only applies to PostgreSQL. Safe to run on every startup.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, columns in TRIGRAM_INDEXED_COLUMNS.items():
+            for column in columns:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_trgm_{table}_{column} "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                ))
+    logger.info("Search indexes ensured")
+
+
 def get_session():
     """Get database session"""
     with Session(engine) as session:
@@ -6,10 +6,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from config import settings
-from database import create_db_and_tables
+from database import create_db_and_tables, ensure_location_partitions, ensure_expiry_indexes, ensure_search_indexes
 from routers import (
-    drivers_router, assignments_router, training_router, incidents_router, mobile_router
+    drivers_router, assignments_router, training_router, incidents_router, mobile_router,
+    locations_router, expiry_alerts_router
 )
+from services.location_service import location_buffer
+from services.expiry_scan_service import expiry_scheduler
+from utils.upload import shutdown_image_pool
 import logging
 
 
@@ -64,9 +68,24 @@ async def internal_server_error_handler(request: Request, exc: Exception):
 async def startup_event():
     """Initialize database and create tables"""
     create_db_and_tables()
+    ensure_location_partitions()
+    ensure_expiry_indexes()
+    ensure_search_indexes()
+    location_buffer.start()
+    if settings.expiry_scan_enabled:
+        expiry_scheduler.start()
     logger.info("Driver management database initialized successfully")
 
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush buffered location pings and stop background jobs before exiting"""
+    await location_buffer.stop()
+    await expiry_scheduler.stop()
+    shutdown_image_pool()
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -84,6 +103,8 @@ app.include_router(assignments_router, prefix="/api/v1")
 app.include_router(training_router, prefix="/api/v1")
 app.include_router(incidents_router, prefix="/api/v1")
 app.include_router(mobile_router, prefix="/api/v1/mobile")
+app.include_router(locations_router, prefix="/api/v1")
+app.include_router(expiry_alerts_router, prefix="/api/v1")
 
 
 # Root endpoint
@@ -102,6 +123,7 @@ async def root():
             "Training record management",
             "Incident reporting and tracking",
             "Mobile API for driver access",
+            "Real-time driver GPS tracking",
             "Compliance monitoring and alerts",
             "Performance analytics and reporting"
         ]
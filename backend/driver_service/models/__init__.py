@@ -6,11 +6,16 @@ from .driver_assignment import DriverAssignment, AssignmentStatus
 from .driver_training import DriverTrainingRecord, TrainingType, TrainingStatus
 from .driver_incident import DriverIncident, IncidentType, IncidentSeverity, IncidentStatus
 from .driver_document import DriverDocument, DocumentType, DocumentStatus
+from .driver_location import DriverLocationPing
+from .driver_metrics import DriverMonthlyMetrics
+from .expiry_alert import ExpiryAlert, ExpiryStage, ExpiryAlertStatus
 
 __all__ = [
     "Driver", "Gender", "LicenseType", "EmploymentType", "DriverStatus",
     "DriverAssignment", "AssignmentStatus",
     "DriverTrainingRecord", "TrainingType", "TrainingStatus",
     "DriverIncident", "IncidentType", "IncidentSeverity", "IncidentStatus",
-    "DriverDocument", "DocumentType", "DocumentStatus"
+    "DriverDocument", "DocumentType", "DocumentStatus",
+    "DriverLocationPing", "DriverMonthlyMetrics",
+    "ExpiryAlert", "ExpiryStage", "ExpiryAlertStatus"
 ]
\ No newline at end of file
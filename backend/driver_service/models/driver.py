@@ -2,6 +2,7 @@
 Driver model for driver management
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List
 from datetime import datetime, date
 from enum import Enum
@@ -177,4 +178,16 @@ class Driver(SQLModel, table=True):
             self.status == DriverStatus.ACTIVE and
             not self.is_license_expired() and
             not self.is_health_cert_expired()
-        )
\ No newline at end of file
+        )
+
+
+# Partial indexes for the daily expiry scan, which only looks at working drivers
+EXPIRY_SCAN_STATUSES = [DriverStatus.ACTIVE, DriverStatus.ON_LEAVE]
+Index(
+    "ix_expiry_drivers_license", Driver.license_expiry_date,
+    postgresql_where=Driver.status.in_(EXPIRY_SCAN_STATUSES)
+)
+Index(
+    "ix_expiry_drivers_health_certificate", Driver.health_certificate_expiry,
+    postgresql_where=Driver.status.in_(EXPIRY_SCAN_STATUSES)
+)
@@ -98,8 +98,13 @@ class DriverAssignment(SQLModel, table=True):
         if not self.actual_start_time or not self.completed_at:
             return None
         
+        return self.started_on_time(self.start_date, self.actual_start_time)
+    
+    @staticmethod
+    def started_on_time(start_date: date, actual_start_time: datetime) -> bool:
+        """Check if an actual start falls within tolerance of the scheduled start"""
         # Consider on-time if started within 30 minutes of scheduled time
-        scheduled_start = datetime.combine(self.start_date, datetime.min.time())
-        time_diff = abs((self.actual_start_time - scheduled_start).total_seconds() / 60)
+        scheduled_start = datetime.combine(start_date, datetime.min.time())
+        time_diff = abs((actual_start_time - scheduled_start).total_seconds() / 60)
         
         return time_diff <= 30  # 30 minutes tolerance
\ No newline at end of file
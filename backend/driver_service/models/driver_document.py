@@ -2,6 +2,7 @@
 Driver document model for document management
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional
 from datetime import datetime, date
 from enum import Enum
@@ -101,4 +102,11 @@ class DriverDocument(SQLModel, table=True):
     
     def get_file_size_mb(self) -> float:
         """Get file size in MB"""
-        return round(self.file_size / (1024 * 1024), 2)
\ No newline at end of file
+        return round(self.file_size / (1024 * 1024), 2)
+
+
+# Partial index for the daily expiry scan
+Index(
+    "ix_expiry_driver_documents_expiry_date", DriverDocument.expiry_date,
+    postgresql_where=DriverDocument.status == DocumentStatus.APPROVED
+)
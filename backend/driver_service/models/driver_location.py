@@ -0,0 +1,36 @@
+"""
+Driver location ping model for GPS tracking
+"""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from typing import Optional
+from datetime import datetime
+import uuid
+
+
+class DriverLocationPing(SQLModel, table=True):
+    """Append-only GPS ping history, range-partitioned by month on PostgreSQL"""
+    __tablename__ = "driver_location_pings"
+    __table_args__ = (
+        Index("ix_driver_location_pings_driver_recorded", "driver_id", "recorded_at"),
+        Index("ix_driver_location_pings_assignment_recorded", "assignment_id", "recorded_at"),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
+
+    # The partition key must be part of the primary key on a partitioned table
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    recorded_at: datetime = Field(primary_key=True)
+
+    # References (no foreign keys so partitions stay cheap to attach/detach)
+    driver_id: uuid.UUID
+    assignment_id: Optional[uuid.UUID] = Field(default=None)
+
+    # Position
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    accuracy_m: Optional[float] = Field(default=None, ge=0)
+    speed_kmh: Optional[float] = Field(default=None, ge=0)
+    heading: Optional[float] = Field(default=None, ge=0, lt=360)
+
+    # Server receive time
+    received_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,43 @@
+"""
+Driver metrics snapshot model for precomputed performance counters
+"""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import UniqueConstraint
+from typing import Optional
+from datetime import datetime, date
+import uuid
+
+
+class DriverMonthlyMetrics(SQLModel, table=True):
+    """Per-driver, per-month performance counters
+
+    Rows are bumped incrementally by assignment and incident state
+    transitions, so metrics over any window of months are a SUM over at
+    most a handful of rows instead of a scan of the assignment history.
+    """
+    __tablename__ = "driver_monthly_metrics"
+    __table_args__ = (
+        UniqueConstraint("driver_id", "month", name="uq_driver_monthly_metrics_driver_month"),
+    )
+
+    id: Optional[uuid.UUID] = Field(
+        default_factory=uuid.uuid4, primary_key=True
+    )
+
+    driver_id: uuid.UUID = Field(foreign_key="drivers.id", index=True)
+    month: date = Field(index=True)  # First day of the month
+
+    # Assignment counters (bucketed by assignment start date)
+    total_assignments: int = Field(default=0)
+    completed_assignments: int = Field(default=0)
+    cancelled_assignments: int = Field(default=0)
+    on_time_assignments: int = Field(default=0)
+    rating_sum: float = Field(default=0)
+    rating_count: int = Field(default=0)
+
+    # Incident counters (bucketed by incident date)
+    incident_count: int = Field(default=0)
+    serious_incident_count: int = Field(default=0)  # Major and critical
+
+    # Timestamps
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -2,6 +2,7 @@
 Driver training record model
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional
 from datetime import datetime, date
 from enum import Enum
@@ -113,4 +114,11 @@ class DriverTrainingRecord(SQLModel, table=True):
         elif self.score >= 80:
             return "Effective"
         else:
-            return "Moderately Effective"
\ No newline at end of file
+            return "Moderately Effective"
+
+
+# Partial index for the daily expiry scan
+Index(
+    "ix_expiry_driver_training_certificate", DriverTrainingRecord.certificate_valid_until,
+    postgresql_where=DriverTrainingRecord.certificate_issued == True
+)
@@ -0,0 +1,88 @@
+"""
+Expiry alert model for the precomputed driver compliance queue
+"""
+from sqlmodel import SQLModel, Field, select
+from sqlalchemy import UniqueConstraint, Index
+from typing import Optional
+from datetime import datetime, date
+from enum import Enum
+import uuid
+
+
+class ExpiryStage(str, Enum):
+    """Expiry stage enumeration"""
+    UPCOMING = "Upcoming"  # Within the compliance alert window
+    IMMINENT = "Imminent"  # Within 7 days
+    EXPIRED = "Expired"
+
+
+class ExpiryAlertStatus(str, Enum):
+    """Expiry alert status enumeration"""
+    PENDING = "Pending"  # Queued, not yet notified
+    DISPATCHED = "Dispatched"
+    RESOLVED = "Resolved"  # Renewed, deactivated or superseded by a later stage
+
+
+class ExpiryAlert(SQLModel, table=True):
+    """Driver license, certificate or document expiry alert
+
+    Written by the daily expiry scan. The unique key includes the expiry
+    date, so renewing an item restarts its alerts while rescans of the
+    same item and stage are ignored.
+    """
+    __tablename__ = "expiry_alerts"
+    __table_args__ = (
+        UniqueConstraint(
+            "source_type", "source_id", "expiry_date", "stage",
+            name="uq_expiry_alerts_source_stage"
+        ),
+        Index("ix_expiry_alerts_status_expiry", "status", "expiry_date"),
+    )
+
+    id: Optional[uuid.UUID] = Field(
+        default_factory=uuid.uuid4, primary_key=True
+    )
+
+    # Source
+    source_type: str = Field(max_length=50)  # license, health_cert, training, document
+    source_id: uuid.UUID = Field(index=True)
+    driver_id: uuid.UUID = Field(foreign_key="drivers.id", index=True)
+    label: str = Field(max_length=255)  # Driver name, training or document title
+
+    # Alert
+    expiry_date: date
+    stage: ExpiryStage
+    status: ExpiryAlertStatus = Field(default=ExpiryAlertStatus.PENDING)
+
+    # Timestamps
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    dispatched_at: Optional[datetime] = Field(default=None)
+    resolved_at: Optional[datetime] = Field(default=None)
+
+    def days_until_expiry(self, today: Optional[date] = None) -> int:
+        """Get days until the source expires"""
+        return (self.expiry_date - (today or date.today())).days
+
+    @staticmethod
+    def stage_for(expiry_date: date, today: date) -> ExpiryStage:
+        """Get the alert stage for an expiry date"""
+        days_left = (expiry_date - today).days
+        if days_left < 0:
+            return ExpiryStage.EXPIRED
+        if days_left <= 7:
+            return ExpiryStage.IMMINENT
+        return ExpiryStage.UPCOMING
+
+    @staticmethod
+    def open_source_ids(source_type: str, start: date, end: date):
+        """Select the sources with an open alert expiring between two dates
+
+        Served by ``ix_expiry_alerts_status_expiry``, so expiring-item
+        lists read the queue instead of scanning the source tables.
+        """
+        return select(ExpiryAlert.source_id).where(
+            ExpiryAlert.source_type == source_type,
+            ExpiryAlert.status != ExpiryAlertStatus.RESOLVED,
+            ExpiryAlert.expiry_date >= start,
+            ExpiryAlert.expiry_date <= end
+        )
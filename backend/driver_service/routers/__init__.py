@@ -6,5 +6,8 @@ from .assignments import router as assignments_router
 from .training import router as training_router
 from .incidents import router as incidents_router
 from .mobile import router as mobile_router
+from .locations import router as locations_router
+from .expiry_alerts import router as expiry_alerts_router
 
-__all__ = ["drivers_router", "assignments_router", "training_router", "incidents_router", "mobile_router"]
\ No newline at end of file
+__all__ = ["drivers_router", "assignments_router", "training_router", "incidents_router", "mobile_router", "locations_router",
+           "expiry_alerts_router"]
\ No newline at end of file
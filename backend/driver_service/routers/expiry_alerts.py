@@ -0,0 +1,44 @@
+"""
+Driver expiry alert routes
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from database import get_session
+from schemas.expiry_alert import ExpiryAlertResponse, ExpiryScanResult
+from models.expiry_alert import ExpiryStage
+from utils.auth import require_permission, CurrentUser
+from services.expiry_scan_service import ExpiryScanService
+from typing import List, Optional
+import uuid
+
+
+router = APIRouter(prefix="/expiry-alerts", tags=["Expiry Alerts"])
+
+
+@router.get("/", response_model=List[ExpiryAlertResponse])
+async def get_expiry_alerts(
+    driver_id: Optional[uuid.UUID] = Query(None, description="Filter by driver"),
+    source_type: Optional[str] = Query(None, description="license, health_cert, training or document"),
+    stage: Optional[ExpiryStage] = Query(None, description="Filter by expiry stage"),
+    include_resolved: bool = Query(False, description="Include renewed and superseded alerts"),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("drivers", "read", "all"))
+):
+    """Get precomputed license, certificate and document expiry alerts"""
+    expiry_service = ExpiryScanService(session)
+    return expiry_service.get_alerts(
+        driver_id=driver_id,
+        source_type=source_type,
+        stage=stage,
+        include_resolved=include_resolved
+    )
+
+
+@router.post("/scan", response_model=ExpiryScanResult)
+async def run_expiry_scan(
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("drivers", "update", "all"))
+):
+    """Run the expiry scan now instead of waiting for the daily job"""
+    expiry_service = ExpiryScanService(session)
+    return await expiry_service.run_scan()
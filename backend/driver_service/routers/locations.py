@@ -0,0 +1,90 @@
+"""
+Driver location routes for dispatch
+"""
+from fastapi import APIRouter, Depends, Query, HTTPException, status
+from sqlmodel import Session
+from database import get_session
+from schemas.driver_location import DriverPosition, LocationHistoryPoint
+from utils.auth import require_permission, CurrentUser
+from services.location_service import LocationService, location_buffer, position_index
+from typing import List, Optional
+from datetime import datetime, timedelta
+import uuid
+
+
+router = APIRouter(prefix="/locations", tags=["Driver Locations"])
+
+
+@router.get("/latest", response_model=List[DriverPosition])
+async def get_latest_positions(
+    driver_ids: Optional[str] = Query(None, description="Comma-separated driver IDs to restrict to"),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("drivers", "read", "all"))
+):
+    """Get the latest known position of every driver for the dispatch board"""
+    location_service = LocationService(session, location_buffer, position_index)
+    id_list = None
+    if driver_ids:
+        try:
+            id_list = [uuid.UUID(i.strip()) for i in driver_ids.split(",") if i.strip()]
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid driver ID format"
+            )
+    return await location_service.get_latest_positions(id_list)
+
+
+@router.get("/drivers/{driver_id}/latest", response_model=DriverPosition)
+async def get_driver_position(
+    driver_id: uuid.UUID,
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("drivers", "read", "all"))
+):
+    """Get the latest known position of a driver"""
+    location_service = LocationService(session, location_buffer, position_index)
+    position = await location_service.get_driver_position(driver_id)
+    if not position:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No position reported for this driver"
+        )
+    return position
+
+
+@router.get("/assignments/{assignment_id}/latest", response_model=DriverPosition)
+async def get_assignment_position(
+    assignment_id: uuid.UUID,
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("assignments", "read", "all"))
+):
+    """Get the latest known position reported for an assignment"""
+    location_service = LocationService(session, location_buffer, position_index)
+    position = await location_service.get_assignment_position(assignment_id)
+    if not position:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No position reported for this assignment"
+        )
+    return position
+
+
+@router.get("/drivers/{driver_id}/history", response_model=List[LocationHistoryPoint])
+async def get_driver_track(
+    driver_id: uuid.UUID,
+    start: Optional[datetime] = Query(None, description="Window start (defaults to 24 hours ago)"),
+    end: Optional[datetime] = Query(None, description="Window end (defaults to now)"),
+    limit: int = Query(5000, ge=1, le=20000),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("drivers", "read", "all"))
+):
+    """Get a driver's GPS track for a time window"""
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(hours=24)
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Start must be before end"
+        )
+    location_service = LocationService(session, location_buffer, position_index)
+    return await location_service.get_driver_track(driver_id, start, end, limit)
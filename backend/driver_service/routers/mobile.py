@@ -11,8 +11,10 @@ from schemas.mobile import (
     DriverDashboard, AssignmentDetails, OfflineDataBundle, 
     StatusUpdate, IncidentReport
 )
+from schemas.driver_location import LocationBatch, LocationBatchAck
 from utils.auth import get_current_user, CurrentUser
 from services.mobile_service import MobileService
+from services.location_service import LocationService, location_buffer, position_index
 from typing import List, Optional
 from datetime import date
 import uuid
@@ -78,6 +80,17 @@ async def update_assignment_status(
     )
 
 
+@router.post("/locations", response_model=LocationBatchAck, status_code=status.HTTP_202_ACCEPTED)
+async def upload_locations(
+    batch: LocationBatch,
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Upload a batch of timestamped GPS pings from the driver app"""
+    location_service = LocationService(session, location_buffer, position_index)
+    return await location_service.ingest_pings(current_user.user_id, batch.pings)
+
+
 @router.get("/assignments/today", response_model=List[DriverAssignmentResponse])
 async def get_today_assignments(
     session: Session = Depends(get_session),
@@ -25,6 +25,10 @@ from .mobile import (
     DriverDashboard, AssignmentDetails, OfflineDataBundle,
     StatusUpdate, IncidentReport, NotificationItem, PerformanceMetrics
 )
+from .driver_location import (
+    LocationPing, LocationBatch, LocationBatchAck, DriverPosition, LocationHistoryPoint
+)
+from .expiry_alert import ExpiryAlertResponse, ExpiryScanResult
 
 __all__ = [
     # Driver schemas
@@ -49,5 +53,11 @@ __all__ = [
     
     # Mobile schemas
     "DriverDashboard", "AssignmentDetails", "OfflineDataBundle",
-    "StatusUpdate", "IncidentReport", "NotificationItem", "PerformanceMetrics"
+    "StatusUpdate", "IncidentReport", "NotificationItem", "PerformanceMetrics",
+    
+    # Location schemas
+    "LocationPing", "LocationBatch", "LocationBatchAck", "DriverPosition", "LocationHistoryPoint",
+    
+    # Expiry alert schemas
+    "ExpiryAlertResponse", "ExpiryScanResult"
 ]
\ No newline at end of file
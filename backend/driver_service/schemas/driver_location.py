@@ -0,0 +1,64 @@
+"""
+Driver location tracking Pydantic schemas
+"""
+from pydantic import BaseModel, Field, validator
+from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+import uuid
+
+
+class LocationPing(BaseModel):
+    """Single timestamped GPS ping from the driver app"""
+    recorded_at: datetime
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+    accuracy_m: Optional[float] = Field(None, ge=0)
+    speed_kmh: Optional[float] = Field(None, ge=0)
+    heading: Optional[float] = Field(None, ge=0, lt=360)
+    assignment_id: Optional[uuid.UUID] = None
+
+    @validator('recorded_at')
+    def validate_recorded_at(cls, v):
+        # Stored as naive UTC like the rest of the service
+        if v.tzinfo is not None:
+            v = v.astimezone(timezone.utc).replace(tzinfo=None)
+        # Device clocks drift; reject anything clearly in the future
+        if v > datetime.utcnow() + timedelta(minutes=5):
+            raise ValueError('Ping timestamp is in the future')
+        return v
+
+
+class LocationBatch(BaseModel):
+    """Batch of pings buffered on the device between uploads"""
+    pings: List[LocationPing] = Field(..., min_items=1, max_items=500)
+
+
+class LocationBatchAck(BaseModel):
+    """Acknowledgement for an ingested ping batch"""
+    accepted: int
+    latest_recorded_at: datetime
+
+
+class DriverPosition(BaseModel):
+    """Latest known position of a driver"""
+    driver_id: uuid.UUID
+    assignment_id: Optional[uuid.UUID] = None
+    latitude: float
+    longitude: float
+    accuracy_m: Optional[float] = None
+    speed_kmh: Optional[float] = None
+    heading: Optional[float] = None
+    recorded_at: datetime
+
+
+class LocationHistoryPoint(BaseModel):
+    """Historical ping for track playback"""
+    recorded_at: datetime
+    latitude: float
+    longitude: float
+    speed_kmh: Optional[float] = None
+    heading: Optional[float] = None
+    assignment_id: Optional[uuid.UUID] = None
+
+    class Config:
+        from_attributes = True
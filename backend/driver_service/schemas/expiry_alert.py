@@ -0,0 +1,30 @@
+"""
+Expiry alert schemas for the driver compliance queue
+"""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime, date
+from models.expiry_alert import ExpiryStage, ExpiryAlertStatus
+import uuid
+
+
+class ExpiryAlertResponse(BaseModel):
+    id: uuid.UUID
+    source_type: str
+    source_id: uuid.UUID
+    driver_id: uuid.UUID
+    label: str
+    expiry_date: date
+    stage: ExpiryStage
+    status: ExpiryAlertStatus
+    days_until_expiry: int
+    created_at: datetime
+    dispatched_at: Optional[datetime]
+    resolved_at: Optional[datetime]
+
+
+class ExpiryScanResult(BaseModel):
+    candidates: int
+    queued: int
+    resolved: int
+    dispatched: int
@@ -9,6 +9,8 @@ from .training_service import TrainingService
 from .incident_service import IncidentService
 from .document_service import DocumentService
 from .mobile_service import MobileService
+from .location_service import LocationService
+from .expiry_scan_service import ExpiryScanService
 
 __all__ = [
     "DriverService", 
@@ -18,5 +20,7 @@ __all__ = [
     "TrainingService", 
     "IncidentService", 
     "DocumentService", 
-    "MobileService"
+    "MobileService",
+    "LocationService",
+    "ExpiryScanService"
 ]
\ No newline at end of file
@@ -10,6 +10,7 @@ from schemas.driver_assignment import (
 )
 from utils.validation import validate_assignment_conflict, validate_driver_availability
 from utils.notifications import send_assignment_notification
+from services.metrics_service import DriverMetricsService
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import uuid
@@ -23,6 +24,7 @@ class AssignmentService:
     
     def __init__(self, session: Session):
         self.session = session
+        self.metrics_service = DriverMetricsService(session)
     
     async def create_assignment(
         self, 
@@ -71,8 +73,10 @@ class AssignmentService:
         )
         
         self.session.add(assignment)
+        self.metrics_service.record_assignment_created(assignment)
         self.session.commit()
         self.session.refresh(assignment)
+        self.metrics_service.invalidate(assignment.driver_id)
         
         # Send notification to driver
         try:
@@ -256,8 +260,14 @@ class AssignmentService:
         assignment.updated_at = datetime.utcnow()
         
         self.session.add(assignment)
+        
+        # Edits can move counters between months or statuses; recount this driver
+        if update_data.keys() & {"status", "start_date", "customer_rating"}:
+            self.metrics_service.rebuild_driver(assignment.driver_id)
+        
         self.session.commit()
         self.session.refresh(assignment)
+        self.metrics_service.invalidate(assignment.driver_id)
         
         logger.info(f"Updated assignment {assignment_id}")
         return self._to_response(assignment)
@@ -293,6 +303,7 @@ class AssignmentService:
         
         self.session.add(assignment)
         self.session.commit()
+        self.metrics_service.invalidate(assignment.driver_id)
         
         logger.info(f"Confirmed assignment {assignment_id}")
         return {"message": "Assignment confirmed successfully"}
@@ -329,6 +340,7 @@ class AssignmentService:
         
         self.session.add(assignment)
         self.session.commit()
+        self.metrics_service.invalidate(assignment.driver_id)
         
         logger.info(f"Started assignment {assignment_id}")
         return {"message": "Assignment started successfully"}
@@ -395,7 +407,9 @@ class AssignmentService:
                     driver.performance_rating = customer_rating
             self.session.add(driver)
         
+        self.metrics_service.record_assignment_completed(assignment)
         self.session.commit()
+        self.metrics_service.invalidate(assignment.driver_id)
         
         logger.info(f"Completed assignment {assignment_id}")
         return {"message": "Assignment completed successfully"}
@@ -433,7 +447,9 @@ class AssignmentService:
             assignment.notes = f"Cancelled: {reason}"
         
         self.session.add(assignment)
+        self.metrics_service.record_assignment_cancelled(assignment)
         self.session.commit()
+        self.metrics_service.invalidate(assignment.driver_id)
         
         logger.info(f"Cancelled assignment {assignment_id}")
         return {"message": "Assignment cancelled successfully"}
@@ -457,8 +473,11 @@ class AssignmentService:
                 detail="Assignment not found"
             )
         
+        driver_id = assignment.driver_id
         self.session.delete(assignment)
+        self.metrics_service.record_assignment_deleted(assignment)
         self.session.commit()
+        self.metrics_service.invalidate(driver_id)
         
         logger.info(f"Deleted assignment {assignment_id}")
         return {"message": "Assignment deleted successfully"}
@@ -514,8 +533,6 @@ class AssignmentService:
         Returns:
             Analytics data
         """
-        query = select(DriverAssignment)
-        
         # Apply date filters
         conditions = []
         if start_date:
@@ -525,23 +542,31 @@ class AssignmentService:
         if driver_id:
             conditions.append(DriverAssignment.driver_id == driver_id)
         
+        # Counts and average rating in one aggregate query
+        totals_query = select(
+            func.count(DriverAssignment.id),
+            func.count(DriverAssignment.id).filter(DriverAssignment.status == AssignmentStatus.COMPLETED),
+            func.count(DriverAssignment.id).filter(DriverAssignment.status == AssignmentStatus.CANCELLED),
+            func.avg(DriverAssignment.customer_rating)
+        )
         if conditions:
-            query = query.where(and_(*conditions))
+            totals_query = totals_query.where(and_(*conditions))
         
-        assignments = self.session.exec(query).all()
-        
-        # Calculate metrics
-        total_assignments = len(assignments)
-        completed_assignments = len([a for a in assignments if a.status == AssignmentStatus.COMPLETED])
-        cancelled_assignments = len([a for a in assignments if a.status == AssignmentStatus.CANCELLED])
-        
-        # Calculate ratings
-        rated_assignments = [a for a in assignments if a.customer_rating is not None]
-        average_rating = sum(a.customer_rating for a in rated_assignments) / len(rated_assignments) if rated_assignments else None
+        total_assignments, completed_assignments, cancelled_assignments, average_rating = (
+            self.session.exec(totals_query).one()
+        )
         
-        # Calculate on-time performance
-        on_time_assignments = [a for a in assignments if a.is_on_time() == True]
-        on_time_rate = len(on_time_assignments) / total_assignments * 100 if total_assignments > 0 else 0
+        # On-time performance only needs the two timing columns of finished assignments
+        timing_query = select(DriverAssignment.start_date, DriverAssignment.actual_start_time).where(
+            DriverAssignment.completed_at.is_not(None),
+            DriverAssignment.actual_start_time.is_not(None),
+            *conditions
+        )
+        on_time_count = sum(
+            1 for scheduled, actual in self.session.exec(timing_query)
+            if DriverAssignment.started_on_time(scheduled, actual)
+        )
+        on_time_rate = on_time_count / total_assignments * 100 if total_assignments > 0 else 0
         
         return {
             "total_assignments": total_assignments,
@@ -5,11 +5,15 @@ from sqlmodel import Session, select, and_
 from fastapi import HTTPException, status, UploadFile
 from models.driver_document import DriverDocument, DocumentType, DocumentStatus
 from models.driver import Driver
+from models.expiry_alert import ExpiryAlert
 from schemas.driver_document import (
     DriverDocumentCreate, DriverDocumentUpdate, DriverDocumentResponse
 )
 from utils.upload import process_upload, get_file_info
 from utils.validation import validate_driver_data
+from services.expiry_scan_service import DOCUMENT_SOURCE
+from services.metrics_service import DriverMetricsService
+from config import settings
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 import uuid
@@ -23,6 +27,7 @@ class DocumentService:
     
     def __init__(self, session: Session):
         self.session = session
+        self.metrics_service = DriverMetricsService(session)
     
     async def upload_document(
         self,
@@ -96,6 +101,7 @@ class DocumentService:
         self.session.add(document)
         self.session.commit()
         self.session.refresh(document)
+        self.metrics_service.invalidate(driver_id)
         
         logger.info(f"Uploaded document {document.id} for driver {driver.full_name}")
         return self._to_response(document)
@@ -177,6 +183,7 @@ class DocumentService:
         self.session.add(document)
         self.session.commit()
         self.session.refresh(document)
+        self.metrics_service.invalidate(document.driver_id)
         
         logger.info(f"Updated document {document_id}")
         return self._to_response(document)
@@ -213,6 +220,7 @@ class DocumentService:
         
         self.session.add(document)
         self.session.commit()
+        self.metrics_service.invalidate(document.driver_id)
         
         logger.info(f"Approved document {document_id}")
         return {"message": "Document approved successfully"}
@@ -256,6 +264,7 @@ class DocumentService:
         
         self.session.add(document)
         self.session.commit()
+        self.metrics_service.invalidate(document.driver_id)
         
         logger.info(f"Rejected document {document_id}: {rejection_reason}")
         return {"message": "Document rejected successfully"}
@@ -285,8 +294,10 @@ class DocumentService:
         handler.delete_file(document.file_path)
         
         # Delete database record
+        driver_id = document.driver_id
         self.session.delete(document)
         self.session.commit()
+        self.metrics_service.invalidate(driver_id)
         
         logger.info(f"Deleted document {document_id}")
         return {"message": "Document deleted successfully"}
@@ -301,17 +312,24 @@ class DocumentService:
             List of expiring documents
         """
         from datetime import timedelta
-        alert_date = date.today() + timedelta(days=days)
+        today = date.today()
+        alert_date = today + timedelta(days=days)
         
         query = select(DriverDocument).where(
             and_(
                 DriverDocument.expiry_date.is_not(None),
                 DriverDocument.expiry_date <= alert_date,
-                DriverDocument.expiry_date > date.today(),
+                DriverDocument.expiry_date > today,
                 DriverDocument.status == DocumentStatus.APPROVED
             )
         ).order_by(DriverDocument.expiry_date)
         
+        # Within the alert window the daily scan has queued every match
+        if days <= settings.certificate_alert_days:
+            query = query.where(
+                DriverDocument.id.in_(ExpiryAlert.open_source_ids(DOCUMENT_SOURCE, today, alert_date))
+            )
+        
         documents = self.session.exec(query).all()
         return [self._to_response(doc) for doc in documents]
     
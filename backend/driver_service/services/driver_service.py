@@ -8,6 +8,8 @@ from schemas.driver import (
     DriverCreate, DriverUpdate, DriverResponse, DriverSummary, 
     DriverSearch, DriverPerformance
 )
+from services.metrics_service import DriverMetricsService
+from utils.search import fuzzy_search_condition, similarity_rank
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 import uuid
@@ -18,6 +20,7 @@ class DriverService:
     
     def __init__(self, session: Session):
         self.session = session
+        self.metrics_service = DriverMetricsService(session)
     
     async def create_driver(self, driver_data: DriverCreate) -> DriverResponse:
         """Create a new driver"""
@@ -78,14 +81,13 @@ class DriverService:
         
         # Apply filters
         conditions = []
+        rank = None
         
         if search_criteria.query:
-            query_filter = or_(
-                Driver.full_name.ilike(f"%{search_criteria.query}%"),
-                Driver.license_number.ilike(f"%{search_criteria.query}%"),
-                Driver.employee_id.ilike(f"%{search_criteria.query}%")
-            )
-            conditions.append(query_filter)
+            search_columns = [Driver.full_name, Driver.license_number, Driver.employee_id]
+            dialect_name = self.session.get_bind().dialect.name
+            conditions.append(fuzzy_search_condition(search_columns, search_criteria.query, dialect_name))
+            rank = similarity_rank(search_columns, search_criteria.query, dialect_name)
         
         if search_criteria.status:
             conditions.append(Driver.status == search_criteria.status)
@@ -134,6 +136,10 @@ class DriverService:
             # For now, we'll filter in Python after the query
             pass
         
+        # Closest matches first when searching by text
+        if rank is not None:
+            statement = statement.order_by(rank.desc(), Driver.full_name)
+        
         statement = statement.offset(skip).limit(limit)
         drivers = self.session.exec(statement).all()
         
@@ -174,6 +180,7 @@ class DriverService:
         self.session.add(driver)
         self.session.commit()
         self.session.refresh(driver)
+        self.metrics_service.invalidate(driver.id)
         
         return self._to_response(driver)
     
@@ -193,6 +200,7 @@ class DriverService:
         
         self.session.add(driver)
         self.session.commit()
+        self.metrics_service.invalidate(driver.id)
         
         return {"message": "Driver deleted successfully"}
     
@@ -0,0 +1,344 @@
+"""
+Expiry scan service for driver licenses, certificates and documents
+"""
+from sqlmodel import Session, select
+from sqlalchemy import update
+from models.driver import Driver, EXPIRY_SCAN_STATUSES
+from models.driver_training import DriverTrainingRecord
+from models.driver_document import DriverDocument, DocumentStatus
+from models.expiry_alert import ExpiryAlert, ExpiryStage, ExpiryAlertStatus
+from schemas.expiry_alert import ExpiryAlertResponse, ExpiryScanResult
+from utils.notifications import NotificationService, send_compliance_alert
+from database import engine, redis_client as default_redis_client
+from config import settings
+from typing import List, Optional, Dict, Tuple, Any
+from datetime import datetime, date, timedelta
+import asyncio
+import redis
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+LICENSE_SOURCE = "license"
+HEALTH_CERT_SOURCE = "health_cert"
+TRAINING_SOURCE = "training"
+DOCUMENT_SOURCE = "document"
+
+SCAN_LOCK_TTL = 86400  # One scan per calendar day across replicas
+IN_CLAUSE_CHUNK_SIZE = 500
+
+AlertKey = Tuple[str, uuid.UUID, date, ExpiryStage]
+
+
+class ExpiryScanService:
+    """Service maintaining the driver expiry alert queue
+
+    Replaces per-request expiry scans with one daily pass: each source is
+    read through its partial ``ix_expiry_*`` index with only the columns
+    the alert needs, alerts already raised for the same item, expiry date
+    and stage are skipped, and the pending queue is sent through the
+    notification batch endpoint followed by one management digest.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        redis_client: Optional[redis.Redis] = None,
+        notification_service: Optional[NotificationService] = None
+    ):
+        self.session = session
+        self.redis = redis_client if redis_client is not None else default_redis_client
+        self.notifications = notification_service or NotificationService()
+
+    async def run_daily_scan(self, today: Optional[date] = None) -> Optional[ExpiryScanResult]:
+        """Run the scan unless another replica already ran it today
+
+        Returns:
+            The scan result, or None when the scan was skipped
+        """
+        today = today or date.today()
+        lock_key = f"expiry_scan:lock:{today.isoformat()}"
+        try:
+            if not self.redis.set(lock_key, "1", nx=True, ex=SCAN_LOCK_TTL):
+                return None
+        except redis.RedisError as e:
+            logger.warning(f"Expiry scan skipped, lock unavailable: {str(e)}")
+            return None
+
+        try:
+            return await self.run_scan(today)
+        except Exception:
+            # Let the next check retry today's scan
+            self.redis.delete(lock_key)
+            raise
+
+    async def run_scan(self, today: Optional[date] = None) -> ExpiryScanResult:
+        """Queue new alerts, resolve stale ones and dispatch the queue"""
+        today = today or date.today()
+        candidates = self._collect_candidates(today)
+        queued = self._queue_new_alerts(candidates)
+        resolved = self._resolve_stale_alerts(candidates)
+        self.session.commit()
+
+        dispatched = await self.dispatch_pending(today)
+        logger.info(
+            f"Driver expiry scan: {len(candidates)} candidates, {queued} queued, "
+            f"{resolved} resolved, {dispatched} dispatched"
+        )
+        return ExpiryScanResult(
+            candidates=len(candidates),
+            queued=queued,
+            resolved=resolved,
+            dispatched=dispatched
+        )
+
+    async def dispatch_pending(self, today: Optional[date] = None) -> int:
+        """Send every pending alert and mark the delivered ones dispatched
+
+        Alerts whose notification failed stay pending for the next scan.
+        """
+        today = today or date.today()
+        pending = self.session.exec(
+            select(ExpiryAlert)
+            .where(ExpiryAlert.status == ExpiryAlertStatus.PENDING)
+            .order_by(ExpiryAlert.expiry_date)
+        ).all()
+        if not pending:
+            return 0
+
+        results = await self.notifications.send_notifications([
+            self._build_notification(alert, today) for alert in pending
+        ])
+        delivered = [alert for alert, sent in zip(pending, results) if sent]
+        if delivered:
+            self.session.execute(
+                update(ExpiryAlert)
+                .where(ExpiryAlert.id.in_([alert.id for alert in delivered]))
+                .values(status=ExpiryAlertStatus.DISPATCHED, dispatched_at=datetime.utcnow())
+            )
+            self.session.commit()
+
+        if settings.compliance_alert_recipients:
+            await send_compliance_alert(
+                {
+                    "alert_type": "expiry_digest",
+                    "driver_count": len({alert.driver_id for alert in pending}),
+                    "critical_count": sum(alert.stage != ExpiryStage.UPCOMING for alert in pending),
+                    "warning_count": sum(alert.stage == ExpiryStage.UPCOMING for alert in pending)
+                },
+                settings.compliance_alert_recipients
+            )
+
+        return len(delivered)
+
+    def get_alerts(
+        self,
+        driver_id: Optional[uuid.UUID] = None,
+        source_type: Optional[str] = None,
+        stage: Optional[ExpiryStage] = None,
+        include_resolved: bool = False
+    ) -> List[ExpiryAlertResponse]:
+        """Get precomputed alerts, soonest expiry first"""
+        query = select(ExpiryAlert)
+        if not include_resolved:
+            query = query.where(ExpiryAlert.status != ExpiryAlertStatus.RESOLVED)
+        if driver_id:
+            query = query.where(ExpiryAlert.driver_id == driver_id)
+        if source_type:
+            query = query.where(ExpiryAlert.source_type == source_type)
+        if stage:
+            query = query.where(ExpiryAlert.stage == stage)
+
+        alerts = self.session.exec(query.order_by(ExpiryAlert.expiry_date)).all()
+        return [self._create_alert_response(alert) for alert in alerts]
+
+    def _collect_candidates(self, today: date) -> Dict[AlertKey, Dict[str, Any]]:
+        """Read the expiry columns of in-scope rows inside each alert window
+
+        Filters mirror the partial index predicates so each query is an
+        index range scan.
+        """
+        candidates: Dict[AlertKey, Dict[str, Any]] = {}
+
+        def add(source_type: str, source_id: uuid.UUID, driver_id: uuid.UUID, label: str, expiry_date: date):
+            key = (source_type, source_id, expiry_date, ExpiryAlert.stage_for(expiry_date, today))
+            candidates[key] = {"driver_id": driver_id, "label": label}
+
+        license_horizon = today + timedelta(days=settings.license_alert_days)
+        for driver_id, full_name, expiry_date in self.session.exec(
+            select(Driver.id, Driver.full_name, Driver.license_expiry_date).where(
+                Driver.status.in_(EXPIRY_SCAN_STATUSES),
+                Driver.license_expiry_date <= license_horizon
+            )
+        ).all():
+            add(LICENSE_SOURCE, driver_id, driver_id, full_name, expiry_date)
+
+        health_horizon = today + timedelta(days=settings.health_cert_alert_days)
+        for driver_id, full_name, expiry_date in self.session.exec(
+            select(Driver.id, Driver.full_name, Driver.health_certificate_expiry).where(
+                Driver.status.in_(EXPIRY_SCAN_STATUSES),
+                Driver.health_certificate_expiry <= health_horizon
+            )
+        ).all():
+            add(HEALTH_CERT_SOURCE, driver_id, driver_id, full_name, expiry_date)
+
+        certificate_horizon = today + timedelta(days=settings.certificate_alert_days)
+        for training_id, driver_id, title, expiry_date in self.session.exec(
+            select(
+                DriverTrainingRecord.id,
+                DriverTrainingRecord.driver_id,
+                DriverTrainingRecord.training_title,
+                DriverTrainingRecord.certificate_valid_until
+            ).where(
+                DriverTrainingRecord.certificate_issued == True,
+                DriverTrainingRecord.certificate_valid_until <= certificate_horizon
+            )
+        ).all():
+            add(TRAINING_SOURCE, training_id, driver_id, title, expiry_date)
+
+        for document_id, driver_id, title, expiry_date in self.session.exec(
+            select(
+                DriverDocument.id,
+                DriverDocument.driver_id,
+                DriverDocument.title,
+                DriverDocument.expiry_date
+            ).where(
+                DriverDocument.status == DocumentStatus.APPROVED,
+                DriverDocument.expiry_date <= certificate_horizon
+            )
+        ).all():
+            add(DOCUMENT_SOURCE, document_id, driver_id, title, expiry_date)
+
+        return candidates
+
+    def _queue_new_alerts(self, candidates: Dict[AlertKey, Dict[str, Any]]) -> int:
+        """Insert alerts for candidates that were never raised before"""
+        source_ids = list({key[1] for key in candidates})
+        existing = set()
+        for start in range(0, len(source_ids), IN_CLAUSE_CHUNK_SIZE):
+            rows = self.session.exec(
+                select(
+                    ExpiryAlert.source_type,
+                    ExpiryAlert.source_id,
+                    ExpiryAlert.expiry_date,
+                    ExpiryAlert.stage
+                ).where(ExpiryAlert.source_id.in_(source_ids[start:start + IN_CLAUSE_CHUNK_SIZE]))
+            ).all()
+            existing.update(tuple(row) for row in rows)
+
+        new_alerts = [
+            ExpiryAlert(
+                source_type=source_type,
+                source_id=source_id,
+                expiry_date=expiry_date,
+                stage=stage,
+                **details
+            )
+            for (source_type, source_id, expiry_date, stage), details in candidates.items()
+            if (source_type, source_id, expiry_date, stage) not in existing
+        ]
+        self.session.add_all(new_alerts)
+        self.session.flush()
+        return len(new_alerts)
+
+    def _resolve_stale_alerts(self, candidates: Dict[AlertKey, Dict[str, Any]]) -> int:
+        """Resolve open alerts for renewed items and superseded stages"""
+        open_alerts = self.session.exec(
+            select(
+                ExpiryAlert.id,
+                ExpiryAlert.source_type,
+                ExpiryAlert.source_id,
+                ExpiryAlert.expiry_date,
+                ExpiryAlert.stage
+            ).where(ExpiryAlert.status != ExpiryAlertStatus.RESOLVED)
+        ).all()
+        stale_ids = [row[0] for row in open_alerts if tuple(row[1:]) not in candidates]
+        if stale_ids:
+            self.session.execute(
+                update(ExpiryAlert)
+                .where(ExpiryAlert.id.in_(stale_ids))
+                .values(status=ExpiryAlertStatus.RESOLVED, resolved_at=datetime.utcnow())
+            )
+        return len(stale_ids)
+
+    def _build_notification(self, alert: ExpiryAlert, today: date) -> Dict[str, Any]:
+        """Build the driver notification for an alert"""
+        days_remaining = alert.days_until_expiry(today)
+        if days_remaining <= 7:
+            priority = "urgent"
+        elif days_remaining <= 14:
+            priority = "high"
+        else:
+            priority = "medium"
+
+        return {
+            "recipient_id": str(alert.driver_id),
+            "template_name": f"driver_{alert.source_type}_expiry_alert",
+            "variables": {
+                "item_type": alert.source_type.replace("_", " ").title(),
+                "item_name": alert.label,
+                "stage": alert.stage.value,
+                "expiry_date": alert.expiry_date.strftime("%Y-%m-%d"),
+                "days_remaining": days_remaining
+            },
+            "channels": ["email", "sms"],
+            "priority": priority
+        }
+
+    def _create_alert_response(self, alert: ExpiryAlert) -> ExpiryAlertResponse:
+        """Create alert response with calculated fields"""
+        return ExpiryAlertResponse(
+            id=alert.id,
+            source_type=alert.source_type,
+            source_id=alert.source_id,
+            driver_id=alert.driver_id,
+            label=alert.label,
+            expiry_date=alert.expiry_date,
+            stage=alert.stage,
+            status=alert.status,
+            days_until_expiry=alert.days_until_expiry(),
+            created_at=alert.created_at,
+            dispatched_at=alert.dispatched_at,
+            resolved_at=alert.resolved_at
+        )
+
+
+class ExpiryScanScheduler:
+    """Background task that checks every ``check_interval`` seconds whether
+    today's expiry scan has run, and runs it if not"""
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> Optional[ExpiryScanResult]:
+        """Run today's scan if it has not run yet"""
+        with Session(engine) as session:
+            return await ExpiryScanService(session).run_daily_scan()
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Driver expiry scan failed: {str(e)}")
+            await asyncio.sleep(self.check_interval)
+
+    def start(self):
+        """Start the periodic scan task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the periodic scan task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+expiry_scheduler = ExpiryScanScheduler(settings.expiry_scan_check_minutes * 60)
@@ -9,6 +9,7 @@ from schemas.driver_incident import (
     DriverIncidentCreate, DriverIncidentUpdate, DriverIncidentResponse
 )
 from utils.notifications import send_incident_notification
+from services.metrics_service import DriverMetricsService
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import uuid
@@ -22,6 +23,7 @@ class IncidentService:
     
     def __init__(self, session: Session):
         self.session = session
+        self.metrics_service = DriverMetricsService(session)
     
     async def create_incident(
         self, 
@@ -56,6 +58,7 @@ class IncidentService:
         )
         
         self.session.add(incident)
+        self.metrics_service.record_incident_created(incident)
         self.session.commit()
         self.session.refresh(incident)
         
@@ -63,6 +66,7 @@ class IncidentService:
         driver.total_incidents += 1
         self.session.add(driver)
         self.session.commit()
+        self.metrics_service.invalidate(incident.driver_id)
         
         # Send notifications for critical incidents
         if incident.requires_immediate_attention():
@@ -250,8 +254,14 @@ class IncidentService:
         incident.updated_at = datetime.utcnow()
         
         self.session.add(incident)
+        
+        # Severity or date edits move counters; recount this driver
+        if update_data.keys() & {"severity", "incident_date"}:
+            self.metrics_service.rebuild_driver(incident.driver_id)
+        
         self.session.commit()
         self.session.refresh(incident)
+        self.metrics_service.invalidate(incident.driver_id)
         
         logger.info(f"Updated incident {incident_id}")
         return self._to_response(incident)
@@ -444,8 +454,11 @@ class IncidentService:
             driver.total_incidents -= 1
             self.session.add(driver)
         
+        driver_id = incident.driver_id
         self.session.delete(incident)
+        self.metrics_service.record_incident_deleted(incident)
         self.session.commit()
+        self.metrics_service.invalidate(driver_id)
         
         logger.info(f"Deleted incident {incident_id}")
         return {"message": "Incident deleted successfully"}
@@ -0,0 +1,352 @@
+"""
+Location service for high-frequency driver GPS ingestion
+"""
+from sqlmodel import Session, select
+from sqlalchemy import insert
+from fastapi import HTTPException, status
+from models.driver_location import DriverLocationPing
+from models.driver_assignment import DriverAssignment
+from schemas.driver_location import (
+    LocationPing, LocationBatchAck, DriverPosition, LocationHistoryPoint
+)
+from config import settings
+from database import engine, redis_client, ensure_location_partitions
+from typing import List, Optional, Dict, Any, Iterable
+from datetime import datetime
+import asyncio
+import json
+import redis
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+LATEST_BY_DRIVER_KEY = "driver_locations:latest:drivers"
+LATEST_BY_ASSIGNMENT_KEY = "driver_locations:latest:assignments"
+
+# ARGV holds (field, recorded_at, position) triples; a field is only
+# written when it is missing or holds an older ping
+MERGE_LATEST_SCRIPT = """
+local written = 0
+for i = 1, #ARGV, 3 do
+    local current = redis.call('HGET', KEYS[1], ARGV[i])
+    if not current or cjson.decode(current)['recorded_at'] < ARGV[i + 1] then
+        redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 2])
+        written = written + 1
+    end
+end
+return written
+"""
+
+
+class LatestPositionIndex:
+    """Latest-position index per driver and per assignment
+
+    Positions are kept in two Redis hashes so "where is everyone now" is a
+    single HGETALL over one field per driver, independent of ping history.
+    Updates are compared and set by a Lua script, so concurrent writers
+    keep the newest ping.
+    A process-local copy is kept as a fallback while Redis is unreachable.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        self.redis = redis_client
+        self._merge_script = redis_client.register_script(MERGE_LATEST_SCRIPT) if redis_client is not None else None
+        self._drivers: Dict[str, str] = {}
+        self._assignments: Dict[str, str] = {}
+
+    def update(self, positions: Iterable[Dict[str, Any]]):
+        """Record positions, keeping only the newest ping per driver/assignment"""
+        by_driver: Dict[str, Dict[str, Any]] = {}
+        by_assignment: Dict[str, Dict[str, Any]] = {}
+        for position in positions:
+            driver_key = position["driver_id"]
+            if driver_key not in by_driver or position["recorded_at"] > by_driver[driver_key]["recorded_at"]:
+                by_driver[driver_key] = position
+            assignment_key = position.get("assignment_id")
+            if assignment_key and (
+                assignment_key not in by_assignment
+                or position["recorded_at"] > by_assignment[assignment_key]["recorded_at"]
+            ):
+                by_assignment[assignment_key] = position
+
+        self._merge(LATEST_BY_DRIVER_KEY, self._drivers, by_driver)
+        self._merge(LATEST_BY_ASSIGNMENT_KEY, self._assignments, by_assignment)
+
+    def _merge(self, key: str, local: Dict[str, str], candidates: Dict[str, Dict[str, Any]]):
+        """Write candidates that are newer than what the index already holds"""
+        if not candidates:
+            return
+
+        local.update({
+            field: json.dumps(candidate)
+            for field, candidate in candidates.items()
+            if field not in local or json.loads(local[field])["recorded_at"] < candidate["recorded_at"]
+        })
+
+        if self.redis is not None:
+            args = []
+            for field, candidate in candidates.items():
+                args.extend((field, candidate["recorded_at"], json.dumps(candidate)))
+            try:
+                # Compare and set inside Redis so concurrent batches cannot
+                # overwrite a newer position with an older one
+                self._merge_script(keys=[key], args=args)
+            except redis.RedisError as e:
+                logger.warning(f"Latest-position index write failed: {str(e)}")
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Get the latest position of every driver"""
+        return [json.loads(v) for v in self._read_all(LATEST_BY_DRIVER_KEY, self._drivers).values()]
+
+    def get_driver(self, driver_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """Get the latest position of a driver"""
+        return self._read_one(LATEST_BY_DRIVER_KEY, self._drivers, str(driver_id))
+
+    def get_assignment(self, assignment_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """Get the latest position reported for an assignment"""
+        return self._read_one(LATEST_BY_ASSIGNMENT_KEY, self._assignments, str(assignment_id))
+
+    def _read_all(self, key: str, local: Dict[str, str]) -> Dict[str, str]:
+        if self.redis is not None:
+            try:
+                return self.redis.hgetall(key)
+            except redis.RedisError as e:
+                logger.warning(f"Latest-position index read failed, using local copy: {str(e)}")
+        return dict(local)
+
+    def _read_one(self, key: str, local: Dict[str, str], field: str) -> Optional[Dict[str, Any]]:
+        value = local.get(field)
+        if self.redis is not None:
+            try:
+                value = self.redis.hget(key, field)
+            except redis.RedisError as e:
+                logger.warning(f"Latest-position index read failed, using local copy: {str(e)}")
+        return json.loads(value) if value else None
+
+
+class LocationIngestBuffer:
+    """In-process buffer that writes pings to the history table in bulk
+
+    Pings are flushed with one multi-row INSERT when the buffer reaches
+    ``max_size`` or every ``flush_interval`` seconds, whichever comes first.
+    Every ``partition_interval`` seconds the flush task also creates the
+    upcoming monthly partitions.
+    """
+
+    def __init__(
+        self,
+        engine,
+        max_size: int = settings.location_buffer_max_size,
+        flush_interval: float = settings.location_flush_interval_seconds,
+        partition_interval: float = settings.location_partition_check_seconds,
+        ensure_partitions=ensure_location_partitions
+    ):
+        self.engine = engine
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.partition_interval = partition_interval
+        self.ensure_partitions = ensure_partitions
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, rows: List[Dict[str, Any]]):
+        """Queue rows, flushing immediately when the size trigger is hit"""
+        self._pending.extend(rows)
+        if len(self._pending) >= self.max_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write all buffered pings in one bulk insert
+
+        Returns:
+            Number of pings written
+        """
+        async with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                # Keep the batch for the next attempt unless the backlog is runaway
+                logger.error(f"Failed to flush {len(batch)} location pings: {str(e)}")
+                if len(self._pending) + len(batch) <= self.max_size * 10:
+                    self._pending = batch + self._pending
+                return 0
+            return len(batch)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        with Session(self.engine) as session:
+            session.execute(insert(DriverLocationPing), batch)
+            session.commit()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        # Startup already created the partitions
+        next_partition_check = loop.time() + self.partition_interval
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if loop.time() >= next_partition_check:
+                next_partition_check = loop.time() + self.partition_interval
+                try:
+                    await asyncio.to_thread(self.ensure_partitions)
+                except Exception as e:
+                    logger.error(f"Failed to ensure driver location partitions: {str(e)}")
+
+    def start(self):
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the periodic flush task and drain the buffer"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+class LocationService:
+    """Service for ingesting and querying driver positions"""
+
+    def __init__(
+        self,
+        session: Session,
+        buffer: LocationIngestBuffer,
+        index: LatestPositionIndex
+    ):
+        self.session = session
+        self.buffer = buffer
+        self.index = index
+
+    async def ingest_pings(self, driver_id: uuid.UUID, pings: List[LocationPing]) -> LocationBatchAck:
+        """Ingest a batch of pings from a driver device
+
+        The latest-position index is updated synchronously so dispatch sees
+        the new position immediately; history rows go through the buffer.
+
+        Args:
+            driver_id: Driver sending the pings
+            pings: Timestamped pings in any order
+
+        Returns:
+            Batch acknowledgement
+
+        Raises:
+            HTTPException: If a ping references an assignment of another driver
+        """
+        self._check_assignments(driver_id, pings)
+
+        received_at = datetime.utcnow()
+        rows = []
+        positions = []
+        for ping in pings:
+            rows.append({
+                "id": uuid.uuid4(),
+                "driver_id": driver_id,
+                "assignment_id": ping.assignment_id,
+                "recorded_at": ping.recorded_at,
+                "latitude": ping.latitude,
+                "longitude": ping.longitude,
+                "accuracy_m": ping.accuracy_m,
+                "speed_kmh": ping.speed_kmh,
+                "heading": ping.heading,
+                "received_at": received_at
+            })
+            positions.append({
+                "driver_id": str(driver_id),
+                "assignment_id": str(ping.assignment_id) if ping.assignment_id else None,
+                "latitude": ping.latitude,
+                "longitude": ping.longitude,
+                "accuracy_m": ping.accuracy_m,
+                "speed_kmh": ping.speed_kmh,
+                "heading": ping.heading,
+                "recorded_at": ping.recorded_at.isoformat()
+            })
+
+        self.index.update(positions)
+        await self.buffer.add(rows)
+
+        return LocationBatchAck(
+            accepted=len(rows),
+            latest_recorded_at=max(ping.recorded_at for ping in pings)
+        )
+
+    def _check_assignments(self, driver_id: uuid.UUID, pings: List[LocationPing]):
+        """Reject pings tagged with assignments that are not the driver's"""
+        assignment_ids = {ping.assignment_id for ping in pings if ping.assignment_id}
+        if not assignment_ids:
+            return
+
+        owned = self.session.exec(
+            select(DriverAssignment.id).where(
+                DriverAssignment.id.in_(assignment_ids),
+                DriverAssignment.driver_id == driver_id
+            )
+        ).all()
+        if len(owned) != len(assignment_ids):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to report positions for this assignment"
+            )
+
+    async def get_latest_positions(
+        self,
+        driver_ids: Optional[List[uuid.UUID]] = None
+    ) -> List[DriverPosition]:
+        """Get the latest position of every driver (or of the given drivers)"""
+        positions = self.index.get_all()
+        if driver_ids is not None:
+            wanted = {str(driver_id) for driver_id in driver_ids}
+            positions = [p for p in positions if p["driver_id"] in wanted]
+        return [DriverPosition(**p) for p in positions]
+
+    async def get_driver_position(self, driver_id: uuid.UUID) -> Optional[DriverPosition]:
+        """Get the latest position of a driver"""
+        position = self.index.get_driver(driver_id)
+        return DriverPosition(**position) if position else None
+
+    async def get_assignment_position(self, assignment_id: uuid.UUID) -> Optional[DriverPosition]:
+        """Get the latest position reported for an assignment"""
+        position = self.index.get_assignment(assignment_id)
+        return DriverPosition(**position) if position else None
+
+    async def get_driver_track(
+        self,
+        driver_id: uuid.UUID,
+        start: datetime,
+        end: datetime,
+        limit: int = 5000
+    ) -> List[LocationHistoryPoint]:
+        """Get a driver's ping history for a time window
+
+        The window on ``recorded_at`` lets PostgreSQL prune to the monthly
+        partitions that overlap it.
+        """
+        pings = self.session.exec(
+            select(DriverLocationPing)
+            .where(
+                DriverLocationPing.driver_id == driver_id,
+                DriverLocationPing.recorded_at >= start,
+                DriverLocationPing.recorded_at < end
+            )
+            .order_by(DriverLocationPing.recorded_at)
+            .limit(limit)
+        ).all()
+        return [LocationHistoryPoint.model_validate(p) for p in pings]
+
+
+# Process-wide ingestion state shared by all requests
+location_buffer = LocationIngestBuffer(engine)
+position_index = LatestPositionIndex(redis_client)
@@ -0,0 +1,270 @@
+"""
+Driver metrics service for precomputed performance snapshots
+"""
+from sqlmodel import Session, select
+from sqlalchemy import delete
+from models.driver_assignment import DriverAssignment, AssignmentStatus
+from models.driver_incident import DriverIncident, IncidentSeverity
+from models.driver_metrics import DriverMonthlyMetrics
+from database import redis_client as default_redis_client
+from typing import List, Optional, Dict, Any
+from datetime import datetime, date, timedelta
+import redis
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_CACHE_TTL = 300  # 5 minutes; invalidated on every state transition anyway
+SERIOUS_SEVERITIES = [IncidentSeverity.MAJOR, IncidentSeverity.CRITICAL]
+
+
+def month_start(day: date) -> date:
+    """Get the first day of the month containing ``day``"""
+    return day.replace(day=1)
+
+
+class DriverMetricsService:
+    """Service maintaining per-driver metric snapshots
+
+    Assignment and incident services call the ``record_*`` hooks after
+    staging a state change and before committing, so counters move in the
+    same transaction as the change. Rendered dashboards and metrics are
+    cached in one Redis hash per driver that is dropped whenever that
+    driver's counters change, and by the driver, document and training
+    services whenever the data shown on the dashboard changes.
+    """
+
+    def __init__(self, session: Session, redis_client: Optional[redis.Redis] = None):
+        self.session = session
+        self.redis = redis_client if redis_client is not None else default_redis_client
+
+    # Incremental updates
+
+    def record_assignment_created(self, assignment: DriverAssignment):
+        """Count a newly created assignment"""
+        self._bump(assignment.driver_id, assignment.start_date, total_assignments=1)
+
+    def record_assignment_completed(self, assignment: DriverAssignment):
+        """Count a completion, its punctuality and its rating"""
+        deltas = {"completed_assignments": 1}
+        if assignment.is_on_time():
+            deltas["on_time_assignments"] = 1
+        if assignment.customer_rating is not None:
+            deltas["rating_sum"] = assignment.customer_rating
+            deltas["rating_count"] = 1
+        self._bump(assignment.driver_id, assignment.start_date, **deltas)
+
+    def record_assignment_cancelled(self, assignment: DriverAssignment):
+        """Count a cancellation"""
+        self._bump(assignment.driver_id, assignment.start_date, cancelled_assignments=1)
+
+    def record_assignment_deleted(self, assignment: DriverAssignment):
+        """Remove everything an assignment contributed"""
+        deltas = {"total_assignments": -1}
+        if assignment.status == AssignmentStatus.COMPLETED:
+            deltas["completed_assignments"] = -1
+            if assignment.is_on_time():
+                deltas["on_time_assignments"] = -1
+            if assignment.customer_rating is not None:
+                deltas["rating_sum"] = -assignment.customer_rating
+                deltas["rating_count"] = -1
+        elif assignment.status == AssignmentStatus.CANCELLED:
+            deltas["cancelled_assignments"] = -1
+        self._bump(assignment.driver_id, assignment.start_date, **deltas)
+
+    def record_incident_created(self, incident: DriverIncident):
+        """Count a newly reported incident"""
+        deltas = {"incident_count": 1}
+        if incident.severity in SERIOUS_SEVERITIES:
+            deltas["serious_incident_count"] = 1
+        self._bump(incident.driver_id, incident.incident_date, **deltas)
+
+    def record_incident_deleted(self, incident: DriverIncident):
+        """Remove a deleted incident from the counters"""
+        deltas = {"incident_count": -1}
+        if incident.severity in SERIOUS_SEVERITIES:
+            deltas["serious_incident_count"] = -1
+        self._bump(incident.driver_id, incident.incident_date, **deltas)
+
+    def _bump(self, driver_id: uuid.UUID, day: date, **deltas):
+        """Apply counter deltas to a driver's month row
+
+        Deltas are applied as ``col = col + delta`` in SQL so concurrent
+        transitions for the same driver do not overwrite each other.
+        Drivers without snapshot rows yet are rebuilt instead, which already
+        reflects the staged change since the rebuild query autoflushes it.
+        """
+        if not self._has_any_rows(driver_id):
+            self.rebuild_driver(driver_id)
+            return
+
+        row = self._get_or_create_row(driver_id, month_start(day))
+        for field, delta in deltas.items():
+            setattr(row, field, getattr(DriverMonthlyMetrics, field) + delta)
+        row.updated_at = datetime.utcnow()
+        self.session.add(row)
+        self.session.flush()
+
+    def _get_or_create_row(self, driver_id: uuid.UUID, month: date) -> DriverMonthlyMetrics:
+        row = self.session.exec(
+            select(DriverMonthlyMetrics).where(
+                DriverMonthlyMetrics.driver_id == driver_id,
+                DriverMonthlyMetrics.month == month
+            )
+        ).first()
+        if not row:
+            row = DriverMonthlyMetrics(driver_id=driver_id, month=month)
+            self.session.add(row)
+            self.session.flush()
+        return row
+
+    # Rebuild
+
+    def rebuild_driver(self, driver_id: uuid.UUID) -> List[DriverMonthlyMetrics]:
+        """Recompute a driver's month rows from assignments and incidents
+
+        Used for drivers that predate snapshots and after edits that can
+        move an assignment between months. Only the columns needed for the
+        counters are read. The caller commits.
+        """
+        buckets: Dict[date, Dict[str, Any]] = {}
+
+        def bucket(day: date) -> Dict[str, Any]:
+            return buckets.setdefault(month_start(day), {
+                "total_assignments": 0, "completed_assignments": 0,
+                "cancelled_assignments": 0, "on_time_assignments": 0,
+                "rating_sum": 0.0, "rating_count": 0,
+                "incident_count": 0, "serious_incident_count": 0
+            })
+
+        assignments = self.session.exec(
+            select(
+                DriverAssignment.start_date,
+                DriverAssignment.status,
+                DriverAssignment.customer_rating,
+                DriverAssignment.actual_start_time,
+                DriverAssignment.completed_at
+            ).where(DriverAssignment.driver_id == driver_id)
+        ).all()
+        for start_date, assignment_status, rating, actual_start_time, completed_at in assignments:
+            counters = bucket(start_date)
+            counters["total_assignments"] += 1
+            if assignment_status == AssignmentStatus.COMPLETED:
+                counters["completed_assignments"] += 1
+                if actual_start_time and completed_at and DriverAssignment.started_on_time(start_date, actual_start_time):
+                    counters["on_time_assignments"] += 1
+                if rating is not None:
+                    counters["rating_sum"] += rating
+                    counters["rating_count"] += 1
+            elif assignment_status == AssignmentStatus.CANCELLED:
+                counters["cancelled_assignments"] += 1
+
+        incidents = self.session.exec(
+            select(DriverIncident.incident_date, DriverIncident.severity)
+            .where(DriverIncident.driver_id == driver_id)
+        ).all()
+        for incident_date, severity in incidents:
+            counters = bucket(incident_date)
+            counters["incident_count"] += 1
+            if severity in SERIOUS_SEVERITIES:
+                counters["serious_incident_count"] += 1
+
+        self.session.execute(
+            delete(DriverMonthlyMetrics).where(DriverMonthlyMetrics.driver_id == driver_id)
+        )
+        rows = [
+            DriverMonthlyMetrics(driver_id=driver_id, month=month, **counters)
+            for month, counters in sorted(buckets.items())
+        ]
+        self.session.add_all(rows)
+        self.session.flush()
+        return rows
+
+    # Reads
+
+    def get_monthly_rows(self, driver_id: uuid.UUID, months: int) -> List[DriverMonthlyMetrics]:
+        """Get a driver's month rows covering the last ``months`` months
+
+        Drivers without any snapshot rows are rebuilt on first read.
+        """
+        since = month_start(date.today() - timedelta(days=months * 30))
+        query = (
+            select(DriverMonthlyMetrics)
+            .where(
+                DriverMonthlyMetrics.driver_id == driver_id,
+                DriverMonthlyMetrics.month >= since
+            )
+            .order_by(DriverMonthlyMetrics.month)
+        )
+        rows = self.session.exec(query).all()
+        if not rows and not self._has_any_rows(driver_id):
+            self.rebuild_driver(driver_id)
+            self.session.commit()
+            rows = self.session.exec(query).all()
+        return rows
+
+    def _has_any_rows(self, driver_id: uuid.UUID) -> bool:
+        return self.session.exec(
+            select(DriverMonthlyMetrics.id).where(DriverMonthlyMetrics.driver_id == driver_id).limit(1)
+        ).first() is not None
+
+    @staticmethod
+    def summarize(rows: List[DriverMonthlyMetrics]) -> Dict[str, Any]:
+        """Collapse month rows into window totals and rates"""
+        total = sum(r.total_assignments for r in rows)
+        completed = sum(r.completed_assignments for r in rows)
+        cancelled = sum(r.cancelled_assignments for r in rows)
+        on_time = sum(r.on_time_assignments for r in rows)
+        rating_count = sum(r.rating_count for r in rows)
+        rating_sum = sum(r.rating_sum for r in rows)
+        return {
+            "total_assignments": total,
+            "completed_assignments": completed,
+            "cancelled_assignments": cancelled,
+            "completion_rate": completed / total * 100 if total > 0 else 0,
+            "on_time_rate": on_time / total * 100 if total > 0 else 0,
+            "average_rating": rating_sum / rating_count if rating_count else None,
+            "incident_count": sum(r.incident_count for r in rows),
+            "serious_incident_count": sum(r.serious_incident_count for r in rows),
+            "monthly_trends": [
+                {
+                    "month": r.month.strftime("%Y-%m"),
+                    "assignments": r.total_assignments,
+                    "rating": round(r.rating_sum / r.rating_count, 2) if r.rating_count else None,
+                    "on_time_rate": round(r.on_time_assignments / r.total_assignments * 100, 1) if r.total_assignments else 0
+                }
+                for r in rows
+            ]
+        }
+
+    # Cache
+
+    def _cache_key(self, driver_id: uuid.UUID) -> str:
+        return f"driver_metrics:{driver_id}"
+
+    def get_cached(self, driver_id: uuid.UUID, field: str) -> Optional[str]:
+        """Get a cached rendering for a driver, if any"""
+        try:
+            return self.redis.hget(self._cache_key(driver_id), field)
+        except redis.RedisError as e:
+            logger.warning(f"Driver metrics cache read failed: {str(e)}")
+            return None
+
+    def set_cached(self, driver_id: uuid.UUID, field: str, value: str):
+        """Cache a rendering for a driver"""
+        key = self._cache_key(driver_id)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(key, field, value)
+            pipe.expire(key, SNAPSHOT_CACHE_TTL)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Driver metrics cache write failed: {str(e)}")
+
+    def invalidate(self, driver_id: uuid.UUID):
+        """Drop every cached rendering for a driver"""
+        try:
+            self.redis.delete(self._cache_key(driver_id))
+        except redis.RedisError as e:
+            logger.warning(f"Driver metrics cache invalidation failed: {str(e)}")
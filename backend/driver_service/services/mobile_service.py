@@ -17,6 +17,7 @@ from schemas.driver import DriverResponse
 from services.driver_service import DriverService
 from services.assignment_service import AssignmentService
 from services.incident_service import IncidentService
+from services.metrics_service import DriverMetricsService
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import uuid
@@ -33,6 +34,7 @@ class MobileService:
         self.driver_service = DriverService(session)
         self.assignment_service = AssignmentService(session)
         self.incident_service = IncidentService(session)
+        self.metrics_service = DriverMetricsService(session)
     
     async def get_driver_dashboard(self, driver_user_id: uuid.UUID) -> DriverDashboard:
         """Get driver dashboard data for mobile app
@@ -46,6 +48,15 @@ class MobileService:
         Raises:
             HTTPException: If driver not found
         """
+        # Served from the per-driver snapshot cache, dropped on any profile,
+        # assignment, incident, document or training change; keyed by day
+        # since "today" moves at midnight
+        today = date.today()
+        cache_field = f"dashboard:{today.isoformat()}"
+        cached = self.metrics_service.get_cached(driver_user_id, cache_field)
+        if cached:
+            return DriverDashboard.model_validate_json(cached)
+        
         # Find driver by user ID (assuming there's a user_id field or relationship)
         # For now, we'll use the driver_id directly
         driver = self.session.get(Driver, driver_user_id)
@@ -56,7 +67,6 @@ class MobileService:
             )
         
         # Get today's assignments
-        today = date.today()
         today_assignments = await self.assignment_service.get_assignments(
             driver_id=driver.id,
             start_date=today,
@@ -86,7 +96,7 @@ class MobileService:
         if driver.days_until_health_cert_expiry() and driver.days_until_health_cert_expiry() <= 60:
             alerts.append(f"Health certificate expires in {driver.days_until_health_cert_expiry()} days")
         
-        return DriverDashboard(
+        dashboard = DriverDashboard(
             driver=self.driver_service._to_response(driver),
             today_assignments=today_assignments,
             upcoming_assignments=upcoming_assignments,
@@ -97,6 +107,9 @@ class MobileService:
             health_cert_expiry_days=driver.days_until_health_cert_expiry(),
             alerts=alerts
         )
+        
+        self.metrics_service.set_cached(driver_user_id, cache_field, dashboard.model_dump_json())
+        return dashboard
     
     async def get_driver_assignments(
         self,
@@ -598,6 +611,11 @@ class MobileService:
         Returns:
             Performance metrics
         """
+        cache_field = f"performance:{months}"
+        cached = self.metrics_service.get_cached(driver_user_id, cache_field)
+        if cached:
+            return PerformanceMetrics.model_validate_json(cached)
+        
         driver = self.session.get(Driver, driver_user_id)
         if not driver:
             raise HTTPException(
@@ -605,26 +623,11 @@ class MobileService:
                 detail="Driver not found"
             )
         
-        # Get assignments for the period
-        start_date = date.today() - timedelta(days=months * 30)
-        assignments = await self.assignment_service.get_assignments(
-            driver_id=driver_user_id,
-            start_date=start_date
+        # Window totals come from the monthly snapshot rows (whole months)
+        summary = self.metrics_service.summarize(
+            self.metrics_service.get_monthly_rows(driver_user_id, months)
         )
         
-        # Calculate metrics
-        total_assignments = len(assignments)
-        completed_assignments = len([a for a in assignments if a.status == AssignmentStatus.COMPLETED])
-        completion_rate = completed_assignments / total_assignments * 100 if total_assignments > 0 else 0
-        
-        # Calculate average rating
-        rated_assignments = [a for a in assignments if a.customer_rating is not None]
-        average_rating = sum(a.customer_rating for a in rated_assignments) / len(rated_assignments) if rated_assignments else None
-        
-        # Calculate on-time rate
-        on_time_assignments = [a for a in assignments if a.is_on_time == True]
-        on_time_rate = len(on_time_assignments) / total_assignments * 100 if total_assignments > 0 else 0
-        
         # Get training info
         last_training = self.session.exec(
             select(DriverTrainingRecord)
@@ -635,22 +638,18 @@ class MobileService:
         # Count expiring certificates
         expiring_certs = len(await self.get_driver_documents(driver_user_id))  # Simplified
         
-        # Mock monthly trends
-        monthly_trends = [
-            {"month": "2024-01", "assignments": 12, "rating": 4.5, "on_time_rate": 95},
-            {"month": "2024-02", "assignments": 15, "rating": 4.7, "on_time_rate": 98},
-            {"month": "2024-03", "assignments": 18, "rating": 4.6, "on_time_rate": 92}
-        ]
-        
-        return PerformanceMetrics(
+        metrics = PerformanceMetrics(
             overall_score=driver.calculate_performance_score(),
-            total_assignments=total_assignments,
-            completed_assignments=completed_assignments,
-            completion_rate=completion_rate,
-            average_rating=average_rating,
-            on_time_rate=on_time_rate,
+            total_assignments=summary["total_assignments"],
+            completed_assignments=summary["completed_assignments"],
+            completion_rate=summary["completion_rate"],
+            average_rating=summary["average_rating"],
+            on_time_rate=summary["on_time_rate"],
             incident_count=driver.total_incidents,
             last_training_date=last_training.scheduled_date if last_training else None,
             certificates_expiring=expiring_certs,
-            monthly_trends=monthly_trends
-        )
\ No newline at end of file
+            monthly_trends=summary["monthly_trends"]
+        )
+        
+        self.metrics_service.set_cached(driver_user_id, cache_field, metrics.model_dump_json())
+        return metrics
\ No newline at end of file
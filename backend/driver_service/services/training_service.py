@@ -5,11 +5,15 @@ from sqlmodel import Session, select, and_, or_, func
 from fastapi import HTTPException, status, UploadFile
 from models.driver_training import DriverTrainingRecord, TrainingType, TrainingStatus
 from models.driver import Driver
+from models.expiry_alert import ExpiryAlert
 from schemas.driver_training import (
     DriverTrainingCreate, DriverTrainingUpdate, DriverTrainingResponse
 )
 from utils.upload import process_upload
 from utils.notifications import send_training_notification
+from services.expiry_scan_service import TRAINING_SOURCE
+from services.metrics_service import DriverMetricsService
+from config import settings
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import uuid
@@ -23,6 +27,7 @@ class TrainingService:
     
     def __init__(self, session: Session):
         self.session = session
+        self.metrics_service = DriverMetricsService(session)
     
     async def create_training_record(
         self, 
@@ -53,6 +58,7 @@ class TrainingService:
         self.session.add(training)
         self.session.commit()
         self.session.refresh(training)
+        self.metrics_service.invalidate(training.driver_id)
         
         # Send notification to driver
         try:
@@ -217,6 +223,7 @@ class TrainingService:
         self.session.add(training)
         self.session.commit()
         self.session.refresh(training)
+        self.metrics_service.invalidate(training.driver_id)
         
         logger.info(f"Updated training record {training_id}")
         return self._to_response(training)
@@ -270,12 +277,12 @@ class TrainingService:
         if training.has_passed():
             training.certificate_issued = True
             # Set certificate validity (default 24 months)
-            from config import settings
             validity_months = getattr(settings, 'training_validity_months', 24)
             training.certificate_valid_until = date.today() + timedelta(days=validity_months * 30)
         
         self.session.add(training)
         self.session.commit()
+        self.metrics_service.invalidate(training.driver_id)
         
         logger.info(f"Completed training {training_id} with score {score}")
         return {
@@ -322,6 +329,7 @@ class TrainingService:
         
         self.session.add(training)
         self.session.commit()
+        self.metrics_service.invalidate(training.driver_id)
         
         logger.info(f"Failed training {training_id}")
         return {"message": "Training marked as failed"}
@@ -379,6 +387,7 @@ class TrainingService:
         
         self.session.add(training)
         self.session.commit()
+        self.metrics_service.invalidate(training.driver_id)
         
         logger.info(f"Uploaded certificate for training {training_id}")
         return {
@@ -400,11 +409,27 @@ class TrainingService:
         Returns:
             List of expiring certificates
         """
-        return await self.get_training_records(
-            expiring_soon=True,
-            training_type=training_type,
-            limit=1000  # Get all expiring certificates
+        today = date.today()
+        alert_date = today + timedelta(days=days)
+        
+        query = select(DriverTrainingRecord).where(
+            DriverTrainingRecord.certificate_issued == True,
+            DriverTrainingRecord.certificate_valid_until.is_not(None),
+            DriverTrainingRecord.certificate_valid_until <= alert_date,
+            DriverTrainingRecord.certificate_valid_until > today
         )
+        
+        if training_type:
+            query = query.where(DriverTrainingRecord.training_type == training_type)
+        
+        # Within the alert window the daily scan has queued every match
+        if days <= settings.certificate_alert_days:
+            query = query.where(
+                DriverTrainingRecord.id.in_(ExpiryAlert.open_source_ids(TRAINING_SOURCE, today, alert_date))
+            )
+        
+        records = self.session.exec(query.order_by(DriverTrainingRecord.certificate_valid_until)).all()
+        return [self._to_response(record) for record in records]
     
     async def get_compliance_report(
         self, 
@@ -508,8 +533,10 @@ class TrainingService:
             handler = FileUploadHandler()
             handler.delete_file(training.certificate_file_path)
         
+        driver_id = training.driver_id
         self.session.delete(training)
         self.session.commit()
+        self.metrics_service.invalidate(driver_id)
         
         logger.info(f"Deleted training record {training_id}")
         return {"message": "Training record deleted successfully"}
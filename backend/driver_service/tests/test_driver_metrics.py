@@ -0,0 +1,129 @@
+"""
+Tests for precomputed driver metric snapshots
+"""
+import asyncio
+import fakeredis
+from sqlmodel import Session, select
+from models.driver import Driver
+from models.driver_assignment import DriverAssignment, AssignmentStatus
+from models.driver_metrics import DriverMonthlyMetrics
+from models.driver_training import DriverTrainingRecord
+from schemas.driver import DriverUpdate
+from schemas.driver_assignment import DriverAssignmentCreate
+from schemas.driver_training import DriverTrainingUpdate
+from services.assignment_service import AssignmentService
+from services.driver_service import DriverService
+from services.metrics_service import DriverMetricsService
+from services.training_service import TrainingService
+from datetime import date, datetime, timedelta
+import uuid
+
+
+def make_service(session: Session, redis_client) -> AssignmentService:
+    service = AssignmentService(session)
+    service.metrics_service.redis = redis_client
+    return service
+
+
+class TestDriverMetricsSnapshots:
+    """Test incremental snapshot maintenance"""
+
+    def test_transitions_update_snapshot(self, session: Session, sample_driver: Driver):
+        """Create, complete and cancel move the month counters"""
+        sample_driver.license_expiry_date = date.today() + timedelta(days=365)
+        sample_driver.health_certificate_expiry = date.today() + timedelta(days=365)
+        session.add(sample_driver)
+        session.commit()
+
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        service = make_service(session, redis_client)
+        start = date.today() + timedelta(days=30)
+
+        created = []
+        for offset in range(2):
+            created.append(asyncio.run(service.create_assignment(
+                DriverAssignmentCreate(
+                    driver_id=sample_driver.id,
+                    tour_instance_id=uuid.uuid4(),
+                    start_date=start + timedelta(days=offset * 3),
+                    end_date=start + timedelta(days=offset * 3 + 1)
+                ),
+                assigned_by=uuid.uuid4()
+            )))
+
+        asyncio.run(service.start_assignment(created[0].id))
+        asyncio.run(service.complete_assignment(created[0].id, customer_rating=4.0))
+        asyncio.run(service.cancel_assignment(created[1].id, "Weather"))
+
+        metrics = DriverMetricsService(session, redis_client)
+        rows = session.exec(
+            select(DriverMonthlyMetrics).where(DriverMonthlyMetrics.driver_id == sample_driver.id)
+        ).all()
+        summary = metrics.summarize(rows)
+        assert summary["total_assignments"] == 2
+        assert summary["completed_assignments"] == 1
+        assert summary["cancelled_assignments"] == 1
+        assert summary["average_rating"] == 4.0
+
+        # Incremental counters agree with a full recount
+        rebuilt = metrics.summarize(metrics.rebuild_driver(sample_driver.id))
+        assert rebuilt == summary
+
+    def test_existing_history_is_backfilled(
+        self, session: Session, sample_driver: Driver, sample_assignment: DriverAssignment
+    ):
+        """Drivers predating snapshots are rebuilt on first read"""
+        metrics = DriverMetricsService(session, fakeredis.FakeRedis(decode_responses=True))
+        rows = metrics.get_monthly_rows(sample_driver.id, months=12)
+        assert metrics.summarize(rows)["total_assignments"] == 1
+
+    def test_transition_invalidates_cache(
+        self, session: Session, sample_driver: Driver, sample_assignment: DriverAssignment
+    ):
+        """Cached renderings are dropped when the driver's state changes"""
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        service = make_service(session, redis_client)
+        service.metrics_service.set_cached(sample_driver.id, "performance:6", "{}")
+
+        asyncio.run(service.confirm_assignment(sample_assignment.id))
+
+        assert service.metrics_service.get_cached(sample_driver.id, "performance:6") is None
+
+    def test_profile_and_training_writes_invalidate_dashboard(
+        self, session: Session, sample_driver: Driver, sample_training: DriverTrainingRecord
+    ):
+        """The cached mobile dashboard is dropped on profile and training changes"""
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        driver_service = DriverService(session)
+        driver_service.metrics_service.redis = redis_client
+        training_service = TrainingService(session)
+        training_service.metrics_service.redis = redis_client
+        cache_field = f"dashboard:{date.today().isoformat()}"
+
+        driver_service.metrics_service.set_cached(sample_driver.id, cache_field, "{}")
+        asyncio.run(driver_service.update_driver(sample_driver.id, DriverUpdate(full_name="Youssef Amrani")))
+        assert driver_service.metrics_service.get_cached(sample_driver.id, cache_field) is None
+
+        driver_service.metrics_service.set_cached(sample_driver.id, cache_field, "{}")
+        asyncio.run(training_service.update_training_record(
+            sample_training.id, DriverTrainingUpdate(training_title="First aid refresher")
+        ))
+        assert driver_service.metrics_service.get_cached(sample_driver.id, cache_field) is None
+
+    def test_analytics_aggregates(
+        self, session: Session, sample_driver: Driver, sample_assignment: DriverAssignment
+    ):
+        """Assignment analytics are computed with aggregate queries"""
+        sample_assignment.status = AssignmentStatus.COMPLETED
+        sample_assignment.customer_rating = 5.0
+        sample_assignment.actual_start_time = datetime.combine(sample_assignment.start_date, datetime.min.time())
+        sample_assignment.completed_at = datetime.utcnow()
+        session.add(sample_assignment)
+        session.commit()
+
+        service = make_service(session, fakeredis.FakeRedis(decode_responses=True))
+        analytics = asyncio.run(service.get_assignment_analytics(driver_id=sample_driver.id))
+        assert analytics["total_assignments"] == 1
+        assert analytics["completed_assignments"] == 1
+        assert analytics["average_rating"] == 5.0
+        assert analytics["on_time_rate"] == 100
@@ -0,0 +1,162 @@
+"""
+Tests for the driver expiry scan and alert queue
+"""
+import asyncio
+import fakeredis
+import httpx
+import json
+from sqlmodel import Session
+from models.driver import Driver, DriverStatus
+from models.driver_training import DriverTrainingRecord
+from models.driver_document import DriverDocument
+from models.expiry_alert import ExpiryStage
+from services.expiry_scan_service import ExpiryScanService
+from services.training_service import TrainingService
+from utils import notifications as notifications_module
+from utils.expiry import ExpiryTracker
+from datetime import date, timedelta
+
+
+class FakeNotificationService:
+    """Records notifications instead of calling the notification service"""
+
+    def __init__(self, fail_recipients=()):
+        self.sent = []
+        self.fail_recipients = set(fail_recipients)
+
+    async def send_notifications(self, notifications):
+        self.sent.extend(notifications)
+        return [n["recipient_id"] not in self.fail_recipients for n in notifications]
+
+
+def make_service(session: Session, notifications: FakeNotificationService) -> ExpiryScanService:
+    return ExpiryScanService(session, fakeredis.FakeRedis(decode_responses=True), notifications)
+
+
+class TestExpiryScan:
+    """Test the daily expiry scan"""
+
+    def test_scan_collects_every_source_once(
+        self, session: Session, sample_driver: Driver,
+        sample_training: DriverTrainingRecord, sample_document: DriverDocument
+    ):
+        """Licenses, certificates, trainings and documents are queued and sent once"""
+        sample_driver.license_expiry_date = date.today() + timedelta(days=20)
+        sample_driver.health_certificate_expiry = date.today() + timedelta(days=365)
+        sample_training.certificate_issued = True
+        sample_training.certificate_valid_until = date.today() + timedelta(days=5)
+        sample_document.expiry_date = date.today() - timedelta(days=2)
+        session.add_all([sample_driver, sample_training, sample_document])
+        session.commit()
+
+        notifications = FakeNotificationService()
+        service = make_service(session, notifications)
+        result = asyncio.run(service.run_scan())
+        assert result.queued == 3
+        assert result.dispatched == 3
+        assert sorted(n["template_name"] for n in notifications.sent) == [
+            "driver_document_expiry_alert",
+            "driver_license_expiry_alert",
+            "driver_training_expiry_alert"
+        ]
+
+        again = asyncio.run(service.run_scan())
+        assert again.queued == 0
+        assert again.dispatched == 0
+        assert len(notifications.sent) == 3
+
+        stages = {a.source_type: a.stage for a in service.get_alerts(driver_id=sample_driver.id)}
+        assert stages == {
+            "license": ExpiryStage.UPCOMING,
+            "training": ExpiryStage.IMMINENT,
+            "document": ExpiryStage.EXPIRED
+        }
+
+    def test_inactive_drivers_and_renewals(self, session: Session, sample_driver: Driver):
+        """Terminated drivers are skipped and renewals resolve open alerts"""
+        sample_driver.license_expiry_date = date.today() + timedelta(days=10)
+        sample_driver.health_certificate_expiry = None
+        session.add(sample_driver)
+        session.commit()
+
+        service = make_service(session, FakeNotificationService())
+        assert asyncio.run(service.run_scan()).queued == 1
+
+        sample_driver.license_expiry_date = date.today() + timedelta(days=3650)
+        session.add(sample_driver)
+        session.commit()
+        assert asyncio.run(service.run_scan()).resolved == 1
+        assert service.get_alerts() == []
+
+        sample_driver.license_expiry_date = date.today()
+        sample_driver.status = DriverStatus.TERMINATED
+        session.add(sample_driver)
+        session.commit()
+        assert asyncio.run(service.run_scan()).candidates == 0
+
+    def test_failed_notifications_stay_pending(self, session: Session, sample_driver: Driver):
+        """Undelivered alerts are retried by the next scan"""
+        sample_driver.license_expiry_date = date.today() + timedelta(days=10)
+        sample_driver.health_certificate_expiry = None
+        session.add(sample_driver)
+        session.commit()
+
+        notifications = FakeNotificationService(fail_recipients={str(sample_driver.id)})
+        service = make_service(session, notifications)
+        assert asyncio.run(service.run_scan()).dispatched == 0
+
+        notifications.fail_recipients.clear()
+        assert asyncio.run(service.run_scan()).dispatched == 1
+        assert len(notifications.sent) == 2
+
+    def test_expiring_lists_read_the_queue(
+        self, session: Session, sample_driver: Driver, sample_training: DriverTrainingRecord
+    ):
+        """Expiring certificate and license lists only show items the scan queued"""
+        sample_driver.license_expiry_date = date.today() + timedelta(days=10)
+        sample_driver.health_certificate_expiry = None
+        sample_training.certificate_issued = True
+        sample_training.certificate_valid_until = date.today() + timedelta(days=5)
+        session.add_all([sample_driver, sample_training])
+        session.commit()
+
+        training_service = TrainingService(session)
+        assert asyncio.run(training_service.get_expiring_certificates(days=30)) == []
+        assert ExpiryTracker(session).check_license_expiry() == []
+
+        asyncio.run(make_service(session, FakeNotificationService()).run_scan())
+
+        certificates = asyncio.run(training_service.get_expiring_certificates(days=30))
+        assert [c.id for c in certificates] == [sample_training.id]
+        assert [a["driver_id"] for a in ExpiryTracker(session).check_license_expiry()] == [sample_driver.id]
+
+
+class TestNotificationBatches:
+    """Test batched notification delivery"""
+
+    def test_notifications_are_posted_in_batches(self, monkeypatch):
+        """One request per batch, with success reported per notification"""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append(body)
+            return httpx.Response(200, json={
+                "results": [n["recipient_id"] != "bad" for n in body["notifications"]]
+            })
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            notifications_module.httpx, "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+        )
+
+        notifications = [
+            {"recipient_id": recipient, "template_name": "driver_license_expiry_alert", "variables": {}, "priority": "urgent"}
+            for recipient in ["a", "bad", "c", "d", "e"]
+        ]
+        results = asyncio.run(notifications_module.NotificationService().send_notifications(notifications, batch_size=2))
+
+        assert results == [True, False, True, True, True]
+        assert len(requests) == 3
+        assert requests[0]["notifications"][0]["priority"] == 1
@@ -0,0 +1,199 @@
+"""
+Tests for driver GPS ping ingestion and the latest-position index
+"""
+import pytest
+import asyncio
+import time
+import fakeredis
+from fastapi import HTTPException
+from sqlmodel import Session, select
+from models.driver_location import DriverLocationPing
+from schemas.driver_location import LocationPing
+from services.location_service import (
+    LocationService, LocationIngestBuffer, LatestPositionIndex
+)
+from database import location_partition_statements
+from datetime import date, datetime, timedelta
+import uuid
+
+
+@pytest.fixture(name="position_index")
+def position_index_fixture():
+    """Latest-position index backed by fake Redis"""
+    return LatestPositionIndex(fakeredis.FakeRedis(decode_responses=True))
+
+
+@pytest.fixture(name="location_buffer")
+def location_buffer_fixture(engine):
+    """Ingestion buffer writing to the test database"""
+    return LocationIngestBuffer(engine, max_size=1000, flush_interval=60)
+
+
+def make_pings(count: int, start: datetime, assignment_id: uuid.UUID = None):
+    return [
+        LocationPing(
+            recorded_at=start + timedelta(seconds=i),
+            latitude=31.6295 + i * 0.0001,
+            longitude=-7.9811 + i * 0.0001,
+            speed_kmh=60.0,
+            heading=90.0,
+            assignment_id=assignment_id
+        )
+        for i in range(count)
+    ]
+
+
+class TestLocationIngestion:
+    """Test GPS ping ingestion"""
+
+    def test_latest_position_is_newest_ping(
+        self, session: Session, location_buffer, position_index, sample_assignment
+    ):
+        """Latest index keeps the newest ping regardless of arrival order"""
+        service = LocationService(session, location_buffer, position_index)
+        driver_id = sample_assignment.driver_id
+        assignment_id = sample_assignment.id
+        start = datetime.utcnow() - timedelta(minutes=10)
+
+        asyncio.run(service.ingest_pings(driver_id, make_pings(5, start, assignment_id)))
+        # A late batch of older pings must not move the driver backwards
+        asyncio.run(service.ingest_pings(driver_id, make_pings(2, start - timedelta(minutes=5))))
+
+        position = asyncio.run(service.get_driver_position(driver_id))
+        assert position.recorded_at == start + timedelta(seconds=4)
+        assert position.assignment_id == assignment_id
+
+        by_assignment = asyncio.run(service.get_assignment_position(assignment_id))
+        assert by_assignment.driver_id == driver_id
+
+    def test_latest_positions_for_all_drivers(
+        self, session: Session, location_buffer, position_index
+    ):
+        """Dispatch board gets one position per driver"""
+        service = LocationService(session, location_buffer, position_index)
+        start = datetime.utcnow() - timedelta(minutes=10)
+        driver_ids = [uuid.uuid4() for _ in range(3)]
+        for driver_id in driver_ids:
+            asyncio.run(service.ingest_pings(driver_id, make_pings(10, start)))
+
+        positions = asyncio.run(service.get_latest_positions())
+        assert {p.driver_id for p in positions} == set(driver_ids)
+
+        subset = asyncio.run(service.get_latest_positions(driver_ids[:1]))
+        assert [p.driver_id for p in subset] == driver_ids[:1]
+
+    def test_buffer_flushes_history_in_bulk(
+        self, session: Session, location_buffer, position_index
+    ):
+        """Buffered pings land in the history table on flush"""
+        service = LocationService(session, location_buffer, position_index)
+        driver_id = uuid.uuid4()
+        start = datetime.utcnow() - timedelta(minutes=10)
+
+        asyncio.run(service.ingest_pings(driver_id, make_pings(20, start)))
+        assert location_buffer.pending_count == 20
+
+        written = asyncio.run(location_buffer.flush())
+        assert written == 20
+        assert location_buffer.pending_count == 0
+
+        track = asyncio.run(service.get_driver_track(
+            driver_id, start, start + timedelta(minutes=1)
+        ))
+        assert len(track) == 20
+        assert track[0].recorded_at == start
+
+    def test_pings_for_another_drivers_assignment_rejected(
+        self, session: Session, location_buffer, position_index, sample_assignment
+    ):
+        """A driver cannot report positions under someone else's assignment"""
+        service = LocationService(session, location_buffer, position_index)
+        start = datetime.utcnow() - timedelta(minutes=10)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(service.ingest_pings(uuid.uuid4(), make_pings(3, start, sample_assignment.id)))
+
+        assert exc_info.value.status_code == 403
+        assert location_buffer.pending_count == 0
+        assert asyncio.run(service.get_assignment_position(sample_assignment.id)) is None
+
+    def test_older_ping_from_another_replica_is_ignored(self):
+        """Replicas sharing Redis never move a driver backwards"""
+        shared = fakeredis.FakeRedis(decode_responses=True)
+        first, second = LatestPositionIndex(shared), LatestPositionIndex(shared)
+        driver_id = str(uuid.uuid4())
+        start = datetime.utcnow() - timedelta(minutes=10)
+
+        second.update([{"driver_id": driver_id, "recorded_at": (start + timedelta(seconds=30)).isoformat()}])
+        # First replica has not seen the newer ping in its local copy
+        first.update([{"driver_id": driver_id, "recorded_at": start.isoformat()}])
+
+        position = first.get_driver(uuid.UUID(driver_id))
+        assert position["recorded_at"] == (start + timedelta(seconds=30)).isoformat()
+
+    def test_future_ping_rejected(self):
+        """Pings stamped well in the future are rejected"""
+        with pytest.raises(ValueError):
+            LocationPing(
+                recorded_at=datetime.utcnow() + timedelta(hours=1),
+                latitude=31.6,
+                longitude=-7.9
+            )
+
+    def test_flush_task_creates_partitions_periodically(self, engine):
+        """The flush loop keeps creating partitions in long-running processes"""
+        calls = []
+        buffer = LocationIngestBuffer(
+            engine,
+            flush_interval=0.01,
+            partition_interval=0.03,
+            ensure_partitions=lambda: calls.append(1)
+        )
+
+        async def run():
+            buffer.start()
+            await asyncio.sleep(0.2)
+            await buffer.stop()
+
+        asyncio.run(run())
+        assert 2 <= len(calls) <= 6
+
+    def test_partition_statements_move_default_rows_before_attaching(self):
+        """Pings of the month leave the default partition before the attach"""
+        statements = location_partition_statements(date(2026, 12, 1))
+
+        assert statements[0].startswith("CREATE TABLE driver_location_pings_2026_12 (LIKE driver_location_pings")
+        assert "DELETE FROM driver_location_pings_default" in statements[2]
+        assert "recorded_at >= '2026-12-01' AND recorded_at < '2027-01-01'" in statements[2]
+        assert statements[3] == (
+            "ALTER TABLE driver_location_pings ATTACH PARTITION driver_location_pings_2026_12 "
+            "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+        )
+        assert not any("PARTITION OF" in statement for statement in statements)
+
+
+class TestLocationIngestionBenchmark:
+    """Throughput benchmark for a single node"""
+
+    def test_ingest_1000_pings_per_second(
+        self, engine, session: Session, position_index
+    ):
+        """One second of traffic (1,000 pings from 100 drivers) ingests and flushes within a second"""
+        buffer = LocationIngestBuffer(engine, max_size=1000, flush_interval=60)
+        service = LocationService(session, buffer, position_index)
+        start = datetime.utcnow() - timedelta(minutes=1)
+        batches = [(uuid.uuid4(), make_pings(10, start)) for _ in range(100)]
+
+        async def run():
+            began = time.perf_counter()
+            for driver_id, pings in batches:
+                await service.ingest_pings(driver_id, pings)
+            await buffer.flush()
+            return time.perf_counter() - began
+
+        elapsed = asyncio.run(run())
+
+        stored = session.exec(select(DriverLocationPing)).all()
+        assert len(stored) == 1000
+        assert len(asyncio.run(service.get_latest_positions())) == 100
+        assert elapsed < 1.0, f"1,000 pings took {elapsed:.3f}s"
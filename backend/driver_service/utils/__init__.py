@@ -6,11 +6,13 @@ from .expiry import *
 from .upload import *
 from .validation import *
 from .notifications import *
+from .search import *
 
 __all__ = [
     "get_current_user", "require_permission", "CurrentUser",
     "ExpiryTracker", "check_expiry_alerts", "get_expiring_items",
     "FileUploadHandler", "validate_document", "process_upload",
     "validate_driver_data", "validate_assignment_conflict", "validate_training_record",
-    "NotificationService", "send_expiry_alert", "send_assignment_notification"
+    "NotificationService", "send_expiry_alert", "send_assignment_notification",
+    "fuzzy_search_condition", "similarity_rank"
 ]
\ No newline at end of file
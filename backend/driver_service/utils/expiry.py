@@ -7,17 +7,32 @@ from sqlmodel import Session, select
 from models.driver import Driver
 from models.driver_training import DriverTrainingRecord
 from models.driver_document import DriverDocument
+from models.expiry_alert import ExpiryAlert
+from config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class ExpiryTracker:
-    """Utility class for tracking and alerting on expiring items"""
+    """Utility class for tracking and alerting on expiring items
+    
+    Within each alert window the items come from the expiry alert queue
+    kept by the daily scan; longer horizons read the source tables.
+    """
     
     def __init__(self, session: Session):
         self.session = session
     
+    def _queued(self, statement, id_column, source_type: str, alert_days: int, window_days: int):
+        """Restrict a source query to items with an open alert when the horizon is inside the scan window"""
+        if alert_days > window_days:
+            return statement
+        today = date.today()
+        return statement.where(
+            id_column.in_(ExpiryAlert.open_source_ids(source_type, today, today + timedelta(days=alert_days)))
+        )
+    
     def check_license_expiry(self, alert_days: int = 30) -> List[Dict[str, Any]]:
         """Check for drivers with expiring licenses
         
@@ -34,6 +49,7 @@ class ExpiryTracker:
             Driver.license_expiry_date > date.today(),
             Driver.status.in_(["Active", "On Leave"])
         )
+        statement = self._queued(statement, Driver.id, "license", alert_days, settings.license_alert_days)
         
         expiring_drivers = self.session.exec(statement).all()
         
@@ -62,6 +78,7 @@ class ExpiryTracker:
             Driver.health_certificate_expiry > date.today(),
             Driver.status.in_(["Active", "On Leave"])
         )
+        statement = self._queued(statement, Driver.id, "health_cert", alert_days, settings.health_cert_alert_days)
         
         expiring_drivers = self.session.exec(statement).all()
         
@@ -89,6 +106,9 @@ class ExpiryTracker:
             DriverTrainingRecord.certificate_valid_until > date.today(),
             DriverTrainingRecord.certificate_issued == True
         )
+        statement = self._queued(
+            statement, DriverTrainingRecord.id, "training", alert_days, settings.certificate_alert_days
+        )
         
         expiring_training = self.session.exec(statement).all()
         
@@ -117,6 +137,9 @@ class ExpiryTracker:
             DriverDocument.expiry_date > date.today(),
             DriverDocument.status == "Approved"
         )
+        statement = self._queued(
+            statement, DriverDocument.id, "document", alert_days, settings.certificate_alert_days
+        )
         
         expiring_documents = self.session.exec(statement).all()
         
@@ -0,0 +1,31 @@
+"""
+Fuzzy text search helpers backed by PostgreSQL pg_trgm
+"""
+from sqlalchemy import ColumnElement, or_, func
+from typing import Optional, Sequence
+
+
+def fuzzy_search_condition(columns: Sequence, term: str, dialect_name: str) -> ColumnElement:
+    """Match ``term`` anywhere in any of the columns, tolerating typos
+    
+    On PostgreSQL both the substring ``ILIKE`` and the ``%>`` word
+    similarity operator are answered by the ``gin_trgm_ops`` indexes created
+    in ``database.ensure_search_indexes``. Other backends fall back to
+    substring matching only.
+    """
+    search_term = f"%{term}%"
+    conditions = [column.ilike(search_term) for column in columns]
+    if dialect_name == "postgresql":
+        conditions.extend(column.op("%>")(term) for column in columns)
+    return or_(*conditions)
+
+
+def similarity_rank(columns: Sequence, term: str, dialect_name: str) -> Optional[ColumnElement]:
+    """Best word similarity of ``term`` across the columns, for ordering
+    
+    Returns:
+        Rank expression (higher is closer), or None when not on PostgreSQL
+    """
+    if dialect_name != "postgresql":
+        return None
+    return func.greatest(*(func.word_similarity(term, column) for column in columns))
@@ -12,6 +12,11 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str
     
+    # Idempotency-Key handling for retried create requests
+    idempotency_ttl_seconds: int = 86400  # How long a stored response can be replayed
+    idempotency_lock_seconds: int = 60  # Claim timeout if the first request dies mid-flight
+    idempotency_wait_seconds: float = 30.0  # How long a concurrent duplicate waits
+    
     # Service Integration
     auth_service_url: str
     crm_service_url: str
@@ -21,6 +21,7 @@ import models.invoice          # noqa: F401
 import models.invoice_item     # noqa: F401
 import models.payment          # noqa: F401
 import models.tax_report       # noqa: F401
+import models.document_sequence  # noqa: F401
 
 # Alembic config
 config = context.config
@@ -0,0 +1,36 @@
+"""add document_sequences
+
+Revision ID: 8b2f4c6d1e90
+Revises: 3cd1a4b3144d
+Create Date: 2026-10-18 09:12:40.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2f4c6d1e90'
+down_revision: Union[str, Sequence[str], None] = '3cd1a4b3144d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'document_sequences',
+        sa.Column('document_type', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+        sa.Column('period', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+        sa.Column('last_value', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('document_type', 'period'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('document_sequences')
@@ -6,11 +6,13 @@ from .invoice_item import InvoiceItem
 from .payment import Payment, PaymentMethod, PaymentStatus
 from .expense import Expense, ExpenseCategory, ExpenseStatus, CostCenter
 from .tax_report import TaxReport, ReportPeriod, ReportStatus, TaxType
+from .document_sequence import DocumentSequence
 
 __all__ = [
     "Invoice", "InvoiceStatus", "InvoicePaymentStatus",
     "InvoiceItem",
     "Payment", "PaymentMethod", "PaymentStatus",
     "Expense", "ExpenseCategory", "ExpenseStatus", "CostCenter",
-    "TaxReport", "ReportPeriod", "ReportStatus", "TaxType"
+    "TaxReport", "ReportPeriod", "ReportStatus", "TaxType",
+    "DocumentSequence"
 ]
\ No newline at end of file
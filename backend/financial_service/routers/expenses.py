@@ -173,7 +173,8 @@ async def get_expenses(
         items=expenses,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -1,7 +1,7 @@
 """
 Invoice management routes
 """
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Header, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 from database import get_session, get_redis
@@ -13,6 +13,7 @@ from schemas.invoice import (
 from models.invoice import InvoiceStatus, PaymentStatus
 from utils.auth import require_permission, CurrentUser
 from utils.pagination import PaginationParams, PaginatedResponse
+from utils.idempotency import IdempotencyStore
 from typing import List, Optional
 import redis
 import uuid
@@ -26,11 +27,18 @@ async def create_invoice(
     invoice_data: InvoiceCreate,
     session: Session = Depends(get_session),
     redis_client: redis.Redis = Depends(get_redis),
-    current_user: CurrentUser = Depends(require_permission("finance", "create", "invoices"))
+    current_user: CurrentUser = Depends(require_permission("finance", "create", "invoices")),
+    idempotency_key: Optional[str] = Header(None, description="Retries with the same key replay the first response")
 ):
     """Create a new invoice"""
     invoice_service = InvoiceService(session, redis_client)
-    return await invoice_service.create_invoice(invoice_data, current_user.user_id)
+    return await IdempotencyStore(redis_client).run(
+        "invoices:create",
+        idempotency_key,
+        current_user.user_id,
+        invoice_data,
+        lambda: invoice_service.create_invoice(invoice_data, current_user.user_id)
+    )
 
 
 @router.post("/generate", response_model=InvoiceResponse)
@@ -38,11 +46,18 @@ async def generate_invoice_from_booking(
     generation_data: InvoiceGeneration,
     session: Session = Depends(get_session),
     redis_client: redis.Redis = Depends(get_redis),
-    current_user: CurrentUser = Depends(require_permission("finance", "create", "invoices"))
+    current_user: CurrentUser = Depends(require_permission("finance", "create", "invoices")),
+    idempotency_key: Optional[str] = Header(None, description="Retries with the same key replay the first response")
 ):
     """Generate invoice from booking"""
     invoice_service = InvoiceService(session, redis_client)
-    return await invoice_service.generate_from_booking(generation_data, current_user.user_id)
+    return await IdempotencyStore(redis_client).run(
+        "invoices:generate",
+        idempotency_key,
+        current_user.user_id,
+        generation_data,
+        lambda: invoice_service.generate_from_booking(generation_data, current_user.user_id)
+    )
 
 
 @router.get("/", response_model=PaginatedResponse[InvoiceResponse])
@@ -109,7 +124,8 @@ async def get_invoices(
         items=invoices,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
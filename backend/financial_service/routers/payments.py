@@ -1,7 +1,7 @@
 """
 Payment management routes
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Header
 from sqlmodel import Session
 from database import get_session, get_redis
 from services.payment_service import PaymentService
@@ -12,6 +12,7 @@ from schemas.payment import (
 from models.payment import PaymentMethod, PaymentStatus
 from utils.auth import require_permission, CurrentUser
 from utils.pagination import PaginationParams, PaginatedResponse
+from utils.idempotency import IdempotencyStore
 from typing import List, Optional
 import redis
 import uuid
@@ -25,11 +26,18 @@ async def create_payment(
     payment_data: PaymentCreate,
     session: Session = Depends(get_session),
     redis_client: redis.Redis = Depends(get_redis),
-    current_user: CurrentUser = Depends(require_permission("finance", "create", "payments"))
+    current_user: CurrentUser = Depends(require_permission("finance", "create", "payments")),
+    idempotency_key: Optional[str] = Header(None, description="Retries with the same key replay the first response")
 ):
     """Create a new payment"""
     payment_service = PaymentService(session, redis_client)
-    return await payment_service.create_payment(payment_data, current_user.user_id)
+    return await IdempotencyStore(redis_client).run(
+        "payments:create",
+        idempotency_key,
+        current_user.user_id,
+        payment_data,
+        lambda: payment_service.create_payment(payment_data, current_user.user_id)
+    )
 
 
 @router.get("/", response_model=PaginatedResponse[PaymentResponse])
@@ -97,7 +105,8 @@ async def get_payments(
         items=payments,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
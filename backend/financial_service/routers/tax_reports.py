@@ -71,7 +71,8 @@ async def get_tax_reports(
         items=reports,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -9,6 +9,7 @@ from schemas.invoice import (
     InvoiceCreate, InvoiceUpdate, InvoiceResponse
 )
 from utils.invoice_generator import InvoicePDFGenerator, generate_invoice_pdf
+from utils.sequences import allocate_sequence, last_used_number
 # from utils.currency import convert_currency, get_exchange_rate
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
@@ -425,25 +426,16 @@ class InvoiceService:
     
     async def _generate_invoice_number(self) -> str:
         """Generate unique invoice number"""
-        # Get current year and month
         now = datetime.now()
-        prefix = f"INV-{now.year}{now.month:02d}"
-        
-        # Get last invoice number for this month
-        last_invoice = self.session.exec(
-            select(Invoice)
-            .where(Invoice.invoice_number.like(f"{prefix}%"))
-            .order_by(Invoice.invoice_number.desc())
-        ).first()
-        
-        if last_invoice:
-            # Extract sequence number and increment
-            last_seq = int(last_invoice.invoice_number.split('-')[-1])
-            seq = last_seq + 1
-        else:
-            seq = 1
-        
-        return f"{prefix}-{seq:04d}"
+        period = f"{now.year}{now.month:02d}"
+        prefix = f"INV-{period}"
+        
+        # Counter row lock serializes concurrent invoices; numbers stay gapless on rollback
+        sequence = allocate_sequence(
+            self.session, "INV", period,
+            seed=lambda: last_used_number(self.session, Invoice.invoice_number, prefix)
+        )
+        return f"{prefix}-{sequence[0]:04d}"
     
     def _to_response(self, invoice: Invoice) -> InvoiceResponse:
         """Convert invoice model to response schema"""
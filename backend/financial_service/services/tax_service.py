@@ -9,6 +9,7 @@ from models.expense import Expense, ExpenseStatus
 from schemas.tax_report import (
     TaxReportCreate, TaxReportUpdate, TaxReportResponse
 )
+from utils.sequences import allocate_sequence, last_used_number
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 from decimal import Decimal
@@ -380,28 +381,14 @@ class TaxService:
         """Generate unique tax report reference"""
         now = datetime.now()
         type_prefix = "VAT" if tax_type == TaxType.VAT else "INC"
-        prefix = f"{type_prefix}-{now.year}{now.month:02d}"
+        period = f"{now.year}{now.month:02d}"
+        prefix = f"{type_prefix}-{period}"
         
-        # Get last report reference for this month and type
-        last_report = self.session.exec(
-            select(TaxReport)
-            .where(
-                and_(
-                    TaxReport.report_reference.like(f"{prefix}%"),
-                    TaxReport.tax_type == tax_type
-                )
-            )
-            .order_by(TaxReport.report_reference.desc())
-        ).first()
-        
-        if last_report:
-            # Extract sequence number and increment
-            last_seq = int(last_report.report_reference.split('-')[-1])
-            seq = last_seq + 1
-        else:
-            seq = 1
-        
-        return f"{prefix}-{seq:04d}"
+        sequence = allocate_sequence(
+            self.session, type_prefix, period,
+            seed=lambda: last_used_number(self.session, TaxReport.report_number, prefix)
+        )
+        return f"{prefix}-{sequence[0]:04d}"
     
     def _to_response(self, tax_report: TaxReport) -> TaxReportResponse:
         """Convert tax report model to response schema"""
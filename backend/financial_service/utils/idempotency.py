@@ -0,0 +1,116 @@
+"""
+Idempotency-Key support for create endpoints that clients retry
+"""
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from typing import Any, Awaitable, Callable, Optional
+from config import settings
+import asyncio
+import hashlib
+import json
+import time
+import redis
+
+MAX_KEY_LENGTH = 255
+IN_PROGRESS = "in_progress"
+COMPLETED = "completed"
+
+
+class IdempotencyStore:
+    """
+    Stores the outcome of a keyed request in Redis so retries replay it.
+    
+    The first request with a key claims it with SET NX and runs the handler;
+    its response is stored with the request fingerprint for ``ttl`` seconds.
+    A replay with the same fingerprint gets the stored response back without
+    running the handler (and so without touching Postgres). A duplicate that
+    arrives while the first is still running waits for its result, up to
+    ``wait_timeout`` seconds. Reusing a key for a different request is a 422.
+    Failed requests release the key so the client can retry them.
+    """
+    
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        ttl: int = settings.idempotency_ttl_seconds,
+        lock_ttl: int = settings.idempotency_lock_seconds,
+        wait_timeout: float = settings.idempotency_wait_seconds,
+        poll_interval: float = 0.05,
+    ):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+    
+    @staticmethod
+    def fingerprint(payload: Any) -> str:
+        """Stable hash of the request payload"""
+        encoded = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
+    
+    async def run(
+        self,
+        scope: str,
+        key: Optional[str],
+        owner: Any,
+        payload: Any,
+        handler: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run ``handler`` once per (scope, owner, key) and replay its response.
+        
+        Requests without a key run the handler directly.
+        """
+        if not key:
+            return await handler()
+        if len(key) > MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters",
+            )
+        
+        redis_key = f"idempotency:{scope}:{owner}:{key}"
+        fingerprint = self.fingerprint(payload)
+        claim = json.dumps({"state": IN_PROGRESS, "fingerprint": fingerprint})
+        deadline = time.monotonic() + self.wait_timeout
+        
+        while not self.redis.set(redis_key, claim, nx=True, ex=self.lock_ttl):
+            raw = self.redis.get(redis_key)
+            if raw is None:
+                # Expired or released between SET and GET; try to claim again
+                continue
+            record = json.loads(raw)
+            if record["fingerprint"] != fingerprint:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Idempotency-Key was already used with a different request",
+                )
+            if record["state"] == COMPLETED:
+                return JSONResponse(
+                    status_code=record["status_code"],
+                    content=record["body"],
+                    headers={"Idempotent-Replayed": "true"},
+                )
+            if time.monotonic() >= deadline:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with this Idempotency-Key is still being processed",
+                )
+            await asyncio.sleep(self.poll_interval)
+        
+        try:
+            response = await handler()
+        except BaseException:
+            self.redis.delete(redis_key)
+            raise
+        
+        record = {
+            "state": COMPLETED,
+            "fingerprint": fingerprint,
+            "status_code": status.HTTP_200_OK,
+            "body": jsonable_encoder(response),
+        }
+        self.redis.set(redis_key, json.dumps(record), ex=self.ttl)
+        return response
@@ -2,7 +2,7 @@
 Configuration settings for the fleet management microservice
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -12,6 +12,13 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str
     
+    # Change feed (Redis Streams shared by all services; defaults to redis_url)
+    change_feed_redis_url: Optional[str] = None
+    change_feed_enabled: bool = True  # Keep local read models of other services
+    change_feed_batch_size: int = 100
+    change_feed_block_ms: int = 5000
+    change_feed_max_deliveries: int = 5  # Deliveries before a failing entry is logged and dropped
+    
     # Service Integration
     auth_service_url: str
     crm_service_url: str
@@ -36,6 +43,10 @@ class Settings(BaseSettings):
     # Fleet Configuration
     maintenance_alert_days: int = 7  # Days before maintenance due
     compliance_alert_days: int = 30  # Days before compliance expiry
+    maintenance_projection_days: int = 60  # Horizon for projected upcoming maintenance on vehicle summaries
+    maintenance_forecast_cache_seconds: int = 3600  # Fleet maintenance forecast cache lifetime
+    expiry_scan_enabled: bool = True  # Run the daily compliance expiry scan
+    expiry_scan_check_minutes: int = 60  # How often to check whether today's scan has run
     
     # File Upload
     max_file_size: int = 10 * 1024 * 1024  # 10MB
@@ -4,6 +4,7 @@ Database configuration and session management
 from sqlmodel import SQLModel, create_engine, Session
 from config import settings
 import redis
+import redis.asyncio as aioredis
 from typing import Generator
 
 
@@ -18,12 +19,30 @@ engine = create_engine(
 # Redis client
 redis_client = redis.from_url(settings.redis_url, decode_responses=True)
 
+# Async Redis client for real-time notifications; all publishers share its connection pool
+async_redis_client = aioredis.from_url(settings.redis_url, decode_responses=True)
+
+# Redis holding the cross-service change feed
+async_change_feed_redis = aioredis.from_url(settings.change_feed_redis_url or settings.redis_url, decode_responses=True)
+
 
 def create_db_and_tables():
     """Create database tables"""
     SQLModel.metadata.create_all(engine)
 
 
+def ensure_expiry_indexes():
+    """Create the partial expiry-scan indexes on tables that predate them
+
+    ``create_all`` only builds indexes together with new tables, so the
+    ``ix_expiry_*`` indexes are created here for existing deployments.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name and index.name.startswith("ix_expiry_"):
+                index.create(engine, checkfirst=True)
+
+
 def get_session() -> Generator[Session, None, None]:
     """Database session dependency"""
     with Session(engine) as session:
@@ -6,10 +6,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from config import settings
-from database import create_db_and_tables
+from database import create_db_and_tables, ensure_expiry_indexes
 from routers import (
-    vehicles_router, maintenance_router, assignments_router, fuel_router, documents_router
+    vehicles_router, maintenance_router, assignments_router, fuel_router, documents_router,
+    expiry_alerts_router
 )
+from services.expiry_scan_service import expiry_scheduler
+from services.change_feed import change_feed_consumer
 import logging
 
 
@@ -64,9 +67,22 @@ async def internal_server_error_handler(request: Request, exc: Exception):
 async def startup_event():
     """Initialize database and create tables"""
     create_db_and_tables()
+    ensure_expiry_indexes()
+    if settings.expiry_scan_enabled:
+        expiry_scheduler.start()
+    if settings.change_feed_enabled:
+        change_feed_consumer.start()
     logger.info("Fleet management database initialized successfully")
 
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the compliance expiry scan task and the change feed consumer"""
+    await expiry_scheduler.stop()
+    await change_feed_consumer.stop()
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -84,6 +100,7 @@ app.include_router(maintenance_router, prefix="/api/v1")
 app.include_router(assignments_router, prefix="/api/v1")
 app.include_router(fuel_router, prefix="/api/v1")
 app.include_router(documents_router, prefix="/api/v1")
+app.include_router(expiry_alerts_router, prefix="/api/v1")
 
 
 # Root endpoint
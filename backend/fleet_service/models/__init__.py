@@ -6,11 +6,15 @@ from .maintenance_record import MaintenanceRecord, MaintenanceType
 from .assignment import Assignment, AssignmentStatus
 from .fuel_log import FuelLog
 from .document import Document, DocumentType
+from .expiry_alert import ExpiryAlert, ExpiryStage, ExpiryAlertStatus
+from .replica import TourInstanceReplica
 
 __all__ = [
     "Vehicle", "VehicleType", "VehicleStatus", "FuelType",
     "MaintenanceRecord", "MaintenanceType",
     "Assignment", "AssignmentStatus",
     "FuelLog",
-    "Document", "DocumentType"
+    "Document", "DocumentType",
+    "ExpiryAlert", "ExpiryStage", "ExpiryAlertStatus",
+    "TourInstanceReplica"
 ]
\ No newline at end of file
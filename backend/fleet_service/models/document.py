@@ -2,6 +2,7 @@
 Document model for vehicle documentation
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from typing import Optional
 from datetime import datetime, date
 from enum import Enum
@@ -21,6 +22,10 @@ class DocumentType(str, Enum):
 class Document(SQLModel, table=True):
     """Document model for vehicle documentation storage"""
     __tablename__ = "documents"
+    __table_args__ = (
+        # Partial index for the daily expiry scan
+        Index("ix_expiry_documents_expiry_date", "expiry_date", postgresql_where=text("is_active")),
+    )
     
     id: Optional[uuid.UUID] = Field(
         default_factory=uuid.uuid4, primary_key=True
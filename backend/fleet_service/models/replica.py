@@ -0,0 +1,21 @@
+"""
+Local read models of other services, kept current from the change feed
+"""
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime, date
+import uuid
+
+
+class TourInstanceReplica(SQLModel, table=True):
+    """Summary of a tour instance, replicated from ``changes:tour_instances``"""
+    __tablename__ = "tour_instance_replicas"
+    
+    id: uuid.UUID = Field(primary_key=True)
+    status: Optional[str] = Field(default=None, max_length=50)
+    start_date: Optional[date] = Field(default=None)
+    end_date: Optional[date] = Field(default=None)
+    
+    # Source ``updated_at`` of the applied event, older events are skipped
+    version: datetime
+    synced_at: datetime = Field(default_factory=datetime.utcnow)
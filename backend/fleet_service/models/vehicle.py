@@ -2,6 +2,7 @@
 Vehicle model for fleet management
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from typing import Optional, List
 from datetime import datetime, date
 from enum import Enum
@@ -39,6 +40,12 @@ class FuelType(str, Enum):
 class Vehicle(SQLModel, table=True):
     """Vehicle model for fleet management"""
     __tablename__ = "vehicles"
+    __table_args__ = (
+        # Partial indexes for the daily expiry scan, which only looks at active vehicles
+        Index("ix_expiry_vehicles_registration", "registration_expiry", postgresql_where=text("is_active")),
+        Index("ix_expiry_vehicles_insurance", "insurance_expiry", postgresql_where=text("is_active")),
+        Index("ix_expiry_vehicles_inspection", "inspection_expiry", postgresql_where=text("is_active")),
+    )
     
     id: Optional[uuid.UUID] = Field(
         default_factory=uuid.uuid4, primary_key=True
@@ -6,5 +6,7 @@ from .maintenance import router as maintenance_router
 from .assignments import router as assignments_router
 from .fuel import router as fuel_router
 from .documents import router as documents_router
+from .expiry_alerts import router as expiry_alerts_router
 
-__all__ = ["vehicles_router", "maintenance_router", "assignments_router", "fuel_router", "documents_router"]
\ No newline at end of file
+__all__ = ["vehicles_router", "maintenance_router", "assignments_router", "fuel_router", "documents_router",
+           "expiry_alerts_router"]
\ No newline at end of file
@@ -88,7 +88,8 @@ async def get_assignments(
         items=assignments,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -173,5 +174,6 @@ async def get_vehicle_assignments(
         items=assignments,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
\ No newline at end of file
@@ -99,7 +99,8 @@ async def get_documents(
         items=documents,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -168,5 +169,6 @@ async def get_vehicle_documents(
         items=documents,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
\ No newline at end of file
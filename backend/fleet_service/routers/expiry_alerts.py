@@ -0,0 +1,47 @@
+"""
+Compliance expiry alert routes
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from database import get_session, get_redis
+from services.expiry_scan_service import ExpiryScanService
+from schemas.expiry_alert import ExpiryAlertResponse, ExpiryScanResult
+from models.expiry_alert import ExpiryStage
+from utils.auth import require_permission, CurrentUser
+from typing import List, Optional
+import redis
+import uuid
+
+
+router = APIRouter(prefix="/expiry-alerts", tags=["Compliance Expiry Alerts"])
+
+
+@router.get("/", response_model=List[ExpiryAlertResponse])
+async def get_expiry_alerts(
+    vehicle_id: Optional[uuid.UUID] = Query(None, description="Filter by vehicle"),
+    source_type: Optional[str] = Query(None, description="registration, insurance, inspection or document"),
+    stage: Optional[ExpiryStage] = Query(None, description="Filter by expiry stage"),
+    include_resolved: bool = Query(False, description="Include renewed and superseded alerts"),
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("fleet", "read", "vehicles"))
+):
+    """Get precomputed compliance expiry alerts"""
+    expiry_service = ExpiryScanService(session, redis_client)
+    return expiry_service.get_alerts(
+        vehicle_id=vehicle_id,
+        source_types=[source_type] if source_type else None,
+        stage=stage,
+        include_resolved=include_resolved
+    )
+
+
+@router.post("/scan", response_model=ExpiryScanResult)
+async def run_expiry_scan(
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("fleet", "update", "vehicles"))
+):
+    """Run the compliance expiry scan now instead of waiting for the daily job"""
+    expiry_service = ExpiryScanService(session, redis_client)
+    return await expiry_service.run_scan()
@@ -3,7 +3,7 @@ Fuel management routes
 """
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlmodel import Session
-from database import get_session
+from database import get_session, get_redis
 from services.fuel_service import FuelService
 from schemas.fuel_log import (
     FuelLogCreate, FuelLogUpdate, FuelLogResponse, FuelStats
@@ -11,6 +11,7 @@ from schemas.fuel_log import (
 from utils.auth import require_permission, CurrentUser
 from utils.pagination import PaginationParams, PaginatedResponse
 from typing import List, Optional
+import redis
 import uuid
 from datetime import date
 
@@ -22,6 +23,7 @@ router = APIRouter(prefix="/fuel", tags=["Fuel Management"])
 async def create_fuel_log(
     log_data: FuelLogCreate,
     session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
     current_user: CurrentUser = Depends(require_permission("fleet", "create", "fuel"))
 ):
     """Create a new fuel log entry"""
@@ -29,7 +31,7 @@ async def create_fuel_log(
     if not log_data.created_by:
         log_data.created_by = current_user.user_id
     
-    fuel_service = FuelService(session)
+    fuel_service = FuelService(session, redis_client)
     return await fuel_service.create_fuel_log(log_data)
 
 
@@ -80,7 +82,8 @@ async def get_fuel_logs(
         items=logs,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -112,10 +115,11 @@ async def update_fuel_log(
     log_id: uuid.UUID,
     log_data: FuelLogUpdate,
     session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
     current_user: CurrentUser = Depends(require_permission("fleet", "update", "fuel"))
 ):
     """Update fuel log information"""
-    fuel_service = FuelService(session)
+    fuel_service = FuelService(session, redis_client)
     return await fuel_service.update_fuel_log(log_id, log_data)
 
 
@@ -123,10 +127,11 @@ async def update_fuel_log(
 async def delete_fuel_log(
     log_id: uuid.UUID,
     session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
     current_user: CurrentUser = Depends(require_permission("fleet", "delete", "fuel"))
 ):
     """Delete fuel log"""
-    fuel_service = FuelService(session)
+    fuel_service = FuelService(session, redis_client)
     return await fuel_service.delete_fuel_log(log_id)
 
 
@@ -146,5 +151,6 @@ async def get_vehicle_fuel_history(
         items=logs,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
\ No newline at end of file
@@ -88,7 +88,8 @@ async def get_maintenance_records(
         items=records,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -170,5 +171,6 @@ async def get_vehicle_maintenance_history(
         items=records,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
\ No newline at end of file
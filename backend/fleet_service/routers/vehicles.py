@@ -109,7 +109,8 @@ async def get_vehicles(
         items=vehicles,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -6,11 +6,13 @@ from .maintenance_record import *
 from .assignment import *
 from .fuel_log import *
 from .document import *
+from .expiry_alert import *
 
 __all__ = [
     "VehicleCreate", "VehicleUpdate", "VehicleResponse", "VehicleSummary",
     "MaintenanceRecordCreate", "MaintenanceRecordUpdate", "MaintenanceRecordResponse",
     "AssignmentCreate", "AssignmentUpdate", "AssignmentResponse",
     "FuelLogCreate", "FuelLogUpdate", "FuelLogResponse",
-    "DocumentCreate", "DocumentUpdate", "DocumentResponse"
+    "DocumentCreate", "DocumentUpdate", "DocumentResponse",
+    "ExpiryAlertResponse", "ExpiryScanResult"
 ]
\ No newline at end of file
@@ -6,5 +6,7 @@ from .maintenance_service import MaintenanceService
 from .assignment_service import AssignmentService
 from .fuel_service import FuelService
 from .document_service import DocumentService
+from .expiry_scan_service import ExpiryScanService
 
-__all__ = ["VehicleService", "MaintenanceService", "AssignmentService", "FuelService", "DocumentService"]
\ No newline at end of file
+__all__ = ["VehicleService", "MaintenanceService", "AssignmentService", "FuelService", "DocumentService",
+           "ExpiryScanService"]
\ No newline at end of file
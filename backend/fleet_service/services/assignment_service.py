@@ -5,11 +5,13 @@ from sqlmodel import Session, select, and_, or_
 from fastapi import HTTPException, status
 from models.assignment import Assignment, AssignmentStatus
 from models.vehicle import Vehicle, VehicleStatus
+from models.replica import TourInstanceReplica
 from schemas.assignment import (
     AssignmentCreate, AssignmentUpdate, AssignmentResponse, AssignmentConflict
 )
 from utils.pagination import PaginationParams, paginate_query
 from utils.notifications import NotificationService
+from services.maintenance_forecast_service import invalidate_maintenance_forecast
 from typing import List, Optional, Tuple
 from datetime import datetime, date
 import redis
@@ -23,7 +25,7 @@ class AssignmentService:
     def __init__(self, session: Session, redis_client: redis.Redis):
         self.session = session
         self.redis = redis_client
-        self.notification_service = NotificationService(redis_client)
+        self.notification_service = NotificationService()
     
     async def create_assignment(self, assignment_data: AssignmentCreate) -> AssignmentResponse:
         """Create a new vehicle assignment"""
@@ -328,6 +330,7 @@ class AssignmentService:
         self.session.add(assignment)
         self.session.commit()
         self.session.refresh(assignment)
+        invalidate_maintenance_forecast(self.redis)
         
         # Send notification
         await self.notification_service.send_assignment_update(
@@ -395,7 +398,9 @@ class AssignmentService:
         return conflicts
     
     async def _verify_tour_instance_exists(self, tour_instance_id: uuid.UUID) -> bool:
-        """Verify tour instance exists in tour service"""
+        """Verify tour instance exists, from the local replica or the tour service"""
+        if self.session.get(TourInstanceReplica, tour_instance_id) is not None:
+            return True
         try:
             from config import settings
             async with httpx.AsyncClient() as client:
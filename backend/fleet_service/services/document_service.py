@@ -5,15 +5,18 @@ from sqlmodel import Session, select, and_
 from fastapi import HTTPException, status, UploadFile
 from models.document import Document, DocumentType
 from models.vehicle import Vehicle
+from models.expiry_alert import ExpiryAlert
 from schemas.document import (
     DocumentCreate, DocumentUpdate, DocumentResponse
 )
 from utils.pagination import PaginationParams, paginate_query
+from utils.upload import process_upload
+from services.expiry_scan_service import DOCUMENT_SOURCE
+from config import settings
 from typing import List, Optional, Tuple
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import uuid
 import os
-import shutil
 
 
 class DocumentService:
@@ -21,10 +24,6 @@ class DocumentService:
     
     def __init__(self, session: Session):
         self.session = session
-        self.upload_directory = "uploads/documents"
-        
-        # Create upload directory if it doesn't exist
-        os.makedirs(self.upload_directory, exist_ok=True)
     
     async def upload_document(
         self, 
@@ -50,30 +49,8 @@ class DocumentService:
                 detail="Vehicle not found"
             )
         
-        # Validate file
-        if not file.filename:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No file provided"
-            )
-        
-        # Generate unique filename
-        file_extension = file.filename.split('.')[-1].lower()
-        unique_filename = f"{uuid.uuid4()}.{file_extension}"
-        file_path = os.path.join(self.upload_directory, unique_filename)
-        
-        # Save file
-        try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to save file: {str(e)}"
-            )
-        
-        # Get file size
-        file_size = os.path.getsize(file_path)
+        # Stream the file into storage
+        upload_result = await process_upload(file)
         
         # Create document record
         document_data = DocumentCreate(
@@ -81,10 +58,10 @@ class DocumentService:
             document_type=document_type,
             title=title,
             description=description,
-            file_name=file.filename,
-            file_path=file_path,
-            file_size=file_size,
-            mime_type=file.content_type or "application/octet-stream",
+            file_name=upload_result["original_filename"],
+            file_path=upload_result["file_path"],
+            file_size=upload_result["file_size"],
+            mime_type=upload_result["mime_type"],
             issue_date=issue_date,
             expiry_date=expiry_date,
             issuing_authority=issuing_authority,
@@ -233,16 +210,26 @@ class DocumentService:
         return await self.get_documents(pagination, vehicle_id=vehicle_id)
     
     async def get_expiring_documents(self, days_ahead: int = 30) -> List[DocumentResponse]:
-        """Get documents expiring within specified days"""
-        expiry_threshold = date.today() + timedelta(days=days_ahead)
+        """Get documents expiring within specified days
+        
+        Within the compliance alert window the documents come from the
+        expiry alert queue; longer horizons read the documents directly.
+        """
+        today = date.today()
+        expiry_threshold = today + timedelta(days=days_ahead)
         
         statement = select(Document).where(
             Document.is_active == True,
             Document.expiry_date.is_not(None),
             Document.expiry_date <= expiry_threshold,
-            Document.expiry_date >= date.today()
+            Document.expiry_date >= today
         ).order_by(Document.expiry_date)
         
+        if days_ahead <= settings.compliance_alert_days:
+            statement = statement.where(
+                Document.id.in_(ExpiryAlert.open_source_ids(DOCUMENT_SOURCE, today, expiry_threshold))
+            )
+        
         documents = self.session.exec(statement).all()
         
         return [self._create_document_response(document) for document in documents]
@@ -0,0 +1,290 @@
+"""
+Expiry scan service for the precomputed compliance alert queue
+"""
+from sqlmodel import Session, select
+from sqlalchemy import update
+from models.vehicle import Vehicle
+from models.document import Document
+from models.expiry_alert import ExpiryAlert, ExpiryStage, ExpiryAlertStatus
+from schemas.expiry_alert import ExpiryAlertResponse, ExpiryScanResult
+from utils.notifications import NotificationService
+from database import engine, redis_client as default_redis_client
+from config import settings
+from typing import List, Optional, Dict, Tuple, Any
+from datetime import datetime, date, timedelta
+import asyncio
+import redis
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Vehicle compliance columns, keyed by the alert source type
+VEHICLE_EXPIRY_COLUMNS = {
+    "registration": Vehicle.registration_expiry,
+    "insurance": Vehicle.insurance_expiry,
+    "inspection": Vehicle.inspection_expiry,
+}
+DOCUMENT_SOURCE = "document"
+
+SCAN_LOCK_TTL = 86400  # One scan per calendar day across replicas
+IN_CLAUSE_CHUNK_SIZE = 500
+
+AlertKey = Tuple[str, uuid.UUID, date, ExpiryStage]
+
+
+class ExpiryScanService:
+    """Service maintaining the compliance expiry alert queue
+
+    The scan reads only the expiry columns of active rows inside the alert
+    window (served by the partial ``ix_expiry_*`` indexes), queues alerts
+    that were not raised before, resolves alerts whose source was renewed
+    or moved to a later stage, and dispatches the queue in one batch.
+    Dashboards read the queue instead of scanning vehicles and documents.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        redis_client: Optional[redis.Redis] = None,
+        notification_service: Optional[NotificationService] = None
+    ):
+        self.session = session
+        self.redis = redis_client if redis_client is not None else default_redis_client
+        self.notifications = notification_service or NotificationService()
+
+    async def run_daily_scan(self, today: Optional[date] = None) -> Optional[ExpiryScanResult]:
+        """Run the scan unless another replica already ran it today
+
+        Returns:
+            The scan result, or None when the scan was skipped
+        """
+        today = today or date.today()
+        lock_key = f"expiry_scan:lock:{today.isoformat()}"
+        try:
+            if not self.redis.set(lock_key, "1", nx=True, ex=SCAN_LOCK_TTL):
+                return None
+        except redis.RedisError as e:
+            logger.warning(f"Expiry scan skipped, lock unavailable: {str(e)}")
+            return None
+
+        try:
+            return await self.run_scan(today)
+        except Exception:
+            # Let the next check retry today's scan
+            self.redis.delete(lock_key)
+            raise
+
+    async def run_scan(self, today: Optional[date] = None) -> ExpiryScanResult:
+        """Queue new alerts, resolve stale ones and dispatch the queue"""
+        today = today or date.today()
+        candidates = self._collect_candidates(today)
+        queued = self._queue_new_alerts(candidates)
+        resolved = self._resolve_stale_alerts(candidates)
+        self.session.commit()
+
+        dispatched = await self.dispatch_pending(today)
+        logger.info(
+            f"Expiry scan: {len(candidates)} candidates, {queued} queued, "
+            f"{resolved} resolved, {dispatched} dispatched"
+        )
+        return ExpiryScanResult(
+            candidates=len(candidates),
+            queued=queued,
+            resolved=resolved,
+            dispatched=dispatched
+        )
+
+    async def dispatch_pending(self, today: Optional[date] = None) -> int:
+        """Send every pending alert in one batch and mark them dispatched"""
+        today = today or date.today()
+        pending = self.session.exec(
+            select(ExpiryAlert)
+            .where(ExpiryAlert.status == ExpiryAlertStatus.PENDING)
+            .order_by(ExpiryAlert.expiry_date)
+        ).all()
+        if not pending:
+            return 0
+
+        try:
+            await self.notifications.send_compliance_alerts([
+                {
+                    "vehicle_id": alert.vehicle_id,
+                    "alert_type": alert.source_type,
+                    "data": {
+                        "label": alert.label,
+                        "stage": alert.stage.value,
+                        "expiry_date": alert.expiry_date.isoformat(),
+                        "days_until_expiry": alert.days_until_expiry(today)
+                    }
+                }
+                for alert in pending
+            ])
+        except redis.RedisError as e:
+            # Alerts stay pending and go out with the next scan
+            logger.warning(f"Expiry alert dispatch failed: {str(e)}")
+            return 0
+
+        self.session.execute(
+            update(ExpiryAlert)
+            .where(ExpiryAlert.id.in_([alert.id for alert in pending]))
+            .values(status=ExpiryAlertStatus.DISPATCHED, dispatched_at=datetime.utcnow())
+        )
+        self.session.commit()
+        return len(pending)
+
+    def get_alerts(
+        self,
+        vehicle_id: Optional[uuid.UUID] = None,
+        source_types: Optional[List[str]] = None,
+        stage: Optional[ExpiryStage] = None,
+        include_resolved: bool = False
+    ) -> List[ExpiryAlertResponse]:
+        """Get precomputed alerts, soonest expiry first"""
+        query = select(ExpiryAlert)
+        if not include_resolved:
+            query = query.where(ExpiryAlert.status != ExpiryAlertStatus.RESOLVED)
+        if vehicle_id:
+            query = query.where(ExpiryAlert.vehicle_id == vehicle_id)
+        if source_types:
+            query = query.where(ExpiryAlert.source_type.in_(source_types))
+        if stage:
+            query = query.where(ExpiryAlert.stage == stage)
+
+        alerts = self.session.exec(query.order_by(ExpiryAlert.expiry_date)).all()
+        return [self._create_alert_response(alert) for alert in alerts]
+
+    def _collect_candidates(self, today: date) -> Dict[AlertKey, Dict[str, Any]]:
+        """Read the expiry columns of active rows inside the alert window"""
+        horizon = today + timedelta(days=settings.compliance_alert_days)
+        candidates: Dict[AlertKey, Dict[str, Any]] = {}
+
+        for source_type, column in VEHICLE_EXPIRY_COLUMNS.items():
+            rows = self.session.exec(
+                select(Vehicle.id, Vehicle.license_plate, column)
+                .where(Vehicle.is_active == True, column <= horizon)
+            ).all()
+            for vehicle_id, license_plate, expiry_date in rows:
+                key = (source_type, vehicle_id, expiry_date, ExpiryAlert.stage_for(expiry_date, today))
+                candidates[key] = {"vehicle_id": vehicle_id, "label": license_plate}
+
+        rows = self.session.exec(
+            select(Document.id, Document.vehicle_id, Document.title, Document.expiry_date)
+            .where(Document.is_active == True, Document.expiry_date <= horizon)
+        ).all()
+        for document_id, vehicle_id, title, expiry_date in rows:
+            key = (DOCUMENT_SOURCE, document_id, expiry_date, ExpiryAlert.stage_for(expiry_date, today))
+            candidates[key] = {"vehicle_id": vehicle_id, "label": title}
+
+        return candidates
+
+    def _queue_new_alerts(self, candidates: Dict[AlertKey, Dict[str, Any]]) -> int:
+        """Insert alerts for candidates that were never raised before"""
+        source_ids = list({key[1] for key in candidates})
+        existing = set()
+        for start in range(0, len(source_ids), IN_CLAUSE_CHUNK_SIZE):
+            rows = self.session.exec(
+                select(
+                    ExpiryAlert.source_type,
+                    ExpiryAlert.source_id,
+                    ExpiryAlert.expiry_date,
+                    ExpiryAlert.stage
+                ).where(ExpiryAlert.source_id.in_(source_ids[start:start + IN_CLAUSE_CHUNK_SIZE]))
+            ).all()
+            existing.update(tuple(row) for row in rows)
+
+        new_alerts = [
+            ExpiryAlert(
+                source_type=source_type,
+                source_id=source_id,
+                expiry_date=expiry_date,
+                stage=stage,
+                **details
+            )
+            for (source_type, source_id, expiry_date, stage), details in candidates.items()
+            if (source_type, source_id, expiry_date, stage) not in existing
+        ]
+        self.session.add_all(new_alerts)
+        self.session.flush()
+        return len(new_alerts)
+
+    def _resolve_stale_alerts(self, candidates: Dict[AlertKey, Dict[str, Any]]) -> int:
+        """Resolve open alerts that no longer match a candidate"""
+        open_alerts = self.session.exec(
+            select(
+                ExpiryAlert.id,
+                ExpiryAlert.source_type,
+                ExpiryAlert.source_id,
+                ExpiryAlert.expiry_date,
+                ExpiryAlert.stage
+            ).where(ExpiryAlert.status != ExpiryAlertStatus.RESOLVED)
+        ).all()
+        stale_ids = [row[0] for row in open_alerts if tuple(row[1:]) not in candidates]
+        if stale_ids:
+            self.session.execute(
+                update(ExpiryAlert)
+                .where(ExpiryAlert.id.in_(stale_ids))
+                .values(status=ExpiryAlertStatus.RESOLVED, resolved_at=datetime.utcnow())
+            )
+        return len(stale_ids)
+
+    def _create_alert_response(self, alert: ExpiryAlert) -> ExpiryAlertResponse:
+        """Create alert response with calculated fields"""
+        return ExpiryAlertResponse(
+            id=alert.id,
+            source_type=alert.source_type,
+            source_id=alert.source_id,
+            vehicle_id=alert.vehicle_id,
+            label=alert.label,
+            expiry_date=alert.expiry_date,
+            stage=alert.stage,
+            status=alert.status,
+            days_until_expiry=alert.days_until_expiry(),
+            created_at=alert.created_at,
+            dispatched_at=alert.dispatched_at,
+            resolved_at=alert.resolved_at
+        )
+
+
+class ExpiryScanScheduler:
+    """Background task that runs the expiry scan once a day
+
+    The task wakes up every ``check_interval`` seconds; the per-day Redis
+    lock makes all but the first check of the day a no-op, so restarts and
+    multiple replicas do not rescan or resend alerts.
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> Optional[ExpiryScanResult]:
+        """Run today's scan if it has not run yet"""
+        with Session(engine) as session:
+            return await ExpiryScanService(session).run_daily_scan()
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Expiry scan failed: {str(e)}")
+            await asyncio.sleep(self.check_interval)
+
+    def start(self):
+        """Start the periodic scan task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the periodic scan task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+expiry_scheduler = ExpiryScanScheduler(settings.expiry_scan_check_minutes * 60)
@@ -9,16 +9,20 @@ from schemas.fuel_log import (
     FuelLogCreate, FuelLogUpdate, FuelLogResponse, FuelStats
 )
 from utils.pagination import PaginationParams, paginate_query
+from services.maintenance_forecast_service import invalidate_maintenance_forecast
+from database import redis_client as default_redis_client
 from typing import List, Optional, Tuple
 from datetime import datetime, date, timedelta
+import redis
 import uuid
 
 
 class FuelService:
     """Service for handling fuel consumption tracking"""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, redis_client: Optional[redis.Redis] = None):
         self.session = session
+        self.redis = redis_client if redis_client is not None else default_redis_client
     
     async def create_fuel_log(self, log_data: FuelLogCreate) -> FuelLogResponse:
         """Create a new fuel log entry"""
@@ -73,6 +77,7 @@ class FuelService:
         
         self.session.commit()
         self.session.refresh(fuel_log)
+        invalidate_maintenance_forecast(self.redis)
         
         return self._create_fuel_log_response(fuel_log)
     
@@ -150,6 +155,7 @@ class FuelService:
         self.session.add(fuel_log)
         self.session.commit()
         self.session.refresh(fuel_log)
+        invalidate_maintenance_forecast(self.redis)
         
         return self._create_fuel_log_response(fuel_log)
     
@@ -166,6 +172,7 @@ class FuelService:
         
         self.session.delete(fuel_log)
         self.session.commit()
+        invalidate_maintenance_forecast(self.redis)
         
         return {"message": "Fuel log deleted successfully"}
     
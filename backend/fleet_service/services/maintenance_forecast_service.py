@@ -0,0 +1,236 @@
+"""
+Maintenance forecast service projecting service due dates from odometer velocity
+"""
+from sqlmodel import Session, select, and_, or_, func
+from sqlalchemy import union_all
+from models.vehicle import Vehicle
+from models.assignment import Assignment, AssignmentStatus
+from models.maintenance_record import MaintenanceRecord
+from models.fuel_log import FuelLog
+from database import redis_client as default_redis_client
+from config import settings
+from typing import List, Optional, Dict, Iterable, Any
+from datetime import date, timedelta
+import json
+import redis
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+USAGE_WINDOW_DAYS = 90  # Odometer readings used to estimate the daily kilometre rate
+FORECAST_HORIZON_DAYS = 365  # Furthest projection kept in the cached schedule
+FORECAST_CACHE_PREFIX = "maintenance:forecast"
+
+
+def _forecast_cache_key(today: date) -> str:
+    """Cache key of the fleet forecast computed on a given day"""
+    return f"{FORECAST_CACHE_PREFIX}:{today.isoformat()}"
+
+
+def invalidate_maintenance_forecast(redis_client: Optional[redis.Redis] = None):
+    """Drop the cached fleet forecast so the next read recomputes it
+
+    Called after writes that move an odometer or a service schedule: fuel
+    logs, assignment completions and maintenance records.
+    """
+    client = redis_client if redis_client is not None else default_redis_client
+    try:
+        client.delete(_forecast_cache_key(date.today()))
+    except redis.RedisError as e:
+        logger.warning(f"Maintenance forecast cache not invalidated: {str(e)}")
+
+
+class MaintenanceForecastService:
+    """Service forecasting when each vehicle falls due for service
+
+    The daily kilometre rate of every vehicle comes from one grouped query
+    over recent fuel-log and assignment odometer readings, and the latest
+    schedule of each vehicle and maintenance type from a second query.
+    Both are combined in a single pass; the fleet-wide result is cached in
+    Redis for the day until a relevant write invalidates it.
+    """
+
+    def __init__(self, session: Session, redis_client: Optional[redis.Redis] = None):
+        self.session = session
+        self.redis = redis_client if redis_client is not None else default_redis_client
+
+    async def get_fleet_forecast(self, days_ahead: int = 30) -> List[dict]:
+        """Get the fleet-wide service schedule due within ``days_ahead`` days
+
+        Overdue services are always included, soonest first.
+        """
+        today = date.today()
+        cache_key = _forecast_cache_key(today)
+
+        forecast = None
+        try:
+            cached = self.redis.get(cache_key)
+            if cached:
+                forecast = json.loads(cached)
+        except redis.RedisError as e:
+            logger.warning(f"Maintenance forecast cache unavailable: {str(e)}")
+
+        if forecast is None:
+            forecast = self.build_forecast(today=today)
+            try:
+                self.redis.setex(cache_key, settings.maintenance_forecast_cache_seconds, json.dumps(forecast))
+            except redis.RedisError as e:
+                logger.warning(f"Maintenance forecast not cached: {str(e)}")
+
+        return [item for item in forecast if item["days_until_service"] <= days_ahead]
+
+    def build_forecast(
+        self,
+        vehicle_ids: Optional[Iterable[uuid.UUID]] = None,
+        today: Optional[date] = None,
+        horizon_days: int = FORECAST_HORIZON_DAYS
+    ) -> List[dict]:
+        """Project the next service of each vehicle and maintenance type
+
+        An odometer target is turned into a date using the vehicle's daily
+        kilometre rate; when a record sets both a date and an odometer
+        target, the earlier projection wins.
+        """
+        today = today or date.today()
+        horizon = today + timedelta(days=horizon_days)
+        vehicle_ids = list(vehicle_ids) if vehicle_ids is not None else None
+        daily_km = self.estimate_daily_km(vehicle_ids, today)
+
+        forecast = []
+        for record, vehicle in self._get_latest_schedules(vehicle_ids):
+            km_rate = daily_km.get(vehicle.id)
+            km_remaining = None
+            projections = []
+            if record.next_service_date:
+                projections.append((record.next_service_date, "date"))
+            if record.next_service_odometer is not None:
+                km_remaining = record.next_service_odometer - vehicle.current_odometer
+                if km_remaining <= 0:
+                    projections.append((today, "odometer"))
+                elif km_rate:
+                    projections.append((today + timedelta(days=int(km_remaining / km_rate)), "odometer"))
+
+            if not projections:
+                continue
+            due_date, due_by = min(projections)
+            if due_date > horizon:
+                continue
+
+            forecast.append({
+                "vehicle_id": str(vehicle.id),
+                "license_plate": vehicle.license_plate,
+                "vehicle_display_name": vehicle.get_display_name(),
+                "maintenance_type": record.maintenance_type.value,
+                "last_service_date": record.date_performed.isoformat(),
+                "last_service_description": record.description,
+                "next_service_date": record.next_service_date.isoformat() if record.next_service_date else None,
+                "next_service_odometer": record.next_service_odometer,
+                "current_odometer": vehicle.current_odometer,
+                "daily_km": round(km_rate, 1) if km_rate else None,
+                "km_remaining": km_remaining,
+                "projected_service_date": due_date.isoformat(),
+                "days_until_service": (due_date - today).days,
+                "due_by": due_by,
+                "is_overdue": due_date < today or (km_remaining is not None and km_remaining <= 0)
+            })
+
+        forecast.sort(key=lambda item: (item["projected_service_date"], item["license_plate"]))
+        return forecast
+
+    def estimate_daily_km(
+        self,
+        vehicle_ids: Optional[List[uuid.UUID]] = None,
+        today: Optional[date] = None
+    ) -> Dict[uuid.UUID, float]:
+        """Estimate each vehicle's daily kilometre rate
+
+        Fuel-log readings and assignment start/end readings from the usage
+        window are pooled per vehicle; the rate is the odometer span over
+        the date span of those readings.
+        """
+        today = today or date.today()
+        since = today - timedelta(days=USAGE_WINDOW_DAYS)
+
+        fuel_readings = select(
+            FuelLog.vehicle_id.label("vehicle_id"),
+            FuelLog.slot_date.label("reading_date"),
+            FuelLog.odometer_reading.label("odometer")
+        ).where(FuelLog.slot_date >= since, FuelLog.slot_date <= today)
+        start_readings = select(
+            Assignment.vehicle_id.label("vehicle_id"),
+            Assignment.start_date.label("reading_date"),
+            Assignment.start_odometer.label("odometer")
+        ).where(
+            Assignment.start_odometer.is_not(None),
+            Assignment.start_date >= since,
+            Assignment.start_date <= today
+        )
+        end_readings = select(
+            Assignment.vehicle_id.label("vehicle_id"),
+            Assignment.end_date.label("reading_date"),
+            Assignment.end_odometer.label("odometer")
+        ).where(
+            Assignment.status == AssignmentStatus.COMPLETED,
+            Assignment.end_odometer.is_not(None),
+            Assignment.end_date >= since,
+            Assignment.end_date <= today
+        )
+        if vehicle_ids is not None:
+            fuel_readings = fuel_readings.where(FuelLog.vehicle_id.in_(vehicle_ids))
+            start_readings = start_readings.where(Assignment.vehicle_id.in_(vehicle_ids))
+            end_readings = end_readings.where(Assignment.vehicle_id.in_(vehicle_ids))
+
+        readings = union_all(fuel_readings, start_readings, end_readings).subquery()
+        rows = self.session.exec(
+            select(
+                readings.c.vehicle_id,
+                func.min(readings.c.reading_date),
+                func.max(readings.c.reading_date),
+                func.min(readings.c.odometer),
+                func.max(readings.c.odometer)
+            ).group_by(readings.c.vehicle_id)
+        ).all()
+
+        daily_km = {}
+        for vehicle_id, first_date, last_date, min_odometer, max_odometer in rows:
+            if last_date > first_date and max_odometer > min_odometer:
+                daily_km[vehicle_id] = (max_odometer - min_odometer) / (last_date - first_date).days
+        return daily_km
+
+    def _get_latest_schedules(self, vehicle_ids: Optional[List[uuid.UUID]] = None) -> List[Any]:
+        """Get the latest scheduling record of each active vehicle and maintenance type"""
+        has_schedule = and_(
+            MaintenanceRecord.is_completed == True,
+            or_(
+                MaintenanceRecord.next_service_date.is_not(None),
+                MaintenanceRecord.next_service_odometer.is_not(None)
+            )
+        )
+
+        latest = select(
+            MaintenanceRecord.vehicle_id,
+            MaintenanceRecord.maintenance_type,
+            func.max(MaintenanceRecord.date_performed).label("date_performed")
+        ).where(has_schedule)
+        if vehicle_ids is not None:
+            latest = latest.where(MaintenanceRecord.vehicle_id.in_(vehicle_ids))
+        latest = latest.group_by(MaintenanceRecord.vehicle_id, MaintenanceRecord.maintenance_type).subquery()
+
+        rows = self.session.exec(
+            select(MaintenanceRecord, Vehicle)
+            .join(latest, and_(
+                MaintenanceRecord.vehicle_id == latest.c.vehicle_id,
+                MaintenanceRecord.maintenance_type == latest.c.maintenance_type,
+                MaintenanceRecord.date_performed == latest.c.date_performed
+            ))
+            .join(Vehicle, Vehicle.id == MaintenanceRecord.vehicle_id)
+            .where(has_schedule, Vehicle.is_active == True)
+            .order_by(MaintenanceRecord.created_at.desc())
+        ).all()
+
+        # Several records of one type on the same day: keep the newest entry
+        schedules = {}
+        for record, vehicle in rows:
+            schedules.setdefault((record.vehicle_id, record.maintenance_type), (record, vehicle))
+        return list(schedules.values())
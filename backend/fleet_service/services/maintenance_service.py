@@ -10,6 +10,7 @@ from schemas.maintenance_record import (
 )
 from utils.pagination import PaginationParams, paginate_query
 from utils.notifications import send_maintenance_reminder
+from services.maintenance_forecast_service import MaintenanceForecastService, invalidate_maintenance_forecast
 from typing import List, Optional, Tuple
 from datetime import datetime, date, timedelta
 import redis
@@ -48,11 +49,11 @@ class MaintenanceService:
         
         self.session.commit()
         self.session.refresh(record)
+        invalidate_maintenance_forecast(self.redis)
         
         # Send notification for next service if scheduled
         if record.next_service_date:
             await send_maintenance_reminder(
-                self.redis,
                 record.vehicle_id,
                 record.maintenance_type.value,
                 {
@@ -143,6 +144,7 @@ class MaintenanceService:
         self.session.add(record)
         self.session.commit()
         self.session.refresh(record)
+        invalidate_maintenance_forecast(self.redis)
         
         return self._create_maintenance_response(record)
     
@@ -159,6 +161,7 @@ class MaintenanceService:
         
         self.session.delete(record)
         self.session.commit()
+        invalidate_maintenance_forecast(self.redis)
         
         return {"message": "Maintenance record deleted successfully"}
     
@@ -181,37 +184,13 @@ class MaintenanceService:
         return await self.get_maintenance_records(pagination, vehicle_id=vehicle_id)
     
     async def get_upcoming_maintenance(self, days_ahead: int = 30) -> List[dict]:
-        """Get vehicles with upcoming maintenance"""
-        cutoff_date = date.today() + timedelta(days=days_ahead)
-        
-        statement = select(MaintenanceRecord).where(
-            MaintenanceRecord.next_service_date <= cutoff_date,
-            MaintenanceRecord.next_service_date >= date.today(),
-            MaintenanceRecord.is_completed == True
-        ).order_by(MaintenanceRecord.next_service_date)
-        
-        upcoming_records = self.session.exec(statement).all()
-        
-        upcoming_maintenance = []
-        for record in upcoming_records:
-            # Get vehicle info
-            vehicle_stmt = select(Vehicle).where(Vehicle.id == record.vehicle_id)
-            vehicle = self.session.exec(vehicle_stmt).first()
-            
-            if vehicle:
-                days_until = (record.next_service_date - date.today()).days
-                upcoming_maintenance.append({
-                    "vehicle_id": str(record.vehicle_id),
-                    "license_plate": vehicle.license_plate,
-                    "vehicle_display_name": vehicle.get_display_name(),
-                    "maintenance_type": record.maintenance_type.value,
-                    "next_service_date": record.next_service_date.isoformat(),
-                    "days_until_service": days_until,
-                    "last_service_description": record.description,
-                    "next_service_odometer": record.next_service_odometer
-                })
+        """Get vehicles with upcoming maintenance
         
-        return upcoming_maintenance
+        Served from the fleet maintenance forecast, which also projects
+        odometer-based service targets from each vehicle's daily mileage.
+        """
+        forecast_service = MaintenanceForecastService(self.session, self.redis)
+        return await forecast_service.get_fleet_forecast(days_ahead)
     
     async def get_maintenance_stats(self, days: int = 365) -> MaintenanceStats:
         """Get maintenance statistics for the specified period"""
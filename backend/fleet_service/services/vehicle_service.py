@@ -4,15 +4,18 @@ Vehicle service for fleet management operations
 from sqlmodel import Session, select, and_, or_, func
 from fastapi import HTTPException, status
 from models.vehicle import Vehicle, VehicleStatus
-from models.assignment import Assignment
+from models.assignment import Assignment, AssignmentStatus
 from models.maintenance_record import MaintenanceRecord
 from models.fuel_log import FuelLog
+from models.expiry_alert import ExpiryStage
 from schemas.vehicle import (
     VehicleCreate, VehicleUpdate, VehicleResponse, VehicleSummary, 
     VehicleSearch, VehicleAvailability
 )
 from utils.pagination import PaginationParams, paginate_query
-from utils.notifications import send_compliance_alert
+from config import settings
+from services.expiry_scan_service import ExpiryScanService, VEHICLE_EXPIRY_COLUMNS
+from services.maintenance_forecast_service import MaintenanceForecastService
 from typing import List, Optional, Tuple
 from datetime import datetime, date, timedelta
 import redis
@@ -244,37 +247,13 @@ class VehicleService:
                 detail="Vehicle not found"
             )
         
-        # Get assignment statistics
-        assignments_stmt = select(Assignment).where(Assignment.vehicle_id == vehicle_id)
-        assignments = self.session.exec(assignments_stmt).all()
-        
-        active_assignments = [a for a in assignments if a.status == "Active"]
-        
-        # Get maintenance statistics
-        maintenance_stmt = select(MaintenanceRecord).where(MaintenanceRecord.vehicle_id == vehicle_id)
-        maintenance_records = self.session.exec(maintenance_stmt).all()
-        
-        total_maintenance_cost = sum(record.cost or 0 for record in maintenance_records)
-        last_maintenance = max(maintenance_records, key=lambda x: x.date_performed, default=None)
-        
-        # Get fuel efficiency
-        fuel_stmt = select(FuelLog).where(
-            FuelLog.vehicle_id == vehicle_id,
-            FuelLog.fuel_efficiency.is_not(None)
-        )
-        fuel_logs = self.session.exec(fuel_stmt).all()
-        
-        avg_fuel_efficiency = None
-        if fuel_logs:
-            avg_fuel_efficiency = sum(log.fuel_efficiency for log in fuel_logs) / len(fuel_logs)
-        
-        # Calculate total distance
-        total_distance = sum(assignment.get_distance_traveled() or 0 for assignment in assignments)
+        # Lifetime statistics in one aggregated query
+        stats = self._get_vehicle_statistics(vehicle_id)
         
         # Days since last service
         days_since_service = None
-        if last_maintenance:
-            days_since_service = (date.today() - last_maintenance.date_performed).days
+        if stats["last_maintenance_date"]:
+            days_since_service = (date.today() - stats["last_maintenance_date"]).days
         
         # Check compliance alerts
         compliance_status = vehicle.get_compliance_status()
@@ -294,15 +273,15 @@ class VehicleService:
         
         return VehicleSummary(
             **base_response.model_dump(),
-            total_assignments=len(assignments),
-            active_assignments=len(active_assignments),
-            total_maintenance_records=len(maintenance_records),
-            last_maintenance_date=last_maintenance.date_performed if last_maintenance else None,
-            total_maintenance_cost=total_maintenance_cost,
-            average_fuel_efficiency=avg_fuel_efficiency,
-            total_distance_traveled=total_distance,
+            total_assignments=stats["total_assignments"],
+            active_assignments=stats["active_assignments"],
+            total_maintenance_records=stats["total_maintenance_records"],
+            last_maintenance_date=stats["last_maintenance_date"],
+            total_maintenance_cost=stats["total_maintenance_cost"],
+            average_fuel_efficiency=stats["average_fuel_efficiency"],
+            total_distance_traveled=stats["total_distance_traveled"],
             days_since_last_service=days_since_service,
-            upcoming_maintenance=[],  # TODO: Implement based on maintenance schedule
+            upcoming_maintenance=self._project_upcoming_maintenance(vehicle_id),
             compliance_alerts=compliance_alerts
         )
     
@@ -337,47 +316,109 @@ class VehicleService:
         return available_vehicles
     
     async def check_compliance_alerts(self) -> List[dict]:
-        """Check for vehicles with upcoming compliance deadlines"""
-        alert_date = date.today() + timedelta(days=settings.compliance_alert_days)
+        """Get vehicles with upcoming compliance deadlines
         
-        vehicles_stmt = select(Vehicle).where(
-            Vehicle.is_active == True,
-            or_(
-                Vehicle.registration_expiry <= alert_date,
-                Vehicle.insurance_expiry <= alert_date,
-                Vehicle.inspection_expiry <= alert_date
-            )
+        Reads the alert queue maintained by the daily expiry scan, which
+        also sends the notifications, instead of scanning the fleet.
+        """
+        alerts = ExpiryScanService(self.session, self.redis).get_alerts(
+            source_types=list(VEHICLE_EXPIRY_COLUMNS)
         )
         
-        vehicles = self.session.exec(vehicles_stmt).all()
-        
-        alerts = []
-        for vehicle in vehicles:
-            compliance_status = vehicle.get_compliance_status()
-            for doc_type, status in compliance_status.items():
-                if status.get("needs_attention"):
-                    alerts.append({
-                        "vehicle_id": str(vehicle.id),
-                        "license_plate": vehicle.license_plate,
-                        "document_type": doc_type,
-                        "expiry_date": status["expiry_date"].isoformat(),
-                        "days_until_expiry": status["days_until_expiry"],
-                        "is_expired": status["is_expired"]
-                    })
-                    
-                    # Send notification
-                    await send_compliance_alert(
-                        self.redis,
-                        vehicle.id,
-                        doc_type,
-                        {
-                            "license_plate": vehicle.license_plate,
-                            "expiry_date": status["expiry_date"].isoformat(),
-                            "days_until_expiry": status["days_until_expiry"]
-                        }
-                    )
-        
-        return alerts
+        return [
+            {
+                "vehicle_id": str(alert.vehicle_id),
+                "license_plate": alert.label,
+                "document_type": alert.source_type,
+                "expiry_date": alert.expiry_date.isoformat(),
+                "days_until_expiry": alert.days_until_expiry,
+                "is_expired": alert.stage == ExpiryStage.EXPIRED
+            }
+            for alert in alerts
+        ]
+    
+    def _get_vehicle_statistics(self, vehicle_id: uuid.UUID) -> dict:
+        """Aggregate assignment, maintenance and fuel statistics in one query
+        
+        Each table is reduced to a single row in a grouped subquery (served
+        by the ``vehicle_id`` indexes) and the three rows are joined, so the
+        cost does not grow with the vehicle's history on the Python side.
+        """
+        assignment_stats = select(
+            Assignment.vehicle_id,
+            func.count().label("total"),
+            func.count().filter(Assignment.status == AssignmentStatus.ACTIVE).label("active"),
+            func.sum(Assignment.end_odometer - Assignment.start_odometer).label("distance")
+        ).where(Assignment.vehicle_id == vehicle_id).group_by(Assignment.vehicle_id).subquery()
+        
+        maintenance_stats = select(
+            MaintenanceRecord.vehicle_id,
+            func.count().label("total"),
+            func.sum(MaintenanceRecord.cost).label("cost"),
+            func.max(MaintenanceRecord.date_performed).label("last_date")
+        ).where(MaintenanceRecord.vehicle_id == vehicle_id).group_by(MaintenanceRecord.vehicle_id).subquery()
+        
+        fuel_stats = select(
+            FuelLog.vehicle_id,
+            func.avg(FuelLog.fuel_efficiency).label("efficiency")
+        ).where(FuelLog.vehicle_id == vehicle_id).group_by(FuelLog.vehicle_id).subquery()
+        
+        row = self.session.exec(
+            select(
+                func.coalesce(assignment_stats.c.total, 0),
+                func.coalesce(assignment_stats.c.active, 0),
+                func.coalesce(assignment_stats.c.distance, 0),
+                func.coalesce(maintenance_stats.c.total, 0),
+                func.coalesce(maintenance_stats.c.cost, 0),
+                maintenance_stats.c.last_date,
+                fuel_stats.c.efficiency
+            )
+            .select_from(Vehicle)
+            .outerjoin(assignment_stats, assignment_stats.c.vehicle_id == Vehicle.id)
+            .outerjoin(maintenance_stats, maintenance_stats.c.vehicle_id == Vehicle.id)
+            .outerjoin(fuel_stats, fuel_stats.c.vehicle_id == Vehicle.id)
+            .where(Vehicle.id == vehicle_id)
+        ).one()
+        
+        (total_assignments, active_assignments, distance, total_records,
+         cost, last_maintenance_date, efficiency) = row
+        
+        return {
+            "total_assignments": total_assignments,
+            "active_assignments": active_assignments,
+            "total_distance_traveled": int(distance),
+            "total_maintenance_records": total_records,
+            "total_maintenance_cost": float(cost),
+            "last_maintenance_date": last_maintenance_date,
+            "average_fuel_efficiency": float(efficiency) if efficiency is not None else None
+        }
+    
+    def _project_upcoming_maintenance(self, vehicle_id: uuid.UUID) -> List[dict]:
+        """Project when each scheduled service of the vehicle falls due
+        
+        The projection is the fleet maintenance forecast restricted to one
+        vehicle; items keep the summary's own shape, without the vehicle
+        fields the fleet schedule repeats on every entry.
+        """
+        forecast = MaintenanceForecastService(self.session, self.redis).build_forecast(
+            vehicle_ids=[vehicle_id],
+            horizon_days=settings.maintenance_projection_days
+        )
+        return [
+            {
+                "maintenance_type": item["maintenance_type"],
+                "last_service_date": item["last_service_date"],
+                "description": item["last_service_description"],
+                "next_service_date": item["next_service_date"],
+                "next_service_odometer": item["next_service_odometer"],
+                "km_remaining": item["km_remaining"],
+                "projected_due_date": item["projected_service_date"],
+                "days_until_due": item["days_until_service"],
+                "due_by": item["due_by"],
+                "is_overdue": item["is_overdue"]
+            }
+            for item in forecast
+        ]
     
     def _create_vehicle_response(self, vehicle: Vehicle) -> VehicleResponse:
         """Create vehicle response with calculated fields"""
@@ -0,0 +1,57 @@
+"""
+Tests for vehicle document uploads
+"""
+import pytest
+import hashlib
+import io
+import os
+from fastapi import HTTPException, UploadFile
+from services.document_service import DocumentService
+from models.document import DocumentType
+import utils.upload
+
+
+def make_upload(content: bytes, filename: str = "registration.pdf") -> UploadFile:
+    """Build an upload without a declared size, like a chunked request"""
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+class TestDocumentUpload:
+    """Test class for streaming document uploads"""
+    
+    @pytest.fixture(autouse=True)
+    def upload_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils.upload, "UPLOAD_DIR", tmp_path)
+        monkeypatch.setattr(utils.upload, "UPLOAD_CHUNK_SIZE", 1024)
+        return tmp_path
+    
+    @pytest.mark.asyncio
+    async def test_upload_streams_file_into_place(self, session, create_test_vehicle, upload_dir):
+        """The stored file matches the upload and no spool file is left behind"""
+        vehicle = create_test_vehicle()
+        content = os.urandom(10 * 1024 + 17)
+        
+        document = await DocumentService(session).upload_document(
+            vehicle_id=vehicle.id,
+            document_type=DocumentType.REGISTRATION,
+            title="Registration",
+            file=make_upload(content)
+        )
+        
+        assert document.file_size == len(content)
+        assert document.file_name == "registration.pdf"
+        with open(document.file_path, "rb") as stored:
+            assert hashlib.sha256(stored.read()).digest() == hashlib.sha256(content).digest()
+        assert os.listdir(upload_dir / ".incoming") == []
+    
+    @pytest.mark.asyncio
+    async def test_upload_over_limit_is_rejected_while_streaming(self, upload_dir, monkeypatch):
+        """Size is enforced on the received bytes, not the declared size"""
+        monkeypatch.setattr(utils.upload, "MAX_FILE_SIZE", 4 * 1024)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await utils.upload.process_upload(make_upload(os.urandom(5 * 1024)))
+        
+        assert exc_info.value.status_code == 413
+        assert os.listdir(upload_dir / ".incoming") == []
+        assert [p for p in upload_dir.iterdir() if p.name != ".incoming"] == []
@@ -0,0 +1,94 @@
+"""
+Tests for the compliance expiry scan and alert queue
+"""
+import pytest
+import json
+from sqlmodel import select
+from services.expiry_scan_service import ExpiryScanService
+from services.vehicle_service import VehicleService
+from models.expiry_alert import ExpiryAlert, ExpiryStage, ExpiryAlertStatus
+from datetime import date, timedelta
+
+
+class TestExpiryScan:
+    """Test class for the expiry scan"""
+    
+    @pytest.mark.asyncio
+    async def test_scan_queues_and_dispatches_once(self, session, redis_client, create_test_vehicle):
+        """A second scan neither queues nor resends the same alerts"""
+        vehicle = create_test_vehicle(
+            insurance_expiry=date.today() + timedelta(days=15),
+            registration_expiry=date.today() + timedelta(days=60),
+            inspection_expiry=date.today() - timedelta(days=5)
+        )
+        create_test_vehicle(is_active=False, insurance_expiry=date.today())
+        pubsub = redis_client.pubsub()
+        pubsub.subscribe("fleet_compliance_alerts")
+        pubsub.get_message()
+        
+        expiry_service = ExpiryScanService(session, redis_client)
+        result = await expiry_service.run_scan()
+        assert result.queued == 2
+        assert result.dispatched == 2
+        
+        # Two alerts and one digest in a single batch
+        messages = [json.loads(pubsub.get_message()["data"]) for _ in range(3)]
+        assert [m["type"] for m in messages] == ["compliance_alert", "compliance_alert", "compliance_digest"]
+        assert redis_client.llen(f"alerts:compliance:{vehicle.id}") == 2
+        
+        again = await expiry_service.run_scan()
+        assert again.queued == 0
+        assert again.dispatched == 0
+        
+        stages = {a.source_type: a.stage for a in expiry_service.get_alerts(vehicle_id=vehicle.id)}
+        assert stages == {"insurance": ExpiryStage.UPCOMING, "inspection": ExpiryStage.EXPIRED}
+    
+    @pytest.mark.asyncio
+    async def test_renewal_and_stage_change_resolve_alerts(self, session, redis_client, create_test_vehicle):
+        """Renewed sources and earlier stages drop out of the open queue"""
+        vehicle = create_test_vehicle(
+            insurance_expiry=date.today() + timedelta(days=10),
+            inspection_expiry=date.today() + timedelta(days=20)
+        )
+        expiry_service = ExpiryScanService(session, redis_client)
+        await expiry_service.run_scan()
+        
+        # Three days later the insurance is within a week; the inspection was renewed
+        vehicle.inspection_expiry = date.today() + timedelta(days=365)
+        session.add(vehicle)
+        session.commit()
+        result = await expiry_service.run_scan(today=date.today() + timedelta(days=3))
+        assert result.queued == 1
+        assert result.resolved == 2
+        
+        open_alerts = expiry_service.get_alerts(vehicle_id=vehicle.id)
+        assert [(a.source_type, a.stage) for a in open_alerts] == [("insurance", ExpiryStage.IMMINENT)]
+        all_alerts = session.exec(select(ExpiryAlert)).all()
+        assert sum(a.status == ExpiryAlertStatus.RESOLVED for a in all_alerts) == 2
+    
+    @pytest.mark.asyncio
+    async def test_daily_scan_runs_once_per_day(self, session, redis_client, create_test_vehicle):
+        """The day lock skips repeat runs"""
+        create_test_vehicle(insurance_expiry=date.today() + timedelta(days=5))
+        expiry_service = ExpiryScanService(session, redis_client)
+        
+        assert (await expiry_service.run_daily_scan()).queued == 1
+        assert await expiry_service.run_daily_scan() is None
+    
+    @pytest.mark.asyncio
+    async def test_compliance_alerts_read_queue(self, session, redis_client, create_test_vehicle):
+        """Vehicle compliance alerts come from the precomputed queue"""
+        vehicle = create_test_vehicle(inspection_expiry=date.today() - timedelta(days=5))
+        vehicle_service = VehicleService(session, redis_client)
+        assert await vehicle_service.check_compliance_alerts() == []
+        
+        await ExpiryScanService(session, redis_client).run_scan()
+        alerts = await vehicle_service.check_compliance_alerts()
+        assert alerts == [{
+            "vehicle_id": str(vehicle.id),
+            "license_plate": vehicle.license_plate,
+            "document_type": "inspection",
+            "expiry_date": (date.today() - timedelta(days=5)).isoformat(),
+            "days_until_expiry": -5,
+            "is_expired": True
+        }]
@@ -115,6 +115,49 @@ class TestMaintenance:
         assert upcoming[0]["license_plate"] == "UPCOMING-001"
         assert upcoming[0]["days_until_service"] == 15
     
+    @pytest.mark.asyncio
+    async def test_upcoming_maintenance_projects_odometer(self, session, redis_client, create_test_vehicle, create_test_maintenance_record, create_test_assignment):
+        """Test odometer targets are projected from mileage and the forecast cache refreshes"""
+        from models.assignment import AssignmentStatus
+        from services.maintenance_forecast_service import invalidate_maintenance_forecast
+        
+        maintenance_service = MaintenanceService(session, redis_client)
+        
+        # 300 km per day over a completed 10-day assignment
+        test_vehicle = create_test_vehicle(license_plate="FORECAST-001", current_odometer=53000)
+        create_test_assignment(
+            test_vehicle.id,
+            status=AssignmentStatus.COMPLETED,
+            start_date=date.today() - timedelta(days=10),
+            end_date=date.today(),
+            start_odometer=50000,
+            end_odometer=53000
+        )
+        create_test_maintenance_record(
+            test_vehicle.id,
+            date_performed=date.today() - timedelta(days=60),
+            next_service_odometer=56000
+        )
+        
+        upcoming = await maintenance_service.get_upcoming_maintenance(days_ahead=30)
+        
+        assert len(upcoming) == 1
+        assert upcoming[0]["license_plate"] == "FORECAST-001"
+        assert upcoming[0]["due_by"] == "odometer"
+        assert upcoming[0]["daily_km"] == 300.0
+        assert upcoming[0]["days_until_service"] == 10
+        
+        # Served from cache until a relevant write invalidates it
+        test_vehicle.current_odometer = 56500
+        session.add(test_vehicle)
+        session.commit()
+        assert (await maintenance_service.get_upcoming_maintenance(days_ahead=30))[0]["is_overdue"] is False
+        
+        invalidate_maintenance_forecast(redis_client)
+        upcoming = await maintenance_service.get_upcoming_maintenance(days_ahead=30)
+        assert upcoming[0]["is_overdue"] is True
+        assert upcoming[0]["km_remaining"] == -500
+    
     @pytest.mark.asyncio
     async def test_get_maintenance_stats(self, session, redis_client, create_test_vehicle, create_test_maintenance_record):
         """Test getting maintenance statistics"""
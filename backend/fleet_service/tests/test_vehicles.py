@@ -148,6 +148,53 @@ class TestVehicles:
         assert summary.total_maintenance_cost == 800.0
         assert summary.average_fuel_efficiency == 12.15  # (12.5 + 11.8) / 2
     
+    @pytest.mark.asyncio
+    async def test_vehicle_summary_projects_upcoming_maintenance(self, session, redis_client, create_test_vehicle, create_test_maintenance_record, create_test_assignment, create_test_fuel_log):
+        """Test summary statistics and odometer-based maintenance projection"""
+        from datetime import date, timedelta
+        from models.assignment import AssignmentStatus
+        from models.maintenance_record import MaintenanceType
+        
+        vehicle_service = VehicleService(session, redis_client)
+        test_vehicle = create_test_vehicle(current_odometer=20000)
+        
+        create_test_assignment(test_vehicle.id, status=AssignmentStatus.ACTIVE, start_odometer=15000, end_odometer=15400)
+        create_test_assignment(test_vehicle.id, start_odometer=16000, end_odometer=16100)
+        
+        # 200 km per day over the last 10 days
+        create_test_fuel_log(test_vehicle.id, slot_date=date.today() - timedelta(days=10), odometer_reading=18000)
+        create_test_fuel_log(test_vehicle.id, slot_date=date.today(), odometer_reading=20000, fuel_efficiency=12.0)
+        
+        create_test_maintenance_record(
+            test_vehicle.id,
+            date_performed=date.today() - timedelta(days=100),
+            next_service_odometer=21000
+        )
+        create_test_maintenance_record(
+            test_vehicle.id,
+            maintenance_type=MaintenanceType.INSPECTION,
+            date_performed=date.today() - timedelta(days=30),
+            next_service_date=date.today() + timedelta(days=365)
+        )
+        
+        summary = await vehicle_service.get_vehicle_summary(test_vehicle.id)
+        
+        assert summary.total_assignments == 2
+        assert summary.active_assignments == 1
+        assert summary.total_distance_traveled == 500
+        assert summary.total_maintenance_records == 2
+        assert summary.days_since_last_service == 30
+        assert summary.average_fuel_efficiency == 12.0
+        
+        # Only the odometer-driven service falls inside the projection horizon
+        assert len(summary.upcoming_maintenance) == 1
+        upcoming = summary.upcoming_maintenance[0]
+        assert upcoming["maintenance_type"] == MaintenanceType.PREVENTIVE.value
+        assert upcoming["due_by"] == "odometer"
+        assert upcoming["km_remaining"] == 1000
+        assert upcoming["days_until_due"] == 5
+        assert not upcoming["is_overdue"]
+    
     @pytest.mark.asyncio
     async def test_get_available_vehicles(self, session, redis_client, create_test_vehicle):
         """Test getting available vehicles for a period"""
@@ -4,9 +4,11 @@ Utility functions and dependencies
 from .auth import *
 from .pagination import *
 from .notifications import *
+from .upload import *
 
 __all__ = [
     "get_current_user", "require_permission", "verify_auth_token",
     "PaginationParams", "paginate_query",
-    "send_compliance_alert", "send_maintenance_reminder"
+    "send_compliance_alert", "send_maintenance_reminder",
+    "FileUploadHandler", "process_upload"
 ]
\ No newline at end of file
@@ -1,81 +1,118 @@
 """
 Notification utilities for fleet management
 """
-import redis
+import redis.asyncio as aioredis
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime, date
 from config import settings
+from database import async_redis_client
 import uuid
 
 
 class NotificationService:
-    """Service for sending fleet-related notifications"""
+    """Service for sending fleet-related notifications
     
-    def __init__(self, redis_client: redis.Redis):
-        self.redis = redis_client
+    Uses the shared async Redis connection pool. Each notification's
+    commands go out as one pipeline, and ``send_compliance_alerts`` flushes
+    a whole batch of alerts in a single round trip.
+    """
     
-    async def send_compliance_alert(self, vehicle_id: uuid.UUID, alert_type: str, data: Dict[str, Any]):
-        """Send compliance alert notification"""
-        notification = {
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self.redis = redis_client if redis_client is not None else async_redis_client
+    
+    def _queue_compliance_alert(self, pipe, vehicle_id: uuid.UUID, alert_type: str, data: Dict[str, Any], timestamp: str):
+        """Queue the commands for one compliance alert on a pipeline"""
+        notification = json.dumps({
             "type": "compliance_alert",
             "vehicle_id": str(vehicle_id),
             "alert_type": alert_type,
             "data": data,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": timestamp
+        })
         
         # Publish to Redis channel for real-time alerts
-        self.redis.publish("fleet_compliance_alerts", json.dumps(notification))
+        pipe.publish("fleet_compliance_alerts", notification)
         
         # Store alert for offline access
         alert_key = f"alerts:compliance:{vehicle_id}"
-        self.redis.lpush(alert_key, json.dumps(notification))
-        self.redis.ltrim(alert_key, 0, 99)  # Keep last 100 alerts
-        self.redis.expire(alert_key, 86400 * 30)  # Expire after 30 days
+        pipe.lpush(alert_key, notification)
+        pipe.ltrim(alert_key, 0, 99)  # Keep last 100 alerts
+        pipe.expire(alert_key, 86400 * 30)  # Expire after 30 days
+    
+    async def send_compliance_alert(self, vehicle_id: uuid.UUID, alert_type: str, data: Dict[str, Any]):
+        """Send compliance alert notification"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._queue_compliance_alert(pipe, vehicle_id, alert_type, data, datetime.utcnow().isoformat())
+            await pipe.execute()
+    
+    async def send_compliance_alerts(self, alerts: List[Dict[str, Any]]):
+        """Send a batch of compliance alerts in a single pipeline flush
+        
+        Each alert dict carries ``vehicle_id``, ``alert_type`` and ``data``.
+        The channel messages and per-vehicle alert lists are the same as
+        ``send_compliance_alert`` produces, followed by one digest message.
+        """
+        if not alerts:
+            return
+        
+        timestamp = datetime.utcnow().isoformat()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for alert in alerts:
+                self._queue_compliance_alert(pipe, alert["vehicle_id"], alert["alert_type"], alert["data"], timestamp)
+            
+            pipe.publish("fleet_compliance_alerts", json.dumps({
+                "type": "compliance_digest",
+                "alert_count": len(alerts),
+                "vehicle_count": len({str(alert["vehicle_id"]) for alert in alerts}),
+                "timestamp": timestamp
+            }))
+            await pipe.execute()
     
     async def send_maintenance_reminder(self, vehicle_id: uuid.UUID, maintenance_type: str, data: Dict[str, Any]):
         """Send maintenance reminder notification"""
-        notification = {
+        notification = json.dumps({
             "type": "maintenance_reminder",
             "vehicle_id": str(vehicle_id),
             "maintenance_type": maintenance_type,
             "data": data,
             "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Publish to Redis channel
-        self.redis.publish("fleet_maintenance_reminders", json.dumps(notification))
+        })
         
-        # Store reminder
-        reminder_key = f"reminders:maintenance:{vehicle_id}"
-        self.redis.setex(reminder_key, 86400 * 7, json.dumps(notification))  # Keep for 7 days
+        async with self.redis.pipeline(transaction=False) as pipe:
+            # Publish to Redis channel
+            pipe.publish("fleet_maintenance_reminders", notification)
+            
+            # Store reminder
+            pipe.setex(f"reminders:maintenance:{vehicle_id}", 86400 * 7, notification)  # Keep for 7 days
+            await pipe.execute()
     
     async def send_assignment_update(self, vehicle_id: uuid.UUID, assignment_id: uuid.UUID, update_type: str):
         """Send assignment update notification"""
-        notification = {
+        notification = json.dumps({
             "type": "assignment_update",
             "vehicle_id": str(vehicle_id),
             "assignment_id": str(assignment_id),
             "update_type": update_type,
             "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Publish to vehicle-specific channel
-        vehicle_channel = f"fleet_updates:{vehicle_id}"
-        self.redis.publish(vehicle_channel, json.dumps(notification))
+        })
         
-        # Publish to general fleet channel
-        self.redis.publish("fleet_assignment_updates", json.dumps(notification))
+        async with self.redis.pipeline(transaction=False) as pipe:
+            # Publish to vehicle-specific channel
+            pipe.publish(f"fleet_updates:{vehicle_id}", notification)
+            
+            # Publish to general fleet channel
+            pipe.publish("fleet_assignment_updates", notification)
+            await pipe.execute()
 
 
-async def send_compliance_alert(redis_client: redis.Redis, vehicle_id: uuid.UUID, alert_type: str, data: Dict[str, Any]):
+async def send_compliance_alert(vehicle_id: uuid.UUID, alert_type: str, data: Dict[str, Any]):
     """Helper function to send compliance alert"""
-    notification_service = NotificationService(redis_client)
+    notification_service = NotificationService()
     await notification_service.send_compliance_alert(vehicle_id, alert_type, data)
 
 
-async def send_maintenance_reminder(redis_client: redis.Redis, vehicle_id: uuid.UUID, maintenance_type: str, data: Dict[str, Any]):
+async def send_maintenance_reminder(vehicle_id: uuid.UUID, maintenance_type: str, data: Dict[str, Any]):
     """Helper function to send maintenance reminder"""
-    notification_service = NotificationService(redis_client)
+    notification_service = NotificationService()
     await notification_service.send_maintenance_reminder(vehicle_id, maintenance_type, data)
\ No newline at end of file
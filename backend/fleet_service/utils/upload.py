@@ -0,0 +1,146 @@
+"""
+File upload utilities for vehicle documents
+"""
+import os
+import uuid
+import hashlib
+import tempfile
+from typing import Optional, Dict, Any
+from pathlib import Path
+from fastapi import UploadFile, HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+UPLOAD_DIR = Path("uploads/documents")
+MAX_FILE_SIZE = settings.max_file_size
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+def _write_chunk(spool, file_hash, chunk: bytes):
+    file_hash.update(chunk)
+    spool.write(chunk)
+
+
+class FileUploadHandler:
+    """Handles streaming file upload for vehicle documents
+    
+    Uploads are streamed in chunks to a temporary file under
+    ``<upload_dir>/.incoming`` and hashed on the way, so memory use stays
+    flat whatever the file size. Once stored, files are moved into place
+    with ``os.replace``, which is atomic on the same filesystem.
+    """
+    
+    def __init__(self, upload_dir: Optional[Path] = None):
+        self.upload_dir = upload_dir or UPLOAD_DIR
+        self.incoming_dir = self.upload_dir / ".incoming"
+        self.incoming_dir.mkdir(parents=True, exist_ok=True)
+    
+    async def validate_file(self, file: UploadFile) -> Dict[str, Any]:
+        """Validate uploaded file while spooling it to a temporary file
+        
+        Pass the result to ``save_file`` to store it, or to ``discard_file``
+        to drop the temporary file.
+        
+        Args:
+            file: FastAPI UploadFile object
+        
+        Returns:
+            Dict with validation results and the temporary file path
+        
+        Raises:
+            HTTPException: If file validation fails
+        """
+        if not file.filename:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No file provided"
+            )
+        
+        if file.size and file.size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE // (1024*1024)}MB"
+            )
+        
+        file_ext = file.filename.split('.')[-1].lower()
+        fd, temp_path = tempfile.mkstemp(dir=self.incoming_dir, suffix=f".{file_ext}")
+        file_hash = hashlib.sha256()
+        file_size = 0
+        
+        try:
+            with os.fdopen(fd, "wb") as spool:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    # Enforce the limit on the bytes actually received
+                    file_size += len(chunk)
+                    if file_size > MAX_FILE_SIZE:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE // (1024*1024)}MB"
+                        )
+                    
+                    await run_in_threadpool(_write_chunk, spool, file_hash, chunk)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        
+        return {
+            "original_filename": file.filename,
+            "file_extension": file_ext,
+            "mime_type": file.content_type or "application/octet-stream",
+            "file_size": file_size,
+            "file_hash": file_hash.hexdigest(),
+            "temp_path": temp_path
+        }
+    
+    async def save_file(self, file_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Move a validated upload into the upload directory
+        
+        Args:
+            file_data: Validated file data
+        
+        Returns:
+            Dict with file storage information
+        """
+        unique_filename = f"{uuid.uuid4()}.{file_data['file_extension']}"
+        file_path = self.upload_dir / unique_filename
+        temp_path = Path(file_data["temp_path"])
+        
+        try:
+            # Move into place in one step, readers never see a partial file
+            await run_in_threadpool(os.replace, temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        
+        logger.info(f"Saved document file {unique_filename}")
+        
+        return {
+            "file_path": str(file_path),
+            "file_name": unique_filename,
+            "original_filename": file_data["original_filename"],
+            "file_size": file_data["file_size"],
+            "mime_type": file_data["mime_type"],
+            "file_hash": file_data["file_hash"]
+        }
+    
+    def discard_file(self, file_data: Dict[str, Any]):
+        """Drop the temporary file of a validated upload that will not be saved"""
+        Path(file_data["temp_path"]).unlink(missing_ok=True)
+
+
+async def process_upload(file: UploadFile) -> Dict[str, Any]:
+    """Stream a vehicle document upload into storage
+    
+    Args:
+        file: FastAPI UploadFile
+    
+    Returns:
+        Upload results
+    """
+    handler = FileUploadHandler()
+    file_data = await handler.validate_file(file)
+    return await handler.save_file(file_data)
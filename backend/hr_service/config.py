@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     booking_service_url: str
     tour_service_url: str
     fleet_service_url: str
+    notification_service_url: str = "http://notification_app:8007"
     
     # JWT (for token validation)
     secret_key: str
@@ -47,6 +48,16 @@ class Settings(BaseSettings):
     training_pass_score: float = 70.0
     mandatory_training_reminder_days: int = 30
     
+    # Expiry Scan
+    expiry_alert_days: int = 30  # Alert before certificate and document expiry
+    contract_alert_days: int = 60  # Alert before fixed-term contract end
+    expiry_scan_enabled: bool = True
+    expiry_scan_check_minutes: int = 60  # How often to check whether today's scan has run
+    compliance_alert_recipients: List[str] = []  # HR user IDs receiving the daily expiry digest
+    
+    # Dashboard
+    dashboard_cache_seconds: int = 300  # HR dashboard snapshot TTL, also invalidated on writes
+    
     # Payroll Integration
     payroll_export_schedule: str = "monthly"  # monthly, bi-weekly
     
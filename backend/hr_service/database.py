@@ -24,6 +24,17 @@ def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
 
+def ensure_expiry_indexes():
+    """Create the partial ``ix_expiry_*`` indexes on existing tables
+
+    ``create_all`` only creates indexes along with new tables.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name and index.name.startswith("ix_expiry_"):
+                index.create(engine, checkfirst=True)
+
+
 def get_session() -> Generator[Session, None, None]:
     """Database session dependency"""
     with Session(engine) as session:
@@ -6,10 +6,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from config import settings
-from database import create_db_and_tables
+from database import create_db_and_tables, ensure_expiry_indexes
 from routers import (
-    employees_router, recruitment_router, training_router, analytics_router, documents_router
+    employees_router, recruitment_router, training_router, analytics_router, documents_router,
+    expiry_alerts_router
 )
+from services.expiry_scan_service import expiry_scheduler
+from services.hierarchy_service import ensure_employee_hierarchy
+from utils.upload import shutdown_image_pool
 import logging
 
 
@@ -64,9 +68,21 @@ async def internal_server_error_handler(request: Request, exc: Exception):
 async def startup_event():
     """Initialize database and create tables"""
     create_db_and_tables()
+    ensure_expiry_indexes()
+    ensure_employee_hierarchy()
+    if settings.expiry_scan_enabled:
+        expiry_scheduler.start()
     logger.info("HR database initialized successfully")
 
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the expiry scan task and the image processing workers"""
+    await expiry_scheduler.stop()
+    shutdown_image_pool()
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -84,6 +100,7 @@ app.include_router(recruitment_router, prefix="/api/v1")
 app.include_router(training_router, prefix="/api/v1")
 app.include_router(analytics_router, prefix="/api/v1")
 app.include_router(documents_router, prefix="/api/v1")
+app.include_router(expiry_alerts_router, prefix="/api/v1")
 
 
 # Root endpoint
@@ -6,11 +6,15 @@ from .job_application import JobApplication, ApplicationSource, ApplicationStage
 from .training_program import TrainingProgram, TrainingCategory, TrainingStatus, DeliveryMethod
 from .employee_training import EmployeeTraining, AttendanceStatus, CompletionStatus
 from .employee_document import EmployeeDocument, DocumentType, DocumentStatus
+from .expiry_alert import ExpiryAlert, ExpiryStage, ExpiryAlertStatus
+from .employee_hierarchy import EmployeeHierarchy
 
 __all__ = [
     "Employee", "Gender", "MaritalStatus", "EmploymentType", "ContractType", "EmployeeStatus",
     "JobApplication", "ApplicationSource", "ApplicationStage", "Priority",
     "TrainingProgram", "TrainingCategory", "TrainingStatus", "DeliveryMethod",
     "EmployeeTraining", "AttendanceStatus", "CompletionStatus",
-    "EmployeeDocument", "DocumentType", "DocumentStatus"
+    "EmployeeDocument", "DocumentType", "DocumentStatus",
+    "ExpiryAlert", "ExpiryStage", "ExpiryAlertStatus",
+    "EmployeeHierarchy"
 ]
\ No newline at end of file
@@ -2,7 +2,7 @@
 Employee model for HR management
 """
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, Numeric
+from sqlalchemy import Column, Numeric, Index
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from enum import Enum
@@ -145,4 +145,11 @@ class Employee(SQLModel, table=True):
     
     def calculate_monthly_salary(self) -> Decimal:
         """Calculate monthly salary"""
-        return self.base_salary / 12
\ No newline at end of file
+        return self.base_salary / 12
+
+
+# Partial index for the daily expiry scan
+Index(
+    "ix_expiry_employees_contract_end", Employee.contract_end_date,
+    postgresql_where=Employee.is_active == True
+)
@@ -2,6 +2,7 @@
 Employee document model for document management
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, Dict, Any
 from datetime import datetime, date
 from enum import Enum
@@ -106,4 +107,11 @@ class EmployeeDocument(SQLModel, table=True):
     
     def get_file_size_mb(self) -> float:
         """Get file size in MB"""
-        return round(self.file_size / (1024 * 1024), 2)
\ No newline at end of file
+        return round(self.file_size / (1024 * 1024), 2)
+
+
+# Partial index for the daily expiry scan
+Index(
+    "ix_expiry_employee_documents_expiry_date", EmployeeDocument.expiry_date,
+    postgresql_where=EmployeeDocument.status == DocumentStatus.APPROVED
+)
@@ -0,0 +1,24 @@
+"""
+Employee hierarchy closure table for reporting-line queries
+"""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+import uuid
+
+
+class EmployeeHierarchy(SQLModel, table=True):
+    """One row per (manager, report) pair at any distance in the org chart
+    
+    Every employee also has a depth 0 row to itself, so "X and everyone
+    under X" is a single lookup on ``ancestor_id``. Maintained by
+    ``HierarchyService`` whenever ``Employee.manager_id`` changes.
+    """
+    __tablename__ = "employee_hierarchy"
+    __table_args__ = (
+        # Reporting chain of an employee, nearest manager first
+        Index("ix_employee_hierarchy_descendant_depth", "descendant_id", "depth"),
+    )
+    
+    ancestor_id: uuid.UUID = Field(foreign_key="employees.id", primary_key=True)
+    descendant_id: uuid.UUID = Field(foreign_key="employees.id", primary_key=True)
+    depth: int = Field(default=0)  # 0 = self, 1 = direct report, ...
@@ -2,6 +2,7 @@
 Employee training model for tracking training participation
 """
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from enum import Enum
@@ -116,4 +117,11 @@ class EmployeeTraining(SQLModel, table=True):
             return 100.0 if self.post_assessment_score > 0 else 0.0
         
         improvement = ((self.post_assessment_score - self.pre_assessment_score) / self.pre_assessment_score) * 100
-        return round(improvement, 2)
\ No newline at end of file
+        return round(improvement, 2)
+
+
+# Partial index for the daily expiry scan
+Index(
+    "ix_expiry_employee_trainings_certificate", EmployeeTraining.certificate_expiry_date,
+    postgresql_where=EmployeeTraining.certificate_issued == True
+)
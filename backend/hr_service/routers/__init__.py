@@ -6,5 +6,7 @@ from .recruitment import router as recruitment_router
 from .training import router as training_router
 from .documents import router as documents_router
 from .analytics import router as analytics_router
+from .expiry_alerts import router as expiry_alerts_router
 
-__all__ = ["employees_router", "recruitment_router", "training_router", "documents_router", "analytics_router"]
\ No newline at end of file
+__all__ = ["employees_router", "recruitment_router", "training_router", "documents_router", "analytics_router",
+           "expiry_alerts_router"]
\ No newline at end of file
@@ -21,7 +21,7 @@ async def get_hr_dashboard(
 ):
     """Get HR dashboard overview"""
     analytics_service = AnalyticsService(session, redis_client)
-    return await analytics_service.get_dashboard_overview()
+    return await analytics_service.get_hr_dashboard()
 
 
 @router.get("/workforce", response_model=Dict[str, Any])
@@ -105,7 +105,8 @@ async def get_documents(
         items=documents,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -186,7 +187,8 @@ async def get_employee_documents(
         items=documents,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -5,10 +5,12 @@ from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlmodel import Session
 from database import get_session, get_redis
 from services.employee_service import EmployeeService
+from services.hierarchy_service import HierarchyService
 from schemas.employee import (
     EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeSummary,
     EmployeeSearch, EmployeeTermination
 )
+from schemas.employee_hierarchy import ReportingLineEntry, HeadcountRollup
 from models.employee import EmploymentType, ContractType, EmployeeStatus
 from utils.auth import require_permission, CurrentUser
 from utils.pagination import PaginationParams, PaginatedResponse
@@ -98,7 +100,8 @@ async def get_employees(
         items=employees,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -126,6 +129,41 @@ async def get_employee_summary(
     return await employee_service.get_employee_summary(employee_id)
 
 
+@router.get("/{employee_id}/reports", response_model=List[ReportingLineEntry])
+async def get_all_reports(
+    employee_id: uuid.UUID,
+    max_depth: Optional[int] = Query(None, ge=1, description="Limit to this many levels below the employee"),
+    include_inactive: bool = Query(False, description="Include inactive employees"),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("hr", "read", "employees"))
+):
+    """Get everyone reporting to an employee, directly or indirectly"""
+    hierarchy_service = HierarchyService(session)
+    return await hierarchy_service.get_reports(employee_id, max_depth, include_inactive)
+
+
+@router.get("/{employee_id}/reporting-chain", response_model=List[ReportingLineEntry])
+async def get_reporting_chain(
+    employee_id: uuid.UUID,
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("hr", "read", "employees"))
+):
+    """Get an employee's managers up to the top of the organization"""
+    hierarchy_service = HierarchyService(session)
+    return await hierarchy_service.get_reporting_chain(employee_id)
+
+
+@router.get("/{employee_id}/headcount", response_model=HeadcountRollup)
+async def get_headcount_rollup(
+    employee_id: uuid.UUID,
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("hr", "read", "employees"))
+):
+    """Get the active headcount under an employee, rolled up per manager"""
+    hierarchy_service = HierarchyService(session)
+    return await hierarchy_service.get_headcount_rollup(employee_id)
+
+
 @router.put("/{employee_id}", response_model=EmployeeResponse)
 async def update_employee(
     employee_id: uuid.UUID,
@@ -0,0 +1,44 @@
+"""
+Employee expiry alert routes
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from database import get_session
+from services.expiry_scan_service import ExpiryScanService
+from schemas.expiry_alert import ExpiryAlertResponse, ExpiryScanResult
+from models.expiry_alert import ExpiryStage
+from utils.auth import require_permission, CurrentUser
+from typing import List, Optional
+import uuid
+
+
+router = APIRouter(prefix="/expiry-alerts", tags=["Expiry Alerts"])
+
+
+@router.get("/", response_model=List[ExpiryAlertResponse])
+async def get_expiry_alerts(
+    employee_id: Optional[uuid.UUID] = Query(None, description="Filter by employee"),
+    source_type: Optional[str] = Query(None, description="contract, training or document"),
+    stage: Optional[ExpiryStage] = Query(None, description="Filter by expiry stage"),
+    include_resolved: bool = Query(False, description="Include renewed and superseded alerts"),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("hr", "read", "employees"))
+):
+    """Get precomputed contract, certificate and document expiry alerts"""
+    expiry_service = ExpiryScanService(session)
+    return expiry_service.get_alerts(
+        employee_id=employee_id,
+        source_type=source_type,
+        stage=stage,
+        include_resolved=include_resolved
+    )
+
+
+@router.post("/scan", response_model=ExpiryScanResult)
+async def run_expiry_scan(
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("hr", "update", "employees"))
+):
+    """Run the expiry scan now instead of waiting for the daily job"""
+    expiry_service = ExpiryScanService(session)
+    return await expiry_service.run_scan()
@@ -160,7 +160,8 @@ async def get_job_applications(
         items=applications,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
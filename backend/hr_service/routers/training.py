@@ -104,7 +104,8 @@ async def get_training_programs(
         items=programs,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -196,7 +197,8 @@ async def get_employee_trainings(
         items=trainings,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -6,11 +6,15 @@ from .job_application import *
 from .training_program import *
 from .employee_training import *
 from .employee_document import *
+from .expiry_alert import *
+from .employee_hierarchy import *
 
 __all__ = [
     "EmployeeCreate", "EmployeeUpdate", "EmployeeResponse", "EmployeeSummary",
     "JobApplicationCreate", "JobApplicationUpdate", "JobApplicationResponse", "RecruitmentStats",
     "TrainingProgramCreate", "TrainingProgramUpdate", "TrainingProgramResponse", "TrainingStats",
     "EmployeeTrainingCreate", "EmployeeTrainingUpdate", "EmployeeTrainingResponse",
-    "EmployeeDocumentCreate", "EmployeeDocumentUpdate", "EmployeeDocumentResponse"
+    "EmployeeDocumentCreate", "EmployeeDocumentUpdate", "EmployeeDocumentResponse",
+    "ExpiryAlertResponse", "ExpiryScanResult",
+    "ReportingLineEntry", "ManagerHeadcount", "HeadcountRollup"
 ]
\ No newline at end of file
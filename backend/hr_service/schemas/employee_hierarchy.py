@@ -0,0 +1,36 @@
+"""
+Employee hierarchy schemas
+"""
+from pydantic import BaseModel
+from typing import Optional, List, Dict
+import uuid
+
+
+class ReportingLineEntry(BaseModel):
+    id: uuid.UUID
+    employee_id: str
+    full_name: str
+    department: str
+    position: str
+    manager_id: Optional[uuid.UUID]
+    is_active: bool
+    depth: int
+
+
+class ManagerHeadcount(BaseModel):
+    id: uuid.UUID
+    full_name: str
+    department: str
+    depth: int
+    direct_reports: int
+    total_reports: int
+
+
+class HeadcountRollup(BaseModel):
+    employee_id: uuid.UUID
+    full_name: str
+    direct_reports: int
+    total_reports: int
+    by_department: Dict[str, int]
+    by_depth: Dict[int, int]
+    managers: List[ManagerHeadcount]
@@ -6,11 +6,13 @@ from .recruitment_service import RecruitmentService
 from .training_service import TrainingService
 from .document_service import DocumentService
 from .analytics_service import AnalyticsService
+from .expiry_scan_service import ExpiryScanService
 
 __all__ = [
     "EmployeeService", 
     "RecruitmentService", 
     "TrainingService", 
     "DocumentService", 
-    "AnalyticsService"
+    "AnalyticsService",
+    "ExpiryScanService"
 ]
\ No newline at end of file
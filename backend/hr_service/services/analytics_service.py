@@ -5,84 +5,154 @@ from sqlmodel import Session, select, and_, func
 from models.employee import Employee, EmployeeStatus
 from models.job_application import JobApplication, ApplicationStage
 from models.training_program import TrainingProgram, TrainingStatus
-from models.employee_training import EmployeeTraining
+from models.employee_training import EmployeeTraining, CompletionStatus
 from models.employee_document import EmployeeDocument, DocumentStatus
+from database import redis_client as default_redis_client
+from config import settings
 from typing import Dict, Any, List, Optional
-from datetime import date, timedelta
+from datetime import datetime, date, timedelta
 from decimal import Decimal
+import json
+import redis
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+DASHBOARD_CACHE_PREFIX = "hr:dashboard"
+
+# Applications still being screened or interviewed
+PENDING_APPLICATION_STAGES = [
+    ApplicationStage.SCREENING,
+    ApplicationStage.PHONE_INTERVIEW,
+    ApplicationStage.TECHNICAL_TEST,
+    ApplicationStage.IN_PERSON_INTERVIEW
+]
+
+
+def _dashboard_cache_key(today: date) -> str:
+    """Cache key of the dashboard snapshot computed on a given day"""
+    return f"{DASHBOARD_CACHE_PREFIX}:{today.isoformat()}"
+
+
+def invalidate_hr_dashboard(redis_client: Optional[redis.Redis] = None):
+    """Drop the cached dashboard snapshot so the next read recomputes it
+    
+    Called after hires and terminations, application changes and document
+    status changes.
+    """
+    client = redis_client if redis_client is not None else default_redis_client
+    try:
+        client.delete(_dashboard_cache_key(date.today()))
+    except redis.RedisError as e:
+        logger.warning(f"HR dashboard cache not invalidated: {str(e)}")
+
+
 class AnalyticsService:
     """Service for HR analytics, KPIs, and reporting"""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, redis_client: Optional[redis.Redis] = None):
         self.session = session
+        self.redis = redis_client if redis_client is not None else default_redis_client
     
     async def get_hr_dashboard(self) -> Dict[str, Any]:
         """Get comprehensive HR dashboard metrics
         
+        The snapshot is cached in Redis for ``dashboard_cache_seconds`` and
+        dropped by ``invalidate_hr_dashboard`` on relevant writes.
+        
         Returns:
             HR dashboard data with key metrics
         """
-        # Employee metrics
-        total_employees = self.session.exec(select(func.count(Employee.id))).first()
-        active_employees = self.session.exec(
-            select(func.count(Employee.id)).where(Employee.status == EmployeeStatus.ACTIVE)
-        ).first()
+        today = date.today()
+        cache_key = _dashboard_cache_key(today)
+        try:
+            cached = self.redis.get(cache_key)
+            if cached:
+                return json.loads(cached)
+        except redis.RedisError as e:
+            logger.warning(f"HR dashboard cache unavailable: {str(e)}")
+        
+        dashboard = self._build_hr_dashboard(today)
+        try:
+            self.redis.setex(cache_key, settings.dashboard_cache_seconds, json.dumps(dashboard))
+        except redis.RedisError as e:
+            logger.warning(f"HR dashboard not cached: {str(e)}")
+        return dashboard
+    
+    def _build_hr_dashboard(self, today: date) -> Dict[str, Any]:
+        """Compute the dashboard with one aggregate query per table"""
+        current_month = today.replace(day=1)
+        last_month = (current_month - timedelta(days=1)).replace(day=1)
         
-        # Recent hires (last 30 days)
-        thirty_days_ago = date.today() - timedelta(days=30)
-        recent_hires = self.session.exec(
-            select(func.count(Employee.id)).where(Employee.start_date >= thirty_days_ago)
-        ).first()
+        # Employee metrics
+        (total_employees, active_employees, recent_hires,
+         employees_before_current_month, employees_before_last_month) = self.session.exec(
+            select(
+                func.count(Employee.id),
+                func.count(Employee.id).filter(Employee.status == EmployeeStatus.ACTIVE),
+                func.count(Employee.id).filter(Employee.hire_date >= today - timedelta(days=30)),
+                func.count(Employee.id).filter(Employee.hire_date < current_month),
+                func.count(Employee.id).filter(Employee.hire_date < last_month)
+            )
+        ).one()
         
         # Recruitment metrics
-        total_applications = self.session.exec(select(func.count(JobApplication.id))).first()
-        pending_applications = self.session.exec(
-            select(func.count(JobApplication.id)).where(
-                JobApplication.stage.in_([ApplicationStage.SCREENING, ApplicationStage.INTERVIEW])
+        total_applications, pending_applications, hired_applications = self.session.exec(
+            select(
+                func.count(JobApplication.id),
+                func.count(JobApplication.id).filter(JobApplication.stage.in_(PENDING_APPLICATION_STAGES)),
+                func.count(JobApplication.id).filter(JobApplication.stage == ApplicationStage.HIRED)
             )
-        ).first()
+        ).one()
         
         # Training metrics
-        total_trainings = self.session.exec(select(func.count(EmployeeTraining.id))).first()
-        completed_trainings = self.session.exec(
-            select(func.count(EmployeeTraining.id)).where(
-                EmployeeTraining.status == TrainingStatus.COMPLETED
+        total_trainings, completed_trainings = self.session.exec(
+            select(
+                func.count(EmployeeTraining.id),
+                func.count(EmployeeTraining.id).filter(
+                    EmployeeTraining.completion_status == CompletionStatus.COMPLETED
+                )
             )
-        ).first()
+        ).one()
         
         # Document compliance
-        pending_documents = self.session.exec(
-            select(func.count(EmployeeDocument.id)).where(
-                EmployeeDocument.status == DocumentStatus.PENDING
+        pending_documents, expiring_documents = self.session.exec(
+            select(
+                func.count(EmployeeDocument.id).filter(EmployeeDocument.status == DocumentStatus.PENDING),
+                func.count(EmployeeDocument.id).filter(
+                    EmployeeDocument.expiry_date > today,
+                    EmployeeDocument.expiry_date <= today + timedelta(days=30)
+                )
             )
-        ).first()
+        ).one()
         
         return {
             "employee_metrics": {
-                "total_employees": total_employees or 0,
-                "active_employees": active_employees or 0,
-                "recent_hires": recent_hires or 0,
-                "employee_growth_rate": self._calculate_growth_rate("employees")
+                "total_employees": total_employees,
+                "active_employees": active_employees,
+                "recent_hires": recent_hires,
+                "employee_growth_rate": (
+                    (employees_before_current_month - employees_before_last_month)
+                    / employees_before_last_month * 100
+                    if employees_before_last_month else 0.0
+                )
             },
             "recruitment_metrics": {
-                "total_applications": total_applications or 0,
-                "pending_applications": pending_applications or 0,
-                "hire_rate": await self._calculate_hire_rate()
+                "total_applications": total_applications,
+                "pending_applications": pending_applications,
+                "hire_rate": hired_applications / total_applications * 100 if total_applications else 0
             },
             "training_metrics": {
-                "total_trainings": total_trainings or 0,
-                "completed_trainings": completed_trainings or 0,
+                "total_trainings": total_trainings,
+                "completed_trainings": completed_trainings,
                 "completion_rate": completed_trainings / total_trainings * 100 if total_trainings else 0
             },
             "compliance_metrics": {
-                "pending_documents": pending_documents or 0,
-                "expiring_documents": await self._count_expiring_documents()
-            }
+                "pending_documents": pending_documents,
+                "expiring_documents": expiring_documents
+            },
+            "generated_at": datetime.utcnow().isoformat()
         }
     
     async def get_employee_analytics(
@@ -528,50 +598,6 @@ class AnalyticsService:
     
     # Helper methods
     
-    def _calculate_growth_rate(self, metric_type: str) -> float:
-        """Calculate growth rate for a metric"""
-        # This is a simplified calculation - in reality, you'd compare periods
-        current_month = date.today().replace(day=1)
-        last_month = (current_month - timedelta(days=1)).replace(day=1)
-        
-        if metric_type == "employees":
-            current_count = self.session.exec(
-                select(func.count(Employee.id)).where(Employee.start_date < current_month)
-            ).first() or 0
-            
-            last_month_count = self.session.exec(
-                select(func.count(Employee.id)).where(Employee.start_date < last_month)
-            ).first() or 0
-            
-            if last_month_count > 0:
-                return (current_count - last_month_count) / last_month_count * 100
-        
-        return 0.0
-    
-    async def _calculate_hire_rate(self) -> float:
-        """Calculate overall hire rate"""
-        total_applications = self.session.exec(select(func.count(JobApplication.id))).first() or 0
-        hired_applications = self.session.exec(
-            select(func.count(JobApplication.id)).where(
-                JobApplication.stage == ApplicationStage.HIRED
-            )
-        ).first() or 0
-        
-        return hired_applications / total_applications * 100 if total_applications > 0 else 0
-    
-    async def _count_expiring_documents(self) -> int:
-        """Count documents expiring within 30 days"""
-        alert_date = date.today() + timedelta(days=30)
-        return self.session.exec(
-            select(func.count(EmployeeDocument.id)).where(
-                and_(
-                    EmployeeDocument.expiry_date.is_not(None),
-                    EmployeeDocument.expiry_date <= alert_date,
-                    EmployeeDocument.expiry_date > date.today()
-                )
-            )
-        ).first() or 0
-    
     async def _analyze_employee_tenure(self, employees: List[Employee]) -> Dict[str, Any]:
         """Analyze employee tenure distribution"""
         tenure_buckets = {
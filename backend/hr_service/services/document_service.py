@@ -5,11 +5,14 @@ from sqlmodel import Session, select, and_
 from fastapi import HTTPException, status, UploadFile
 from models.employee_document import EmployeeDocument, DocumentType, DocumentStatus
 from models.employee import Employee
+from models.expiry_alert import ExpiryAlert
 from schemas.employee_document import (
     EmployeeDocumentCreate, EmployeeDocumentUpdate, EmployeeDocumentResponse
 )
-from utils.upload import process_upload, get_file_info
-from utils.validation import validate_document
+from services.analytics_service import invalidate_hr_dashboard
+from services.expiry_scan_service import DOCUMENT_SOURCE
+from utils.upload import FileUploadHandler, get_file_info
+from config import settings
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import uuid
@@ -59,9 +62,12 @@ class DocumentService:
                 detail="Employee not found"
             )
         
-        # Validate document
+        # Validate while spooling to a temporary file, then store that same file
+        handler = FileUploadHandler()
         try:
-            validation_result = await validate_document(file)
+            file_data = await handler.validate_file(file)
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Document validation failed: {str(e)}")
             raise HTTPException(
@@ -69,9 +75,9 @@ class DocumentService:
                 detail=f"Document validation failed: {str(e)}"
             )
         
-        # Process file upload
+        # Move the spooled file into storage
         try:
-            upload_result = await process_upload(file, f"employees/{employee_id}/documents")
+            upload_result = await handler.save_file(file_data, f"employees/{employee_id}/documents")
         except Exception as e:
             logger.error(f"File upload failed: {str(e)}")
             raise HTTPException(
@@ -96,6 +102,7 @@ class DocumentService:
         
         self.session.add(document)
         self.session.commit()
+        invalidate_hr_dashboard()
         self.session.refresh(document)
         
         logger.info(f"Uploaded document {document.id} for employee {employee.full_name}")
@@ -187,6 +194,7 @@ class DocumentService:
         
         self.session.add(document)
         self.session.commit()
+        invalidate_hr_dashboard()
         self.session.refresh(document)
         
         logger.info(f"Updated document {document_id}")
@@ -225,6 +233,7 @@ class DocumentService:
         
         self.session.add(document)
         self.session.commit()
+        invalidate_hr_dashboard()
         
         logger.info(f"Approved document {document_id}")
         return {"message": "Document approved successfully"}
@@ -269,6 +278,7 @@ class DocumentService:
         
         self.session.add(document)
         self.session.commit()
+        invalidate_hr_dashboard()
         
         logger.info(f"Rejected document {document_id}: {rejection_reason}")
         return {"message": "Document rejected successfully"}
@@ -300,6 +310,7 @@ class DocumentService:
         # Delete database record
         self.session.delete(document)
         self.session.commit()
+        invalidate_hr_dashboard()
         
         logger.info(f"Deleted document {document_id}")
         return {"message": "Document deleted successfully"}
@@ -313,17 +324,24 @@ class DocumentService:
         Returns:
             List of expiring documents
         """
-        alert_date = date.today() + timedelta(days=days)
+        today = date.today()
+        alert_date = today + timedelta(days=days)
         
         query = select(EmployeeDocument).where(
             and_(
                 EmployeeDocument.expiry_date.is_not(None),
                 EmployeeDocument.expiry_date <= alert_date,
-                EmployeeDocument.expiry_date > date.today(),
+                EmployeeDocument.expiry_date > today,
                 EmployeeDocument.status == DocumentStatus.APPROVED
             )
         ).order_by(EmployeeDocument.expiry_date)
         
+        # Within the alert window the daily scan has queued every match
+        if days <= settings.expiry_alert_days:
+            query = query.where(
+                EmployeeDocument.id.in_(ExpiryAlert.open_source_ids(DOCUMENT_SOURCE, today, alert_date))
+            )
+        
         documents = self.session.exec(query).all()
         return [self._to_response(doc) for doc in documents]
     
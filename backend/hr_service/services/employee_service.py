@@ -10,6 +10,8 @@ from schemas.employee import (
     EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeSummary, 
     EmployeeSearch, EmployeeTermination
 )
+from services.analytics_service import invalidate_hr_dashboard
+from services.hierarchy_service import HierarchyService
 from utils.pagination import PaginationParams, paginate_query
 from typing import List, Optional, Tuple
 from datetime import datetime, date, timedelta
@@ -21,9 +23,10 @@ import uuid
 class EmployeeService:
     """Service for handling employee operations"""
     
-    def __init__(self, session: Session, redis_client: redis.Redis):
+    def __init__(self, session: Session, redis_client: Optional[redis.Redis] = None):
         self.session = session
         self.redis = redis_client
+        self.hierarchy = HierarchyService(session)
     
     async def create_employee(self, employee_data: EmployeeCreate) -> EmployeeResponse:
         """Create a new employee"""
@@ -57,6 +60,9 @@ class EmployeeService:
                 detail="Email already exists"
             )
         
+        if employee_data.manager_id:
+            self._get_manager(employee_data.manager_id)
+        
         # Calculate probation end date
         from config import settings
         probation_end_date = employee_data.hire_date + timedelta(days=settings.probation_period_months * 30)
@@ -68,7 +74,10 @@ class EmployeeService:
         )
         
         self.session.add(employee)
+        self.session.flush()
+        self.hierarchy.add_employee(employee.id, employee.manager_id)
         self.session.commit()
+        invalidate_hr_dashboard(self.redis)
         self.session.refresh(employee)
         
         return self._create_employee_response(employee)
@@ -170,6 +179,11 @@ class EmployeeService:
         # Update fields
         update_data = employee_data.model_dump(exclude_unset=True)
         
+        if "manager_id" in update_data and update_data["manager_id"] != employee.manager_id:
+            if update_data["manager_id"]:
+                self._get_manager(update_data["manager_id"])
+            self.hierarchy.move_employee(employee.id, update_data["manager_id"])
+        
         for field, value in update_data.items():
             setattr(employee, field, value)
         
@@ -177,6 +191,7 @@ class EmployeeService:
         
         self.session.add(employee)
         self.session.commit()
+        invalidate_hr_dashboard(self.redis)
         self.session.refresh(employee)
         
         return self._create_employee_response(employee)
@@ -221,6 +236,7 @@ class EmployeeService:
         
         self.session.add(employee)
         self.session.commit()
+        invalidate_hr_dashboard(self.redis)
         self.session.refresh(employee)
         
         return self._create_employee_response(employee)
@@ -241,6 +257,7 @@ class EmployeeService:
         
         self.session.add(employee)
         self.session.commit()
+        invalidate_hr_dashboard(self.redis)
         
         return {"message": "Employee deactivated successfully"}
     
@@ -370,7 +387,13 @@ class EmployeeService:
         update_dict = update_data.model_dump(exclude_unset=True)
         updated_count = 0
         
+        if "manager_id" in update_dict and update_dict["manager_id"]:
+            self._get_manager(update_dict["manager_id"])
+        
         for employee in employees:
+            if "manager_id" in update_dict and update_dict["manager_id"] != employee.manager_id:
+                self.hierarchy.move_employee(employee.id, update_dict["manager_id"])
+            
             for field, value in update_dict.items():
                 setattr(employee, field, value)
             
@@ -379,12 +402,23 @@ class EmployeeService:
             updated_count += 1
         
         self.session.commit()
+        invalidate_hr_dashboard(self.redis)
         
         return {
             "message": f"Successfully updated {updated_count} employees",
             "updated_count": updated_count
         }
     
+    def _get_manager(self, manager_id: uuid.UUID) -> Employee:
+        """Get the employee assigned as manager"""
+        manager = self.session.get(Employee, manager_id)
+        if not manager:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Manager not found"
+            )
+        return manager
+    
     def _create_employee_response(self, employee: Employee) -> EmployeeResponse:
         """Create employee response with calculated fields"""
         return EmployeeResponse(
@@ -0,0 +1,293 @@
+"""
+Hierarchy service maintaining the employee closure table and reporting-line queries
+"""
+from sqlmodel import Session, select, func, delete, insert, literal
+from sqlalchemy import true
+from sqlalchemy.orm import aliased
+from fastapi import HTTPException, status
+from models.employee import Employee
+from models.employee_hierarchy import EmployeeHierarchy
+from schemas.employee_hierarchy import ReportingLineEntry, ManagerHeadcount, HeadcountRollup
+from database import engine
+from typing import List, Optional
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on reporting-line length walked by the rebuild
+MAX_HIERARCHY_DEPTH = 50
+
+CLOSURE_COLUMNS = ["ancestor_id", "descendant_id", "depth"]
+
+
+class HierarchyService:
+    """Service for the employee reporting hierarchy
+    
+    Reporting lines are stored as a closure table: one row per (manager,
+    report) pair at any distance, plus a depth 0 row per employee. Subtrees,
+    reporting chains and headcount rollups are then single indexed joins
+    instead of one lazy load per level. Writes are flushed into the caller's
+    transaction; the caller commits together with the ``manager_id`` change.
+    """
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def add_employee(self, employee_id: uuid.UUID, manager_id: Optional[uuid.UUID] = None):
+        """Insert the closure rows of a new employee"""
+        self.session.add(EmployeeHierarchy(ancestor_id=employee_id, descendant_id=employee_id, depth=0))
+        self.session.flush()
+        if manager_id:
+            self._attach(employee_id, manager_id)
+    
+    def move_employee(self, employee_id: uuid.UUID, manager_id: Optional[uuid.UUID]):
+        """Move an employee, with everyone under them, to a new manager
+        
+        Raises:
+            HTTPException: If the new manager reports to the employee
+        """
+        if manager_id and self.is_in_reporting_line(employee_id, manager_id, include_self=True):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Manager cannot be the employee or one of their reports"
+            )
+        
+        # Cut the links between the employee's old managers and the moved subtree
+        subtree = select(EmployeeHierarchy.descendant_id).where(EmployeeHierarchy.ancestor_id == employee_id)
+        old_managers = select(EmployeeHierarchy.ancestor_id).where(
+            EmployeeHierarchy.descendant_id == employee_id,
+            EmployeeHierarchy.depth > 0
+        )
+        self.session.execute(
+            delete(EmployeeHierarchy)
+            .where(
+                EmployeeHierarchy.descendant_id.in_(subtree.scalar_subquery()),
+                EmployeeHierarchy.ancestor_id.in_(old_managers.scalar_subquery())
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
+        if manager_id:
+            self._attach(employee_id, manager_id)
+    
+    def _attach(self, employee_id: uuid.UUID, manager_id: uuid.UUID):
+        """Link every manager above ``manager_id`` to every node under ``employee_id``"""
+        above = aliased(EmployeeHierarchy)
+        below = aliased(EmployeeHierarchy)
+        self.session.execute(
+            insert(EmployeeHierarchy).from_select(
+                CLOSURE_COLUMNS,
+                select(
+                    above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+                ).select_from(above).join(below, true()).where(
+                    above.descendant_id == manager_id,
+                    below.ancestor_id == employee_id
+                )
+            )
+        )
+    
+    def rebuild(self) -> int:
+        """Recompute the whole closure table from ``Employee.manager_id``
+        
+        A walk stops when it comes back to its starting employee, so a
+        ``manager_id`` cycle in legacy data yields one row per pair instead
+        of repeating the loop; the employees on a cycle are logged.
+        
+        Returns:
+            Number of closure rows written
+        """
+        tree = select(
+            Employee.id.label("ancestor_id"),
+            Employee.id.label("descendant_id"),
+            literal(0).label("depth")
+        ).cte("tree", recursive=True)
+        tree = tree.union_all(
+            select(tree.c.ancestor_id, Employee.id, tree.c.depth + 1).where(
+                Employee.manager_id == tree.c.descendant_id,
+                Employee.id != tree.c.ancestor_id,
+                tree.c.depth < MAX_HIERARCHY_DEPTH
+            )
+        )
+        
+        self.session.execute(delete(EmployeeHierarchy).execution_options(synchronize_session=False))
+        result = self.session.execute(
+            insert(EmployeeHierarchy).from_select(
+                CLOSURE_COLUMNS,
+                select(tree.c.ancestor_id, tree.c.descendant_id, tree.c.depth)
+            )
+        )
+        
+        # An employee whose own manager is one of their reports is on a cycle
+        in_cycle = self.session.exec(
+            select(EmployeeHierarchy.ancestor_id).join(
+                Employee, Employee.id == EmployeeHierarchy.ancestor_id
+            ).where(Employee.manager_id == EmployeeHierarchy.descendant_id)
+        ).all()
+        if in_cycle:
+            logger.warning(
+                f"Employees in a manager_id cycle: {', '.join(str(employee_id) for employee_id in in_cycle)}"
+            )
+        return result.rowcount
+    
+    def is_in_reporting_line(
+        self,
+        manager_id: uuid.UUID,
+        employee_id: uuid.UUID,
+        include_self: bool = False
+    ) -> bool:
+        """Check whether an employee reports to a manager, directly or not"""
+        statement = select(EmployeeHierarchy.depth).where(
+            EmployeeHierarchy.ancestor_id == manager_id,
+            EmployeeHierarchy.descendant_id == employee_id
+        )
+        if not include_self:
+            statement = statement.where(EmployeeHierarchy.depth > 0)
+        return self.session.exec(statement).first() is not None
+    
+    def get_manager_at_level(self, employee_id: uuid.UUID, level: int = 1) -> Optional[Employee]:
+        """Get the manager ``level`` steps above an employee, e.g. for approval routing"""
+        statement = select(Employee).join(
+            EmployeeHierarchy, EmployeeHierarchy.ancestor_id == Employee.id
+        ).where(
+            EmployeeHierarchy.descendant_id == employee_id,
+            EmployeeHierarchy.depth == level
+        )
+        return self.session.exec(statement).first()
+    
+    async def get_reports(
+        self,
+        manager_id: uuid.UUID,
+        max_depth: Optional[int] = None,
+        include_inactive: bool = False
+    ) -> List[ReportingLineEntry]:
+        """Get everyone reporting to a manager, nearest level first"""
+        self._get_employee(manager_id)
+        
+        statement = select(Employee, EmployeeHierarchy.depth).join(
+            EmployeeHierarchy, EmployeeHierarchy.descendant_id == Employee.id
+        ).where(
+            EmployeeHierarchy.ancestor_id == manager_id,
+            EmployeeHierarchy.depth > 0
+        )
+        if max_depth:
+            statement = statement.where(EmployeeHierarchy.depth <= max_depth)
+        if not include_inactive:
+            statement = statement.where(Employee.is_active == True)
+        
+        rows = self.session.exec(statement.order_by(EmployeeHierarchy.depth, Employee.full_name)).all()
+        return [self._create_entry(employee, depth) for employee, depth in rows]
+    
+    async def get_reporting_chain(self, employee_id: uuid.UUID) -> List[ReportingLineEntry]:
+        """Get an employee's managers, from the direct manager to the top"""
+        self._get_employee(employee_id)
+        
+        statement = select(Employee, EmployeeHierarchy.depth).join(
+            EmployeeHierarchy, EmployeeHierarchy.ancestor_id == Employee.id
+        ).where(
+            EmployeeHierarchy.descendant_id == employee_id,
+            EmployeeHierarchy.depth > 0
+        ).order_by(EmployeeHierarchy.depth)
+        
+        rows = self.session.exec(statement).all()
+        return [self._create_entry(employee, depth) for employee, depth in rows]
+    
+    async def get_headcount_rollup(self, manager_id: uuid.UUID) -> HeadcountRollup:
+        """Get active headcount under a manager, rolled up per manager in the subtree
+        
+        Each active member of the subtree is returned once with the size of
+        their own subtree, so totals per department, per level and per
+        manager all come from the same grouped join.
+        """
+        manager = self._get_employee(manager_id)
+        
+        position = aliased(EmployeeHierarchy)
+        below = aliased(EmployeeHierarchy)
+        report = aliased(Employee)
+        
+        active_report = (below.depth > 0) & (report.is_active == True)
+        statement = select(
+            Employee.id,
+            Employee.full_name,
+            Employee.department,
+            position.depth,
+            func.count().filter(active_report & (below.depth == 1)),
+            func.count().filter(active_report)
+        ).select_from(Employee).join(
+            position, position.descendant_id == Employee.id
+        ).join(
+            below, below.ancestor_id == Employee.id
+        ).join(
+            report, report.id == below.descendant_id
+        ).where(
+            position.ancestor_id == manager_id,
+            (Employee.is_active == True) | (position.depth == 0)
+        ).group_by(
+            Employee.id, Employee.full_name, Employee.department, position.depth
+        ).order_by(position.depth, Employee.full_name)
+        
+        rollup = HeadcountRollup(
+            employee_id=manager.id,
+            full_name=manager.full_name,
+            direct_reports=0,
+            total_reports=0,
+            by_department={},
+            by_depth={},
+            managers=[]
+        )
+        for employee_id, full_name, department, depth, direct_reports, total_reports in self.session.exec(statement).all():
+            if depth == 0:
+                rollup.direct_reports = direct_reports
+                rollup.total_reports = total_reports
+                continue
+            
+            rollup.by_department[department] = rollup.by_department.get(department, 0) + 1
+            rollup.by_depth[depth] = rollup.by_depth.get(depth, 0) + 1
+            if total_reports:
+                rollup.managers.append(ManagerHeadcount(
+                    id=employee_id,
+                    full_name=full_name,
+                    department=department,
+                    depth=depth,
+                    direct_reports=direct_reports,
+                    total_reports=total_reports
+                ))
+        
+        return rollup
+    
+    def _get_employee(self, employee_id: uuid.UUID) -> Employee:
+        employee = self.session.get(Employee, employee_id)
+        if not employee:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Employee not found"
+            )
+        return employee
+    
+    def _create_entry(self, employee: Employee, depth: int) -> ReportingLineEntry:
+        return ReportingLineEntry(
+            id=employee.id,
+            employee_id=employee.employee_id,
+            full_name=employee.full_name,
+            department=employee.department,
+            position=employee.position,
+            manager_id=employee.manager_id,
+            is_active=employee.is_active,
+            depth=depth
+        )
+
+
+def ensure_employee_hierarchy():
+    """Build the closure table when it is empty but employees exist
+    
+    Covers databases created before the table was introduced.
+    """
+    with Session(engine) as session:
+        if session.exec(select(EmployeeHierarchy.ancestor_id).limit(1)).first() is not None:
+            return
+        if session.exec(select(Employee.id).limit(1)).first() is None:
+            return
+        
+        count = HierarchyService(session).rebuild()
+        session.commit()
+        logger.info(f"Built employee hierarchy with {count} rows")
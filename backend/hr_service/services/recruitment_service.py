@@ -8,6 +8,7 @@ from models.employee import Employee
 from schemas.job_application import (
     JobApplicationCreate, JobApplicationUpdate, JobApplicationResponse
 )
+from services.analytics_service import invalidate_hr_dashboard
 from utils.upload import process_upload
 from utils.notifications import send_recruitment_notification
 from typing import List, Optional, Dict, Any
@@ -82,6 +83,7 @@ class RecruitmentService:
         
         self.session.add(application)
         self.session.commit()
+        invalidate_hr_dashboard()
         self.session.refresh(application)
         
         # Send notification to recruiters
@@ -212,6 +214,7 @@ class RecruitmentService:
         
         self.session.add(application)
         self.session.commit()
+        invalidate_hr_dashboard()
         self.session.refresh(application)
         
         logger.info(f"Updated job application {application_id}")
@@ -267,6 +270,7 @@ class RecruitmentService:
         
         self.session.add(application)
         self.session.commit()
+        invalidate_hr_dashboard()
         
         # Send notification for important stage changes
         if new_stage in [ApplicationStage.INTERVIEW, ApplicationStage.OFFER, ApplicationStage.HIRED]:
@@ -339,6 +343,7 @@ class RecruitmentService:
             
             self.session.add(application)
             self.session.commit()
+            invalidate_hr_dashboard()
             
             logger.info(f"Hired applicant {application_id} as employee {employee.id}")
             return {
@@ -389,6 +394,7 @@ class RecruitmentService:
         
         self.session.add(application)
         self.session.commit()
+        invalidate_hr_dashboard()
         
         # Send rejection notification
         try:
@@ -517,6 +523,7 @@ class RecruitmentService:
         
         self.session.delete(application)
         self.session.commit()
+        invalidate_hr_dashboard()
         
         logger.info(f"Deleted job application {application_id}")
         return {"message": "Job application deleted successfully"}
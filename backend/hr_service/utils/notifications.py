@@ -9,6 +9,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Notification service priorities, 1 = highest
+NOTIFICATION_PRIORITIES = {"urgent": 1, "high": 3, "medium": 5, "low": 7}
+
 
 class NotificationService:
     """Service for sending notifications via notification microservice"""
@@ -64,6 +67,61 @@ class NotificationService:
             logger.error(f"Error sending notification: {str(e)}")
             return False
     
+    async def send_notifications(
+        self,
+        notifications: List[Dict[str, Any]],
+        batch_size: int = 100,
+        notification_type: str = "document_expiry"
+    ) -> List[bool]:
+        """Send individually templated notifications in batched requests
+        
+        Args:
+            notifications: Dicts with recipient_id, template_name, variables
+                and optionally channels and priority
+            batch_size: Notifications per request to the batch endpoint
+            notification_type: Notification type of the whole batch
+            
+        Returns:
+            Success status per notification, in input order
+        """
+        results: List[bool] = []
+        if not notifications:
+            return results
+        
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            for start in range(0, len(notifications), batch_size):
+                chunk = notifications[start:start + batch_size]
+                payload = {
+                    "type": notification_type,
+                    "source_service": "hr_service",
+                    "notifications": [
+                        {
+                            "recipient_id": notification["recipient_id"],
+                            "template_name": notification["template_name"],
+                            "variables": notification["variables"],
+                            "channels": notification.get("channels") or ["email"],
+                            "priority": NOTIFICATION_PRIORITIES.get(notification.get("priority", "medium"), 5)
+                        }
+                        for notification in chunk
+                    ]
+                }
+                try:
+                    response = await client.post(
+                        f"{self.notification_service_url}/api/v1/notifications/send-batch",
+                        json=payload
+                    )
+                except Exception as e:
+                    logger.error(f"Error sending notification batch: {str(e)}")
+                    results.extend([False] * len(chunk))
+                    continue
+                if response.status_code != 200:
+                    logger.error(f"Failed to send notification batch: {response.status_code} - {response.text}")
+                    results.extend([False] * len(chunk))
+                    continue
+                results.extend(bool(sent) for sent in response.json().get("results", [False] * len(chunk)))
+        
+        return results
+    
     async def send_bulk_notification(
         self,
         recipient_ids: List[str],
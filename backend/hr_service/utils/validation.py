@@ -4,6 +4,7 @@ Data validation utilities for HR service
 from datetime import date, datetime, timedelta
 from typing import List, Optional, Dict, Any
 from fastapi import HTTPException, status, UploadFile
+from config import settings
 import re
 import logging
 
@@ -312,7 +313,7 @@ async def validate_document(file: UploadFile) -> Dict[str, Any]:
         HTTPException: If validation fails
     """
     # File size check
-    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    MAX_FILE_SIZE = settings.max_file_size
     if file.size and file.size > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
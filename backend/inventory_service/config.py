@@ -55,6 +55,10 @@ class Settings(BaseSettings):
     enable_expiry_alerts: bool = True
     alert_check_interval_hours: int = 24
     
+    # Stock Ledger Configuration
+    stock_snapshot_enabled: bool = True  # Write month-end stock snapshots
+    stock_snapshot_check_minutes: int = 60
+    
     # File Upload
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     allowed_file_types: List[str]
@@ -7,8 +7,10 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from config import settings
 from database import create_db_and_tables
+from services.stock_ledger_service import snapshot_scheduler
 from routers import (
-    items_router, movements_router, suppliers_router, purchase_orders_router, analytics_router
+    items_router, movements_router, suppliers_router, purchase_orders_router, analytics_router,
+    stock_ledger_router
 )
 import logging
 
@@ -65,6 +67,15 @@ async def startup_event():
     """Initialize database and create tables"""
     create_db_and_tables()
     logger.info("Inventory database initialized successfully")
+    if settings.stock_snapshot_enabled:
+        snapshot_scheduler.start()
+
+
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks"""
+    await snapshot_scheduler.stop()
 
 
 # Health check
@@ -84,6 +95,7 @@ app.include_router(movements_router, prefix="/api/v1")
 app.include_router(suppliers_router, prefix="/api/v1")
 app.include_router(purchase_orders_router, prefix="/api/v1")
 app.include_router(analytics_router, prefix="/api/v1")
+app.include_router(stock_ledger_router, prefix="/api/v1")
 
 
 # Root endpoint
@@ -102,6 +114,7 @@ async def root():
             "Supplier performance tracking",
             "Stock movement logging",
             "Inventory valuation reports",
+            "Point-in-time stock ledger (WAC and FIFO)",
             "Multi-warehouse support",
             "Cost center allocation"
         ]
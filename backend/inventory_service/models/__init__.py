@@ -5,10 +5,14 @@ from .item import Item, ItemCategory, ItemUnit, ItemStatus
 from .stock_movement import StockMovement, MovementType, MovementReason
 from .supplier import Supplier, SupplierStatus, SupplierType
 from .purchase_order import PurchaseOrder, PurchaseOrderItem, PurchaseOrderStatus, PurchaseOrderPriority
+from .stock_snapshot import StockSnapshot
+from .document_sequence import DocumentSequence
 
 __all__ = [
     "Item", "ItemCategory", "ItemUnit", "ItemStatus",
     "StockMovement", "MovementType", "MovementReason",
     "Supplier", "SupplierStatus", "SupplierType",
-    "PurchaseOrder", "PurchaseOrderItem", "PurchaseOrderStatus", "PurchaseOrderPriority"
+    "PurchaseOrder", "PurchaseOrderItem", "PurchaseOrderStatus", "PurchaseOrderPriority",
+    "StockSnapshot",
+    "DocumentSequence"
 ]
\ No newline at end of file
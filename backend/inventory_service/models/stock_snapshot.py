@@ -0,0 +1,40 @@
+"""
+Stock snapshot model for point-in-time stock ledger queries
+"""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Numeric, UniqueConstraint
+from typing import Optional
+from datetime import datetime, date
+from decimal import Decimal
+import uuid
+
+
+class StockSnapshot(SQLModel, table=True):
+    """Closing stock position of an item at the end of a snapshot date
+    
+    Written by the stock snapshot job (month end by default). Historical
+    stock and valuation queries start from the nearest snapshot and only
+    replay the movements after it.
+    """
+    __tablename__ = "stock_snapshots"
+    __table_args__ = (
+        UniqueConstraint("snapshot_date", "item_id", name="uq_stock_snapshots_date_item"),
+    )
+    
+    id: Optional[uuid.UUID] = Field(
+        default_factory=uuid.uuid4, primary_key=True
+    )
+    
+    # Position
+    snapshot_date: date = Field(index=True)  # Position at the end of this day
+    item_id: uuid.UUID = Field(foreign_key="items.id", index=True)
+    warehouse_location: str = Field(max_length=100, index=True)
+    quantity: Decimal = Field(sa_column=Column(Numeric(12, 2)))
+    
+    # Valuation
+    average_cost: Decimal = Field(sa_column=Column(Numeric(12, 4)))  # Weighted average unit cost
+    wac_value: Decimal = Field(sa_column=Column(Numeric(15, 2)))
+    fifo_value: Decimal = Field(sa_column=Column(Numeric(15, 2)))
+    
+    # Timestamps
+    created_at: datetime = Field(default_factory=datetime.utcnow)
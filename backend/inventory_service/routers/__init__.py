@@ -6,5 +6,7 @@ from .movements import router as movements_router
 from .suppliers import router as suppliers_router
 from .purchase_orders import router as purchase_orders_router
 from .analytics import router as analytics_router
+from .stock_ledger import router as stock_ledger_router
 
-__all__ = ["items_router", "movements_router", "suppliers_router", "purchase_orders_router", "analytics_router"]
\ No newline at end of file
+__all__ = ["items_router", "movements_router", "suppliers_router", "purchase_orders_router", "analytics_router",
+           "stock_ledger_router"]
\ No newline at end of file
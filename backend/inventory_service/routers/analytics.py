@@ -9,6 +9,7 @@ from services.analytics_service import AnalyticsService
 from utils.auth import require_permission, CurrentUser
 from typing import Dict, Any, List, Optional
 import redis
+import uuid
 
 
 router = APIRouter(prefix="/analytics", tags=["Inventory Analytics"])
@@ -98,8 +99,8 @@ async def get_supplier_performance_analytics(
     current_user: CurrentUser = Depends(require_permission("inventory", "read", "analytics"))
 ):
     """Get supplier performance analytics"""
-    analytics_service = AnalyticsService(session, redis_client)
-    return await analytics_service.get_supplier_performance_analytics(period_months)
+    analytics_service = AnalyticsService(session)
+    return await analytics_service.get_supplier_performance_report(period_months)
 
 
 @router.get("/cost-analysis", response_model=Dict[str, Any])
@@ -128,15 +129,15 @@ async def get_inventory_alerts(
 
 @router.get("/forecasting", response_model=Dict[str, Any])
 async def get_demand_forecasting(
-    item_id: Optional[str] = Query(None, description="Specific item for forecasting"),
+    item_id: Optional[uuid.UUID] = Query(None, description="Specific item for forecasting"),
     forecast_months: int = Query(6, ge=1, le=24, description="Months to forecast"),
     session: Session = Depends(get_session),
     redis_client: redis.Redis = Depends(get_redis),
     current_user: CurrentUser = Depends(require_permission("inventory", "read", "analytics"))
 ):
     """Get demand forecasting analysis"""
-    analytics_service = AnalyticsService(session, redis_client)
-    return await analytics_service.get_demand_forecasting(item_id, forecast_months)
+    analytics_service = AnalyticsService(session)
+    return await analytics_service.get_consumption_forecast(item_id, forecast_months)
 
 
 @router.get("/export/stock-report")
@@ -111,7 +111,8 @@ async def get_stock_movements(
         items=movements,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -5,10 +5,12 @@ from fastapi import APIRouter, Depends, Query
 from sqlmodel import Session
 from database import get_session, get_redis
 from services.purchase_order_service import PurchaseOrderService
+from services.reorder_service import ReorderPlannerService
 from schemas.purchase_order import (
     PurchaseOrderCreate, PurchaseOrderUpdate, PurchaseOrderResponse,
     PurchaseOrderSummary, PurchaseOrderSearch, PurchaseOrderApproval,
-    PurchaseOrderReceiving, PurchaseOrderGeneration
+    PurchaseOrderReceiving, PurchaseOrderGeneration,
+    ReorderPlan, ReorderDraftRequest, ReorderDraftResult
 )
 from models.purchase_order import PurchaseOrderStatus, PurchaseOrderPriority
 from utils.auth import require_permission, CurrentUser
@@ -109,7 +111,8 @@ async def get_purchase_orders(
         items=orders,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -135,6 +138,30 @@ async def get_pending_approval_orders(
     return await po_service.get_pending_approval_orders()
 
 
+@router.get("/reorder-plan", response_model=ReorderPlan)
+async def get_reorder_plan(
+    warehouse: Optional[str] = Query(None, description="Filter by warehouse"),
+    supplier_ids: Optional[List[uuid.UUID]] = Query(None, description="Filter by suppliers"),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("inventory", "read", "purchase_orders"))
+):
+    """Get restock suggestions grouped by primary supplier"""
+    planner = ReorderPlannerService(session)
+    return await planner.build_plan(warehouse, supplier_ids)
+
+
+@router.post("/reorder-plan/drafts", response_model=ReorderDraftResult)
+async def create_draft_orders_from_reorder_plan(
+    draft_request: ReorderDraftRequest,
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("inventory", "create", "purchase_orders"))
+):
+    """Create one draft purchase order per supplier from the reorder plan"""
+    po_service = PurchaseOrderService(session, redis_client)
+    return await po_service.create_draft_orders(draft_request, current_user.user_id)
+
+
 @router.get("/{po_id}", response_model=PurchaseOrderResponse)
 async def get_purchase_order(
     po_id: uuid.UUID,
@@ -0,0 +1,46 @@
+"""
+Stock ledger routes for point-in-time stock and valuation
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from database import get_session
+from services.stock_ledger_service import StockLedgerService, last_month_end
+from schemas.stock_ledger import StockLedgerReport, StockSnapshotResult
+from utils.auth import require_permission, CurrentUser
+from typing import Optional
+from datetime import date
+import uuid
+
+
+router = APIRouter(prefix="/stock-ledger", tags=["Stock Ledger"])
+
+
+@router.get("/positions", response_model=StockLedgerReport)
+async def get_stock_positions(
+    as_of: Optional[date] = Query(None, description="Position date, end of day (defaults to today)"),
+    item_id: Optional[uuid.UUID] = Query(None, description="Filter by item"),
+    warehouse: Optional[str] = Query(None, description="Filter by warehouse"),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("inventory", "read", "analytics"))
+):
+    """Get stock on hand with WAC and FIFO valuation at a past date
+
+    Positions are rolled forward from the nearest earlier stock snapshot.
+    """
+    ledger_service = StockLedgerService(session)
+    return await ledger_service.get_stock_report(as_of or date.today(), item_id, warehouse)
+
+
+@router.post("/snapshots", response_model=StockSnapshotResult)
+async def create_stock_snapshot(
+    snapshot_date: Optional[date] = Query(None, description="Snapshot date (defaults to the last month end)"),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(require_permission("inventory", "update", "movements"))
+):
+    """Write (or rewrite) the stock snapshot of a date
+
+    Later snapshots are chained from their predecessor and are not
+    rewritten; rebuild them in date order after backfilling.
+    """
+    ledger_service = StockLedgerService(session)
+    return await ledger_service.create_snapshot(snapshot_date or last_month_end())
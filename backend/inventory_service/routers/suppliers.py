@@ -68,7 +68,8 @@ async def get_suppliers(
         items=suppliers,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -22,7 +22,14 @@ from .purchase_order import (
     PurchaseOrderUpdate,
     PurchaseOrderResponse,
     PurchaseOrderSummary,
+    ReorderLine,
+    SupplierReorderGroup,
+    ReorderPlan,
+    ReorderDraftRequest,
+    DraftPurchaseOrder,
+    ReorderDraftResult,
 )
+from .stock_ledger import StockPosition, StockLedgerReport, StockSnapshotResult
 
 
 __all__ = [
@@ -44,9 +51,19 @@ __all__ = [
     "PurchaseOrderUpdate",
     "PurchaseOrderResponse",
     "PurchaseOrderSummary",
+    "ReorderLine",
+    "SupplierReorderGroup",
+    "ReorderPlan",
+    "ReorderDraftRequest",
+    "DraftPurchaseOrder",
+    "ReorderDraftResult",
     # Stock movement schemas
     "StockMovementBase",
     "StockMovementCreate",
     "StockMovementUpdate",
     "StockMovementResponse",
+    # Stock ledger schemas
+    "StockPosition",
+    "StockLedgerReport",
+    "StockSnapshotResult",
 ]
@@ -167,4 +167,76 @@ class PurchaseOrderGeneration(BaseModel):
     items: List[Dict[str, Any]]  # item_id, quantity
     priority: PurchaseOrderPriority = PurchaseOrderPriority.NORMAL
     required_date: Optional[date] = None
-    notes: Optional[str] = None
\ No newline at end of file
+    notes: Optional[str] = None
+
+class ReorderLine(BaseModel):
+    """Suggested reorder of one item"""
+    item_id: uuid.UUID
+    item_name: str
+    item_sku: str
+    category: str
+    warehouse_location: str
+    is_critical: bool
+    stock_status: str  # out_of_stock, critical_low, low_stock
+    priority: str  # urgent, high, medium
+    current_quantity: Decimal
+    on_order_quantity: Decimal  # Still outstanding on open purchase orders
+    reorder_level: Decimal
+    target_quantity: Decimal  # Max stock level, or twice the reorder level
+    suggested_quantity: Decimal
+    unit_cost: Decimal
+    estimated_cost: Decimal
+
+
+class SupplierReorderGroup(BaseModel):
+    """Reorder suggestions of one supplier"""
+    supplier_id: uuid.UUID
+    supplier_name: str
+    currency: str
+    delivery_time_days: Optional[int]
+    minimum_order_amount: Optional[Decimal]
+    estimated_total: Decimal
+    meets_minimum_order: bool
+    lines: List[ReorderLine]
+
+
+class ReorderPlan(BaseModel):
+    """Reorder suggestions grouped by primary supplier"""
+    generated_at: datetime
+    total_items: int
+    total_estimated_cost: Decimal
+    suppliers: List[SupplierReorderGroup]
+    unassigned: List[ReorderLine]  # Items without an active primary supplier
+
+
+class ReorderDraftRequest(BaseModel):
+    """Schema for creating draft purchase orders from the reorder plan"""
+    supplier_ids: Optional[List[uuid.UUID]] = None
+    warehouse_location: Optional[str] = None
+    priority: PurchaseOrderPriority = PurchaseOrderPriority.NORMAL
+    required_date: Optional[date] = None
+    notes: Optional[str] = None
+    skip_below_minimum: bool = False  # Leave out suppliers whose minimum order amount is not reached
+    
+    @validator('required_date')
+    def validate_required_date(cls, v):
+        if v and v < date.today():
+            raise ValueError('Required date cannot be in the past')
+        return v
+
+
+class DraftPurchaseOrder(BaseModel):
+    """Draft purchase order created by the reorder planner"""
+    id: uuid.UUID
+    po_number: str
+    supplier_id: uuid.UUID
+    supplier_name: str
+    line_count: int
+    total_amount: Decimal
+
+
+class ReorderDraftResult(BaseModel):
+    """Result of creating draft purchase orders from the reorder plan"""
+    orders: List[DraftPurchaseOrder]
+    skipped_supplier_ids: List[uuid.UUID]  # Below their minimum order amount
+    unassigned_items: int
@@ -0,0 +1,39 @@
+"""
+Stock ledger-related Pydantic schemas
+"""
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import date
+from decimal import Decimal
+import uuid
+
+
+class StockPosition(BaseModel):
+    """Stock position of an item at a point in time"""
+    item_id: uuid.UUID
+    item_name: str
+    item_sku: str
+    warehouse_location: str
+    quantity: Decimal
+    average_cost: Decimal
+    wac_value: Decimal
+    fifo_value: Decimal
+
+
+class StockLedgerReport(BaseModel):
+    """Stock on hand and valuation at a point in time"""
+    as_of: date
+    snapshot_date: Optional[date]  # Snapshot the positions were rolled forward from
+    total_quantity: Decimal
+    total_wac_value: Decimal
+    total_fifo_value: Decimal
+    by_warehouse: Dict[str, Dict[str, Decimal]]
+    positions: List[StockPosition]
+
+
+class StockSnapshotResult(BaseModel):
+    """Result of writing a stock snapshot"""
+    snapshot_date: date
+    items: int
+    total_wac_value: Decimal
+    total_fifo_value: Decimal
@@ -8,6 +8,8 @@ from decimal import Decimal
 from models.stock_movement import MovementType, MovementReason
 import uuid
 
+MAX_BULK_MOVEMENTS = 1000
+
 
 class StockMovementBase(BaseModel):
     item_id: uuid.UUID
@@ -26,7 +28,7 @@ class StockMovementBase(BaseModel):
 
 
 class StockMovementCreate(StockMovementBase):
-    performed_by: uuid.UUID
+    performed_by: Optional[uuid.UUID] = None  # Defaults to the current user
     movement_date: Optional[datetime] = None
     
     @validator('quantity')
@@ -91,4 +93,6 @@ class BulkStockMovement(BaseModel):
     def validate_movements(cls, v):
         if not v:
             raise ValueError('At least one movement is required')
+        if len(v) > MAX_BULK_MOVEMENTS:
+            raise ValueError(f'At most {MAX_BULK_MOVEMENTS} movements can be posted at once')
         return v
\ No newline at end of file
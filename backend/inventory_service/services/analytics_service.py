@@ -2,18 +2,32 @@
 Analytics service for inventory analytics and reporting
 """
 from sqlmodel import Session, select, and_, or_, func
+from sqlalchemy import case
 from models.item import Item, ItemCategory
 from models.stock_movement import StockMovement, MovementType
-from models.supplier import Supplier
+from models.supplier import Supplier, SupplierStatus
 from models.purchase_order import PurchaseOrder, PurchaseOrderStatus
+from services.reorder_service import ReorderPlannerService
+from utils.forecasting import forecast_consumption, month_starts, months_until_threshold
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
+from dateutil.relativedelta import relativedelta
 from decimal import Decimal
+import numpy as np
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+FORECAST_HISTORY_MONTHS = 12
+ITEM_QUERY_CHUNK_SIZE = 1000
+
+# Orders whose goods have arrived
+DELIVERED_ORDER_STATUSES = [
+    PurchaseOrderStatus.RECEIVED,
+    PurchaseOrderStatus.CLOSED
+]
+
 
 class AnalyticsService:
     """Service for inventory analytics and reporting"""
@@ -273,86 +287,114 @@ class AnalyticsService:
             "most_active_items": top_items_with_names
         }
     
-    async def get_supplier_performance_report(self) -> Dict[str, Any]:
+    async def get_supplier_performance_report(self, period_months: Optional[int] = None) -> Dict[str, Any]:
         """Get supplier performance analytics
         
+        The whole report comes from one query: purchase orders and items are
+        each aggregated per supplier and joined onto the supplier list, with
+        lead-time percentiles computed by the database.
+        
+        Args:
+            period_months: Only count orders placed in this many past months
+            
         Returns:
             Supplier performance data
         """
-        suppliers = self.session.exec(select(Supplier)).all()
+        delivered = and_(
+            PurchaseOrder.status.in_(DELIVERED_ORDER_STATUSES),
+            PurchaseOrder.actual_delivery_date.is_not(None)
+        )
+        lead_time_days = case(
+            (delivered, PurchaseOrder.actual_delivery_date - PurchaseOrder.order_date),
+            else_=None
+        )
         
-        supplier_metrics = []
+        order_stats = select(
+            PurchaseOrder.supplier_id,
+            func.count().label("total_orders"),
+            func.count().filter(delivered).label("delivered_orders"),
+            func.count().filter(PurchaseOrder.status == PurchaseOrderStatus.PENDING).label("pending_orders"),
+            func.count().filter(
+                delivered,
+                PurchaseOrder.expected_delivery_date.is_not(None),
+                PurchaseOrder.actual_delivery_date <= PurchaseOrder.expected_delivery_date
+            ).label("on_time_deliveries"),
+            func.avg(lead_time_days).label("average_lead_time"),
+            func.percentile_cont(0.5).within_group(lead_time_days).label("lead_time_p50"),
+            func.percentile_cont(0.9).within_group(lead_time_days).label("lead_time_p90"),
+            func.sum(PurchaseOrder.total_amount).label("total_order_value")
+        )
+        if period_months:
+            order_stats = order_stats.where(
+                PurchaseOrder.order_date >= date.today() - relativedelta(months=period_months)
+            )
+        order_stats = order_stats.group_by(PurchaseOrder.supplier_id).subquery()
+        
+        item_counts = select(
+            Item.primary_supplier_id.label("supplier_id"),
+            func.count().label("items_supplied")
+        ).where(Item.primary_supplier_id.is_not(None)).group_by(Item.primary_supplier_id).subquery()
+        
+        rows = self.session.exec(
+            select(
+                Supplier.id,
+                Supplier.name,
+                Supplier.performance_rating,
+                Supplier.status,
+                func.coalesce(order_stats.c.total_orders, 0),
+                func.coalesce(order_stats.c.delivered_orders, 0),
+                func.coalesce(order_stats.c.pending_orders, 0),
+                func.coalesce(order_stats.c.on_time_deliveries, 0),
+                order_stats.c.average_lead_time,
+                order_stats.c.lead_time_p50,
+                order_stats.c.lead_time_p90,
+                func.coalesce(order_stats.c.total_order_value, 0),
+                func.coalesce(item_counts.c.items_supplied, 0)
+            )
+            .outerjoin(order_stats, order_stats.c.supplier_id == Supplier.id)
+            .outerjoin(item_counts, item_counts.c.supplier_id == Supplier.id)
+            .order_by(Supplier.performance_rating.desc().nulls_last(), Supplier.name)
+        ).all()
         
-        for supplier in suppliers:
-            # Get purchase orders for this supplier
-            orders = self.session.exec(
-                select(PurchaseOrder).where(PurchaseOrder.supplier_id == supplier.id)
-            ).all()
-            
-            # Calculate metrics
-            total_orders = len(orders)
-            delivered_orders = [o for o in orders if o.status == PurchaseOrderStatus.DELIVERED]
-            pending_orders = [o for o in orders if o.status == PurchaseOrderStatus.PENDING]
-            
-            # Delivery performance
-            on_time_deliveries = 0
-            total_delivery_days = 0
-            
-            for order in delivered_orders:
-                if order.delivery_date and order.expected_delivery_date:
-                    if order.delivery_date <= order.expected_delivery_date:
-                        on_time_deliveries += 1
-                    
-                    delivery_days = (order.delivery_date - order.order_date).days
-                    total_delivery_days += delivery_days
-            
-            on_time_rate = (on_time_deliveries / len(delivered_orders) * 100) if delivered_orders else 0
-            avg_delivery_days = total_delivery_days / len(delivered_orders) if delivered_orders else 0
-            
-            # Financial metrics
-            total_order_value = sum(o.total_cost or 0 for o in orders)
-            avg_order_value = total_order_value / total_orders if total_orders > 0 else 0
-            
-            # Items supplied
-            items_count = self.session.exec(
-                select(func.count(Item.id)).where(Item.supplier_id == supplier.id)
-            ).first() or 0
-            
+        supplier_metrics = []
+        for (supplier_id, name, rating, supplier_status, total_orders, delivered_orders, pending_orders,
+             on_time_deliveries, average_lead_time, lead_time_p50, lead_time_p90, total_order_value,
+             items_supplied) in rows:
             supplier_metrics.append({
-                "supplier_id": str(supplier.id),
-                "supplier_name": supplier.name,
-                "performance_score": supplier.performance_score,
-                "is_active": supplier.is_active,
+                "supplier_id": str(supplier_id),
+                "supplier_name": name,
+                "performance_score": rating,
+                "is_active": supplier_status == SupplierStatus.ACTIVE,
                 "total_orders": total_orders,
-                "delivered_orders": len(delivered_orders),
-                "pending_orders": len(pending_orders),
-                "on_time_delivery_rate": round(on_time_rate, 2),
-                "average_delivery_days": round(avg_delivery_days, 1),
+                "delivered_orders": delivered_orders,
+                "pending_orders": pending_orders,
+                "on_time_delivery_rate": round(on_time_deliveries / delivered_orders * 100, 2) if delivered_orders else 0,
+                "average_delivery_days": round(float(average_lead_time), 1) if average_lead_time is not None else 0,
+                "delivery_days_p50": round(float(lead_time_p50), 1) if lead_time_p50 is not None else None,
+                "delivery_days_p90": round(float(lead_time_p90), 1) if lead_time_p90 is not None else None,
                 "total_order_value": float(total_order_value),
-                "average_order_value": float(avg_order_value),
-                "items_supplied": items_count
+                "average_order_value": float(total_order_value) / total_orders if total_orders else 0,
+                "items_supplied": items_supplied
             })
         
-        # Sort by performance score
-        supplier_metrics.sort(key=lambda x: x["performance_score"] or 0, reverse=True)
-        
         # Overall statistics
-        active_suppliers = len([s for s in suppliers if s.is_active])
-        avg_performance = sum(s.performance_score or 0 for s in suppliers) / len(suppliers) if suppliers else 0
+        ratings = [metric["performance_score"] for metric in supplier_metrics]
+        rated = [rating for rating in ratings if rating is not None]
+        avg_performance = sum(rated) / len(supplier_metrics) if supplier_metrics else 0
         
         return {
             "summary": {
-                "total_suppliers": len(suppliers),
-                "active_suppliers": active_suppliers,
+                "total_suppliers": len(supplier_metrics),
+                "active_suppliers": len([m for m in supplier_metrics if m["is_active"]]),
                 "average_performance_score": round(avg_performance, 2)
             },
             "supplier_metrics": supplier_metrics,
             "performance_distribution": {
-                "excellent": len([s for s in suppliers if s.performance_score and s.performance_score >= 90]),
-                "good": len([s for s in suppliers if s.performance_score and 70 <= s.performance_score < 90]),
-                "average": len([s for s in suppliers if s.performance_score and 50 <= s.performance_score < 70]),
-                "poor": len([s for s in suppliers if s.performance_score and s.performance_score < 50]),
-                "unrated": len([s for s in suppliers if not s.performance_score])
+                "excellent": len([r for r in rated if r >= 4.5]),
+                "good": len([r for r in rated if 3.5 <= r < 4.5]),
+                "average": len([r for r in rated if 2.5 <= r < 3.5]),
+                "poor": len([r for r in rated if r < 2.5]),
+                "unrated": len(ratings) - len(rated)
             }
         }
     
@@ -362,62 +404,30 @@ class AnalyticsService:
         Returns:
             Reorder analysis data
         """
-        items = self.session.exec(select(Item)).all()
+        planner = ReorderPlannerService(self.session)
+        stock_status_summary = await planner.get_stock_status_summary()
+        plan = await planner.build_plan()
         
-        # Categorize items by stock status
-        stock_status = {
-            "out_of_stock": [],
-            "critical_low": [],
-            "low_stock": [],
-            "adequate": [],
-            "overstocked": []
-        }
+        lines = [(line, group) for group in plan.suppliers for line in group.lines]
+        lines += [(line, None) for line in plan.unassigned]
         
-        for item in items:
-            if item.current_quantity == 0:
-                stock_status["out_of_stock"].append(item)
-            elif item.current_quantity < item.reorder_level * 0.5:
-                stock_status["critical_low"].append(item)
-            elif item.current_quantity <= item.reorder_level:
-                stock_status["low_stock"].append(item)
-            elif item.current_quantity > item.reorder_level * 3:
-                stock_status["overstocked"].append(item)
-            else:
-                stock_status["adequate"].append(item)
-        
-        # Calculate reorder recommendations
-        reorder_recommendations = []
-        
-        for category in ["out_of_stock", "critical_low", "low_stock"]:
-            for item in stock_status[category]:
-                # Simple reorder calculation
-                suggested_quantity = max(
-                    item.reorder_level * 2 - item.current_quantity,
-                    item.reorder_level
-                )
-                
-                estimated_cost = suggested_quantity * item.unit_cost
-                
-                # Get supplier info
-                supplier = None
-                if item.supplier_id:
-                    supplier = self.session.get(Supplier, item.supplier_id)
-                
-                priority = "urgent" if category == "out_of_stock" else "high" if category == "critical_low" else "medium"
-                
-                reorder_recommendations.append({
-                    "item_id": str(item.id),
-                    "item_name": item.name,
-                    "category": item.category.value if item.category else "Uncategorized",
-                    "current_quantity": item.current_quantity,
-                    "reorder_level": item.reorder_level,
-                    "suggested_quantity": suggested_quantity,
-                    "estimated_cost": float(estimated_cost),
-                    "supplier_id": str(item.supplier_id) if item.supplier_id else None,
-                    "supplier_name": supplier.name if supplier else None,
-                    "priority": priority,
-                    "stock_status": category
-                })
+        reorder_recommendations = [
+            {
+                "item_id": str(line.item_id),
+                "item_name": line.item_name,
+                "category": line.category,
+                "current_quantity": line.current_quantity,
+                "on_order_quantity": line.on_order_quantity,
+                "reorder_level": line.reorder_level,
+                "suggested_quantity": line.suggested_quantity,
+                "estimated_cost": float(line.estimated_cost),
+                "supplier_id": str(group.supplier_id) if group else None,
+                "supplier_name": group.supplier_name if group else None,
+                "priority": line.priority,
+                "stock_status": line.stock_status
+            }
+            for line, group in lines
+        ]
         
         # Sort by priority and cost impact
         priority_order = {"urgent": 0, "high": 1, "medium": 2}
@@ -426,20 +436,11 @@ class AnalyticsService:
             -x["estimated_cost"]
         ))
         
-        # Calculate total reorder cost
-        total_reorder_cost = sum(rec["estimated_cost"] for rec in reorder_recommendations)
-        
         return {
-            "stock_status_summary": {
-                "out_of_stock": len(stock_status["out_of_stock"]),
-                "critical_low": len(stock_status["critical_low"]),
-                "low_stock": len(stock_status["low_stock"]),
-                "adequate": len(stock_status["adequate"]),
-                "overstocked": len(stock_status["overstocked"])
-            },
+            "stock_status_summary": stock_status_summary,
             "reorder_recommendations": reorder_recommendations,
             "financial_impact": {
-                "total_reorder_cost": float(total_reorder_cost),
+                "total_reorder_cost": float(plan.total_estimated_cost),
                 "urgent_items_cost": float(sum(
                     rec["estimated_cost"] for rec in reorder_recommendations 
                     if rec["priority"] == "urgent"
@@ -458,6 +459,11 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """Get consumption forecast based on historical data
         
+        Monthly OUT quantities of the last 12 complete months come from one
+        ``date_trunc`` aggregate and are laid out as an items x months
+        matrix; trend and the Ramadan and summer peaks are then fitted for
+        all items in a single vectorized pass.
+        
         Args:
             item_id: Specific item to forecast (if None, forecasts for all items)
             months_ahead: Number of months to forecast
@@ -465,95 +471,79 @@ class AnalyticsService:
         Returns:
             Consumption forecast data
         """
-        # Get historical movement data (last 12 months)
-        twelve_months_ago = date.today() - timedelta(days=365)
-        
-        query = select(StockMovement).where(
-            and_(
-                StockMovement.type == MovementType.OUT,
-                StockMovement.date >= datetime.combine(twelve_months_ago, datetime.min.time())
-            )
+        current_month = date.today().replace(day=1)
+        history_months = month_starts(
+            date(current_month.year - 1, current_month.month, 1), FORECAST_HISTORY_MONTHS
         )
         
+        month = func.date_trunc("month", StockMovement.movement_date).label("month")
+        consumption_query = select(
+            StockMovement.item_id,
+            month,
+            func.sum(StockMovement.quantity).label("quantity")
+        ).where(
+            StockMovement.movement_type == MovementType.OUT,
+            StockMovement.movement_date >= datetime.combine(history_months[0], datetime.min.time()),
+            StockMovement.movement_date < datetime.combine(current_month, datetime.min.time())
+        )
         if item_id:
-            query = query.where(StockMovement.item_id == item_id)
+            consumption_query = consumption_query.where(StockMovement.item_id == item_id)
+        consumption_query = consumption_query.group_by(StockMovement.item_id, month)
+        
+        rows = self.session.exec(consumption_query).all()
+        item_ids = list({row[0] for row in rows})
+        
+        # Item attributes in one query, in matrix row order
+        items = {}
+        for start in range(0, len(item_ids), ITEM_QUERY_CHUNK_SIZE):
+            for item_row in self.session.exec(
+                select(Item.id, Item.name, Item.current_quantity, Item.reorder_level)
+                .where(Item.id.in_(item_ids[start:start + ITEM_QUERY_CHUNK_SIZE]))
+            ).all():
+                items[item_row[0]] = item_row
+        item_ids = [key for key in item_ids if key in items]
+        
+        # Assemble the items x months consumption matrix
+        row_index = {key: index for index, key in enumerate(item_ids)}
+        column_index = {(m.year, m.month): index for index, m in enumerate(history_months)}
+        history = np.zeros((len(item_ids), len(history_months)))
+        for row_item_id, row_month, quantity in rows:
+            if row_item_id in row_index:
+                history[row_index[row_item_id], column_index[(row_month.year, row_month.month)]] = float(quantity)
+        
+        model = forecast_consumption(history, history_months, months_ahead)
+        current_quantity = np.array([float(items[key][2]) for key in item_ids])
+        reorder_level = np.array([float(items[key][3] or 0) for key in item_ids])
+        reorder_month = months_until_threshold(model["forecast"], current_quantity, reorder_level)
+        
+        forecast_months = month_starts(current_month, months_ahead)
+        forecast_values = np.round(model["forecast"], 2).tolist()
         
-        movements = self.session.exec(query).all()
-        
-        # Group by item and month
-        item_consumption = {}
-        
-        for movement in movements:
-            item_key = str(movement.item_id)
-            month_key = movement.date.strftime("%Y-%m")
-            
-            if item_key not in item_consumption:
-                item_consumption[item_key] = {}
-            
-            if month_key not in item_consumption[item_key]:
-                item_consumption[item_key][month_key] = 0
-            
-            item_consumption[item_key][month_key] += movement.quantity
-        
-        # Generate forecasts
         forecasts = []
-        
-        for item_key, monthly_data in item_consumption.items():
-            item = self.session.get(Item, uuid.UUID(item_key))
-            if not item:
-                continue
-            
-            # Calculate average monthly consumption
-            consumption_values = list(monthly_data.values())
-            if not consumption_values:
-                continue
-            
-            avg_monthly_consumption = sum(consumption_values) / len(consumption_values)
-            
-            # Simple trend analysis (last 3 months vs previous 3 months)
-            recent_months = consumption_values[-3:] if len(consumption_values) >= 3 else consumption_values
-            earlier_months = consumption_values[-6:-3] if len(consumption_values) >= 6 else consumption_values[:-3]
-            
-            trend_factor = 1.0
-            if recent_months and earlier_months:
-                recent_avg = sum(recent_months) / len(recent_months)
-                earlier_avg = sum(earlier_months) / len(earlier_months)
-                if earlier_avg > 0:
-                    trend_factor = recent_avg / earlier_avg
-            
-            # Generate monthly forecasts
-            monthly_forecasts = []
-            for month in range(1, months_ahead + 1):
-                # Apply trend factor with diminishing effect over time
-                trend_adjustment = 1 + (trend_factor - 1) * (0.8 ** month)
-                forecasted_consumption = avg_monthly_consumption * trend_adjustment
-                
-                monthly_forecasts.append({
-                    "month": month,
-                    "forecasted_consumption": round(forecasted_consumption, 2)
-                })
-            
-            # Calculate when reorder will be needed
-            current_stock = item.current_quantity
-            months_until_reorder = None
-            
-            cumulative_consumption = 0
-            for forecast in monthly_forecasts:
-                cumulative_consumption += forecast["forecasted_consumption"]
-                if current_stock - cumulative_consumption <= item.reorder_level:
-                    months_until_reorder = forecast["month"]
-                    break
-            
+        for index, key in enumerate(item_ids):
+            monthly_forecasts = [
+                {
+                    "month": offset + 1,
+                    "period": forecast_months[offset].strftime("%Y-%m"),
+                    "forecasted_consumption": value
+                }
+                for offset, value in enumerate(forecast_values[index])
+            ]
             forecasts.append({
-                "item_id": item_key,
-                "item_name": item.name,
-                "current_quantity": current_stock,
-                "reorder_level": item.reorder_level,
-                "average_monthly_consumption": round(avg_monthly_consumption, 2),
-                "trend_factor": round(trend_factor, 3),
+                "item_id": str(key),
+                "item_name": items[key][1],
+                "current_quantity": float(current_quantity[index]),
+                "reorder_level": float(reorder_level[index]),
+                "average_monthly_consumption": round(float(model["average"][index]), 2),
+                "trend_factor": round(float(model["trend_factor"][index]), 3),
+                "monthly_trend": round(float(model["monthly_trend"][index]), 2),
+                "seasonal_uplift": {
+                    "ramadan": round(float(model["ramadan_uplift"][index]), 2),
+                    "summer": round(float(model["summer_uplift"][index]), 2)
+                },
                 "monthly_forecasts": monthly_forecasts,
-                "months_until_reorder": months_until_reorder,
-                "total_forecasted_consumption": round(sum(f["forecasted_consumption"] for f in monthly_forecasts), 2)
+                "months_until_reorder": int(reorder_month[index]) or None,
+                "total_forecasted_consumption": round(sum(forecast_values[index]), 2)
             })
         
         # Sort by urgency (items needing reorder soonest first)
@@ -561,11 +551,12 @@ class AnalyticsService:
         
         return {
             "forecast_period_months": months_ahead,
+            "history_months": [m.strftime("%Y-%m") for m in history_months],
             "items_analyzed": len(forecasts),
             "forecasts": forecasts,
             "summary": {
-                "items_needing_reorder_soon": len([f for f in forecasts if f["months_until_reorder"] and f["months_until_reorder"] <= 1]),
-                "items_with_increasing_trend": len([f for f in forecasts if f["trend_factor"] > 1.1]),
-                "items_with_decreasing_trend": len([f for f in forecasts if f["trend_factor"] < 0.9])
+                "items_needing_reorder_soon": int(np.count_nonzero(reorder_month == 1)),
+                "items_with_increasing_trend": int(np.count_nonzero(model["trend_factor"] > 1.1)),
+                "items_with_decreasing_trend": int(np.count_nonzero(model["trend_factor"] < 0.9))
             }
-        }
\ No newline at end of file
+        }
@@ -15,6 +15,8 @@ from schemas.item import (
     ItemStockAdjustment,
     ItemReorderSuggestion,
 )
+from services.movement_service import apply_stock_change
+from services.reorder_service import ReorderPlannerService
 from utils.pagination import PaginationParams, paginate_query
 from typing import List, Optional, Tuple
 from datetime import datetime, date
@@ -171,7 +173,11 @@ class ItemService:
         adjustment: ItemStockAdjustment,
         performed_by: uuid.UUID,
     ) -> ItemResponse:
-        """Adjust item stock quantity"""
+        """Adjust item stock quantity
+
+        The quantity is changed with an atomic conditional update, so
+        concurrent adjustments cannot overwrite each other.
+        """
         statement = select(Item).where(Item.id == item_id)
         item = self.session.exec(statement).first()
 
@@ -180,9 +186,9 @@ class ItemService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Item not found"
             )
 
-        # Validate adjustment
-        new_quantity = item.current_quantity + adjustment.quantity
-        if new_quantity < 0:
+        new_quantity = apply_stock_change(self.session, item_id, adjustment.quantity)
+        if new_quantity is None:
+            self.session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Adjustment would result in negative stock",
@@ -194,19 +200,14 @@ class ItemService:
             movement_type=MovementType.ADJUST,
             reason=MovementReason.ADJUSTMENT,
             quantity=abs(adjustment.quantity),
-            quantity_before=item.current_quantity,
+            quantity_before=new_quantity - adjustment.quantity,
             quantity_after=new_quantity,
             notes=adjustment.notes,
             reference_number=adjustment.reference_number,
             performed_by=performed_by,
         )
 
-        # Update item quantity
-        item.current_quantity = new_quantity
-        item.updated_at = datetime.utcnow()
-
         self.session.add(movement)
-        self.session.add(item)
         self.session.commit()
         self.session.refresh(item)
 
@@ -362,43 +363,33 @@ class ItemService:
         return [self._create_item_response(item) for item in items]
 
     async def get_reorder_suggestions(self) -> List[ItemReorderSuggestion]:
-        """Get reorder suggestions for low stock items"""
-        statement = (
-            select(Item)
-            .where(
-                and_(
-                    Item.status == ItemStatus.ACTIVE,
-                    Item.current_quantity <= Item.reorder_level,
-                )
-            )
-            .order_by(
-                Item.is_critical.desc(),
-                Item.current_quantity / Item.reorder_level,
+        """Get reorder suggestions for low stock items
+
+        Quantities already on open purchase orders are deducted from the
+        suggestion, see ``ReorderPlannerService``.
+        """
+        plan = await ReorderPlannerService(self.session).build_plan()
+
+        lines = [(line, group.supplier_name) for group in plan.suppliers for line in group.lines]
+        lines += [(line, None) for line in plan.unassigned]
+        lines.sort(
+            key=lambda entry: (
+                not entry[0].is_critical,
+                entry[0].current_quantity / entry[0].reorder_level
+                if entry[0].reorder_level > 0
+                else 0,
             )
         )
 
-        items = self.session.exec(statement).all()
-
         suggestions = []
-        for item in items:
-            # Calculate suggested quantity 
-            # (reorder to max level or 2x reorder level)
-            if item.max_stock_level:
-                suggested_quantity = (
-                    item.max_stock_level - item.current_quantity
-                )
-            else:
-                suggested_quantity = (
-                    (item.reorder_level * 2) - item.current_quantity
-                )
-
+        for line, supplier_name in lines:
             # Determine priority
             stock_ratio = (
-                item.current_quantity / item.reorder_level
-                if item.reorder_level > 0
+                line.current_quantity / line.reorder_level
+                if line.reorder_level > 0
                 else 0
             )
-            if item.is_critical and stock_ratio <= 0.1:
+            if line.is_critical and stock_ratio <= 0.1:
                 priority = "Critical"
             elif stock_ratio <= 0.2:
                 priority = "High"
@@ -407,22 +398,15 @@ class ItemService:
             else:
                 priority = "Low"
 
-            # Get supplier info
-            supplier_name = None
-            if item.supplier:
-                supplier_name = item.supplier.name
-
             suggestions.append(
                 ItemReorderSuggestion(
-                    item_id=item.id,
-                    item_name=item.name,
-                    current_quantity=item.current_quantity,
-                    reorder_level=item.reorder_level,
-                    suggested_quantity=suggested_quantity,
+                    item_id=line.item_id,
+                    item_name=line.item_name,
+                    current_quantity=line.current_quantity,
+                    reorder_level=line.reorder_level,
+                    suggested_quantity=line.suggested_quantity,
                     primary_supplier_name=supplier_name,
-                    estimated_cost=(
-                        suggested_quantity * item.unit_cost
-                    ),
+                    estimated_cost=line.estimated_cost,
                     priority=priority,
                 )
             )
@@ -2,106 +2,189 @@
 Stock movement service for inventory management operations
 """
 from sqlmodel import Session, select, and_, or_, func
+from sqlalchemy import update
 from fastapi import HTTPException, status
 from models.stock_movement import StockMovement, MovementType
 from models.item import Item
 from schemas.stock_movement import (
-    StockMovementCreate, StockMovementUpdate, StockMovementResponse
+    StockMovementCreate, StockMovementUpdate, StockMovementResponse, BulkStockMovement,
+    StockMovementSearch
 )
 from utils.notifications import send_low_stock_alert
-from utils.validation import validate_stock_movement
-from typing import List, Optional, Dict, Any
+from utils.pagination import PaginationParams, paginate_query
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, date, timedelta
+from decimal import Decimal
+import asyncio
+import redis
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def apply_stock_change(session: Session, item_id: uuid.UUID, delta: Decimal) -> Optional[Decimal]:
+    """Atomically add ``delta`` to an item's stock
+    
+    Issues ``UPDATE ... SET current_quantity = current_quantity + :delta
+    WHERE current_quantity + :delta >= 0 RETURNING current_quantity`` so
+    concurrent movements cannot lose an update or drive stock negative.
+    The row stays locked until the surrounding transaction ends.
+    
+    Args:
+        session: Database session (the caller commits)
+        item_id: Item UUID
+        delta: Signed quantity change
+        
+    Returns:
+        Quantity after the change, or None if the item does not exist or
+        the change would make its stock negative
+    """
+    result = session.execute(
+        update(Item)
+        .where(Item.id == item_id, Item.current_quantity + delta >= 0)
+        .values(current_quantity=Item.current_quantity + delta, updated_at=datetime.utcnow())
+        .returning(Item.current_quantity)
+        .execution_options(synchronize_session=False)
+    ).first()
+    return result[0] if result else None
+
+
 class MovementService:
     """Service for handling stock movement operations"""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, redis_client: Optional[redis.Redis] = None):
         self.session = session
+        self.redis = redis_client
     
     async def create_movement(
         self, 
         movement_data: StockMovementCreate, 
-        performed_by: uuid.UUID
+        performed_by: Optional[uuid.UUID] = None
     ) -> StockMovementResponse:
         """Create a new stock movement
         
         Args:
             movement_data: Movement creation data
-            performed_by: User ID who performed the movement
+            performed_by: User ID who performed the movement (if not set on the movement)
             
         Returns:
             Created movement record
             
         Raises:
-            HTTPException: If validation fails or item not found
+            HTTPException: If the item is not found or stock is insufficient
         """
-        # Validate item exists
-        item = self.session.get(Item, movement_data.item_id)
-        if not item:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Item not found"
-            )
-        
-        # Validate movement data
-        validation_errors = validate_stock_movement(movement_data.model_dump(), item)
-        if validation_errors:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail={"message": "Validation failed", "errors": validation_errors}
-            )
-        
-        # Check stock availability for OUT movements
-        if movement_data.type == MovementType.OUT:
-            if item.current_quantity < movement_data.quantity:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Insufficient stock. Available: {item.current_quantity}, Requested: {movement_data.quantity}"
-                )
-        
-        # Create movement record
-        movement = StockMovement(
-            **movement_data.model_dump(),
-            performed_by=performed_by,
-            date=datetime.utcnow()
+        movements = await self.create_bulk_movements(
+            BulkStockMovement(movements=[movement_data]), performed_by
         )
+        return movements[0]
+    
+    async def create_bulk_movements(
+        self,
+        bulk_data: BulkStockMovement,
+        performed_by: Optional[uuid.UUID] = None
+    ) -> List[StockMovementResponse]:
+        """Post many stock movements in one transaction
         
-        self.session.add(movement)
-        
-        # Update item quantity
-        if movement_data.type == MovementType.IN:
-            item.current_quantity += movement_data.quantity
-        elif movement_data.type == MovementType.OUT:
-            item.current_quantity -= movement_data.quantity
-        elif movement_data.type == MovementType.ADJUST:
-            # For adjustments, the quantity is the new total, not the change
-            item.current_quantity = movement_data.quantity
+        Every line is applied with an atomic conditional update and its
+        ledger row is inserted in the same transaction; if any line fails
+        nothing is posted. Low stock alerts are checked once per item after
+        the batch commits.
         
-        self.session.add(item)
-        self.session.commit()
-        self.session.refresh(movement)
+        Args:
+            bulk_data: Movements to post, e.g. the lines of a scanned delivery
+            performed_by: User ID who performed the movements (if not set per line)
+            
+        Returns:
+            Created movement records, in request order
+            
+        Raises:
+            HTTPException: If an item is not found or a line would make stock negative
+        """
+        lines = bulk_data.movements
+        item_ids = list({line.item_id for line in lines})
+        items = {
+            row[0]: row
+            for row in self.session.exec(
+                select(Item.id, Item.name, Item.sku).where(Item.id.in_(item_ids))
+            ).all()
+        }
+        missing = [str(item_id) for item_id in item_ids if item_id not in items]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"message": "Item not found", "item_ids": missing}
+            )
         
-        # Check for low stock alert
-        if item.current_quantity <= item.reorder_level:
-            try:
-                await send_low_stock_alert(
-                    item_id=str(item.id),
-                    item_name=item.name,
-                    current_quantity=item.current_quantity,
-                    reorder_level=item.reorder_level,
-                    supplier_id=str(item.supplier_id) if item.supplier_id else None
+        # Lock rows in item order so concurrent batches cannot deadlock;
+        # lines of the same item keep their request order
+        order = sorted(range(len(lines)), key=lambda index: str(lines[index].item_id))
+        movements: List[Optional[StockMovement]] = [None] * len(lines)
+        try:
+            for index in order:
+                line = lines[index]
+                movement = StockMovement(
+                    **line.model_dump(exclude={"performed_by", "movement_date"}),
+                    performed_by=line.performed_by or performed_by,
+                    movement_date=line.movement_date or datetime.utcnow(),
+                    quantity_before=Decimal(0),
+                    quantity_after=Decimal(0)
                 )
-            except Exception as e:
-                logger.error(f"Failed to send low stock alert: {str(e)}")
-        
-        logger.info(f"Created stock movement {movement.id} for item {item.name}")
-        return self._to_response(movement)
+                delta = movement.get_quantity_change()
+                quantity_after = apply_stock_change(self.session, line.item_id, delta)
+                if quantity_after is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail={
+                            "message": "Insufficient stock",
+                            "line": index,
+                            "item_id": str(line.item_id),
+                            "requested": str(line.quantity)
+                        }
+                    )
+                movement.quantity_before = quantity_after - delta
+                movement.quantity_after = quantity_after
+                movement.calculate_total_cost()
+                movements[index] = movement
+            
+            self.session.add_all(movements)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        
+        await self._check_low_stock(item_ids)
+        
+        logger.info(f"Posted {len(movements)} stock movements for {len(item_ids)} items")
+        return [
+            self._to_response(movement, items[movement.item_id][1], items[movement.item_id][2])
+            for movement in movements
+        ]
+    
+    async def _check_low_stock(self, item_ids: List[uuid.UUID]):
+        """Send one low stock alert per item at or below its reorder level"""
+        low_stock_items = self.session.exec(
+            select(Item).where(
+                Item.id.in_(item_ids),
+                Item.current_quantity <= Item.reorder_level
+            )
+        ).all()
+        if not low_stock_items:
+            return
+        
+        results = await asyncio.gather(*[
+            send_low_stock_alert(
+                item_id=str(item.id),
+                item_name=item.name,
+                current_quantity=item.current_quantity,
+                reorder_level=item.reorder_level,
+                supplier_id=str(item.primary_supplier_id) if item.primary_supplier_id else None
+            )
+            for item in low_stock_items
+        ], return_exceptions=True)
+        for item, result in zip(low_stock_items, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send low stock alert for {item.name}: {str(result)}")
     
     async def get_movement(self, movement_id: uuid.UUID) -> StockMovementResponse:
         """Get movement by ID
@@ -126,84 +209,77 @@ class MovementService:
     
     async def get_movements(
         self,
-        skip: int = 0,
-        limit: int = 100,
-        item_id: Optional[uuid.UUID] = None,
-        movement_type: Optional[MovementType] = None,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-        performed_by: Optional[uuid.UUID] = None,
-        reference: Optional[str] = None
-    ) -> List[StockMovementResponse]:
+        pagination: PaginationParams,
+        search: Optional[StockMovementSearch] = None
+    ) -> Tuple[List[StockMovementResponse], Optional[int]]:
         """Get movements with filtering
         
         Args:
-            skip: Number of records to skip
-            limit: Maximum number of records to return
-            item_id: Filter by item ID
-            movement_type: Filter by movement type
-            start_date: Filter movements from this date
-            end_date: Filter movements until this date
-            performed_by: Filter by user who performed movement
-            reference: Filter by reference
+            pagination: Page/size or cursor of the page to read
+            search: Optional search criteria
             
         Returns:
-            List of movements
+            Movements of the page, newest first, and the total count
         """
         query = select(StockMovement)
         
         # Apply filters
-        conditions = []
-        
-        if item_id:
-            conditions.append(StockMovement.item_id == item_id)
-        
-        if movement_type:
-            conditions.append(StockMovement.type == movement_type)
-        
-        if start_date:
-            conditions.append(StockMovement.date >= datetime.combine(start_date, datetime.min.time()))
-        
-        if end_date:
-            conditions.append(StockMovement.date <= datetime.combine(end_date, datetime.max.time()))
-        
-        if performed_by:
-            conditions.append(StockMovement.performed_by == performed_by)
-        
-        if reference:
-            conditions.append(StockMovement.reference.ilike(f"%{reference}%"))
+        if search:
+            conditions = []
+            
+            if search.item_id:
+                conditions.append(StockMovement.item_id == search.item_id)
+            
+            if search.movement_type:
+                conditions.append(StockMovement.movement_type == search.movement_type)
+            
+            if search.reason:
+                conditions.append(StockMovement.reason == search.reason)
+            
+            if search.reference_type:
+                conditions.append(StockMovement.reference_type == search.reference_type)
+            
+            if search.reference_id:
+                conditions.append(StockMovement.reference_id == search.reference_id)
+            
+            if search.performed_by:
+                conditions.append(StockMovement.performed_by == search.performed_by)
+            
+            if search.date_from:
+                conditions.append(StockMovement.movement_date >= search.date_from)
+            
+            if search.date_to:
+                conditions.append(StockMovement.movement_date <= search.date_to)
+            
+            if conditions:
+                query = query.where(and_(*conditions))
         
-        if conditions:
-            query = query.where(and_(*conditions))
+        # id breaks ties between movements recorded at the same instant
+        query = query.order_by(StockMovement.movement_date.desc(), StockMovement.id.desc())
         
-        query = query.order_by(StockMovement.date.desc()).offset(skip).limit(limit)
-        movements = self.session.exec(query).all()
+        movements, total = paginate_query(self.session, query, pagination)
         
-        return [self._to_response(movement) for movement in movements]
+        return [self._to_response(movement) for movement in movements], total
     
     async def get_item_movements(
         self,
         item_id: uuid.UUID,
-        skip: int = 0,
-        limit: int = 100,
+        pagination: PaginationParams,
         movement_type: Optional[MovementType] = None
-    ) -> List[StockMovementResponse]:
+    ) -> Tuple[List[StockMovementResponse], Optional[int]]:
         """Get movements for a specific item
         
         Args:
             item_id: Item UUID
-            skip: Number of records to skip
-            limit: Maximum number of records to return
+            pagination: Page/size or cursor of the page to read
             movement_type: Filter by movement type
             
         Returns:
-            List of item movements
+            Movements of the page and the total count
         """
         return await self.get_movements(
-            skip=skip,
-            limit=limit,
-            item_id=item_id,
-            movement_type=movement_type
+            pagination,
+            StockMovementSearch(item_id=item_id, movement_type=movement_type)
         )
     
     async def update_movement(
@@ -255,7 +331,7 @@ class MovementService:
             Success message
             
         Raises:
-            HTTPException: If movement not found
+            HTTPException: If movement not found or its reversal would make stock negative
         """
         movement = self.session.get(StockMovement, movement_id)
         if not movement:
@@ -264,24 +340,28 @@ class MovementService:
                 detail="Movement not found"
             )
         
-        # Get the item to reverse stock changes
-        item = self.session.get(Item, movement.item_id)
-        if item:
-            # Reverse the stock movement
-            if movement.type == MovementType.IN:
-                item.current_quantity -= movement.quantity
-            elif movement.type == MovementType.OUT:
-                item.current_quantity += movement.quantity
-            # For ADJUST movements, we can't easily reverse without knowing previous state
-            
-            # Ensure quantity doesn't go negative
-            if item.current_quantity < 0:
-                item.current_quantity = 0
-            
-            self.session.add(item)
+        # Undo exactly what posting applied, with the same atomic conditional update
+        item_id = movement.item_id
+        delta = -movement.get_quantity_change()
+        item_exists = self.session.exec(select(Item.id).where(Item.id == item_id)).first() is not None
+        try:
+            if item_exists and delta != 0 and apply_stock_change(self.session, item_id, delta) is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail={
+                        "message": "Insufficient stock to reverse movement",
+                        "item_id": str(item_id),
+                        "requested": str(movement.quantity)
+                    }
+                )
+            self.session.delete(movement)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
         
-        self.session.delete(movement)
-        self.session.commit()
+        if item_exists:
+            await self._check_low_stock([item_id])
         
         logger.info(f"Deleted movement {movement_id} and reversed stock changes")
         return {"message": "Movement deleted successfully"}
@@ -422,23 +502,27 @@ class MovementService:
             "analysis_period_months": months
         }
     
-    def _to_response(self, movement: StockMovement) -> StockMovementResponse:
+    def _to_response(
+        self,
+        movement: StockMovement,
+        item_name: Optional[str] = None,
+        item_sku: Optional[str] = None
+    ) -> StockMovementResponse:
         """Convert movement model to response schema
         
         Args:
             movement: Movement model
+            item_name: Item name (loaded from the movement's item if omitted)
+            item_sku: Item SKU (loaded from the movement's item if omitted)
             
         Returns:
             Movement response schema
         """
+        if item_name is None or item_sku is None:
+            item_name, item_sku = movement.item.name, movement.item.sku
+        
         return StockMovementResponse(
-            id=movement.id,
-            item_id=movement.item_id,
-            type=movement.type,
-            quantity=movement.quantity,
-            reference=movement.reference,
-            notes=movement.notes,
-            date=movement.date,
-            performed_by=movement.performed_by,
-            created_at=movement.created_at
-        )
\ No newline at end of file
+            **movement.model_dump(exclude={"item"}),
+            item_name=item_name,
+            item_sku=item_sku
+        )
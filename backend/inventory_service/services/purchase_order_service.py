@@ -8,13 +8,17 @@ from models.supplier import Supplier
 from models.item import Item
 from schemas.purchase_order import (
     PurchaseOrderCreate, PurchaseOrderUpdate, PurchaseOrderResponse,
-    PurchaseOrderItemCreate, PurchaseOrderItemResponse
+    PurchaseOrderItemCreate, PurchaseOrderItemResponse,
+    ReorderDraftRequest, ReorderDraftResult, DraftPurchaseOrder
 )
+from services.reorder_service import ReorderPlannerService
 from utils.notifications import send_purchase_order_notification
 from utils.validation import validate_purchase_order
+from utils.sequences import allocate_sequence, last_used_number
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 from decimal import Decimal
+import redis
 import uuid
 import logging
 
@@ -24,8 +28,9 @@ logger = logging.getLogger(__name__)
 class PurchaseOrderService:
     """Service for handling purchase order operations"""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, redis_client: Optional[redis.Redis] = None):
         self.session = session
+        self.redis = redis_client
     
     async def create_purchase_order(
         self, 
@@ -74,7 +79,7 @@ class PurchaseOrderService:
         
         # Create purchase order
         purchase_order = PurchaseOrder(
-            order_number=order_number,
+            po_number=order_number,
             supplier_id=order_data.supplier_id,
             status=PurchaseOrderStatus.PENDING,
             order_date=date.today(),
@@ -486,36 +491,25 @@ class PurchaseOrderService:
         Returns:
             List of restock suggestions
         """
-        # Get items below reorder level
-        low_stock_items = self.session.exec(
-            select(Item).where(Item.current_quantity <= Item.reorder_level)
-        ).all()
-        
-        suggestions = []
-        
-        for item in low_stock_items:
-            # Calculate suggested order quantity (simple reorder formula)
-            suggested_quantity = max(
-                item.reorder_level * 2 - item.current_quantity,  # Bring to 2x reorder level
-                item.reorder_level  # Minimum order
-            )
-            
-            # Get supplier info
-            supplier = None
-            if item.supplier_id:
-                supplier = self.session.get(Supplier, item.supplier_id)
-            
-            suggestions.append({
-                "item_id": str(item.id),
-                "item_name": item.name,
-                "current_quantity": item.current_quantity,
-                "reorder_level": item.reorder_level,
-                "suggested_quantity": suggested_quantity,
-                "estimated_cost": float(suggested_quantity * item.unit_cost),
-                "supplier_id": str(item.supplier_id) if item.supplier_id else None,
-                "supplier_name": supplier.name if supplier else None,
-                "priority": "high" if item.current_quantity == 0 else "medium"
-            })
+        plan = await ReorderPlannerService(self.session).build_plan()
+        
+        lines = [(line, group) for group in plan.suppliers for line in group.lines]
+        lines += [(line, None) for line in plan.unassigned]
+        
+        suggestions = [
+            {
+                "item_id": str(line.item_id),
+                "item_name": line.item_name,
+                "current_quantity": line.current_quantity,
+                "reorder_level": line.reorder_level,
+                "suggested_quantity": line.suggested_quantity,
+                "estimated_cost": float(line.estimated_cost),
+                "supplier_id": str(group.supplier_id) if group else None,
+                "supplier_name": group.supplier_name if group else None,
+                "priority": "high" if line.stock_status == "out_of_stock" else "medium"
+            }
+            for line, group in lines
+        ]
         
         # Sort by priority (out of stock first, then by cost impact)
         suggestions.sort(key=lambda x: (
@@ -525,30 +519,127 @@ class PurchaseOrderService:
         
         return suggestions
     
+    async def create_draft_orders(
+        self,
+        draft_request: ReorderDraftRequest,
+        requested_by: uuid.UUID
+    ) -> ReorderDraftResult:
+        """Create one draft purchase order per supplier from the reorder plan
+        
+        Order numbers are reserved as one block, and the orders and their
+        lines are written in a single flush, which SQLAlchemy batches into
+        one multi-row insert per table.
+        
+        Args:
+            draft_request: Plan filters and order defaults
+            requested_by: User requesting the orders
+            
+        Returns:
+            Created draft orders and skipped suppliers
+        """
+        plan = await ReorderPlannerService(self.session).build_plan(
+            draft_request.warehouse_location, draft_request.supplier_ids
+        )
+        
+        groups = plan.suppliers
+        skipped = []
+        if draft_request.skip_below_minimum:
+            skipped = [group.supplier_id for group in groups if not group.meets_minimum_order]
+            groups = [group for group in groups if group.meets_minimum_order]
+        
+        if not groups:
+            return ReorderDraftResult(orders=[], skipped_supplier_ids=skipped, unassigned_items=len(plan.unassigned))
+        
+        order_numbers = await self._generate_order_numbers(len(groups))
+        today = date.today()
+        
+        orders = []
+        order_items = []
+        for order_number, group in zip(order_numbers, groups):
+            order = PurchaseOrder(
+                id=uuid.uuid4(),
+                po_number=order_number,
+                supplier_id=group.supplier_id,
+                status=PurchaseOrderStatus.DRAFT,
+                priority=draft_request.priority,
+                subtotal=group.estimated_total,
+                tax_amount=Decimal("0"),
+                shipping_cost=Decimal("0"),
+                discount_amount=Decimal("0"),
+                total_amount=group.estimated_total,
+                currency=group.currency,
+                order_date=today,
+                required_date=draft_request.required_date,
+                expected_delivery_date=(
+                    today + timedelta(days=group.delivery_time_days)
+                    if group.delivery_time_days is not None else None
+                ),
+                notes=draft_request.notes,
+                internal_notes="Generated from reorder plan",
+                requested_by=requested_by
+            )
+            orders.append(order)
+            order_items.extend(
+                PurchaseOrderItem(
+                    purchase_order_id=order.id,
+                    item_id=line.item_id,
+                    quantity=line.suggested_quantity,
+                    unit_cost=line.unit_cost,
+                    total_cost=line.estimated_cost,
+                    received_quantity=Decimal("0"),
+                    remaining_quantity=line.suggested_quantity
+                )
+                for line in group.lines
+            )
+        
+        # Summaries are built before the commit expires the new orders
+        drafts = [
+            DraftPurchaseOrder(
+                id=order.id,
+                po_number=order.po_number,
+                supplier_id=group.supplier_id,
+                supplier_name=group.supplier_name,
+                line_count=len(group.lines),
+                total_amount=group.estimated_total
+            )
+            for order, group in zip(orders, groups)
+        ]
+        
+        self.session.add_all(orders)
+        self.session.add_all(order_items)
+        self.session.commit()
+        
+        logger.info(f"Created {len(orders)} draft purchase orders with {len(order_items)} lines from reorder plan")
+        return ReorderDraftResult(
+            orders=drafts,
+            skipped_supplier_ids=skipped,
+            unassigned_items=len(plan.unassigned)
+        )
+    
     async def _generate_order_number(self) -> str:
         """Generate unique order number
         
         Returns:
             Order number in format PO-YYYYMM-XXXX
         """
-        today = date.today()
-        prefix = f"PO-{today.strftime('%Y%m')}"
-        
-        # Get the last order number for this month
-        last_order = self.session.exec(
-            select(PurchaseOrder)
-            .where(PurchaseOrder.order_number.like(f"{prefix}%"))
-            .order_by(PurchaseOrder.order_number.desc())
-        ).first()
-        
-        if last_order:
-            # Extract sequence number and increment
-            last_sequence = int(last_order.order_number.split('-')[-1])
-            sequence = last_sequence + 1
-        else:
-            sequence = 1
-        
-        return f"{prefix}-{sequence:04d}"
+        return (await self._generate_order_numbers(1))[0]
+    
+    async def _generate_order_numbers(self, count: int) -> List[str]:
+        """Reserve a block of consecutive order numbers
+        
+        Args:
+            count: Number of orders to number
+            
+        Returns:
+            Order numbers in format PO-YYYYMM-XXXX
+        """
+        period = date.today().strftime('%Y%m')
+        prefix = f"PO-{period}"
+        sequence = allocate_sequence(
+            self.session, "PO", period, count,
+            seed=lambda: last_used_number(self.session, PurchaseOrder.po_number, prefix)
+        )
+        return [f"{prefix}-{value:04d}" for value in sequence]
     
     async def _to_response(self, order: PurchaseOrder) -> PurchaseOrderResponse:
         """Convert purchase order model to response schema
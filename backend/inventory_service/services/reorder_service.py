@@ -0,0 +1,197 @@
+"""
+Reorder planning service for restock suggestions and draft purchase orders
+"""
+from sqlmodel import Session, select, and_, func
+from sqlalchemy import case
+from models.item import Item, ItemStatus
+from models.supplier import Supplier, SupplierStatus
+from models.purchase_order import PurchaseOrder, PurchaseOrderItem, PurchaseOrderStatus
+from schemas.purchase_order import ReorderLine, SupplierReorderGroup, ReorderPlan
+from typing import List, Optional, Dict
+from datetime import datetime
+from decimal import Decimal
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Orders whose outstanding quantities are already on the way
+OPEN_ORDER_STATUSES = [
+    PurchaseOrderStatus.DRAFT,
+    PurchaseOrderStatus.PENDING,
+    PurchaseOrderStatus.APPROVED,
+    PurchaseOrderStatus.SENT,
+    PurchaseOrderStatus.CONFIRMED,
+    PurchaseOrderStatus.PARTIALLY_RECEIVED
+]
+
+STOCK_STATUSES = ["out_of_stock", "critical_low", "low_stock", "adequate", "overstocked"]
+REORDER_PRIORITIES = {"out_of_stock": "urgent", "critical_low": "high", "low_stock": "medium"}
+
+
+def stock_status_expression():
+    """SQL expression classifying an item's stock level"""
+    return case(
+        (Item.current_quantity <= 0, "out_of_stock"),
+        (Item.current_quantity < Item.reorder_level * Decimal("0.5"), "critical_low"),
+        (Item.current_quantity <= Item.reorder_level, "low_stock"),
+        (Item.current_quantity > Item.reorder_level * 3, "overstocked"),
+        else_="adequate"
+    )
+
+
+class ReorderPlannerService:
+    """Service planning restocks for items at or below their reorder level
+    
+    Stock status, on-order quantities and suggested quantities are computed
+    in one query with the primary supplier joined in, and the result is
+    grouped per supplier so each group can become one purchase order.
+    Quantities still outstanding on open orders are deducted, so running
+    the plan again does not order the same shortfall twice.
+    """
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    async def get_stock_status_summary(self, warehouse_location: Optional[str] = None) -> Dict[str, int]:
+        """Count active items per stock status
+        
+        Args:
+            warehouse_location: Filter by warehouse location
+        
+        Returns:
+            Item count per stock status
+        """
+        stock_status = stock_status_expression()
+        query = select(stock_status, func.count(Item.id)).where(Item.status == ItemStatus.ACTIVE)
+        if warehouse_location:
+            query = query.where(Item.warehouse_location == warehouse_location)
+        
+        counts = dict(self.session.exec(query.group_by(stock_status)).all())
+        return {status: counts.get(status, 0) for status in STOCK_STATUSES}
+    
+    async def build_plan(
+        self,
+        warehouse_location: Optional[str] = None,
+        supplier_ids: Optional[List[uuid.UUID]] = None
+    ) -> ReorderPlan:
+        """Build the reorder plan grouped by primary supplier
+        
+        Args:
+            warehouse_location: Filter by warehouse location
+            supplier_ids: Only plan items of these suppliers
+        
+        Returns:
+            Reorder plan; items without an active supplier are listed apart
+        """
+        on_order = select(
+            PurchaseOrderItem.item_id,
+            func.sum(PurchaseOrderItem.remaining_quantity).label("quantity")
+        ).join(
+            PurchaseOrder, PurchaseOrder.id == PurchaseOrderItem.purchase_order_id
+        ).where(
+            PurchaseOrder.status.in_(OPEN_ORDER_STATUSES)
+        ).group_by(PurchaseOrderItem.item_id).subquery()
+        
+        on_order_quantity = func.coalesce(on_order.c.quantity, 0)
+        target_quantity = func.coalesce(Item.max_stock_level, Item.reorder_level * 2)
+        suggested_quantity = target_quantity - Item.current_quantity - on_order_quantity
+        
+        query = select(
+            Item.id,
+            Item.name,
+            Item.sku,
+            Item.category,
+            Item.warehouse_location,
+            Item.is_critical,
+            stock_status_expression(),
+            Item.current_quantity,
+            on_order_quantity,
+            Item.reorder_level,
+            target_quantity,
+            suggested_quantity,
+            Item.unit_cost,
+            Supplier.id,
+            Supplier.name,
+            Supplier.currency,
+            Supplier.delivery_time_days,
+            Supplier.minimum_order_amount
+        ).select_from(Item).outerjoin(
+            Supplier, and_(Supplier.id == Item.primary_supplier_id, Supplier.status == SupplierStatus.ACTIVE)
+        ).outerjoin(
+            on_order, on_order.c.item_id == Item.id
+        ).where(
+            Item.status == ItemStatus.ACTIVE,
+            Item.current_quantity <= Item.reorder_level,
+            suggested_quantity > 0
+        )
+        if warehouse_location:
+            query = query.where(Item.warehouse_location == warehouse_location)
+        if supplier_ids:
+            query = query.where(Supplier.id.in_(supplier_ids))
+        
+        rows = self.session.exec(
+            query.order_by(
+                Supplier.name,
+                Item.is_critical.desc(),
+                Item.current_quantity / func.nullif(Item.reorder_level, 0)
+            )
+        ).all()
+        
+        groups: Dict[uuid.UUID, SupplierReorderGroup] = {}
+        unassigned = []
+        for row in rows:
+            (item_id, name, sku, category, warehouse, is_critical, stock_status, current_quantity,
+             on_order_qty, reorder_level, target, suggested, unit_cost,
+             supplier_id, supplier_name, currency, delivery_time_days, minimum_order_amount) = row
+            
+            line = ReorderLine(
+                item_id=item_id,
+                item_name=name,
+                item_sku=sku,
+                category=category.value if category else "Uncategorized",
+                warehouse_location=warehouse,
+                is_critical=is_critical,
+                stock_status=stock_status,
+                priority=REORDER_PRIORITIES[stock_status],
+                current_quantity=current_quantity,
+                on_order_quantity=on_order_qty,
+                reorder_level=reorder_level,
+                target_quantity=target,
+                suggested_quantity=suggested,
+                unit_cost=unit_cost,
+                estimated_cost=(Decimal(suggested) * unit_cost).quantize(Decimal("0.01"))
+            )
+            
+            if supplier_id is None:
+                unassigned.append(line)
+                continue
+            
+            group = groups.get(supplier_id)
+            if group is None:
+                group = groups[supplier_id] = SupplierReorderGroup(
+                    supplier_id=supplier_id,
+                    supplier_name=supplier_name,
+                    currency=currency,
+                    delivery_time_days=delivery_time_days,
+                    minimum_order_amount=minimum_order_amount,
+                    estimated_total=Decimal("0"),
+                    meets_minimum_order=True,
+                    lines=[]
+                )
+            group.lines.append(line)
+            group.estimated_total += line.estimated_cost
+        
+        for group in groups.values():
+            group.meets_minimum_order = (
+                group.minimum_order_amount is None or group.estimated_total >= group.minimum_order_amount
+            )
+        
+        all_lines = [line for group in groups.values() for line in group.lines] + unassigned
+        return ReorderPlan(
+            generated_at=datetime.utcnow(),
+            total_items=len(all_lines),
+            total_estimated_cost=sum((line.estimated_cost for line in all_lines), Decimal("0")),
+            suppliers=list(groups.values()),
+            unassigned=unassigned
+        )
@@ -0,0 +1,374 @@
+"""
+Stock ledger service for point-in-time stock and valuation queries
+"""
+from sqlmodel import Session, select, and_, func
+from sqlalchemy import case, delete, false
+from sqlalchemy.exc import IntegrityError
+from models.item import Item
+from models.stock_movement import StockMovement
+from models.stock_snapshot import StockSnapshot
+from schemas.stock_ledger import StockPosition, StockLedgerReport, StockSnapshotResult
+from database import engine
+from config import settings
+from typing import List, Optional, Dict
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+import asyncio
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal("0")
+CENT = Decimal("0.01")
+
+
+class StockLedgerService:
+    """Service for historical stock positions and valuation
+    
+    A position at any date is the nearest earlier snapshot rolled forward
+    with the movements since, so the work is bounded by one snapshot
+    interval of movements rather than the whole history.
+    
+    Valuation per snapshot period:
+    
+    * Weighted average cost: opening quantity at the opening average cost
+      pooled with the costed receipts of the period.
+    * FIFO: closing stock is made of the newest costed receipts, picked
+      with a running ``SUM() OVER`` newest-first; any remainder comes from
+      the opening position at its FIFO unit cost.
+    """
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    async def get_stock_report(
+        self,
+        as_of: date,
+        item_id: Optional[uuid.UUID] = None,
+        warehouse_location: Optional[str] = None
+    ) -> StockLedgerReport:
+        """Get stock on hand and valuation at the end of a day
+        
+        Args:
+            as_of: Report date (positions at the end of this day)
+            item_id: Filter by item
+            warehouse_location: Filter by warehouse location
+        
+        Returns:
+            Stock positions with totals per warehouse
+        """
+        return await asyncio.to_thread(self._build_report, as_of, item_id, warehouse_location)
+    
+    async def create_snapshot(self, snapshot_date: date) -> StockSnapshotResult:
+        """Write the closing positions of every item at the end of a day
+        
+        Replaces an existing snapshot for the same date. Items without
+        stock are not stored; a missing row means an empty position. The
+        queries run in a worker thread so the event loop keeps serving.
+        
+        Args:
+            snapshot_date: Day to snapshot
+        
+        Returns:
+            Snapshot summary
+        """
+        return await asyncio.to_thread(self.write_snapshot, snapshot_date)
+    
+    def _build_report(
+        self,
+        as_of: date,
+        item_id: Optional[uuid.UUID],
+        warehouse_location: Optional[str]
+    ) -> StockLedgerReport:
+        """Compute the stock report (blocking, run off the event loop)"""
+        snapshot_date = self._nearest_snapshot_date(as_of)
+        positions = self.compute_positions(as_of, snapshot_date, item_id, warehouse_location)
+        positions = [position for position in positions if position.quantity != 0]
+        
+        by_warehouse: Dict[str, Dict[str, Decimal]] = {}
+        for position in positions:
+            totals = by_warehouse.setdefault(position.warehouse_location, {
+                "quantity": ZERO, "wac_value": ZERO, "fifo_value": ZERO
+            })
+            totals["quantity"] += position.quantity
+            totals["wac_value"] += position.wac_value
+            totals["fifo_value"] += position.fifo_value
+        
+        return StockLedgerReport(
+            as_of=as_of,
+            snapshot_date=snapshot_date,
+            total_quantity=sum((p.quantity for p in positions), ZERO),
+            total_wac_value=sum((p.wac_value for p in positions), ZERO),
+            total_fifo_value=sum((p.fifo_value for p in positions), ZERO),
+            by_warehouse=by_warehouse,
+            positions=positions
+        )
+    
+    def write_snapshot(self, snapshot_date: date) -> StockSnapshotResult:
+        """Write a snapshot in the calling thread (see ``create_snapshot``)"""
+        opening_date = self._nearest_snapshot_date(snapshot_date - timedelta(days=1))
+        positions = [
+            position for position in self.compute_positions(snapshot_date, opening_date)
+            if position.quantity != 0
+        ]
+        
+        self.session.execute(
+            delete(StockSnapshot).where(StockSnapshot.snapshot_date == snapshot_date)
+        )
+        self.session.add_all([
+            StockSnapshot(
+                snapshot_date=snapshot_date,
+                item_id=position.item_id,
+                warehouse_location=position.warehouse_location,
+                quantity=position.quantity,
+                average_cost=position.average_cost,
+                wac_value=position.wac_value,
+                fifo_value=position.fifo_value
+            )
+            for position in positions
+        ])
+        self.session.commit()
+        
+        logger.info(f"Stock snapshot for {snapshot_date}: {len(positions)} items")
+        return StockSnapshotResult(
+            snapshot_date=snapshot_date,
+            items=len(positions),
+            total_wac_value=sum((p.wac_value for p in positions), ZERO),
+            total_fifo_value=sum((p.fifo_value for p in positions), ZERO)
+        )
+    
+    def has_snapshot(self, snapshot_date: date) -> bool:
+        """Check whether a snapshot exists for a date"""
+        return self.session.exec(
+            select(StockSnapshot.id).where(StockSnapshot.snapshot_date == snapshot_date).limit(1)
+        ).first() is not None
+    
+    def compute_positions(
+        self,
+        as_of: date,
+        opening_date: Optional[date],
+        item_id: Optional[uuid.UUID] = None,
+        warehouse_location: Optional[str] = None
+    ) -> List[StockPosition]:
+        """Roll the opening snapshot forward to the end of ``as_of``
+        
+        Args:
+            as_of: Position date
+            opening_date: Snapshot to start from (None replays from the first movement)
+            item_id: Filter by item
+            warehouse_location: Filter by warehouse location
+        
+        Returns:
+            Positions of all matching items, including empty ones
+        """
+        period_end = datetime.combine(as_of + timedelta(days=1), datetime.min.time())
+        in_period = [StockMovement.movement_date < period_end]
+        if opening_date:
+            in_period.append(
+                StockMovement.movement_date >= datetime.combine(opening_date + timedelta(days=1), datetime.min.time())
+            )
+        
+        # Signed change of each movement, straight from the ledger
+        change = StockMovement.quantity_after - StockMovement.quantity_before
+        costed_receipt = and_(change > 0, StockMovement.unit_cost.is_not(None))
+        
+        period = select(
+            StockMovement.item_id,
+            func.sum(change).label("net_change"),
+            func.sum(case((costed_receipt, change), else_=0)).label("received_quantity"),
+            func.sum(case((costed_receipt, change * StockMovement.unit_cost), else_=0)).label("received_value")
+        ).where(*in_period).group_by(StockMovement.item_id).cte("period")
+        
+        opening = select(
+            StockSnapshot.item_id,
+            StockSnapshot.quantity,
+            StockSnapshot.average_cost,
+            StockSnapshot.fifo_value
+        ).where(
+            StockSnapshot.snapshot_date == opening_date if opening_date else false()
+        ).cte("opening")
+        
+        item_filters = []
+        if item_id:
+            item_filters.append(Item.id == item_id)
+        if warehouse_location:
+            item_filters.append(Item.warehouse_location == warehouse_location)
+        
+        closing = select(
+            Item.id.label("item_id"),
+            (func.coalesce(opening.c.quantity, 0) + func.coalesce(period.c.net_change, 0)).label("quantity")
+        ).select_from(Item).outerjoin(
+            opening, opening.c.item_id == Item.id
+        ).outerjoin(
+            period, period.c.item_id == Item.id
+        ).where(*item_filters).cte("closing")
+        
+        # Costed receipts of the period, newest first, with the quantity received since
+        receipts = select(
+            StockMovement.item_id,
+            change.label("quantity"),
+            StockMovement.unit_cost,
+            func.sum(change).over(
+                partition_by=StockMovement.item_id,
+                order_by=(StockMovement.movement_date.desc(), StockMovement.id.desc())
+            ).label("received_since")
+        ).where(*in_period, costed_receipt).subquery()
+        
+        # Part of each receipt still on hand under FIFO
+        received_before = receipts.c.received_since - receipts.c.quantity
+        on_hand = case(
+            (receipts.c.received_since <= closing.c.quantity, receipts.c.quantity),
+            (received_before < closing.c.quantity, closing.c.quantity - received_before),
+            else_=0
+        )
+        fifo = select(
+            receipts.c.item_id,
+            func.sum(on_hand).label("layer_quantity"),
+            func.sum(on_hand * receipts.c.unit_cost).label("layer_value")
+        ).join(closing, closing.c.item_id == receipts.c.item_id).group_by(receipts.c.item_id).cte("fifo")
+        
+        rows = self.session.exec(
+            select(
+                Item.id,
+                Item.name,
+                Item.sku,
+                Item.warehouse_location,
+                Item.unit_cost,
+                closing.c.quantity,
+                opening.c.quantity,
+                opening.c.average_cost,
+                opening.c.fifo_value,
+                period.c.received_quantity,
+                period.c.received_value,
+                fifo.c.layer_quantity,
+                fifo.c.layer_value
+            )
+            .join(closing, closing.c.item_id == Item.id)
+            .outerjoin(opening, opening.c.item_id == Item.id)
+            .outerjoin(period, period.c.item_id == Item.id)
+            .outerjoin(fifo, fifo.c.item_id == Item.id)
+            .order_by(Item.warehouse_location, Item.sku)
+        ).all()
+        
+        return [self._value_position(*row) for row in rows]
+    
+    def _value_position(
+        self, item_id, name, sku, warehouse_location, unit_cost, quantity,
+        opening_quantity, opening_average_cost, opening_fifo_value,
+        received_quantity, received_value, layer_quantity, layer_value
+    ) -> StockPosition:
+        """Value one closing position from the period aggregates"""
+        quantity = Decimal(quantity or 0)
+        unit_cost = Decimal(unit_cost or 0)
+        opening_quantity = max(Decimal(opening_quantity or 0), ZERO)
+        received_quantity = Decimal(received_quantity or 0)
+        received_value = Decimal(received_value or 0)
+        
+        # Weighted average of the opening position and the period's receipts
+        pooled_quantity = opening_quantity + received_quantity
+        if pooled_quantity > 0:
+            opening_cost = Decimal(opening_average_cost) if opening_average_cost is not None else unit_cost
+            average_cost = (opening_quantity * opening_cost + received_value) / pooled_quantity
+        elif opening_average_cost is not None:
+            average_cost = Decimal(opening_average_cost)
+        else:
+            average_cost = unit_cost
+        
+        if quantity <= 0:
+            return StockPosition(
+                item_id=item_id, item_name=name, item_sku=sku, warehouse_location=warehouse_location,
+                quantity=quantity, average_cost=average_cost.quantize(Decimal("0.0001")),
+                wac_value=ZERO, fifo_value=ZERO
+            )
+        
+        # FIFO: newest receipts first, then the opening position, then uncosted stock
+        fifo_value = Decimal(layer_value or 0)
+        remaining = quantity - Decimal(layer_quantity or 0)
+        if remaining > 0 and opening_quantity > 0:
+            from_opening = min(remaining, opening_quantity)
+            fifo_value += from_opening * Decimal(opening_fifo_value or 0) / opening_quantity
+            remaining -= from_opening
+        if remaining > 0:
+            fifo_value += remaining * average_cost
+        
+        return StockPosition(
+            item_id=item_id,
+            item_name=name,
+            item_sku=sku,
+            warehouse_location=warehouse_location,
+            quantity=quantity,
+            average_cost=average_cost.quantize(Decimal("0.0001")),
+            wac_value=(quantity * average_cost).quantize(CENT),
+            fifo_value=fifo_value.quantize(CENT)
+        )
+    
+    def _nearest_snapshot_date(self, as_of: date) -> Optional[date]:
+        """Get the latest snapshot date on or before ``as_of``"""
+        return self.session.exec(
+            select(func.max(StockSnapshot.snapshot_date)).where(StockSnapshot.snapshot_date <= as_of)
+        ).first()
+
+
+def last_month_end(today: Optional[date] = None) -> date:
+    """Get the last day of the previous month"""
+    return (today or date.today()).replace(day=1) - timedelta(days=1)
+
+
+class StockSnapshotScheduler:
+    """Background task that writes the month-end stock snapshot
+    
+    Wakes up every ``check_interval`` seconds and writes the snapshot of
+    the previous month end once it is missing; the unique constraint on
+    (snapshot_date, item_id) keeps concurrent replicas from writing it twice.
+    """
+    
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._task: Optional[asyncio.Task] = None
+    
+    async def run_once(self) -> Optional[StockSnapshotResult]:
+        """Write the previous month-end snapshot if it does not exist yet
+        
+        The check and the write are blocking DB work, so they run in a
+        worker thread instead of stalling the event loop.
+        """
+        return await asyncio.to_thread(self._write_missing_snapshot, last_month_end())
+    
+    def _write_missing_snapshot(self, snapshot_date: date) -> Optional[StockSnapshotResult]:
+        with Session(engine) as session:
+            ledger_service = StockLedgerService(session)
+            if ledger_service.has_snapshot(snapshot_date):
+                return None
+            try:
+                return ledger_service.write_snapshot(snapshot_date)
+            except IntegrityError:
+                session.rollback()
+                logger.info(f"Stock snapshot for {snapshot_date} written by another worker")
+                return None
+    
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Stock snapshot failed: {str(e)}")
+            await asyncio.sleep(self.check_interval)
+    
+    def start(self):
+        """Start the periodic snapshot task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the periodic snapshot task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+snapshot_scheduler = StockSnapshotScheduler(settings.stock_snapshot_check_minutes * 60)
@@ -0,0 +1,149 @@
+"""
+Vectorized consumption forecasting utilities for inventory service
+"""
+from datetime import date, timedelta
+from typing import List, Dict, Any, Sequence
+import numpy as np
+
+# Approximate first day of Ramadan (Morocco); the month moves ~11 days earlier each year
+RAMADAN_START_DATES = [
+    date(2022, 4, 3),
+    date(2023, 3, 23),
+    date(2024, 3, 12),
+    date(2025, 3, 2),
+    date(2026, 2, 19),
+    date(2027, 2, 9),
+    date(2028, 1, 29),
+    date(2029, 1, 17),
+    date(2030, 1, 6),
+    date(2030, 12, 27),
+]
+RAMADAN_LENGTH_DAYS = 30
+SUMMER_MONTHS = (6, 7, 8)  # Peak tourist season
+
+TREND_DAMPING = 0.8  # Share of the monthly trend carried into each further forecast month
+
+
+def month_starts(first_month: date, count: int) -> List[date]:
+    """Get ``count`` consecutive month start dates from ``first_month``"""
+    months = []
+    year, month = first_month.year, first_month.month
+    for _ in range(count):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def ramadan_exposure(months: Sequence[date]) -> np.ndarray:
+    """Get the share of each month's days that fall in Ramadan
+
+    Args:
+        months: Month start dates
+
+    Returns:
+        Array of values in [0, 1], one per month
+    """
+    exposure = np.zeros(len(months))
+    for index, month_start in enumerate(months):
+        next_month = month_starts(month_start, 2)[1]
+        days_in_month = (next_month - month_start).days
+        for ramadan_start in RAMADAN_START_DATES:
+            ramadan_end = ramadan_start + timedelta(days=RAMADAN_LENGTH_DAYS)
+            overlap = (min(next_month, ramadan_end) - max(month_start, ramadan_start)).days
+            if overlap > 0:
+                exposure[index] += overlap / days_in_month
+    return exposure
+
+
+def seasonal_design_matrix(months: Sequence[date], time_index: np.ndarray) -> np.ndarray:
+    """Build the regression design: level, trend, Ramadan and summer terms"""
+    summer = np.array([1.0 if month.month in SUMMER_MONTHS else 0.0 for month in months])
+    return np.column_stack([
+        np.ones(len(months)),
+        time_index,
+        ramadan_exposure(months),
+        summer
+    ])
+
+
+def forecast_consumption(
+    history: np.ndarray,
+    history_months: Sequence[date],
+    months_ahead: int
+) -> Dict[str, np.ndarray]:
+    """Forecast monthly consumption for every item at once
+
+    Fits ``consumption = level + trend * t + ramadan * exposure + summer``
+    for all items with a single least-squares solve over the
+    items x months matrix, then projects ``months_ahead`` months with a
+    damped trend and the calendar effects of the forecast months.
+
+    Args:
+        history: Matrix of shape (items, months), oldest month first
+        history_months: Month start dates of the history columns
+        months_ahead: Number of months to forecast
+
+    Returns:
+        Dict of arrays: ``forecast`` (items, months_ahead), ``average``,
+        ``trend_factor``, ``monthly_trend``, ``ramadan_uplift`` and
+        ``summer_uplift`` (one value per item)
+    """
+    item_count, month_count = history.shape
+    if item_count == 0:
+        empty = np.zeros(0)
+        return {
+            "forecast": np.zeros((0, months_ahead)),
+            "average": empty,
+            "trend_factor": empty,
+            "monthly_trend": empty,
+            "ramadan_uplift": empty,
+            "summer_uplift": empty
+        }
+
+    # One solve for all items: columns of the right-hand side are items
+    design = seasonal_design_matrix(history_months, np.arange(month_count, dtype=float))
+    coefficients, _, _, _ = np.linalg.lstsq(design, history.T, rcond=None)
+    level, slope, ramadan, summer = coefficients
+
+    future_months = month_starts(month_starts(history_months[-1], 2)[1], months_ahead)
+    future_design = seasonal_design_matrix(future_months, np.zeros(months_ahead))
+
+    # Fitted level at the last observed month, plus the damped trend beyond it
+    damping = np.cumsum(TREND_DAMPING ** np.arange(1, months_ahead + 1))
+    base = level + slope * (month_count - 1)
+    forecast = (
+        base[:, None]
+        + slope[:, None] * damping[None, :]
+        + ramadan[:, None] * future_design[:, 2][None, :]
+        + summer[:, None] * future_design[:, 3][None, :]
+    )
+    forecast = np.clip(forecast, 0, None)
+
+    # Last 3 months against the 3 before them, as a simple momentum indicator
+    recent = history[:, -3:].mean(axis=1)
+    earlier = history[:, -6:-3].mean(axis=1) if month_count >= 6 else recent
+    trend_factor = np.divide(recent, earlier, out=np.ones(item_count), where=earlier > 0)
+
+    return {
+        "forecast": forecast,
+        "average": history.mean(axis=1),
+        "trend_factor": trend_factor,
+        "monthly_trend": slope,
+        "ramadan_uplift": ramadan,
+        "summer_uplift": summer
+    }
+
+
+def months_until_threshold(
+    forecast: np.ndarray,
+    current_quantity: np.ndarray,
+    reorder_level: np.ndarray
+) -> np.ndarray:
+    """Get the first forecast month (1-based) at which stock reaches the reorder level
+
+    Returns:
+        Array with 0 where the reorder level is not reached within the forecast
+    """
+    remaining = current_quantity[:, None] - np.cumsum(forecast, axis=1)
+    reached = remaining <= reorder_level[:, None]
+    return np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, 0)
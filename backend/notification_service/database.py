@@ -2,9 +2,13 @@
 Database configuration and session management
 """
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import text
 from config import settings
 import redis
 from typing import Generator
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # PostgreSQL engine
@@ -24,6 +28,31 @@ def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
 
+# Columns matched by utils.search, indexed with pg_trgm
+TRIGRAM_INDEXED_COLUMNS = {
+    "templates": ["name", "description", "body"]
+}
+
+
+def ensure_search_indexes():
+    """Create the pg_trgm GIN indexes used by fuzzy search
+    
+    Only applies to PostgreSQL. Safe to run on every startup.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, columns in TRIGRAM_INDEXED_COLUMNS.items():
+            for column in columns:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_trgm_{table}_{column} "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                ))
+    logger.info("Search indexes ensured")
+
+
 def get_session() -> Generator[Session, None, None]:
     """Database session dependency"""
     with Session(engine) as session:
@@ -6,7 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from config import settings
-from database import create_db_and_tables
+from database import create_db_and_tables, ensure_search_indexes
 from routers import (
     notifications_router, templates_router, preferences_router, logs_router
 )
@@ -64,6 +64,7 @@ async def internal_server_error_handler(request: Request, exc: Exception):
 async def startup_event():
     """Initialize database and create tables"""
     create_db_and_tables()
+    ensure_search_indexes()
     logger.info("Notification database initialized successfully")
 
 
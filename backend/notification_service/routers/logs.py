@@ -73,7 +73,8 @@ async def get_recipient_notification_history(
         items=notifications,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -7,7 +7,7 @@ from database import get_session, get_redis
 from services.notification_service import NotificationService
 from schemas.notification import (
     NotificationCreate, NotificationUpdate, NotificationResponse,
-    NotificationSend, NotificationBulkSend, NotificationSearch, NotificationStats
+    NotificationSend, NotificationBulkSend, NotificationBatchSend, NotificationSearch, NotificationStats
 )
 from models.notification import (
     NotificationType, NotificationChannel, NotificationStatus, RecipientType
@@ -53,6 +53,22 @@ async def send_bulk_notification(
     return await notification_service.send_bulk_notification(bulk_data)
 
 
+@router.post("/send-batch", response_model=Dict[str, Any])
+async def send_notification_batch(
+    batch_data: NotificationBatchSend,
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("notification", "create", "notifications"))
+):
+    """Send many individually templated notifications, reporting success per item"""
+    notification_service = NotificationService(session, redis_client)
+    
+    if not batch_data.source_service:
+        batch_data.source_service = "manual"
+    
+    return await notification_service.send_notification_batch(batch_data)
+
+
 @router.get("/", response_model=PaginatedResponse[NotificationResponse])
 async def get_notifications(
     pagination: PaginationParams = Depends(),
@@ -120,7 +136,8 @@ async def get_notifications(
         items=notifications,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -202,7 +219,8 @@ async def get_recipient_notifications(
         items=notifications,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
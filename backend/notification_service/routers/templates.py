@@ -64,7 +64,8 @@ async def get_templates(
         items=templates,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
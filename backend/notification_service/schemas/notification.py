@@ -122,6 +122,31 @@ class NotificationBulkSend(BaseModel):
     group_id: Optional[str] = None
 
 
+class NotificationBatchItem(BaseModel):
+    """One individually templated notification of a batch"""
+    recipient_id: str
+    template_name: str
+    variables: Dict[str, Any] = {}
+    channels: List[NotificationChannel] = [NotificationChannel.EMAIL]
+    priority: int = 5
+
+
+class NotificationBatchSend(BaseModel):
+    """Schema for sending many individually templated notifications in one request"""
+    type: NotificationType
+    notifications: List[NotificationBatchItem]
+    source_service: Optional[str] = None
+    source_event: Optional[str] = None
+    
+    @validator('notifications')
+    def validate_notifications(cls, v):
+        if not v:
+            raise ValueError('At least one notification is required')
+        if len(v) > 500:
+            raise ValueError('A batch cannot exceed 500 notifications')
+        return v
+
+
 class NotificationSearch(BaseModel):
     """Notification search criteria"""
     type: Optional[NotificationType] = None
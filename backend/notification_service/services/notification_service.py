@@ -10,7 +10,7 @@ from models.template import Template
 from models.user_preference import UserPreference
 from schemas.notification import (
     NotificationCreate, NotificationUpdate, NotificationResponse,
-    NotificationSend, NotificationBulkSend, NotificationSearch, NotificationStats
+    NotificationSend, NotificationBulkSend, NotificationBatchSend, NotificationSearch, NotificationStats
 )
 from utils.pagination import PaginationParams, paginate_query
 from services.channel_services import (
@@ -94,6 +94,49 @@ class NotificationService:
             "group_id": bulk_data.group_id
         }
     
+    async def send_notification_batch(self, batch_data: NotificationBatchSend) -> Dict[str, Any]:
+        """Send individually templated notifications received in one request
+        
+        Templates are resolved by name once for the whole batch. Items whose
+        template is unknown or whose send fails are reported as failed
+        without affecting the rest.
+        """
+        template_names = {item.template_name for item in batch_data.notifications}
+        templates = {
+            template.name: template
+            for template in self.session.exec(
+                select(Template).where(Template.name.in_(template_names))
+            ).all()
+        }
+        
+        results = []
+        for item in batch_data.notifications:
+            template = templates.get(item.template_name)
+            if not template:
+                results.append(False)
+                continue
+            try:
+                await self.send_notification(NotificationSend(
+                    type=batch_data.type,
+                    recipients=[{"user_id": item.recipient_id}],
+                    template_id=template.id,
+                    template_variables=item.variables,
+                    channels=item.channels,
+                    priority=item.priority,
+                    source_service=batch_data.source_service,
+                    source_event=batch_data.source_event or item.template_name
+                ))
+                results.append(True)
+            except Exception:
+                self.session.rollback()
+                results.append(False)
+        
+        return {
+            "results": results,
+            "successful": sum(results),
+            "failed": len(results) - sum(results)
+        }
+    
     async def get_notification(self, notification_id: uuid.UUID) -> NotificationResponse:
         """Get notification by ID"""
         statement = select(Notification).where(Notification.id == notification_id)
@@ -1,7 +1,7 @@
 """
 Template service for managing notification templates
 """
-from sqlmodel import Session, select, and_, or_
+from sqlmodel import Session, select, and_
 from fastapi import HTTPException, status
 from models.template import Template, TemplateType
 from models.notification import NotificationChannel
@@ -10,6 +10,7 @@ from schemas.template import (
     TemplatePreview, TemplatePreviewResponse, TemplateValidation, TemplateSearch
 )
 from utils.pagination import PaginationParams, paginate_query
+from utils.search import fuzzy_search_condition, similarity_rank
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime
 import uuid
@@ -85,20 +86,17 @@ class TemplateService:
     ) -> Tuple[List[TemplateResponse], int]:
         """Get list of templates with optional search"""
         query = select(Template)
+        rank = None
         
         # Apply search filters
         if search:
             conditions = []
             
             if search.query:
-                search_term = f"%{search.query}%"
-                conditions.append(
-                    or_(
-                        Template.name.ilike(search_term),
-                        Template.description.ilike(search_term),
-                        Template.body.ilike(search_term)
-                    )
-                )
+                search_columns = [Template.name, Template.description, Template.body]
+                dialect_name = self.session.get_bind().dialect.name
+                conditions.append(fuzzy_search_condition(search_columns, search.query, dialect_name))
+                rank = similarity_rank(search_columns, search.query, dialect_name)
             
             if search.type:
                 conditions.append(Template.type == search.type)
@@ -118,7 +116,9 @@ class TemplateService:
             if conditions:
                 query = query.where(and_(*conditions))
         
-        # Order by usage and creation date
+        # Order by closest match when searching by text, then by usage and creation date
+        if rank is not None:
+            query = query.order_by(rank.desc())
         query = query.order_by(Template.usage_count.desc(), Template.created_at.desc())
         
         templates, total = paginate_query(self.session, query, pagination)
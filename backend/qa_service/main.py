@@ -11,6 +11,7 @@ from routers import (
     audits_router, nonconformities_router, compliance_router, 
     certifications_router, reports_router
 )
+from utils.upload import shutdown_image_pool
 import logging
 
 
@@ -68,6 +69,13 @@ async def startup_event():
     logger.info("QA & Compliance database initialized successfully")
 
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the image processing workers"""
+    shutdown_image_pool()
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -16,6 +16,7 @@ from .certification import (
     CertificationStatus,
     CertificationScope,
 )
+from .document_sequence import DocumentSequence
 
 __all__ = [
     "QualityAudit",
@@ -33,4 +34,5 @@ __all__ = [
     "CertificationType",
     "CertificationStatus",
     "CertificationScope",
+    "DocumentSequence",
 ]
@@ -0,0 +1,21 @@
+"""
+Document sequence model for race-free document numbering
+"""
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class DocumentSequence(SQLModel, table=True):
+    """Last number handed out for a document type in a numbering period
+    
+    One row per (document type, period), e.g. ("NC", "202610"). Numbers are
+    allocated with a single ``UPDATE ... RETURNING`` on this row, see
+    ``utils.sequences``.
+    """
+    __tablename__ = "document_sequences"
+    
+    document_type: str = Field(primary_key=True, max_length=20)
+    period: str = Field(primary_key=True, max_length=20)
+    last_value: int = Field(default=0)
+    updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
@@ -98,7 +98,8 @@ async def get_audits(
         items=audits,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
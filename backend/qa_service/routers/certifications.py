@@ -144,7 +144,8 @@ async def get_certifications(
         items=certifications,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
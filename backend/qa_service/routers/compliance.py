@@ -73,7 +73,8 @@ async def get_compliance_requirements(
         items=requirements,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -60,7 +60,8 @@ async def get_nonconformities(
         items=nonconformities,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
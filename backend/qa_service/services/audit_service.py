@@ -6,14 +6,17 @@ from fastapi import HTTPException, status
 from models.quality_audit import QualityAudit, AuditStatus, EntityType
 from models.nonconformity import NonConformity, Severity, NCStatus
 from schemas.quality_audit import (
-    QualityAuditCreate, QualityAuditUpdate, QualityAuditResponse
+    QualityAuditCreate, QualityAuditUpdate, QualityAuditResponse, AuditSearch
 )
 from schemas.nonconformity import (
     NonConformityCreate, NonConformityUpdate, NonConformityResponse
 )
 from utils.notifications import send_audit_notification, send_nonconformity_alert
 from utils.validation import validate_audit_data, validate_checklist
-from typing import List, Optional, Dict, Any
+from utils.sequences import allocate_sequence, last_used_number
+from services.nonconformity_service import generate_nc_number
+from utils.pagination import PaginationParams, paginate_query
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, date, timedelta
 import uuid
 import json
@@ -118,63 +121,65 @@ class AuditService:
     
     async def get_audits(
         self,
-        skip: int = 0,
-        limit: int = 100,
-        entity_type: Optional[EntityType] = None,
-        status: Optional[AuditStatus] = None,
-        auditor_id: Optional[uuid.UUID] = None,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-        overdue_only: bool = False
-    ) -> List[QualityAuditResponse]:
+        pagination: PaginationParams,
+        search: Optional[AuditSearch] = None
+    ) -> Tuple[List[QualityAuditResponse], Optional[int]]:
         """Get audits with filtering
         
         Args:
-            skip: Number of records to skip
-            limit: Maximum number of records to return
-            entity_type: Filter by entity type
-            status: Filter by audit status
-            auditor_id: Filter by auditor
-            start_date: Filter audits from this date
-            end_date: Filter audits until this date
-            overdue_only: Show only overdue audits
+            pagination: Page/size or cursor of the page to read
+            search: Optional search criteria
             
         Returns:
-            List of audits
+            Audits of the page, latest scheduled first, and the total count
         """
         query = select(QualityAudit)
         
         # Apply filters
-        conditions = []
-        
-        if entity_type:
-            conditions.append(QualityAudit.entity_type == entity_type)
-        
-        if status:
-            conditions.append(QualityAudit.status == status)
-        
-        if auditor_id:
-            conditions.append(QualityAudit.auditor_id == auditor_id)
-        
-        if start_date:
-            conditions.append(QualityAudit.scheduled_date >= start_date)
-        
-        if end_date:
-            conditions.append(QualityAudit.scheduled_date <= end_date)
-        
-        if overdue_only:
-            conditions.extend([
-                QualityAudit.scheduled_date < date.today(),
-                QualityAudit.status.in_([AuditStatus.SCHEDULED, AuditStatus.IN_PROGRESS])
-            ])
+        if search:
+            conditions = []
+            
+            if search.query:
+                search_term = f"%{search.query}%"
+                conditions.append(or_(
+                    QualityAudit.audit_number.ilike(search_term),
+                    QualityAudit.title.ilike(search_term),
+                    QualityAudit.entity_name.ilike(search_term)
+                ))
+            
+            if search.entity_type:
+                conditions.append(QualityAudit.entity_type == search.entity_type)
+            
+            if search.audit_type:
+                conditions.append(QualityAudit.audit_type == search.audit_type)
+            
+            if search.status:
+                conditions.append(QualityAudit.status == search.status)
+            
+            if search.auditor_id:
+                conditions.append(QualityAudit.auditor_id == search.auditor_id)
+            
+            if search.scheduled_from:
+                conditions.append(QualityAudit.scheduled_date >= search.scheduled_from)
+            
+            if search.scheduled_to:
+                conditions.append(QualityAudit.scheduled_date <= search.scheduled_to)
+            
+            if search.outcome:
+                conditions.append(QualityAudit.outcome == search.outcome)
+            
+            if search.requires_follow_up is not None:
+                conditions.append(QualityAudit.requires_follow_up == search.requires_follow_up)
+            
+            if conditions:
+                query = query.where(and_(*conditions))
         
-        if conditions:
-            query = query.where(and_(*conditions))
+        # id breaks ties between audits scheduled on the same day
+        query = query.order_by(QualityAudit.scheduled_date.desc(), QualityAudit.id.desc())
         
-        query = query.order_by(QualityAudit.scheduled_date.desc()).offset(skip).limit(limit)
-        audits = self.session.exec(query).all()
+        audits, total = paginate_query(self.session, query, pagination)
         
-        return [self._to_response(audit) for audit in audits]
+        return [self._to_response(audit) for audit in audits], total
     
     async def update_audit(
         self, 
@@ -567,43 +572,17 @@ class AuditService:
     
     async def _generate_audit_number(self) -> str:
         """Generate unique audit number"""
-        today = date.today()
-        prefix = f"AUD-{today.strftime('%Y%m')}"
-        
-        # Get last audit number for this month
-        query = select(QualityAudit).where(
-            QualityAudit.audit_number.like(f"{prefix}%")
-        ).order_by(QualityAudit.audit_number.desc())
-        
-        last_audit = self.session.exec(query).first()
-        
-        if last_audit:
-            last_number = int(last_audit.audit_number.split('-')[-1])
-            new_number = last_number + 1
-        else:
-            new_number = 1
-        
-        return f"{prefix}-{new_number:04d}"
+        period = date.today().strftime('%Y%m')
+        prefix = f"AUD-{period}"
+        sequence = allocate_sequence(
+            self.session, "AUD", period,
+            seed=lambda: last_used_number(self.session, QualityAudit.audit_number, prefix)
+        )
+        return f"{prefix}-{sequence[0]:04d}"
     
     async def _generate_nc_number(self) -> str:
         """Generate unique non-conformity number"""
-        today = date.today()
-        prefix = f"NC-{today.strftime('%Y%m')}"
-        
-        # Get last NC number for this month
-        query = select(NonConformity).where(
-            NonConformity.nc_number.like(f"{prefix}%")
-        ).order_by(NonConformity.nc_number.desc())
-        
-        last_nc = self.session.exec(query).first()
-        
-        if last_nc:
-            last_number = int(last_nc.nc_number.split('-')[-1])
-            new_number = last_number + 1
-        else:
-            new_number = 1
-        
-        return f"{prefix}-{new_number:04d}"
+        return await generate_nc_number(self.session)
     
     def _to_response(self, audit: QualityAudit) -> QualityAuditResponse:
         """Convert audit model to response schema"""
@@ -9,6 +9,7 @@ from schemas.nonconformity import (
     NonConformityCreate, NonConformityUpdate, NonConformityResponse
 )
 from utils.notifications import send_nonconformity_alert
+from utils.sequences import allocate_sequence, last_used_number
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import uuid
@@ -17,6 +18,21 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+async def generate_nc_number(session: Session) -> str:
+    """Generate unique non-conformity number
+    
+    Shared by audit findings and directly reported non-conformities so
+    both draw from the same NC sequence.
+    """
+    period = date.today().strftime('%Y%m')
+    prefix = f"NC-{period}"
+    sequence = allocate_sequence(
+        session, "NC", period,
+        seed=lambda: last_used_number(session, NonConformity.nc_number, prefix)
+    )
+    return f"{prefix}-{sequence[0]:04d}"
+
+
 class NonConformityService:
     """Service for handling non-conformity operations"""
     
@@ -444,16 +460,7 @@ class NonConformityService:
     
     async def _generate_nc_number(self) -> str:
         """Generate unique non-conformity number"""
-        current_date = datetime.now()
-        prefix = f"NC-{current_date.strftime('%Y%m')}"
-        
-        # Get the latest number for this month
-        query = select(func.count(NonConformity.id)).where(
-            NonConformity.nc_number.like(f"{prefix}%")
-        )
-        count = self.session.exec(query).first() or 0
-        
-        return f"{prefix}-{count + 1:04d}"
+        return await generate_nc_number(self.session)
     
     def _to_response(self, nonconformity: NonConformity) -> NonConformityResponse:
         """Convert non-conformity model to response schema
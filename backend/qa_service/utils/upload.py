@@ -3,11 +3,16 @@ File upload utilities for QA service
 """
 import os
 import uuid
+import asyncio
 import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Dict, Any
 from pathlib import Path
 from fastapi import UploadFile, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 from PIL import Image
+from config import settings
 import magic
 import logging
 
@@ -16,7 +21,7 @@ logger = logging.getLogger(__name__)
 # Configuration
 UPLOAD_DIR = Path("uploads/qa_documents")
 CERTIFICATE_DIR = Path("uploads/certificates")
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_FILE_SIZE = settings.max_file_size
 ALLOWED_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png", ".doc", ".docx"}
 ALLOWED_MIME_TYPES = {
     "application/pdf",
@@ -26,27 +31,96 @@ ALLOWED_MIME_TYPES = {
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 }
 
+# Streaming settings
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+MIME_SNIFF_SIZE = 2048
+
 # Image processing settings
 MAX_IMAGE_WIDTH = 2048
 MAX_IMAGE_HEIGHT = 2048
 IMAGE_QUALITY = 85
+IMAGE_PROCESS_WORKERS = 2
+
+_image_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_image_pool() -> ProcessPoolExecutor:
+    """Get the process pool that runs image optimization off the event loop"""
+    global _image_pool
+    if _image_pool is None:
+        _image_pool = ProcessPoolExecutor(max_workers=IMAGE_PROCESS_WORKERS)
+    return _image_pool
+
+
+def shutdown_image_pool():
+    """Stop the image processing workers"""
+    global _image_pool
+    if _image_pool is not None:
+        _image_pool.shutdown()
+        _image_pool = None
+
+
+def optimize_image(source_path: str, target_path: str) -> bool:
+    """Resize and re-encode an image file as JPEG
+    
+    Runs in an image pool worker, so decoding and encoding never hold the
+    event loop.
+    
+    Args:
+        source_path: Image file to read
+        target_path: File to write the optimized image to
+        
+    Returns:
+        False if the image could not be processed
+    """
+    try:
+        with Image.open(source_path) as image:
+            # Convert to RGB if necessary
+            if image.mode in ('RGBA', 'LA', 'P'):
+                image = image.convert('RGB')
+            
+            # Resize if too large
+            if image.width > MAX_IMAGE_WIDTH or image.height > MAX_IMAGE_HEIGHT:
+                image.thumbnail((MAX_IMAGE_WIDTH, MAX_IMAGE_HEIGHT), Image.Resampling.LANCZOS)
+                logger.info(f"Resized image {source_path} to {image.width}x{image.height}")
+            
+            image.save(target_path, format='JPEG', quality=IMAGE_QUALITY, optimize=True)
+        return True
+    except Exception as e:
+        logger.error(f"Error processing image {source_path}: {str(e)}")
+        return False
+
+
+def _write_chunk(spool, file_hash, chunk: bytes):
+    file_hash.update(chunk)
+    spool.write(chunk)
 
 
 class QAFileUploadHandler:
-    """Handles secure file upload for QA documents"""
+    """Handles secure file upload for QA documents
+    
+    Uploads are streamed in chunks to a temporary file under
+    ``<upload_dir>/.incoming`` and hashed on the way, so memory use stays
+    flat whatever the file size. Once stored, files are moved into place
+    with ``os.replace``, which is atomic on the same filesystem.
+    """
     
     def __init__(self, upload_dir: Optional[Path] = None):
         self.upload_dir = upload_dir or UPLOAD_DIR
-        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.incoming_dir = self.upload_dir / ".incoming"
+        self.incoming_dir.mkdir(parents=True, exist_ok=True)
     
     async def validate_file(self, file: UploadFile) -> Dict[str, Any]:
-        """Validate uploaded file
+        """Validate uploaded file while spooling it to a temporary file
+        
+        Pass the result to ``save_file`` to store it, or to ``discard_file``
+        to drop the temporary file.
         
         Args:
             file: FastAPI UploadFile object
             
         Returns:
-            Dict with validation results
+            Dict with validation results and the temporary file path
             
         Raises:
             HTTPException: If file validation fails
@@ -66,28 +140,51 @@ class QAFileUploadHandler:
                 detail=f"File extension {file_ext} not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
             )
         
-        # Read file content for MIME type validation
-        content = await file.read()
-        await file.seek(0)  # Reset file pointer
+        fd, temp_path = tempfile.mkstemp(dir=self.incoming_dir, suffix=file_ext)
+        file_hash = hashlib.sha256()
+        file_size = 0
+        mime_type = None
         
-        # Validate MIME type using python-magic
-        mime_type = magic.from_buffer(content, mime=True)
-        if mime_type not in ALLOWED_MIME_TYPES:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File type {mime_type} not allowed"
-            )
+        try:
+            with os.fdopen(fd, "wb") as spool:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    # Validate MIME type from the first chunk using python-magic
+                    if mime_type is None:
+                        mime_type = magic.from_buffer(chunk[:MIME_SNIFF_SIZE], mime=True)
+                        if mime_type not in ALLOWED_MIME_TYPES:
+                            raise HTTPException(
+                                status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"File type {mime_type} not allowed"
+                            )
+                    
+                    # Enforce the limit on the bytes actually received
+                    file_size += len(chunk)
+                    if file_size > MAX_FILE_SIZE:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE // (1024*1024)}MB"
+                        )
+                    
+                    await run_in_threadpool(_write_chunk, spool, file_hash, chunk)
+            
+            if mime_type is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="File is empty"
+                )
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
         
-        # Calculate file hash for deduplication
-        file_hash = hashlib.sha256(content).hexdigest()
+        await file.seek(0)  # Reset file pointer
         
         return {
             "original_filename": file.filename,
             "file_extension": file_ext,
             "mime_type": mime_type,
-            "file_size": len(content),
-            "file_hash": file_hash,
-            "content": content
+            "file_size": file_size,
+            "file_hash": file_hash.hexdigest(),
+            "temp_path": temp_path
         }
     
     async def save_file(self, file_data: Dict[str, Any], entity_id: uuid.UUID, file_type: str = "document") -> Dict[str, Any]:
@@ -111,15 +208,18 @@ class QAFileUploadHandler:
         entity_dir.mkdir(exist_ok=True)
         
         file_path = entity_dir / safe_filename
+        temp_path = Path(file_data["temp_path"])
         
-        # Process content if it's an image
-        content = file_data["content"]
-        if file_data["mime_type"].startswith("image/"):
-            content = await self._process_image(content, file_data["original_filename"])
-        
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(content)
+        try:
+            # Process content if it's an image
+            if file_data["mime_type"].startswith("image/"):
+                temp_path = await self._process_image(temp_path, file_data["original_filename"])
+            
+            # Move into place in one step, readers never see a partial file
+            await run_in_threadpool(os.replace, temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
         
         logger.info(f"Saved {file_type} file {safe_filename} for entity {entity_id}")
         
@@ -128,43 +228,40 @@ class QAFileUploadHandler:
             "file_path": str(file_path),
             "file_name": safe_filename,
             "original_filename": file_data["original_filename"],
-            "file_size": len(content),
+            "file_size": file_path.stat().st_size,
             "mime_type": file_data["mime_type"],
             "file_hash": file_data["file_hash"]
         }
     
-    async def _process_image(self, content: bytes, filename: str) -> bytes:
-        """Process and optimize image files
+    async def _process_image(self, source_path: Path, filename: str) -> Path:
+        """Optimize an image file in the image process pool
         
         Args:
-            content: Image file content
+            source_path: Spooled image file
             filename: Original filename
             
         Returns:
-            Processed image content
+            Path of the optimized image, or ``source_path`` if processing failed
         """
-        try:
-            import io
-            # Open image with PIL
-            image = Image.open(io.BytesIO(content))
-            
-            # Convert to RGB if necessary
-            if image.mode in ('RGBA', 'LA', 'P'):
-                image = image.convert('RGB')
-            
-            # Resize if too large
-            if image.width > MAX_IMAGE_WIDTH or image.height > MAX_IMAGE_HEIGHT:
-                image.thumbnail((MAX_IMAGE_WIDTH, MAX_IMAGE_HEIGHT), Image.Resampling.LANCZOS)
-                logger.info(f"Resized image {filename} to {image.width}x{image.height}")
-            
-            # Save optimized image
-            output = io.BytesIO()
-            image.save(output, format='JPEG', quality=IMAGE_QUALITY, optimize=True)
-            return output.getvalue()
-            
-        except Exception as e:
-            logger.error(f"Error processing image {filename}: {str(e)}")
-            return content  # Return original if processing fails
+        fd, target_path = tempfile.mkstemp(dir=self.incoming_dir, suffix=source_path.suffix)
+        os.close(fd)
+        
+        loop = asyncio.get_running_loop()
+        processed = await loop.run_in_executor(
+            get_image_pool(), optimize_image, str(source_path), target_path
+        )
+        
+        if not processed:
+            logger.warning(f"Storing image {filename} unprocessed")
+            Path(target_path).unlink(missing_ok=True)
+            return source_path  # Keep original if processing fails
+        
+        source_path.unlink(missing_ok=True)
+        return Path(target_path)
+    
+    def discard_file(self, file_data: Dict[str, Any]):
+        """Drop the temporary file of a validated upload that will not be saved"""
+        Path(file_data["temp_path"]).unlink(missing_ok=True)
     
     def delete_file(self, file_path: str) -> bool:
         """Delete file from storage
@@ -2,7 +2,7 @@
 Configuration settings for the tour operations microservice
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -12,6 +12,14 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6382/3"
     
+    # Change feed (Redis Streams shared by all services; defaults to redis_url)
+    change_feed_redis_url: Optional[str] = None
+    change_stream_max_length: int = 100000  # Approximate cap per stream
+    change_feed_enabled: bool = True  # Keep local read models of other services
+    change_feed_batch_size: int = 100
+    change_feed_block_ms: int = 5000
+    change_feed_max_deliveries: int = 5  # Deliveries before a failing entry is logged and dropped
+    
     # Service Integration
     auth_service_url: str = "http://auth_service:8000"
     crm_service_url: str = "http://crm_service:8001"
@@ -36,6 +44,10 @@ class Settings(BaseSettings):
     max_tour_duration_days: int = 30
     default_language: str = "French"
     
+    # Schedule Generation
+    schedule_max_departures: int = 1000  # Per generated schedule
+    schedule_insert_chunk_size: int = 500  # Rows per bulk INSERT
+    
     # Real-time Updates
     websocket_enabled: bool = True
     notification_timeout: int = 30
@@ -2,9 +2,15 @@
 Database configuration and session management
 """
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import inspect, text
 from config import settings
+from models.tour_template import SEARCH_CONFIGS
 import redis
-from typing import Generator
+import redis.asyncio as aioredis
+from typing import Generator, List
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # PostgreSQL engine
@@ -18,12 +24,150 @@ engine = create_engine(
 # Redis client
 redis_client = redis.from_url(settings.redis_url, decode_responses=True)
 
+# Async Redis client for real-time notifications; all publishers share its connection pool
+async_redis_client = aioredis.from_url(settings.redis_url, decode_responses=True)
+
+# Redis holding the cross-service change feed, for publishing and consuming
+change_feed_redis = redis.from_url(settings.change_feed_redis_url or settings.redis_url, decode_responses=True)
+async_change_feed_redis = aioredis.from_url(settings.change_feed_redis_url or settings.redis_url, decode_responses=True)
+
 
 def create_db_and_tables():
     """Create database tables"""
     SQLModel.metadata.create_all(engine)
 
 
+# Columns matched by utils.search, indexed with pg_trgm
+TRIGRAM_INDEXED_COLUMNS = {
+    "tour_templates": ["title", "description", "short_description", "highlights"]
+}
+
+
+def ensure_search_indexes():
+    """Create the pg_trgm GIN indexes used by fuzzy search
+    
+    Only applies to PostgreSQL. Safe to run on every startup.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, columns in TRIGRAM_INDEXED_COLUMNS.items():
+            for column in columns:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_trgm_{table}_{column} "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                ))
+    logger.info("Search indexes ensured")
+
+
+# Highlights are stored as a JSON array; index the text of its elements,
+# not the brackets, quotes and escapes of the serialised form
+HIGHLIGHTS_TEXT_SQL = (
+    "coalesce(array_to_string("
+    "ARRAY(SELECT json_array_elements_text(NEW.highlights::json)), ' '), '')"
+)
+
+
+def ensure_tour_search_vector():
+    """Create the weighted full-text search column of tour templates
+    
+    The trigger builds the vector in the template's language, weighting
+    title (A), short description (B), description (C) and highlights (D).
+    Highlights written with ASCII escapes by older versions are rewritten
+    unescaped so trigram search matches accented text. Only applies to
+    PostgreSQL. Safe to run on every startup.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    language_cases = " ".join(
+        f"WHEN '{language}' THEN '{config}'" for language, config in SEARCH_CONFIGS.items()
+    )
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE tour_templates ADD COLUMN IF NOT EXISTS search_vector tsvector"))
+        conn.execute(text(f"""
+            CREATE OR REPLACE FUNCTION tour_templates_search_vector_update() RETURNS trigger AS $$
+            DECLARE
+                config regconfig := CASE lower(NEW.default_language) {language_cases} ELSE 'simple' END;
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector(config, coalesce(NEW.title, '')), 'A') ||
+                    setweight(to_tsvector(config, coalesce(NEW.short_description, '')), 'B') ||
+                    setweight(to_tsvector(config, coalesce(NEW.description, '')), 'C') ||
+                    setweight(to_tsvector(config, {HIGHLIGHTS_TEXT_SQL}), 'D');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """))
+        conn.execute(text("DROP TRIGGER IF EXISTS tour_templates_search_vector ON tour_templates"))
+        conn.execute(text(
+            "CREATE TRIGGER tour_templates_search_vector "
+            "BEFORE INSERT OR UPDATE OF title, short_description, description, highlights, default_language "
+            "ON tour_templates FOR EACH ROW EXECUTE FUNCTION tour_templates_search_vector_update()"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_tour_templates_search_vector "
+            "ON tour_templates USING gin (search_vector)"
+        ))
+        # Rewrite escaped highlights, which also refreshes their vectors
+        conn.execute(text(
+            "UPDATE tour_templates "
+            "SET highlights = to_json(ARRAY(SELECT json_array_elements_text(highlights::json)))::text "
+            "WHERE strpos(highlights, '\\u') > 0"
+        ))
+        # Backfill rows written before the trigger existed
+        conn.execute(text("UPDATE tour_templates SET title = title WHERE search_vector IS NULL"))
+    logger.info("Tour search vector ensured")
+
+
+# Columns of tour_instances relaxed to NULL for scheduled departures
+TOUR_INSTANCE_NULLABLE_COLUMNS = ["booking_id", "customer_id", "lead_participant_name"]
+
+
+def tour_instance_upgrade_statements(conn) -> List[str]:
+    """DDL bringing an existing tour_instances table up to the current model
+    
+    Returns nothing for a table created by ``create_db_and_tables``.
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table("tour_instances"):
+        return []
+    columns = {column["name"]: column for column in inspector.get_columns("tour_instances")}
+    
+    statements = []
+    if "schedule_id" not in columns:
+        statements.append(
+            "ALTER TABLE tour_instances ADD COLUMN IF NOT EXISTS schedule_id UUID "
+            "REFERENCES tour_schedules (id)"
+        )
+        statements.append(
+            "CREATE INDEX IF NOT EXISTS ix_tour_instances_schedule_id "
+            "ON tour_instances (schedule_id)"
+        )
+    for name in TOUR_INSTANCE_NULLABLE_COLUMNS:
+        if name in columns and not columns[name]["nullable"]:
+            statements.append(f"ALTER TABLE tour_instances ALTER COLUMN {name} DROP NOT NULL")
+    return statements
+
+
+def ensure_tour_instance_columns():
+    """Upgrade tour_instances created before scheduled departures
+    
+    ``create_all`` never alters an existing table, so this adds
+    ``schedule_id`` and drops the NOT NULL constraints scheduled departures
+    cannot satisfy. Only applies to PostgreSQL. Safe to run on every startup.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    with engine.begin() as conn:
+        for statement in tour_instance_upgrade_statements(conn):
+            conn.execute(text(statement))
+    logger.info("Tour instance columns ensured")
+
+
 def get_session() -> Generator[Session, None, None]:
     """Database session dependency"""
     with Session(engine) as session:
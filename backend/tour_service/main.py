@@ -6,9 +6,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from config import settings
-from database import create_db_and_tables
+from database import (
+    create_db_and_tables, ensure_search_indexes, ensure_tour_search_vector, ensure_tour_instance_columns
+)
+from services.change_feed import change_feed_consumer
 from routers import (
-    tour_templates_router, tour_instances_router, itinerary_router, incidents_router
+    tour_templates_router, tour_instances_router, itinerary_router, incidents_router,
+    tour_schedules_router
 )
 import logging
 
@@ -64,9 +68,21 @@ async def internal_server_error_handler(request: Request, exc: Exception):
 async def startup_event():
     """Initialize database and create tables"""
     create_db_and_tables()
+    ensure_search_indexes()
+    ensure_tour_search_vector()
+    ensure_tour_instance_columns()
+    if settings.change_feed_enabled:
+        change_feed_consumer.start()
     logger.info("Tour operations database initialized successfully")
 
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the change feed consumer"""
+    await change_feed_consumer.stop()
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -83,6 +99,7 @@ app.include_router(tour_templates_router, prefix="/api/v1")
 app.include_router(tour_instances_router, prefix="/api/v1")
 app.include_router(itinerary_router, prefix="/api/v1")
 app.include_router(incidents_router, prefix="/api/v1")
+app.include_router(tour_schedules_router, prefix="/api/v1")
 
 
 # Root endpoint
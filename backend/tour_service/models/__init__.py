@@ -5,10 +5,15 @@ from .tour_template import TourTemplate, TourCategory, DifficultyLevel
 from .tour_instance import TourInstance, TourStatus
 from .itinerary_item import ItineraryItem, ActivityType
 from .incident import Incident, IncidentType, SeverityLevel
+from .tour_schedule import TourSchedule
+from .availability_slot import AvailabilitySlot
+from .replica import CustomerReplica, BookingReplica
 
 __all__ = [
     "TourTemplate", "TourCategory", "DifficultyLevel",
     "TourInstance", "TourStatus",
     "ItineraryItem", "ActivityType",
-    "Incident", "IncidentType", "SeverityLevel"
+    "Incident", "IncidentType", "SeverityLevel",
+    "TourSchedule", "AvailabilitySlot",
+    "CustomerReplica", "BookingReplica"
 ]
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Availability slot model for bookable seats on a scheduled departure
+"""
+from sqlmodel import SQLModel, Field, Relationship
+from typing import Optional
+from datetime import datetime, date
+import uuid
+
+
+class AvailabilitySlot(SQLModel, table=True):
+    """Seats offered on one scheduled departure"""
+    __tablename__ = "availability_slots"
+    
+    id: Optional[uuid.UUID] = Field(
+        default_factory=uuid.uuid4, primary_key=True
+    )
+    
+    # Foreign Keys
+    schedule_id: uuid.UUID = Field(foreign_key="tour_schedules.id", index=True)
+    template_id: uuid.UUID = Field(foreign_key="tour_templates.id", index=True)
+    tour_instance_id: uuid.UUID = Field(foreign_key="tour_instances.id", unique=True)
+    
+    # Departure
+    start_date: date = Field(index=True)
+    end_date: date
+    
+    # Capacity
+    capacity: int = Field(ge=0)
+    booked_count: int = Field(default=0, ge=0)
+    is_open: bool = Field(default=True, index=True)
+    
+    # Timestamps
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = Field(default=None)
+    
+    # Relationships
+    schedule: Optional["TourSchedule"] = Relationship(back_populates="availability_slots")
+    
+    @property
+    def remaining(self) -> int:
+        """Seats still available"""
+        return max(self.capacity - self.booked_count, 0)
@@ -0,0 +1,39 @@
+"""
+Local read models of other services, kept current from the change feed
+"""
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime, date
+import uuid
+
+
+class CustomerReplica(SQLModel, table=True):
+    """Summary of a CRM customer, replicated from ``changes:customers``"""
+    __tablename__ = "customer_replicas"
+    
+    id: uuid.UUID = Field(primary_key=True)
+    full_name: Optional[str] = Field(default=None, max_length=255)
+    company_name: Optional[str] = Field(default=None, max_length=255)
+    email: Optional[str] = Field(default=None, max_length=255)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    preferred_language: Optional[str] = Field(default=None, max_length=50)
+    is_active: bool = Field(default=True)
+    
+    # Source ``updated_at`` of the applied event, older events are skipped
+    version: datetime
+    synced_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class BookingReplica(SQLModel, table=True):
+    """Summary of a booking, replicated from ``changes:bookings``"""
+    __tablename__ = "booking_replicas"
+    
+    id: uuid.UUID = Field(primary_key=True)
+    customer_id: Optional[uuid.UUID] = Field(default=None, index=True)
+    status: Optional[str] = Field(default=None, max_length=50)
+    start_date: Optional[date] = Field(default=None)
+    end_date: Optional[date] = Field(default=None)
+    
+    # Source ``updated_at`` of the applied event, older events are skipped
+    version: datetime
+    synced_at: datetime = Field(default_factory=datetime.utcnow)
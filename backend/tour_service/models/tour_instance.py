@@ -28,8 +28,10 @@ class TourInstance(SQLModel, table=True):
     
     # Foreign Keys
     template_id: uuid.UUID = Field(foreign_key="tour_templates.id", index=True)
-    booking_id: uuid.UUID = Field(index=True)  # Reference to booking service
-    customer_id: uuid.UUID = Field(index=True)  # Reference to CRM service
+    # Scheduled departures are generated without a booking or customer
+    booking_id: Optional[uuid.UUID] = Field(default=None, index=True)  # Reference to booking service
+    customer_id: Optional[uuid.UUID] = Field(default=None, index=True)  # Reference to CRM service
+    schedule_id: Optional[uuid.UUID] = Field(default=None, foreign_key="tour_schedules.id", index=True)
     
     # Tour Details
     status: TourStatus = Field(default=TourStatus.PLANNED, index=True)
@@ -42,8 +44,8 @@ class TourInstance(SQLModel, table=True):
     actual_end_date: Optional[datetime] = Field(default=None)
     
     # Participants
-    participant_count: int = Field(ge=1)
-    lead_participant_name: str = Field(max_length=255)
+    participant_count: int = Field(ge=0)
+    lead_participant_name: Optional[str] = Field(default=None, max_length=255)
     participant_details: Optional[str] = Field(default=None)  # JSON string
     
     # Resource Assignment
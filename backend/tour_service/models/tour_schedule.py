@@ -0,0 +1,72 @@
+"""
+Tour schedule model for recurring departures of a template
+"""
+from sqlmodel import SQLModel, Field, Relationship
+from typing import Optional, List
+from datetime import datetime, date
+import uuid
+
+
+class TourSchedule(SQLModel, table=True):
+    """Recurring departure schedule expanded into tour instances
+    
+    ``weekdays`` holds a JSON list of ISO weekdays (1 = Monday .. 7 = Sunday)
+    and ``excluded_dates`` a JSON list of ISO dates skipped by the rule.
+    """
+    __tablename__ = "tour_schedules"
+    
+    id: Optional[uuid.UUID] = Field(
+        default_factory=uuid.uuid4, primary_key=True
+    )
+    
+    # Foreign Keys
+    template_id: uuid.UUID = Field(foreign_key="tour_templates.id", index=True)
+    
+    # Recurrence Rule
+    name: str = Field(max_length=255)
+    start_date: date = Field(index=True)
+    end_date: date = Field(index=True)
+    weekdays: str = Field(max_length=50)  # JSON list of ISO weekdays
+    excluded_dates: Optional[str] = Field(default=None)  # JSON list of ISO dates
+    
+    # Departure Configuration
+    language: str = Field(default="French", max_length=50)
+    capacity: int = Field(ge=1)
+    departures_count: int = Field(default=0, ge=0)
+    
+    # Timestamps
+    created_by: Optional[uuid.UUID] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    # Relationships
+    availability_slots: List["AvailabilitySlot"] = Relationship(back_populates="schedule")
+    
+    def get_weekdays_list(self) -> List[int]:
+        """Parse weekdays from JSON string"""
+        try:
+            import json
+            return json.loads(self.weekdays)
+        except:
+            return []
+    
+    def set_weekdays_list(self, weekdays: List[int]):
+        """Set weekdays as JSON string"""
+        import json
+        self.weekdays = json.dumps(sorted(set(weekdays)))
+    
+    def get_excluded_dates_list(self) -> List[date]:
+        """Parse excluded dates from JSON string"""
+        if not self.excluded_dates:
+            return []
+        try:
+            import json
+            return [date.fromisoformat(value) for value in json.loads(self.excluded_dates)]
+        except:
+            return []
+    
+    def set_excluded_dates_list(self, excluded_dates: List[date]):
+        """Set excluded dates as JSON string"""
+        import json
+        self.excluded_dates = json.dumps(
+            sorted({value.isoformat() for value in excluded_dates})
+        ) if excluded_dates else None
@@ -26,8 +26,25 @@ class DifficultyLevel(str, Enum):
     EXPERT = "Expert"
 
 
+# PostgreSQL text search configuration per template language; others use "simple"
+SEARCH_CONFIGS = {
+    "french": "french",
+    "fr": "french",
+    "english": "english",
+    "en": "english",
+    "arabic": "arabic",
+    "ar": "arabic"
+}
+
+
 class TourTemplate(SQLModel, table=True):
-    """Tour template model for reusable tour definitions"""
+    """Tour template model for reusable tour definitions
+    
+    On PostgreSQL the table also carries a ``search_vector`` tsvector column,
+    maintained by trigger in the template's language (see
+    ``database.ensure_tour_search_vector``). It is not mapped here so the ORM
+    never loads it.
+    """
     __tablename__ = "tour_templates"
     
     id: Optional[uuid.UUID] = Field(
@@ -83,9 +100,12 @@ class TourTemplate(SQLModel, table=True):
             return []
     
     def set_highlights_list(self, highlights: List[str]):
-        """Set highlights as JSON string"""
+        """Set highlights as JSON string
+        
+        Stored unescaped so search matches accented and non-Latin text.
+        """
         import json
-        self.highlights = json.dumps(highlights) if highlights else None
+        self.highlights = json.dumps(highlights, ensure_ascii=False) if highlights else None
     
     def get_inclusions_list(self) -> List[str]:
         """Parse inclusions from JSON string"""
@@ -5,5 +5,6 @@ from .tour_templates import router as tour_templates_router
 from .tour_instances import router as tour_instances_router
 from .itinerary import router as itinerary_router
 from .incidents import router as incidents_router
+from .tour_schedules import router as tour_schedules_router
 
-__all__ = ["tour_templates_router", "tour_instances_router", "itinerary_router", "incidents_router"]
\ No newline at end of file
+__all__ = ["tour_templates_router", "tour_instances_router", "itinerary_router", "incidents_router", "tour_schedules_router"]
\ No newline at end of file
@@ -108,7 +108,8 @@ async def get_incidents(
         items=incidents,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -238,4 +239,5 @@ async def get_tour_incidents(
         total=total,
         page=pagination.page,
         size=pagination.size,
+        next_cursor=pagination.next_cursor,
     )
@@ -83,7 +83,8 @@ async def get_tour_instances(
         items=instances,
         total=total,
         page=pagination.page,
-        size=pagination.size
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
     )
 
 
@@ -0,0 +1,88 @@
+"""
+Tour schedule management routes
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from database import get_session, get_redis
+from services.tour_schedule_service import TourScheduleService
+from schemas.tour_schedule import TourScheduleCreate, TourScheduleResponse, AvailabilitySlotResponse
+from utils.auth import require_permission, CurrentUser
+from utils.pagination import PaginationParams, PaginatedResponse
+from typing import Optional
+from datetime import date
+import redis
+import uuid
+
+
+router = APIRouter(prefix="/tour-schedules", tags=["Tour Schedules"])
+
+
+@router.post("/", response_model=TourScheduleResponse)
+async def create_tour_schedule(
+    schedule_data: TourScheduleCreate,
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("tours", "create", "instances"))
+):
+    """Generate a season of departures from a template and a weekly recurrence rule"""
+    schedule_service = TourScheduleService(session, redis_client)
+    return await schedule_service.create_schedule(schedule_data, created_by=current_user.user_id)
+
+
+@router.get("/", response_model=PaginatedResponse[TourScheduleResponse])
+async def get_tour_schedules(
+    pagination: PaginationParams = Depends(),
+    template_id: Optional[uuid.UUID] = Query(None, description="Filter by template ID"),
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("tours", "read", "instances"))
+):
+    """Get list of tour schedules"""
+    schedule_service = TourScheduleService(session, redis_client)
+    schedules, total = await schedule_service.get_schedules(pagination, template_id)
+    
+    return PaginatedResponse.create(
+        items=schedules,
+        total=total,
+        page=pagination.page,
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
+    )
+
+
+@router.get("/{schedule_id}", response_model=TourScheduleResponse)
+async def get_tour_schedule(
+    schedule_id: uuid.UUID,
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("tours", "read", "instances"))
+):
+    """Get tour schedule by ID"""
+    schedule_service = TourScheduleService(session, redis_client)
+    return await schedule_service.get_schedule(schedule_id)
+
+
+@router.get("/{schedule_id}/availability", response_model=PaginatedResponse[AvailabilitySlotResponse])
+async def get_tour_schedule_availability(
+    schedule_id: uuid.UUID,
+    pagination: PaginationParams = Depends(),
+    date_from: Optional[date] = Query(None, description="Departures from this date"),
+    date_to: Optional[date] = Query(None, description="Departures up to this date"),
+    open_only: bool = Query(False, description="Only departures with seats left"),
+    session: Session = Depends(get_session),
+    redis_client: redis.Redis = Depends(get_redis),
+    current_user: CurrentUser = Depends(require_permission("tours", "read", "instances"))
+):
+    """Get the availability slots of a schedule's departures"""
+    schedule_service = TourScheduleService(session, redis_client)
+    slots, total = await schedule_service.get_availability(
+        schedule_id, pagination, date_from, date_to, open_only
+    )
+    
+    return PaginatedResponse.create(
+        items=slots,
+        total=total,
+        page=pagination.page,
+        size=pagination.size,
+        next_cursor=pagination.next_cursor
+    )
@@ -11,6 +11,7 @@ from schemas.tour_template import (
     TourTemplateUpdate,
     TourTemplateResponse,
     TourTemplateSearch,
+    TourTemplateSearchResult,
 )
 from models.tour_template import TourCategory, DifficultyLevel
 from utils.auth import require_permission, CurrentUser
@@ -108,9 +109,56 @@ async def get_tour_templates(
         total=total,
         page=pagination.page,
         size=pagination.size,
+        next_cursor=pagination.next_cursor,
     )
 
 
+@router.get("/search", response_model=TourTemplateSearchResult)
+async def search_tour_templates(
+    query: str = Query(..., min_length=1, description="Full-text search query"),
+    pagination: PaginationParams = Depends(),
+    category: Optional[TourCategory] = Query(
+        None, description="Filter by category",
+    ),
+    difficulty_level: Optional[DifficultyLevel] = Query(
+        None, description="Filter by difficulty"
+    ),
+    region: Optional[str] = Query(None, description="Filter by region"),
+    min_duration: Optional[int] = Query(
+        None, description="Minimum duration in days",
+    ),
+    max_duration: Optional[int] = Query(
+        None, description="Maximum duration in days"
+    ),
+    min_participants: Optional[int] = Query(
+        None, description="Minimum participants",
+    ),
+    max_participants: Optional[int] = Query(
+        None, description="Maximum participants",
+    ),
+    session: Session = Depends(get_session),
+    current_user: CurrentUser = Depends(
+        require_permission("tours", "read", "templates")
+    ),
+):
+    """Search the active tour catalog by relevance, with facet counts"""
+    template_service = TourTemplateService(session)
+
+    search = TourTemplateSearch(
+        query=query,
+        category=category,
+        difficulty_level=difficulty_level,
+        region=region,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        min_participants=min_participants,
+        max_participants=max_participants,
+        is_active=True,
+    )
+
+    return await template_service.search_templates(pagination, search)
+
+
 @router.get("/featured", response_model=List[TourTemplateResponse])
 async def get_featured_templates(
     limit: int = Query(
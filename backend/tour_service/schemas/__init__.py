@@ -5,10 +5,13 @@ from .tour_template import *
 from .tour_instance import *
 from .itinerary_item import *
 from .incident import *
+from .tour_schedule import *
 
 __all__ = [
     "TourTemplateCreate", "TourTemplateUpdate", "TourTemplateResponse",
+    "TourTemplateSearch", "TourTemplateFacets", "TourTemplateSearchResult",
     "TourInstanceCreate", "TourInstanceUpdate", "TourInstanceResponse", "TourInstanceSummary",
     "ItineraryItemCreate", "ItineraryItemUpdate", "ItineraryItemResponse",
-    "IncidentCreate", "IncidentUpdate", "IncidentResponse", "IncidentStats"
+    "IncidentCreate", "IncidentUpdate", "IncidentResponse", "IncidentStats",
+    "TourScheduleCreate", "TourScheduleResponse", "AvailabilitySlotResponse"
 ]
\ No newline at end of file
@@ -10,18 +10,21 @@ import uuid
 
 class TourInstanceBase(BaseModel):
     template_id: uuid.UUID
-    booking_id: uuid.UUID
-    customer_id: uuid.UUID
+    booking_id: Optional[uuid.UUID] = None
+    customer_id: Optional[uuid.UUID] = None
     title: str
     start_date: date
     end_date: date
     participant_count: int
-    lead_participant_name: str
+    lead_participant_name: Optional[str] = None
     language: str = "French"
     special_requirements: Optional[str] = None
 
 
 class TourInstanceCreate(TourInstanceBase):
+    booking_id: uuid.UUID
+    customer_id: uuid.UUID
+    lead_participant_name: str
     participant_details: Optional[Dict[str, Any]] = None
     
     @validator('end_date')
@@ -53,6 +56,7 @@ class TourInstanceUpdate(BaseModel):
 
 class TourInstanceResponse(TourInstanceBase):
     id: uuid.UUID
+    schedule_id: Optional[uuid.UUID] = None
     status: TourStatus
     actual_start_date: Optional[datetime]
     actual_end_date: Optional[datetime]
@@ -72,6 +76,7 @@ class TourInstanceResponse(TourInstanceBase):
         """Create response from database model"""
         return cls(
             id=instance.id,
+            schedule_id=instance.schedule_id,
             template_id=instance.template_id,
             booking_id=instance.booking_id,
             customer_id=instance.customer_id,
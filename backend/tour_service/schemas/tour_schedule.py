@@ -0,0 +1,111 @@
+"""
+Tour schedule-related Pydantic schemas
+"""
+from pydantic import BaseModel, validator
+from typing import Optional, List
+from datetime import datetime, date
+from schemas.itinerary_item import ItineraryItemBase
+import uuid
+
+
+class TourScheduleBase(BaseModel):
+    template_id: uuid.UUID
+    name: Optional[str] = None
+    start_date: date
+    end_date: date
+    weekdays: List[int]  # ISO weekdays, 1 = Monday .. 7 = Sunday
+    excluded_dates: List[date] = []
+    language: Optional[str] = None
+    capacity: Optional[int] = None
+
+
+class TourScheduleCreate(TourScheduleBase):
+    """Recurrence rule and itinerary skeleton for a season of departures
+    
+    ``itinerary`` is copied onto every departure. When empty, the itinerary
+    of ``itinerary_source_instance_id`` is copied instead, and without
+    either each departure gets a meeting point and departure skeleton from
+    the template locations.
+    """
+    title: Optional[str] = None
+    itinerary: List[ItineraryItemBase] = []
+    itinerary_source_instance_id: Optional[uuid.UUID] = None
+    
+    @validator('end_date')
+    def validate_end_date(cls, v, values):
+        if 'start_date' in values and v < values['start_date']:
+            raise ValueError('End date must be after start date')
+        return v
+    
+    @validator('weekdays')
+    def validate_weekdays(cls, v):
+        if not v:
+            raise ValueError('At least one weekday is required')
+        if any(day < 1 or day > 7 for day in v):
+            raise ValueError('Weekdays must be between 1 (Monday) and 7 (Sunday)')
+        return sorted(set(v))
+    
+    @validator('capacity')
+    def validate_capacity(cls, v):
+        if v is not None and v < 1:
+            raise ValueError('Capacity must be at least 1')
+        return v
+
+
+class TourScheduleResponse(TourScheduleBase):
+    id: uuid.UUID
+    name: str
+    language: str
+    capacity: int
+    departures_count: int
+    itinerary_items_count: int = 0
+    created_by: Optional[uuid.UUID]
+    created_at: datetime
+    
+    @classmethod
+    def from_model(cls, schedule, itinerary_items_count: int = 0):
+        """Create response from database model"""
+        return cls(
+            id=schedule.id,
+            template_id=schedule.template_id,
+            name=schedule.name,
+            start_date=schedule.start_date,
+            end_date=schedule.end_date,
+            weekdays=schedule.get_weekdays_list(),
+            excluded_dates=schedule.get_excluded_dates_list(),
+            language=schedule.language,
+            capacity=schedule.capacity,
+            departures_count=schedule.departures_count,
+            itinerary_items_count=itinerary_items_count,
+            created_by=schedule.created_by,
+            created_at=schedule.created_at
+        )
+
+
+class AvailabilitySlotResponse(BaseModel):
+    id: uuid.UUID
+    schedule_id: uuid.UUID
+    template_id: uuid.UUID
+    tour_instance_id: uuid.UUID
+    start_date: date
+    end_date: date
+    capacity: int
+    booked_count: int
+    remaining: int
+    is_open: bool
+    
+    @classmethod
+    def from_model(cls, slot):
+        """Create response from database model"""
+        return cls(
+            id=slot.id,
+            schedule_id=slot.schedule_id,
+            template_id=slot.template_id,
+            tour_instance_id=slot.tour_instance_id,
+            start_date=slot.start_date,
+            end_date=slot.end_date,
+            capacity=slot.capacity,
+            booked_count=slot.booked_count,
+            remaining=slot.remaining,
+            is_open=slot.is_open
+        )
@@ -2,7 +2,7 @@
 Tour template-related Pydantic schemas
 """
 from pydantic import BaseModel, validator
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from models.tour_template import TourCategory, DifficultyLevel
 import uuid
@@ -115,4 +115,20 @@ class TourTemplateSearch(BaseModel):
     min_participants: Optional[int] = None
     max_participants: Optional[int] = None
     is_active: Optional[bool] = True
-    is_featured: Optional[bool] = None
\ No newline at end of file
+    is_featured: Optional[bool] = None
+
+class TourTemplateFacets(BaseModel):
+    """Match counts per filter value for a tour template search"""
+    category: Dict[str, int] = {}
+    difficulty_level: Dict[str, int] = {}
+    region: Dict[str, int] = {}
+
+
+class TourTemplateSearchResult(BaseModel):
+    """Relevance-ranked page of tour templates with facet counts"""
+    items: List[TourTemplateResponse]
+    total: int
+    page: int
+    size: int
+    pages: int
+    facets: TourTemplateFacets
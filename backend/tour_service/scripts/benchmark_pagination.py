@@ -0,0 +1,114 @@
+"""
+Deep-page benchmark for list endpoint pagination.
+
+Seeds incidents into an in-memory SQLite database and times fetching
+page 1 and a deep page of the newest-first incident listing, once with
+page/size (OFFSET plus a total count) and once by following next_cursor
+(keyset seek, no count). Offset cost grows with the page number; cursor
+cost stays flat.
+
+Run inside the container:
+    docker compose exec tour_service python -m scripts.benchmark_pagination
+
+Options:
+    --rows 100000       incidents to seed
+    --size 20           page size
+    --page 1000         deep page to compare against page 1
+    --repeat 20         timed fetches per case (the median is reported)
+"""
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+from models.incident import Incident, IncidentType, SeverityLevel
+from utils.pagination import PaginationParams, paginate_query
+from datetime import datetime, timedelta
+import statistics
+import time
+import uuid
+
+
+def _seed(session: Session, rows: int) -> None:
+    tour_instance_id = uuid.uuid4()
+    started = datetime(2024, 1, 1)
+    session.exec(insert(Incident), params=[
+        {
+            "id": uuid.uuid4(),
+            "tour_instance_id": tour_instance_id,
+            "reporter_id": tour_instance_id,
+            "incident_type": IncidentType.DELAY,
+            "severity": SeverityLevel.LOW,
+            "title": f"Incident {i}",
+            "description": "Seeded for the pagination benchmark",
+            "is_resolved": False,
+            "requires_follow_up": False,
+            # A few rows share each timestamp so the id tie-breaker is used
+            "reported_at": started + timedelta(seconds=i // 3),
+            "created_at": started
+        }
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def _time(session: Session, query, params: dict, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        pagination = PaginationParams(**params)
+        started = time.perf_counter()
+        paginate_query(session, query, pagination)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def _cursor_for_page(session: Session, query, size: int, page: int):
+    """Cursor a client holds after reading ``page - 1`` pages"""
+    if page == 1:
+        return None
+    pagination = PaginationParams(page=page - 1, size=size, cursor=None, include_total=False)
+    paginate_query(session, query, pagination)
+    return pagination.next_cursor
+
+
+def run(rows: int, size: int, page: int, repeat: int) -> None:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine, tables=[Incident.__table__])
+    query = select(Incident).order_by(Incident.reported_at.desc())
+    
+    with Session(engine) as session:
+        _seed(session, rows)
+        
+        print(f"rows:     {rows} incidents, page size {size}, median of {repeat}")
+        print(f"{'':10}{'page 1':>12}{f'page {page}':>14}")
+        
+        offset = [
+            _time(session, query, {"page": p, "size": size, "cursor": None, "include_total": None}, repeat)
+            for p in (1, page)
+        ]
+        print(f"{'offset':10}{offset[0] * 1000:>10.2f}ms{offset[1] * 1000:>12.2f}ms")
+        
+        offset_no_total = [
+            _time(session, query, {"page": p, "size": size, "cursor": None, "include_total": False}, repeat)
+            for p in (1, page)
+        ]
+        print(f"{'  no total':10}{offset_no_total[0] * 1000:>10.2f}ms{offset_no_total[1] * 1000:>12.2f}ms")
+        
+        cursor = [
+            _time(session, query, {"page": 1, "size": size, "cursor": _cursor_for_page(session, query, size, p), "include_total": None}, repeat)
+            for p in (1, page)
+        ]
+        print(f"{'cursor':10}{cursor[0] * 1000:>10.2f}ms{cursor[1] * 1000:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Benchmark offset vs cursor pagination")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    
+    run(args.rows, args.size, args.page, args.repeat)
@@ -5,5 +5,6 @@ from .tour_template_service import TourTemplateService
 from .tour_instance_service import TourInstanceService
 from .itinerary_service import ItineraryService
 from .incident_service import IncidentService
+from .tour_schedule_service import TourScheduleService
 
-__all__ = ["TourTemplateService", "TourInstanceService", "ItineraryService", "IncidentService"]
\ No newline at end of file
+__all__ = ["TourTemplateService", "TourInstanceService", "ItineraryService", "IncidentService", "TourScheduleService"]
\ No newline at end of file
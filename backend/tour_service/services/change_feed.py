@@ -0,0 +1,193 @@
+"""
+Change feed consumer keeping local read models of other services
+"""
+from sqlmodel import Session, SQLModel
+from sqlalchemy.exc import DataError, IntegrityError
+from models.replica import CustomerReplica, BookingReplica
+from database import engine, async_change_feed_redis
+from config import settings
+from typing import Any, Dict, Optional, Type
+from datetime import datetime
+import asyncio
+import json
+import socket
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Failures caused by the entry itself; anything else (Redis or the database
+# being unreachable) aborts the batch, which stays pending and is never dropped
+ENTRY_ERRORS = (KeyError, TypeError, ValueError, DataError, IntegrityError)
+
+# Streams this service follows and the replica table each one feeds
+REPLICATED_STREAMS: Dict[str, Type[SQLModel]] = {
+    "changes:customers": CustomerReplica,
+    "changes:bookings": BookingReplica,
+}
+
+
+class ChangeFeedConsumer:
+    """Background task applying change events to the replica tables
+    
+    The service reads through a consumer group, so replicas of this service
+    share the work and an event is acknowledged only once it is written. On
+    start the consumer first re-reads its own unacknowledged entries, which
+    covers a crash between the write and the ack. Each replica row keeps
+    the source version it was built from and older events are skipped, so
+    redelivery and reordering never roll a row back.
+    
+    Entries are applied one at a time. An entry that fails on its own stays
+    pending and is retried on the next pass while the rest of the batch and
+    newer entries go through; after ``max_deliveries`` deliveries it is
+    logged and acknowledged so it cannot hold replication back.
+    """
+    
+    def __init__(
+        self,
+        redis_client,
+        replicas: Dict[str, Type[SQLModel]],
+        group: str,
+        consumer: str,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        max_deliveries: int = 5,
+        engine=engine
+    ):
+        self.redis = redis_client
+        self.replicas = replicas
+        self.group = group
+        self.consumer = consumer
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.max_deliveries = max_deliveries
+        self.engine = engine
+        self.retry_pending = False
+        self._task: Optional[asyncio.Task] = None
+    
+    async def ensure_groups(self):
+        """Create the consumer group on every stream, reading from the start"""
+        for stream in self.replicas:
+            try:
+                await self.redis.xgroup_create(stream, self.group, id="0", mkstream=True)
+            except Exception as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+    
+    async def poll(self, pending: bool = False, block: Optional[int] = None) -> int:
+        """Read one batch, apply it and acknowledge it
+        
+        Args:
+            pending: Re-read this consumer's unacknowledged entries instead of new ones
+            block: Milliseconds to wait for new entries, ``None`` to return at once
+        
+        Returns:
+            Number of entries acknowledged
+        """
+        start_id = "0" if pending else ">"
+        response = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {stream: start_id for stream in self.replicas},
+            count=self.batch_size,
+            block=block
+        )
+        processed = 0
+        for stream, entries in response or []:
+            done = []
+            for entry_id, fields in entries:
+                try:
+                    await asyncio.to_thread(self._apply, self.replicas[stream], fields)
+                except ENTRY_ERRORS as e:
+                    deliveries = await self._deliveries(stream, entry_id)
+                    if deliveries < self.max_deliveries:
+                        logger.warning(f"Change feed entry {stream} {entry_id} failed, will retry: {str(e)}")
+                        self.retry_pending = True
+                        continue
+                    logger.error(
+                        f"Dropping change feed entry {stream} {entry_id} after {deliveries} "
+                        f"deliveries: {str(e)}; fields={fields}"
+                    )
+                done.append(entry_id)
+            if done:
+                await self.redis.xack(stream, self.group, *done)
+                processed += len(done)
+        return processed
+    
+    async def _deliveries(self, stream: str, entry_id: str) -> int:
+        """Get how many times an entry was delivered to the group"""
+        pending = await self.redis.xpending_range(stream, self.group, min=entry_id, max=entry_id, count=1)
+        return pending[0]["times_delivered"] if pending else 0
+    
+    def _apply(self, model: Type[SQLModel], fields: Dict[str, Any]):
+        """Upsert one event into a replica table"""
+        if not fields:
+            # Trimmed from the stream before it was acknowledged
+            return
+        entity_id = uuid.UUID(fields["id"])
+        version = datetime.fromisoformat(fields["version"])
+        with Session(self.engine) as session:
+            row = session.get(model, entity_id)
+            if row is not None and row.version >= version:
+                return
+            
+            incoming = model.model_validate({
+                **json.loads(fields["data"]),
+                "id": entity_id,
+                "version": version,
+                "synced_at": datetime.utcnow()
+            })
+            if row is None:
+                session.add(incoming)
+            else:
+                for field, value in incoming.model_dump().items():
+                    setattr(row, field, value)
+                session.add(row)
+            session.commit()
+    
+    async def _run(self):
+        recovered = False
+        while True:
+            try:
+                if not recovered:
+                    await self.ensure_groups()
+                    self.retry_pending = False
+                    while await self.poll(pending=True):
+                        pass
+                    recovered = True
+                await self.poll(block=self.block_ms)
+                if self.retry_pending:
+                    # Entries that failed on their own are re-read on the next pass
+                    recovered = False
+                    await asyncio.sleep(1)
+            except Exception as e:
+                logger.error(f"Change feed consumer failed: {str(e)}")
+                # The failed batch is still pending; re-read it before new entries
+                recovered = False
+                await asyncio.sleep(1)
+    
+    def start(self):
+        """Start the consumer task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the consumer task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+change_feed_consumer = ChangeFeedConsumer(
+    async_change_feed_redis,
+    REPLICATED_STREAMS,
+    group="tour_service",
+    consumer=socket.gethostname(),
+    batch_size=settings.change_feed_batch_size,
+    block_ms=settings.change_feed_block_ms,
+    max_deliveries=settings.change_feed_max_deliveries
+)
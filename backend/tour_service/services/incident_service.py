@@ -54,7 +54,6 @@ class IncidentService:
         
         # Send incident alert
         await send_incident_alert(
-            self.redis,
             incident.id,
             incident.tour_instance_id,
             incident.severity.value,
@@ -71,7 +70,6 @@ class IncidentService:
         
         # Send tour update
         await send_tour_update(
-            self.redis,
             incident.tour_instance_id,
             "incident_reported",
             {
@@ -195,7 +193,6 @@ class IncidentService:
         if incident_data.is_resolved is not None:
             status_text = "resolved" if incident_data.is_resolved else "reopened"
             await send_tour_update(
-                self.redis,
                 incident.tour_instance_id,
                 f"incident_{status_text}",
                 {
@@ -244,7 +241,6 @@ class IncidentService:
         
         # Send notification
         await send_tour_update(
-            self.redis,
             incident.tour_instance_id,
             "incident_resolved",
             {
@@ -300,7 +296,6 @@ class IncidentService:
         
         # Send escalation alert
         await send_incident_alert(
-            self.redis,
             incident.id,
             incident.tour_instance_id,
             "ESCALATED",
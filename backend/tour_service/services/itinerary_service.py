@@ -49,7 +49,6 @@ class ItineraryService:
         
         # Send notification
         await send_tour_update(
-            self.redis,
             item_data.tour_instance_id,
             "itinerary_item_added",
             {
@@ -172,7 +171,6 @@ class ItineraryService:
         
         # Send notification
         await send_tour_update(
-            self.redis,
             item.tour_instance_id,
             "itinerary_item_updated",
             {
@@ -234,7 +232,6 @@ class ItineraryService:
         
         # Send notification
         await send_tour_update(
-            self.redis,
             item.tour_instance_id,
             "itinerary_item_completed",
             {
@@ -274,7 +271,6 @@ class ItineraryService:
         
         # Send notification
         await send_tour_update(
-            self.redis,
             tour_instance_id,
             "itinerary_item_deleted",
             item_info
@@ -322,7 +318,6 @@ class ItineraryService:
         
         # Send notification
         await send_tour_update(
-            self.redis,
             tour_instance_id,
             "itinerary_reordered",
             {
@@ -7,12 +7,14 @@ from models.tour_instance import TourInstance, TourStatus
 from models.tour_template import TourTemplate
 from models.itinerary_item import ItineraryItem
 from models.incident import Incident
+from models.replica import CustomerReplica, BookingReplica
 from schemas.tour_instance import (
     TourInstanceCreate, TourInstanceUpdate, TourInstanceResponse, TourInstanceSummary,
     TourAssignment, TourStatusUpdate, TourProgressUpdate, TourInstanceSearch
 )
 from utils.pagination import PaginationParams, paginate_query
 from utils.notifications import send_tour_update
+from utils.events import publish_tour_instance_change
 from typing import List, Optional, Tuple
 from datetime import datetime
 import redis
@@ -69,10 +71,10 @@ class TourInstanceService:
         self.session.add(instance)
         self.session.commit()
         self.session.refresh(instance)
+        publish_tour_instance_change(instance)
         
         # Send notification
         await send_tour_update(
-            self.redis, 
             instance.id, 
             "created", 
             {"title": instance.title, "start_date": str(instance.start_date)}
@@ -177,10 +179,10 @@ class TourInstanceService:
         self.session.add(instance)
         self.session.commit()
         self.session.refresh(instance)
+        publish_tour_instance_change(instance)
         
         # Send notification
         await send_tour_update(
-            self.redis, 
             instance.id, 
             "updated", 
             {"fields_updated": list(update_data.keys())}
@@ -226,10 +228,10 @@ class TourInstanceService:
         self.session.add(instance)
         self.session.commit()
         self.session.refresh(instance)
+        publish_tour_instance_change(instance)
         
         # Send notification
         await send_tour_update(
-            self.redis, 
             instance.id, 
             "resources_assigned", 
             {
@@ -283,10 +285,10 @@ class TourInstanceService:
         self.session.add(instance)
         self.session.commit()
         self.session.refresh(instance)
+        publish_tour_instance_change(instance)
         
         # Send notification
         await send_tour_update(
-            self.redis, 
             instance.id, 
             "status_changed", 
             {
@@ -338,10 +340,10 @@ class TourInstanceService:
         self.session.add(instance)
         self.session.commit()
         self.session.refresh(instance)
+        publish_tour_instance_change(instance)
         
         # Send notification
         await send_tour_update(
-            self.redis, 
             instance.id, 
             "progress_updated", 
             {
@@ -376,8 +378,8 @@ class TourInstanceService:
         template_stmt = select(TourTemplate).where(TourTemplate.id == instance.template_id)
         template = self.session.exec(template_stmt).first()
         
-        # Get customer information from CRM service
-        customer_info = await self._get_customer_info(instance.customer_id)
+        # Get customer information from CRM service (scheduled departures have none)
+        customer_info = await self._get_customer_info(instance.customer_id) if instance.customer_id else None
         
         # Create summary response
         base_response = TourInstanceResponse.from_model(instance)
@@ -419,7 +421,9 @@ class TourInstanceService:
         return new_status in valid_transitions.get(current_status, [])
     
     async def _verify_booking_exists(self, booking_id: uuid.UUID) -> bool:
-        """Verify booking exists in booking service"""
+        """Verify booking exists, from the local replica or the booking service"""
+        if self.session.get(BookingReplica, booking_id) is not None:
+            return True
         try:
             from config import settings
             async with httpx.AsyncClient() as client:
@@ -434,7 +438,9 @@ class TourInstanceService:
             )
     
     async def _verify_customer_exists(self, customer_id: uuid.UUID) -> bool:
-        """Verify customer exists in CRM service"""
+        """Verify customer exists, from the local replica or the CRM service"""
+        if self.session.get(CustomerReplica, customer_id) is not None:
+            return True
         try:
             from config import settings
             async with httpx.AsyncClient() as client:
@@ -449,7 +455,10 @@ class TourInstanceService:
             )
     
     async def _get_customer_info(self, customer_id: uuid.UUID) -> Optional[dict]:
-        """Get customer information from CRM service"""
+        """Get customer information, from the local replica or the CRM service"""
+        replica = self.session.get(CustomerReplica, customer_id)
+        if replica is not None:
+            return replica.model_dump(exclude={"version", "synced_at"})
         try:
             from config import settings
             async with httpx.AsyncClient() as client:
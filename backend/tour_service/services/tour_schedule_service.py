@@ -0,0 +1,306 @@
+"""
+Tour schedule service for generating seasons of recurring departures
+"""
+from sqlmodel import Session, select, func
+from sqlalchemy import insert
+from fastapi import HTTPException, status
+from models.tour_template import TourTemplate
+from models.tour_instance import TourInstance, TourStatus
+from models.itinerary_item import ItineraryItem, ActivityType
+from models.tour_schedule import TourSchedule
+from models.availability_slot import AvailabilitySlot
+from schemas.tour_schedule import TourScheduleCreate, TourScheduleResponse, AvailabilitySlotResponse
+from utils.pagination import PaginationParams, paginate_query
+from utils.events import publish_tour_instance_changes
+from config import settings
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+import redis
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Execution and cancellation state is per departure, never copied
+ITINERARY_COPY_EXCLUDE = {
+    "id", "tour_instance_id", "is_completed", "completed_at", "completed_by",
+    "is_cancelled", "cancellation_reason", "created_at", "updated_at"
+}
+
+
+def expand_schedule_dates(
+    start_date: date,
+    end_date: date,
+    weekdays: List[int],
+    excluded_dates: Optional[List[date]] = None
+) -> List[date]:
+    """Departure dates between ``start_date`` and ``end_date`` on the given ISO weekdays"""
+    excluded = set(excluded_dates or [])
+    dates = []
+    for weekday in set(weekdays):
+        # First matching day on or after start_date, then every 7 days
+        current = start_date + timedelta(days=(weekday - start_date.isoweekday()) % 7)
+        while current <= end_date:
+            if current not in excluded:
+                dates.append(current)
+            current += timedelta(days=7)
+    return sorted(dates)
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class TourScheduleService:
+    """Service for expanding templates into scheduled departures"""
+    
+    def __init__(self, session: Session, redis_client: redis.Redis):
+        self.session = session
+        self.redis = redis_client
+    
+    async def create_schedule(
+        self,
+        schedule_data: TourScheduleCreate,
+        created_by: Optional[uuid.UUID] = None
+    ) -> TourScheduleResponse:
+        """Generate a season of departures with their itinerary and availability
+        
+        Instances, itinerary items and availability slots are bulk-inserted in
+        chunks within one transaction, so either the whole season is created
+        or nothing is.
+        """
+        template = self.session.get(TourTemplate, schedule_data.template_id)
+        
+        if not template:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tour template not found"
+            )
+        
+        if not template.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot create instance from inactive template"
+            )
+        
+        capacity = schedule_data.capacity or template.max_participants
+        if capacity < template.min_participants or capacity > template.max_participants:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Capacity must be between {template.min_participants} and {template.max_participants}"
+            )
+        
+        departures = expand_schedule_dates(
+            schedule_data.start_date,
+            schedule_data.end_date,
+            schedule_data.weekdays,
+            schedule_data.excluded_dates
+        )
+        if not departures:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Recurrence rule does not produce any departure"
+            )
+        if len(departures) > settings.schedule_max_departures:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Schedule cannot exceed {settings.schedule_max_departures} departures"
+            )
+        
+        itinerary = self._itinerary_skeleton(template, schedule_data)
+        
+        schedule = TourSchedule(
+            template_id=template.id,
+            name=schedule_data.name or f"{template.title} {schedule_data.start_date} - {schedule_data.end_date}",
+            start_date=schedule_data.start_date,
+            end_date=schedule_data.end_date,
+            language=schedule_data.language or template.default_language,
+            capacity=capacity,
+            departures_count=len(departures),
+            created_by=created_by
+        )
+        schedule.set_weekdays_list(schedule_data.weekdays)
+        schedule.set_excluded_dates_list(schedule_data.excluded_dates)
+        
+        now = datetime.utcnow()
+        instances = [
+            TourInstance(
+                template_id=template.id,
+                schedule_id=schedule.id,
+                status=TourStatus.PLANNED,
+                title=schedule_data.title or template.title,
+                start_date=departure,
+                end_date=departure + timedelta(days=template.duration_days - 1),
+                participant_count=0,
+                language=schedule.language,
+                created_at=now
+            )
+            for departure in departures
+        ]
+        item_rows = [
+            {**item, "id": uuid.uuid4(), "tour_instance_id": instance.id, "created_at": now}
+            for instance in instances
+            for item in itinerary
+        ]
+        slot_rows = [
+            {
+                "id": uuid.uuid4(),
+                "schedule_id": schedule.id,
+                "template_id": template.id,
+                "tour_instance_id": instance.id,
+                "start_date": instance.start_date,
+                "end_date": instance.end_date,
+                "capacity": capacity,
+                "booked_count": 0,
+                "is_open": True,
+                "created_at": now
+            }
+            for instance in instances
+        ]
+        
+        try:
+            self.session.add(schedule)
+            self.session.flush()
+            self._bulk_insert(TourInstance, [instance.model_dump() for instance in instances])
+            self._bulk_insert(ItineraryItem, item_rows)
+            self._bulk_insert(AvailabilitySlot, slot_rows)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        
+        self.session.refresh(schedule)
+        publish_tour_instance_changes(instances)
+        logger.info(
+            f"Generated schedule {schedule.id}: {len(instances)} departures, "
+            f"{len(item_rows)} itinerary items"
+        )
+        
+        return TourScheduleResponse.from_model(schedule, itinerary_items_count=len(item_rows))
+    
+    async def get_schedule(self, schedule_id: uuid.UUID) -> TourScheduleResponse:
+        """Get tour schedule by ID"""
+        schedule = self.session.get(TourSchedule, schedule_id)
+        
+        if not schedule:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tour schedule not found"
+            )
+        
+        items_count = self.session.exec(
+            select(func.count(ItineraryItem.id))
+            .join(TourInstance, TourInstance.id == ItineraryItem.tour_instance_id)
+            .where(TourInstance.schedule_id == schedule_id)
+        ).one()
+        
+        return TourScheduleResponse.from_model(schedule, itinerary_items_count=items_count)
+    
+    async def get_schedules(
+        self,
+        pagination: PaginationParams,
+        template_id: Optional[uuid.UUID] = None
+    ) -> Tuple[List[TourScheduleResponse], Optional[int]]:
+        """Get list of tour schedules"""
+        query = select(TourSchedule)
+        
+        if template_id:
+            query = query.where(TourSchedule.template_id == template_id)
+        
+        query = query.order_by(TourSchedule.created_at.desc())
+        
+        schedules, total = paginate_query(self.session, query, pagination)
+        
+        return [TourScheduleResponse.from_model(schedule) for schedule in schedules], total
+    
+    async def get_availability(
+        self,
+        schedule_id: uuid.UUID,
+        pagination: PaginationParams,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        open_only: bool = False
+    ) -> Tuple[List[AvailabilitySlotResponse], Optional[int]]:
+        """Get the availability slots of a schedule in departure order"""
+        if not self.session.get(TourSchedule, schedule_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tour schedule not found"
+            )
+        
+        query = select(AvailabilitySlot).where(AvailabilitySlot.schedule_id == schedule_id)
+        
+        if date_from:
+            query = query.where(AvailabilitySlot.start_date >= date_from)
+        
+        if date_to:
+            query = query.where(AvailabilitySlot.start_date <= date_to)
+        
+        if open_only:
+            query = query.where(
+                AvailabilitySlot.is_open == True,
+                AvailabilitySlot.booked_count < AvailabilitySlot.capacity
+            )
+        
+        query = query.order_by(AvailabilitySlot.start_date)
+        
+        slots, total = paginate_query(self.session, query, pagination)
+        
+        return [AvailabilitySlotResponse.from_model(slot) for slot in slots], total
+    
+    def _bulk_insert(self, model, rows: List[Dict[str, Any]]):
+        """Insert rows with one multi-row INSERT per chunk"""
+        for chunk in _chunks(rows, settings.schedule_insert_chunk_size):
+            self.session.execute(insert(model), chunk)
+    
+    def _itinerary_skeleton(self, template: TourTemplate, schedule_data: TourScheduleCreate) -> List[Dict[str, Any]]:
+        """Itinerary item fields copied onto every departure"""
+        if schedule_data.itinerary:
+            items = [item.model_dump() for item in schedule_data.itinerary]
+        elif schedule_data.itinerary_source_instance_id:
+            source_items = self.session.exec(
+                select(ItineraryItem)
+                .where(ItineraryItem.tour_instance_id == schedule_data.itinerary_source_instance_id)
+                .where(ItineraryItem.is_cancelled == False)
+                .order_by(ItineraryItem.day_number, ItineraryItem.start_time)
+            ).all()
+            if not source_items:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Source tour instance has no itinerary to copy"
+                )
+            items = [item.model_dump(exclude=ITINERARY_COPY_EXCLUDE) for item in source_items]
+        else:
+            items = [{
+                "day_number": 1,
+                "activity_type": ActivityType.MEETING_POINT,
+                "title": "Meeting point",
+                "location_name": template.starting_location
+            }]
+            items.extend(
+                {"day_number": day, "activity_type": ActivityType.ACTIVITY, "title": f"Day {day}"}
+                for day in range(1, template.duration_days + 1)
+            )
+            items.append({
+                "day_number": template.duration_days,
+                "activity_type": ActivityType.DEPARTURE,
+                "title": "Departure",
+                "location_name": template.ending_location
+            })
+        
+        for item in items:
+            if item["day_number"] < 1 or item["day_number"] > template.duration_days:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Day number cannot exceed tour duration ({template.duration_days} days)"
+                )
+        
+        # Every row of one bulk INSERT needs the same columns
+        defaults = {
+            column.name: None
+            for column in ItineraryItem.__table__.columns
+            if column.name not in ITINERARY_COPY_EXCLUDE
+        }
+        defaults["is_mandatory"] = True
+        return [{**defaults, **item} for item in items]
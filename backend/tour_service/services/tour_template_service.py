@@ -1,17 +1,33 @@
 """
 Tour template service for managing reusable tour definitions
 """
-from sqlmodel import Session, select, and_, or_
+from sqlmodel import Session, select, and_, or_, func
+from sqlalchemy import String, cast, literal, literal_column, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
 from fastapi import HTTPException, status
-from models.tour_template import TourTemplate
+from models.tour_template import TourTemplate, TourCategory, DifficultyLevel, SEARCH_CONFIGS
 from schemas.tour_template import (
-    TourTemplateCreate, TourTemplateUpdate, TourTemplateResponse, TourTemplateSearch
+    TourTemplateCreate, TourTemplateUpdate, TourTemplateResponse, TourTemplateSearch,
+    TourTemplateFacets, TourTemplateSearchResult
 )
 from utils.pagination import PaginationParams, paginate_query
+from utils.search import fuzzy_search_condition, similarity_rank
 from typing import List, Optional, Tuple
 from datetime import datetime
+from functools import reduce
 import uuid
 
+# Maintained by trigger on PostgreSQL, see database.ensure_tour_search_vector
+SEARCH_VECTOR = literal_column("tour_templates.search_vector", type_=TSVECTOR)
+
+# Facet name -> grouped column, and the enums whose stored names map back to values
+FACET_COLUMNS = {
+    "category": "category",
+    "difficulty_level": "difficulty_level",
+    "region": "default_region"
+}
+FACET_ENUMS = {"category": TourCategory, "difficulty_level": DifficultyLevel}
+
 
 class TourTemplateService:
     """Service for handling tour template operations"""
@@ -67,21 +83,77 @@ class TourTemplateService:
         search: Optional[TourTemplateSearch] = None
     ) -> Tuple[List[TourTemplateResponse], int]:
         """Get list of tour templates with optional search"""
+        query, ranking = self._build_search_query(search)
+        
+        # Order by relevance when searching by text, then featured first, then by creation date
+        query = query.order_by(*ranking, TourTemplate.is_featured.desc(), TourTemplate.created_at.desc())
+        
+        templates, total = paginate_query(self.session, query, pagination)
+        
+        return [TourTemplateResponse.from_model(template) for template in templates], total
+    
+    async def search_templates(
+        self,
+        pagination: PaginationParams,
+        search: TourTemplateSearch
+    ) -> TourTemplateSearchResult:
+        """Relevance-ranked catalog search with facet counts
+        
+        The total and the category, difficulty and region counts are taken
+        from the same filtered query as the page, in one grouped statement.
+        """
+        query, ranking = self._build_search_query(search)
+        
+        page_query = query.order_by(
+            *ranking, TourTemplate.is_featured.desc(), TourTemplate.created_at.desc()
+        ).offset(pagination.offset).limit(pagination.size)
+        templates = self.session.exec(page_query).all()
+        
+        matched = query.with_only_columns(
+            TourTemplate.category, TourTemplate.difficulty_level, TourTemplate.default_region
+        ).subquery("matched")
+        facet_query = union_all(*(
+            select(
+                literal(facet).label("facet"),
+                cast(matched.c[column], String).label("value"),
+                func.count().label("count")
+            ).group_by(matched.c[column])
+            for facet, column in FACET_COLUMNS.items()
+        ))
+        
+        facets = TourTemplateFacets()
+        for facet, value, count in self.session.exec(facet_query).all():
+            enum = FACET_ENUMS.get(facet)
+            if enum and value in enum.__members__:
+                value = enum[value].value
+            getattr(facets, facet)[value] = count
+        total = sum(facets.category.values())
+        
+        return TourTemplateSearchResult(
+            items=[TourTemplateResponse.from_model(template) for template in templates],
+            total=total,
+            page=pagination.page,
+            size=pagination.size,
+            pages=(total + pagination.size - 1) // pagination.size,
+            facets=facets
+        )
+    
+    def _build_search_query(self, search: Optional[TourTemplateSearch]):
+        """Build the filtered template query and its relevance ordering
+        
+        Returns:
+            Tuple of (query, ranking order clauses)
+        """
         query = select(TourTemplate)
+        ranking = []
         
         # Apply search filters
         if search:
             conditions = []
             
             if search.query:
-                search_term = f"%{search.query}%"
-                conditions.append(
-                    or_(
-                        TourTemplate.title.ilike(search_term),
-                        TourTemplate.description.ilike(search_term),
-                        TourTemplate.short_description.ilike(search_term)
-                    )
-                )
+                condition, ranking = self._text_match(search.query)
+                conditions.append(condition)
             
             if search.category:
                 conditions.append(TourTemplate.category == search.category)
@@ -113,12 +185,42 @@ class TourTemplateService:
             if conditions:
                 query = query.where(and_(*conditions))
         
-        # Order by featured first, then by creation date
-        query = query.order_by(TourTemplate.is_featured.desc(), TourTemplate.created_at.desc())
+        return query, ranking
+    
+    def _text_match(self, term: str):
+        """Match free text against the catalog
+        
+        On PostgreSQL the weighted ``search_vector`` is queried in every
+        catalog language at once, ranked by ``ts_rank_cd``; trigram matching
+        still catches typos and partial words. Other backends use substring
+        matching only.
         
-        templates, total = paginate_query(self.session, query, pagination)
+        Returns:
+            Tuple of (condition, ranking order clauses)
+        """
+        search_columns = [
+            TourTemplate.title, TourTemplate.short_description,
+            TourTemplate.description, TourTemplate.highlights
+        ]
+        dialect_name = self.session.get_bind().dialect.name
+        fuzzy_match = fuzzy_search_condition(search_columns, term, dialect_name)
+        if dialect_name != "postgresql":
+            return fuzzy_match, []
         
-        return [TourTemplateResponse.from_model(template) for template in templates], total
+        ts_query = reduce(
+            lambda combined, language_query: combined.op("||")(language_query),
+            (
+                func.websearch_to_tsquery(cast(config, REGCONFIG), term)
+                for config in sorted(set(SEARCH_CONFIGS.values())) + ["simple"]
+            )
+        )
+        return (
+            or_(SEARCH_VECTOR.op("@@")(ts_query), fuzzy_match),
+            [
+                func.ts_rank_cd(SEARCH_VECTOR, ts_query).desc(),
+                similarity_rank(search_columns, term, dialect_name).desc()
+            ]
+        )
     
     async def update_template(self, template_id: uuid.UUID, template_data: TourTemplateUpdate) -> TourTemplateResponse:
         """Update tour template information"""
@@ -37,10 +37,34 @@ def session_fixture():
         pass
 
 
+@pytest.fixture(name="redis_server")
+def redis_server_fixture():
+    """Create fake Redis server shared by the sync and async clients"""
+    return fakeredis.FakeServer()
+
+
 @pytest.fixture(name="redis_client")
-def redis_client_fixture():
+def redis_client_fixture(redis_server):
     """Create fake Redis client for testing"""
-    return fakeredis.FakeRedis(decode_responses=True)
+    return fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+
+
+@pytest.fixture(autouse=True)
+def async_redis_client_fixture(redis_server, monkeypatch):
+    """Point the shared async notification client at the fake server"""
+    async_client = fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
+    monkeypatch.setattr("utils.notifications.async_redis_client", async_client)
+    return async_client
+
+
+@pytest.fixture(autouse=True)
+def change_feed_fixture(redis_server, monkeypatch):
+    """Publish change events to the fake server and keep the consumer task off"""
+    monkeypatch.setattr(
+        "utils.events.change_feed_redis",
+        fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+    )
+    monkeypatch.setattr("config.settings.change_feed_enabled", False)
 
 
 @pytest.fixture(name="client")
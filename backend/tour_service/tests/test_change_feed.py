@@ -0,0 +1,132 @@
+"""
+Tests for the change feed consumer and the local read models
+"""
+import pytest
+import asyncio
+from services.change_feed import ChangeFeedConsumer, REPLICATED_STREAMS
+from services.tour_instance_service import TourInstanceService
+from models.replica import CustomerReplica, BookingReplica
+from datetime import datetime, timedelta
+import fakeredis
+import json
+import uuid
+
+
+def _event(entity_id, version, **data):
+    return {"id": str(entity_id), "version": version.isoformat(), "data": json.dumps(data)}
+
+
+class TestChangeFeed:
+    """Test class for change feed replication"""
+    
+    @pytest.mark.asyncio
+    async def test_consumer_applies_newest_version(self, session, redis_server):
+        """Test events upsert replicas and older versions are skipped"""
+        redis = fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
+        consumer = ChangeFeedConsumer(
+            redis, REPLICATED_STREAMS, group="tour_service", consumer="test",
+            engine=session.get_bind()
+        )
+        await consumer.ensure_groups()
+        
+        customer_id = uuid.uuid4()
+        booking_id = uuid.uuid4()
+        now = datetime.utcnow()
+        await redis.xadd("changes:customers", _event(customer_id, now, full_name="Ahmed Hassan"))
+        await redis.xadd("changes:customers", _event(customer_id, now - timedelta(minutes=5), full_name="Stale"))
+        await redis.xadd("changes:bookings", _event(
+            booking_id, now, customer_id=str(customer_id), status="Confirmed",
+            start_date="2024-03-15", end_date="2024-03-17"
+        ))
+        
+        assert await consumer.poll() == 3
+        assert await redis.xpending("changes:customers", "tour_service") == {
+            "pending": 0, "min": None, "max": None, "consumers": []
+        }
+        
+        session.expire_all()
+        customer = session.get(CustomerReplica, customer_id)
+        assert customer.full_name == "Ahmed Hassan"
+        assert customer.version == now
+        booking = session.get(BookingReplica, booking_id)
+        assert booking.customer_id == customer_id
+        assert booking.status == "Confirmed"
+        
+        await redis.xadd("changes:customers", _event(
+            customer_id, now + timedelta(minutes=1), full_name="Ahmed Hassan", is_active=False
+        ))
+        assert await consumer.poll() == 1
+        session.expire_all()
+        assert session.get(CustomerReplica, customer_id).is_active is False
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_in_process(self, session, redis_server, monkeypatch):
+        """Test the consumer re-reads its pending entries after a failed batch"""
+        consumer = ChangeFeedConsumer(
+            fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True),
+            REPLICATED_STREAMS, group="tour_service", consumer="test",
+            engine=session.get_bind()
+        )
+        polls = []
+        
+        async def ensure_groups():
+            pass
+        
+        async def poll(pending=False, block=None):
+            polls.append(pending)
+            if len(polls) == 2:
+                raise RuntimeError("database unavailable")
+            if len(polls) == 4:
+                raise asyncio.CancelledError()
+            return 0
+        
+        monkeypatch.setattr(consumer, "ensure_groups", ensure_groups)
+        monkeypatch.setattr(consumer, "poll", poll)
+        
+        with pytest.raises(asyncio.CancelledError):
+            await consumer._run()
+        
+        # Recovery, a failing read, recovery again, then new entries
+        assert polls == [True, False, True, False]
+    
+    @pytest.mark.asyncio
+    async def test_failing_entry_does_not_block_the_feed(self, session, redis_server):
+        """Test a bad entry is retried, then dropped, while the others apply"""
+        redis = fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
+        consumer = ChangeFeedConsumer(
+            redis, REPLICATED_STREAMS, group="tour_service", consumer="test",
+            max_deliveries=2, engine=session.get_bind()
+        )
+        await consumer.ensure_groups()
+        
+        good_id = uuid.uuid4()
+        now = datetime.utcnow()
+        await redis.xadd("changes:customers", {"id": "not-a-uuid", "version": now.isoformat(), "data": "{}"})
+        await redis.xadd("changes:customers", _event(good_id, now, full_name="Ahmed Hassan"))
+        
+        assert await consumer.poll() == 1
+        assert consumer.retry_pending
+        session.expire_all()
+        assert session.get(CustomerReplica, good_id).full_name == "Ahmed Hassan"
+        assert (await redis.xpending("changes:customers", "tour_service"))["pending"] == 1
+        
+        # Second delivery reaches the limit and the entry is acknowledged
+        assert await consumer.poll(pending=True) == 1
+        assert (await redis.xpending("changes:customers", "tour_service"))["pending"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_lookups_use_replica(self, session, redis_client):
+        """Test replicated customers and bookings are resolved without HTTP"""
+        customer_id = uuid.uuid4()
+        booking_id = uuid.uuid4()
+        session.add(CustomerReplica(id=customer_id, full_name="Fatima Zahra", version=datetime.utcnow()))
+        session.add(BookingReplica(id=booking_id, customer_id=customer_id, version=datetime.utcnow()))
+        session.commit()
+        
+        service = TourInstanceService(session, redis_client)
+        
+        assert await service._verify_customer_exists(customer_id) is True
+        assert await service._verify_booking_exists(booking_id) is True
+        info = await service._get_customer_info(customer_id)
+        assert info["full_name"] == "Fatima Zahra"
+        assert "version" not in info
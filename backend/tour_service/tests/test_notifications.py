@@ -0,0 +1,38 @@
+"""
+Tests for real-time notification publishing
+"""
+import pytest
+from utils.notifications import NotificationService
+import uuid
+
+
+class TestNotifications:
+    """Test class for pipelined notification publishing"""
+    
+    @pytest.mark.asyncio
+    async def test_tour_update_is_stored(self, redis_client, async_redis_client_fixture):
+        """A tour update is published and kept for offline access"""
+        notification_service = NotificationService(async_redis_client_fixture)
+        tour_id = uuid.uuid4()
+        
+        await notification_service.send_tour_update(tour_id, "status_changed", {"new_status": "In Progress"})
+        
+        notifications = await notification_service.get_tour_notifications(tour_id)
+        assert [n["update_type"] for n in notifications] == ["status_changed"]
+        assert redis_client.ttl(f"notifications:tour:{tour_id}") > 0
+    
+    @pytest.mark.asyncio
+    async def test_batched_tour_updates(self, redis_client, async_redis_client_fixture):
+        """Many updates go out in one flush and each tour keeps its own history"""
+        notification_service = NotificationService(async_redis_client_fixture)
+        tour_ids = [uuid.uuid4() for _ in range(3)]
+        
+        await notification_service.send_tour_updates([
+            {"tour_id": tour_id, "update_type": "created", "data": {"index": i}}
+            for i, tour_id in enumerate(tour_ids)
+        ])
+        
+        for i, tour_id in enumerate(tour_ids):
+            history = redis_client.lrange(f"notifications:tour:{tour_id}", 0, -1)
+            assert len(history) == 1
+            assert f'"index": {i}' in history[0]
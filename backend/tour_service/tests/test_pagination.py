@@ -0,0 +1,86 @@
+"""
+Tests for offset and keyset (cursor) pagination
+"""
+import pytest
+from fastapi import HTTPException
+from sqlmodel import select
+from models.incident import Incident, SeverityLevel
+from utils.pagination import PaginationParams, paginate_query
+from datetime import datetime, timedelta
+
+
+class TestPagination:
+    """Test class for pagination utilities"""
+    
+    def _seed(self, create_test_tour_template, create_test_tour_instance, create_test_incident, count=7):
+        template = create_test_tour_template()
+        instance = create_test_tour_instance(template.id, lead_participant_name="Test Customer")
+        reported_at = datetime(2024, 3, 15, 9, 0)
+        for i in range(count):
+            # Pairs share a timestamp so the id tie-breaker is exercised
+            create_test_incident(
+                instance.id,
+                title=f"Incident {i}",
+                severity=SeverityLevel.HIGH if i % 2 else SeverityLevel.LOW,
+                reported_at=reported_at + timedelta(minutes=i // 2)
+            )
+    
+    def test_cursor_walk_matches_full_ordering(self, session, create_test_tour_template, create_test_tour_instance, create_test_incident):
+        """Test following next_cursor returns every row once, in order"""
+        self._seed(create_test_tour_template, create_test_tour_instance, create_test_incident)
+        query = select(Incident).order_by(Incident.reported_at.desc())
+        expected = [incident.id for incident in session.exec(query.order_by(Incident.id.desc())).all()]
+        
+        seen, cursor = [], None
+        while True:
+            pagination = PaginationParams(page=1, size=3, cursor=cursor, include_total=None)
+            items, total = paginate_query(session, query, pagination)
+            seen.extend(item.id for item in items)
+            assert total == (len(expected) if cursor is None else None)
+            cursor = pagination.next_cursor
+            if cursor is None:
+                break
+        
+        assert seen == expected
+    
+    def test_page_mode_unchanged(self, session, create_test_tour_template, create_test_tour_instance, create_test_incident):
+        """Test page/size still returns offset pages with a total"""
+        self._seed(create_test_tour_template, create_test_tour_instance, create_test_incident)
+        query = select(Incident).order_by(Incident.reported_at.desc())
+        
+        pagination = PaginationParams(page=3, size=3, cursor=None, include_total=None)
+        items, total = paginate_query(session, query, pagination)
+        
+        assert total == 7
+        assert len(items) == 1
+        assert pagination.next_cursor is None
+    
+    def test_invalid_cursor_rejected(self, session, create_test_tour_template, create_test_tour_instance, create_test_incident):
+        """Test malformed cursors and unsupported orderings return 400"""
+        self._seed(create_test_tour_template, create_test_tour_instance, create_test_incident)
+        query = select(Incident).order_by(Incident.reported_at.desc())
+        pagination = PaginationParams(page=1, size=3, cursor=None, include_total=None)
+        paginate_query(session, query, pagination)
+        cursor = pagination.next_cursor
+        
+        with pytest.raises(HTTPException) as exc_info:
+            paginate_query(session, query, PaginationParams(page=1, size=3, cursor="not-a-cursor", include_total=None))
+        assert exc_info.value.status_code == 400
+        
+        # A cursor from one ordering does not apply to another
+        with pytest.raises(HTTPException) as exc_info:
+            paginate_query(
+                session,
+                select(Incident).order_by(Incident.title.asc()),
+                PaginationParams(page=1, size=3, cursor=cursor, include_total=None)
+            )
+        assert exc_info.value.status_code == 400
+        
+        # Nullable sort columns only support offset paging
+        with pytest.raises(HTTPException) as exc_info:
+            paginate_query(
+                session,
+                select(Incident).order_by(Incident.resolved_at.desc()),
+                PaginationParams(page=1, size=3, cursor=cursor, include_total=None)
+            )
+        assert exc_info.value.status_code == 400
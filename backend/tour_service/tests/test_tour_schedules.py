@@ -0,0 +1,170 @@
+"""
+Tests for tour schedule generation
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, func, text
+from sqlmodel import select
+from services.tour_schedule_service import TourScheduleService, expand_schedule_dates
+from schemas.tour_schedule import TourScheduleCreate
+from schemas.itinerary_item import ItineraryItemBase
+from models.tour_instance import TourInstance, TourStatus
+from models.itinerary_item import ItineraryItem, ActivityType
+from models.availability_slot import AvailabilitySlot
+from utils.pagination import PaginationParams
+from config import settings
+from database import tour_instance_upgrade_statements
+from datetime import date, time
+
+
+class TestTourSchedules:
+    """Test class for tour schedule operations"""
+    
+    def test_expand_schedule_dates(self):
+        """Test the weekly rule yields every Monday and Thursday in range"""
+        dates = expand_schedule_dates(
+            date(2025, 3, 1), date(2025, 3, 20), [1, 4], excluded_dates=[date(2025, 3, 13)]
+        )
+        
+        assert dates == [
+            date(2025, 3, 3), date(2025, 3, 6), date(2025, 3, 10),
+            date(2025, 3, 17), date(2025, 3, 20)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_create_season_in_bulk(self, session, redis_client, create_test_tour_template, monkeypatch):
+        """Test a season is bulk-inserted with itineraries and availability slots"""
+        monkeypatch.setattr(settings, "schedule_insert_chunk_size", 20)
+        template = create_test_tour_template(title="Desert 3-day", duration_days=3, max_participants=12)
+        
+        inserts = []
+        
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO tour_instances"):
+                inserts.append(statement)
+        
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            schedule = await TourScheduleService(session, redis_client).create_schedule(
+                TourScheduleCreate(
+                    template_id=template.id,
+                    start_date=date(2025, 3, 1),
+                    end_date=date(2025, 10, 31),
+                    weekdays=[1, 4],
+                    itinerary=[
+                        ItineraryItemBase(day_number=1, activity_type=ActivityType.MEETING_POINT, title="Pickup", start_time=time(8, 0)),
+                        ItineraryItemBase(day_number=2, activity_type=ActivityType.ACTIVITY, title="Camel trek"),
+                        ItineraryItemBase(day_number=3, activity_type=ActivityType.DEPARTURE, title="Return")
+                    ]
+                )
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        
+        assert schedule.departures_count == 70
+        assert schedule.itinerary_items_count == 210
+        assert schedule.capacity == 12
+        # 70 instances in chunks of 20
+        assert len(inserts) == 4
+        
+        instances = session.exec(
+            select(TourInstance).where(TourInstance.schedule_id == schedule.id).order_by(TourInstance.start_date)
+        ).all()
+        assert len(instances) == 70
+        assert instances[0].start_date == date(2025, 3, 3)
+        assert instances[0].end_date == date(2025, 3, 5)
+        assert all(instance.status == TourStatus.PLANNED and instance.booking_id is None for instance in instances)
+        
+        items_count = session.exec(
+            select(func.count(ItineraryItem.id)).where(ItineraryItem.tour_instance_id == instances[0].id)
+        ).one()
+        assert items_count == 3
+        
+        slots, total = await TourScheduleService(session, redis_client).get_availability(
+            schedule.id, PaginationParams(page=1, size=5, cursor=None, include_total=None)
+        )
+        assert total == 70
+        assert [slot.start_date for slot in slots][:2] == [date(2025, 3, 3), date(2025, 3, 6)]
+        assert slots[0].remaining == 12
+        assert session.exec(select(func.count(AvailabilitySlot.id))).one() == 70
+    
+    @pytest.mark.asyncio
+    async def test_copy_itinerary_from_instance(self, session, redis_client, create_test_tour_template, create_test_tour_instance, create_test_itinerary_item):
+        """Test the itinerary of an existing instance is copied without its progress"""
+        template = create_test_tour_template(duration_days=3)
+        source = create_test_tour_instance(template.id, lead_participant_name="Test Customer")
+        create_test_itinerary_item(source.id, title="Medina walk", is_completed=True)
+        create_test_itinerary_item(source.id, day_number=2, title="Atlas drive")
+        
+        schedule = await TourScheduleService(session, redis_client).create_schedule(
+            TourScheduleCreate(
+                template_id=template.id,
+                start_date=date(2025, 4, 1),
+                end_date=date(2025, 4, 30),
+                weekdays=[6],
+                itinerary_source_instance_id=source.id
+            )
+        )
+        
+        assert schedule.departures_count == 4
+        copied = session.exec(
+            select(ItineraryItem)
+            .join(TourInstance, TourInstance.id == ItineraryItem.tour_instance_id)
+            .where(TourInstance.schedule_id == schedule.id)
+        ).all()
+        assert len(copied) == 8
+        assert {item.title for item in copied} == {"Medina walk", "Atlas drive"}
+        assert not any(item.is_completed for item in copied)
+    
+    @pytest.mark.asyncio
+    async def test_schedule_validation(self, session, redis_client, create_test_tour_template, monkeypatch):
+        """Test invalid schedules are rejected before anything is written"""
+        template = create_test_tour_template(duration_days=2)
+        service = TourScheduleService(session, redis_client)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_schedule(TourScheduleCreate(
+                template_id=template.id,
+                start_date=date(2025, 3, 1),
+                end_date=date(2025, 3, 31),
+                weekdays=[1],
+                itinerary=[ItineraryItemBase(day_number=3, activity_type=ActivityType.VISIT, title="Too late")]
+            ))
+        assert exc_info.value.status_code == 400
+        
+        monkeypatch.setattr(settings, "schedule_max_departures", 10)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_schedule(TourScheduleCreate(
+                template_id=template.id,
+                start_date=date(2025, 3, 1),
+                end_date=date(2025, 10, 31),
+                weekdays=[1, 4]
+            ))
+        assert exc_info.value.status_code == 400
+        
+        assert session.exec(select(func.count(TourInstance.id))).one() == 0
+    
+    
+    def test_upgrade_existing_tour_instances_table(self, session):
+        """Test a tour_instances table from before schedules gets the new column and relaxed constraints"""
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE tour_instances ("
+                "id CHAR(32) PRIMARY KEY, template_id CHAR(32) NOT NULL, "
+                "booking_id CHAR(32) NOT NULL, customer_id CHAR(32) NOT NULL, "
+                "title VARCHAR(255) NOT NULL, lead_participant_name VARCHAR(255) NOT NULL)"
+            ))
+            statements = tour_instance_upgrade_statements(conn)
+        
+        assert statements == [
+            "ALTER TABLE tour_instances ADD COLUMN IF NOT EXISTS schedule_id UUID REFERENCES tour_schedules (id)",
+            "CREATE INDEX IF NOT EXISTS ix_tour_instances_schedule_id ON tour_instances (schedule_id)",
+            "ALTER TABLE tour_instances ALTER COLUMN booking_id DROP NOT NULL",
+            "ALTER TABLE tour_instances ALTER COLUMN customer_id DROP NOT NULL",
+            "ALTER TABLE tour_instances ALTER COLUMN lead_participant_name DROP NOT NULL"
+        ]
+        
+        # Tables created from the current model need nothing
+        assert tour_instance_upgrade_statements(session.connection()) == []
@@ -205,6 +205,101 @@ class TestTourTemplates:
         assert total == 1
         assert templates[0].duration_days == 5
     
+    @pytest.mark.asyncio
+    async def test_search_templates_with_facets(self, session, create_test_tour_template):
+        """Test catalog search returns facet counts from the filtered matches"""
+        from schemas.tour_template import TourTemplateSearch
+        from utils.pagination import PaginationParams
+        
+        template_service = TourTemplateService(session)
+        
+        create_test_tour_template(
+            title="Sahara Desert Adventure",
+            category=TourCategory.DESERT,
+            difficulty_level=DifficultyLevel.MODERATE,
+            default_region="Merzouga"
+        )
+        create_test_tour_template(
+            title="Sahara Camel Trek",
+            category=TourCategory.ADVENTURE,
+            duration_days=5,
+            default_region="Merzouga"
+        )
+        create_test_tour_template(
+            title="Atlas Mountains Trek",
+            category=TourCategory.ADVENTURE,
+            default_region="Atlas"
+        )
+        
+        result = await template_service.search_templates(
+            PaginationParams(page=1, size=1),
+            TourTemplateSearch(query="Sahara")
+        )
+        
+        assert result.total == 2
+        assert result.pages == 2
+        assert len(result.items) == 1
+        assert result.facets.category == {"Desert": 1, "Adventure": 1}
+        assert result.facets.difficulty_level == {"Moderate": 1, "Easy": 1}
+        assert result.facets.region == {"Merzouga": 2}
+        
+        # Filters narrow the facets too
+        result = await template_service.search_templates(
+            PaginationParams(page=1, size=10),
+            TourTemplateSearch(query="Sahara", min_duration=4)
+        )
+        
+        assert result.total == 1
+        assert result.items[0].title == "Sahara Camel Trek"
+        assert result.facets.category == {"Adventure": 1}
+    
+    def test_postgresql_search_uses_ranked_full_text(self, session):
+        """Test the PostgreSQL query matches the search vector in every catalog language"""
+        from sqlalchemy.dialects import postgresql
+        from schemas.tour_template import TourTemplateSearch
+        
+        template_service = TourTemplateService(session)
+        template_service.session = type("PostgresSession", (), {
+            "get_bind": lambda self: type("Bind", (), {"dialect": postgresql.dialect()})()
+        })()
+        
+        query, ranking = template_service._build_search_query(TourTemplateSearch(query="désert"))
+        sql = str(query.order_by(*ranking).compile(dialect=postgresql.dialect()))
+        
+        assert "tour_templates.search_vector @@" in sql
+        # One query per catalog language plus "simple", in the filter and the rank
+        assert sql.count("websearch_to_tsquery(CAST(") == 8
+        assert "ORDER BY ts_rank_cd(tour_templates.search_vector" in sql
+    
+    @pytest.mark.asyncio
+    async def test_search_matches_accented_highlights(self, session, create_test_tour_template):
+        """Test highlights are stored unescaped so text search sees the accented words"""
+        from schemas.tour_template import TourTemplateSearch
+        from utils.pagination import PaginationParams
+        
+        template = create_test_tour_template(title="Southern Oases")
+        template.set_highlights_list(["Nuit dans le désert", "Thé à la menthe"])
+        session.add(template)
+        session.commit()
+        
+        assert "désert" in template.highlights
+        assert "\\u" not in template.highlights
+        
+        templates, total = await TourTemplateService(session).get_templates(
+            PaginationParams(page=1, size=10),
+            TourTemplateSearch(query="désert")
+        )
+        
+        assert total == 1
+        assert templates[0].highlights == ["Nuit dans le désert", "Thé à la menthe"]
+    
+    def test_search_vector_indexes_highlight_text(self):
+        """Test the trigger indexes the highlight strings rather than the raw JSON"""
+        from database import HIGHLIGHTS_TEXT_SQL
+        
+        assert "json_array_elements_text(NEW.highlights::json)" in HIGHLIGHTS_TEXT_SQL
+        assert "array_to_string(" in HIGHLIGHTS_TEXT_SQL
+    
     @pytest.mark.asyncio
     async def test_delete_template_with_instances(self, session, create_test_tour_template, create_test_tour_instance):
         """Test deleting template that has associated tour instances"""
@@ -4,9 +4,13 @@ Utility functions and dependencies
 from .auth import *
 from .pagination import *
 from .notifications import *
+from .search import *
+from .events import *
 
 __all__ = [
     "get_current_user", "require_permission", "verify_auth_token",
     "PaginationParams", "paginate_query",
-    "NotificationService", "send_tour_update", "send_incident_alert"
+    "NotificationService", "send_tour_update", "send_incident_alert",
+    "fuzzy_search_condition", "similarity_rank",
+    "publish_change", "publish_tour_instance_change", "publish_tour_instance_changes"
 ]
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Change events published to the shared Redis Streams change feed
+"""
+from database import change_feed_redis
+from config import settings
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+import json
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+TOUR_INSTANCE_STREAM = "changes:tour_instances"
+
+
+def publish_change(
+    stream: str,
+    entity_id: uuid.UUID,
+    data: Dict[str, Any],
+    version: Optional[datetime] = None
+):
+    """Publish the current state of an entity to a change stream
+    
+    Consumers keep the highest ``version`` per entity, so replays and
+    out-of-order delivery are harmless. Publishing is best effort: consumers
+    fall back to HTTP for anything their replica has not seen yet.
+    """
+    try:
+        change_feed_redis.xadd(
+            stream, _change_fields(entity_id, data, version),
+            maxlen=settings.change_stream_max_length, approximate=True
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish change to {stream}: {str(e)}")
+
+
+def _change_fields(
+    entity_id: uuid.UUID,
+    data: Dict[str, Any],
+    version: Optional[datetime] = None
+) -> Dict[str, str]:
+    return {
+        "id": str(entity_id),
+        "version": (version or datetime.utcnow()).isoformat(),
+        "data": json.dumps(data, default=str)
+    }
+
+
+def _tour_instance_data(instance) -> Dict[str, Any]:
+    return {
+        "booking_id": instance.booking_id,
+        "customer_id": instance.customer_id,
+        "status": instance.status,
+        "start_date": instance.start_date,
+        "end_date": instance.end_date
+    }
+
+
+def publish_tour_instance_change(instance):
+    """Publish the summary fields other services replicate for a tour instance"""
+    publish_change(
+        TOUR_INSTANCE_STREAM,
+        instance.id,
+        _tour_instance_data(instance),
+        version=instance.updated_at or instance.created_at
+    )
+
+
+def publish_tour_instance_changes(instances: Iterable):
+    """Publish many tour instances in one pipelined round trip"""
+    pipeline = change_feed_redis.pipeline(transaction=False)
+    for instance in instances:
+        pipeline.xadd(
+            TOUR_INSTANCE_STREAM,
+            _change_fields(
+                instance.id,
+                _tour_instance_data(instance),
+                instance.updated_at or instance.created_at
+            ),
+            maxlen=settings.change_stream_max_length, approximate=True
+        )
+    try:
+        pipeline.execute()
+    except Exception as e:
+        logger.error(f"Failed to publish changes to {TOUR_INSTANCE_STREAM}: {str(e)}")